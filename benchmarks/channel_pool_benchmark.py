@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares service clients with and without a shared channel pool.
+
+For each mode this retrieves a number of service clients, makes one request
+with each of them and reports how many gRPC channels were opened along with the
+latency of each service client's first request.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import six
+import timeit
+
+import google.api_core.grpc_helpers
+
+import google.ads.google_ads.client
+from google.ads.google_ads.channel_pool import ChannelPool
+
+
+class _ChannelCounter(object):
+    """Counts the channels created through google.api_core.grpc_helpers."""
+
+    def __init__(self):
+        self.count = 0
+        self._create_channel = google.api_core.grpc_helpers.create_channel
+
+    def __enter__(self):
+        def counting_create_channel(*args, **kwargs):
+            self.count += 1
+            return self._create_channel(*args, **kwargs)
+
+        google.api_core.grpc_helpers.create_channel = counting_create_channel
+        return self
+
+    def __exit__(self, *exc_info):
+        google.api_core.grpc_helpers.create_channel = self._create_channel
+
+
+def _get_first_calls(customer_id):
+    """Returns (service name, callable) pairs that each make one request."""
+    query = 'SELECT customer.id FROM customer LIMIT 1'
+    return [
+        ('GoogleAdsService',
+         lambda service: list(service.search(customer_id, query))),
+        ('CustomerService',
+         lambda service: service.get_customer('customers/%s' % customer_id)),
+        ('GoogleAdsFieldService',
+         lambda service: service.get_google_ads_field(
+             'googleAdsFields/customer.id')),
+    ]
+
+
+def _run(client, customer_id, repeat):
+    """Retrieves service clients and times the first request of each.
+
+    Returns:
+        A tuple of the number of channels opened and a list of
+        (service name, latency in seconds) pairs.
+    """
+    services = []
+    latencies = []
+
+    with _ChannelCounter() as counter:
+        for _ in range(repeat):
+            for name, first_call in _get_first_calls(customer_id):
+                service = client.get_service(name, version='v2')
+                # Keep service clients alive so that pooled channels stay
+                # leased, as they would be in a long running worker.
+                services.append(service)
+                start = timeit.default_timer()
+                first_call(service)
+                latencies.append((name, timeit.default_timer() - start))
+
+    return counter.count, latencies
+
+
+def main(client, customer_id, repeat, pool_size):
+    modes = (('unpooled', None), ('pooled', ChannelPool(size=pool_size)))
+
+    for label, pool in modes:
+        client.channel_pool = pool
+        channels, latencies = _run(client, customer_id, repeat)
+        total = sum(latency for _, latency in latencies)
+        print('%s: %d channel(s) opened for %d service client(s); total '
+              'first-call latency %.1f ms' %
+              (label, channels, len(latencies), total * 1000))
+        for name, latency in latencies:
+            print('\t%s first call: %.1f ms' % (name, latency * 1000))
+        client.close()
+
+
+if __name__ == '__main__':
+    # GoogleAdsClient will read the google-ads.yaml configuration file in the
+    # home directory if none is specified.
+    google_ads_client = (google.ads.google_ads.client.GoogleAdsClient
+                         .load_from_storage())
+
+    parser = argparse.ArgumentParser(
+        description=('Measures connection count and first-call latency with '
+                     'and without a channel pool.'))
+    # The following argument(s) should be provided to run the benchmark.
+    parser.add_argument('-c', '--customer_id', type=six.text_type,
+                        required=True, help='The Google Ads customer ID.')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='How many times each service is retrieved.')
+    parser.add_argument('-s', '--pool_size', type=int, default=1,
+                        help='The number of channels in the pool.')
+    args = parser.parse_args()
+
+    main(google_ads_client, args.customer_id, args.repeat, args.pool_size)
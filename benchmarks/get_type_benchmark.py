@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the throughput of constructing operations with get_type.
+
+Operations creating campaigns are built in several ways: by looking the type
+up on the types module for every operation, as get_type used to, with
+get_type and the type registry, and with a TypePrototypes instance returning
+copies of a prototype. The first three populate the shared default fields by
+hand, while the prototype already holds them. No requests are made.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import timeit
+from importlib import import_module
+
+from google.ads.google_ads.client import GoogleAdsClient
+from google.ads.google_ads.client import TypePrototypes
+
+
+_TYPE_NAME = 'CampaignOperation'
+
+
+def _populate_defaults(operation, enums):
+    """Sets the fields that every operation in the benchmark shares."""
+    campaign = operation.create
+    campaign.status = enums.CampaignStatusEnum.CampaignStatus.PAUSED
+    campaign.advertising_channel_type = (
+        enums.AdvertisingChannelTypeEnum.AdvertisingChannelType.SEARCH)
+    campaign.manual_cpc.enhanced_cpc_enabled.value = False
+    campaign.network_settings.target_google_search.value = True
+    campaign.network_settings.target_search_network.value = True
+    campaign.network_settings.target_content_network.value = False
+
+
+def _get_builders(version, prototypes):
+    """Returns pairs of labels and functions creating an operation."""
+    api_version = import_module('google.ads.google_ads.%s' % version)
+    enums = api_version.enums
+
+    def build_with_getattr(index):
+        operation = getattr(import_module(api_version.__name__).types,
+                            _TYPE_NAME)()
+        _populate_defaults(operation, enums)
+        operation.create.name.value = 'Campaign %d' % index
+        return operation
+
+    def build_with_get_type(index):
+        operation = GoogleAdsClient.get_type(_TYPE_NAME, version=version)
+        _populate_defaults(operation, enums)
+        operation.create.name.value = 'Campaign %d' % index
+        return operation
+
+    def build_with_prototype(index):
+        operation = prototypes.get_type(_TYPE_NAME)
+        operation.create.name.value = 'Campaign %d' % index
+        return operation
+
+    def build_empty(index):
+        return GoogleAdsClient.get_type(_TYPE_NAME, version=version)
+
+    return (('empty operation (get_type)', build_empty),
+            ('types module lookup + defaults', build_with_getattr),
+            ('get_type + defaults', build_with_get_type),
+            ('TypePrototypes copy', build_with_prototype))
+
+
+def main(version, count, repeat):
+    prototype = GoogleAdsClient.get_type(_TYPE_NAME, version=version)
+    _populate_defaults(
+        prototype, import_module('google.ads.google_ads.%s' % version).enums)
+    prototypes = TypePrototypes(version=version)
+    prototypes.set_prototype(_TYPE_NAME, prototype)
+    builders = _get_builders(version, prototypes)
+    expected = builders[1][1](0)
+
+    for label, build in builders:
+        seconds = min(timeit.repeat(
+            lambda: [build(index) for index in range(count)],
+            number=1, repeat=repeat))
+
+        if build is not builders[0][1]:
+            # All of the approaches must produce the same operation.
+            assert build(0) == expected, label
+
+        print('%-32s %10.0f operations/s %8.2f us/operation' % (
+            label, count / seconds, seconds / count * 1e6))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=('Measures how many operations per second can be '
+                     'constructed with get_type.'))
+    parser.add_argument('-v', '--version', default='v2',
+                        help='The Google Ads API version.')
+    parser.add_argument('-n', '--count', type=int, default=20000,
+                        help='The number of operations built per run.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='How many times each measurement is taken.')
+    args = parser.parse_args()
+
+    main(args.version, args.count, args.repeat)
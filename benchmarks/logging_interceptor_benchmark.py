@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the per-call overhead of the LoggingInterceptor.
+
+A completed Search request returning a page of campaign rows is passed
+through the interceptor under several logging configurations, with a handler
+writing to os.devnull. The time of the continuation alone is reported as the
+baseline. The asynchronous handler is measured last, since it can't be
+disabled once it's enabled. No requests are made.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import logging
+import os
+import timeit
+from importlib import import_module
+
+from google.ads.google_ads import client as Client
+
+
+_METHOD = '/google.ads.googleads.%s.services.GoogleAdsService/Search'
+_QUERY = 'SELECT campaign.id, campaign.name FROM campaign'
+
+
+class _CompletedResponse(object):
+    """Stands in for the grpc.Call of a completed request."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def done(self):
+        return True
+
+    def exception(self):
+        return None
+
+    def result(self):
+        return self._response
+
+    def trailing_metadata(self):
+        return (('request-id', 'abcdefghijklmnop'),)
+
+
+def _get_call(version, rows):
+    """Returns the client call details, request and response of a search."""
+    service_pb2 = import_module(
+        'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+        % version)
+    request = service_pb2.SearchGoogleAdsRequest(
+        customer_id='1234567890', query=_QUERY, page_size=1000)
+    response = service_pb2.SearchGoogleAdsResponse()
+
+    for index in range(rows):
+        row = response.results.add()
+        row.campaign.id.value = index
+        row.campaign.name.value = 'Campaign %d' % index
+
+    client_call_details = Client._ClientCallDetails(
+        _METHOD % version, None,
+        [('developer-token', 'abcdefghijklmnopqrstuv'),
+         ('login-customer-id', '1234567890')],
+        None)
+    return client_call_details, request, _CompletedResponse(response)
+
+
+def main(version, rows, count, repeat):
+    client_call_details, request, response = _get_call(version, rows)
+
+    def continuation(client_call_details, request):
+        return response
+
+    package_logger = logging.getLogger(Client._LOGGER_PACKAGE)
+    package_logger.propagate = False
+    handler = logging.StreamHandler(open(os.devnull, 'w'))
+    package_logger.addHandler(handler)
+    interceptor = Client.LoggingInterceptor(
+        endpoint='googleads.googleapis.com')
+    sampled_interceptor = Client.LoggingInterceptor(
+        endpoint='googleads.googleapis.com', sample_rate=0.01)
+
+    def measure(label, call):
+        seconds = min(timeit.repeat(call, number=count, repeat=repeat))
+        print('%-36s %10.2f us/call' % (label, seconds / count * 1e6))
+
+    measure('continuation only',
+            lambda: continuation(client_call_details, request))
+
+    for label, logger_level, handler_level, logging_interceptor in (
+            ('WARNING (default)', logging.WARNING, logging.NOTSET,
+             interceptor),
+            ('INFO', logging.INFO, logging.NOTSET, interceptor),
+            ('INFO, handler at WARNING', logging.INFO, logging.WARNING,
+             interceptor),
+            ('INFO, 1% sampled', logging.INFO, logging.NOTSET,
+             sampled_interceptor),
+            ('DEBUG', logging.DEBUG, logging.NOTSET, interceptor)):
+        package_logger.setLevel(logger_level)
+        handler.setLevel(handler_level)
+        measure(label, lambda: logging_interceptor.intercept_unary_unary(
+            continuation, client_call_details, request))
+
+    handler.setLevel(logging.NOTSET)
+    async_logging = Client.enable_async_logging()
+
+    for label, logger_level in (('INFO, async handler', logging.INFO),
+                                ('DEBUG, async handler', logging.DEBUG)):
+        package_logger.setLevel(logger_level)
+        measure(label, lambda: interceptor.intercept_unary_unary(
+            continuation, client_call_details, request))
+
+    # Waits for the listener to emit the queued records.
+    async_logging.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=('Measures the per-call overhead of the '
+                     'LoggingInterceptor.'))
+    parser.add_argument('-v', '--version', default='v2',
+                        help='The Google Ads API version.')
+    parser.add_argument('-s', '--rows', type=int, default=100,
+                        help='The number of rows in the search response.')
+    parser.add_argument('-n', '--count', type=int, default=2000,
+                        help='The number of calls per run.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='How many times each measurement is taken.')
+    args = parser.parse_args()
+
+    main(args.version, args.rows, args.count, args.repeat)
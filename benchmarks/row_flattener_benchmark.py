@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares a RowFlattener with other ways of reading selected fields.
+
+A RowFlattener is timed against attribute access written out by hand for one
+query, as in the get_keyword_stats example, and against the generic approach
+of reading each selected field by name. Rows are built locally so that no
+requests are made to the Google Ads API.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import functools
+import timeit
+
+from google.ads.google_ads import rows as rows_util
+from google.ads.google_ads.rows import RowFlattener
+from google.ads.google_ads.v2.proto.services import google_ads_service_pb2
+
+
+_QUERY = ('SELECT campaign.id, campaign.name, ad_group.id, ad_group.name, '
+          'ad_group_criterion.criterion_id, '
+          'ad_group_criterion.keyword.text, '
+          'ad_group_criterion.keyword.match_type, '
+          'metrics.impressions, metrics.clicks, metrics.cost_micros '
+          'FROM keyword_view')
+
+
+def _create_rows(count):
+    rows = []
+
+    for index in range(count):
+        row = google_ads_service_pb2.GoogleAdsRow()
+        row.campaign.id.value = index
+        row.campaign.name.value = 'Campaign %d' % index
+        row.ad_group.id.value = index
+        row.ad_group.name.value = 'Ad group %d' % index
+        row.ad_group_criterion.criterion_id.value = index
+        row.ad_group_criterion.keyword.text.value = 'keyword %d' % index
+        row.ad_group_criterion.keyword.match_type = 2
+        row.metrics.impressions.value = index * 10
+        row.metrics.clicks.value = index
+        row.metrics.cost_micros.value = index * 1000000
+        rows.append(row)
+
+    return rows
+
+
+def _naive_tuples(rows):
+    result = []
+
+    for row in rows:
+        campaign = row.campaign
+        ad_group = row.ad_group
+        criterion = row.ad_group_criterion
+        metrics = row.metrics
+        result.append((campaign.id.value, campaign.name.value,
+                       ad_group.id.value, ad_group.name.value,
+                       criterion.criterion_id.value,
+                       criterion.keyword.text.value,
+                       criterion.keyword.match_type,
+                       metrics.impressions.value, metrics.clicks.value,
+                       metrics.cost_micros.value))
+
+    return result
+
+
+def _generic_tuples(rows, paths):
+    return [tuple(functools.reduce(getattr, path, row) for path in paths)
+            for row in rows]
+
+
+def main(row_count, repeat):
+    flattener = RowFlattener(_QUERY, version='v2')
+    paths = [rows_util.get_field_descriptor(field, 'v2')[0].split('.')
+             for field in flattener.fields]
+
+    runs = (('hand-written access', _naive_tuples),
+            ('generic access by field name',
+             lambda rows: _generic_tuples(rows, paths)),
+            ('RowFlattener.tuples', lambda rows: list(flattener.tuples(rows))),
+            ('RowFlattener.dicts', lambda rows: list(flattener.dicts(rows))))
+
+    rows = _create_rows(row_count)
+    assert _naive_tuples(rows) == list(flattener.tuples(rows))
+
+    for label, run in runs:
+        elapsed = []
+
+        for _ in range(repeat):
+            # Fresh rows keep protobuf's cached sub-messages from favoring
+            # whichever method runs later.
+            rows = _create_rows(row_count)
+            start = timeit.default_timer()
+            run(rows)
+            elapsed.append(timeit.default_timer() - start)
+
+        print('%s: %.1f ms for %d rows (%.0f rows/s)' %
+              (label, min(elapsed) * 1000, row_count,
+               row_count / min(elapsed)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=('Measures the time taken to flatten rows with and '
+                     'without a RowFlattener.'))
+    parser.add_argument('-n', '--row_count', type=int, default=100000,
+                        help='The number of rows to flatten.')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='How many times each method is timed.')
+    args = parser.parse_args()
+
+    main(args.row_count, args.repeat)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares paged search with and without background page prefetching.
+
+Each page is "processed" by sleeping for a fixed time, standing in for the
+work an export does with each page of rows, so that the overlap between
+processing and network time is visible in the reported wall time.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import six
+import time
+import timeit
+
+import google.ads.google_ads.client
+from google.ads.google_ads.iterators import PrefetchingPageIterator
+
+
+_DEFAULT_QUERY = ('SELECT ad_group_criterion.keyword.text, metrics.clicks '
+                  'FROM keyword_view '
+                  'WHERE segments.date DURING LAST_30_DAYS')
+
+
+def _consume(pages, processing_seconds):
+    """Processes each page and returns the number of pages and rows seen."""
+    page_count = 0
+    row_count = 0
+
+    for page in pages:
+        page_count += 1
+        row_count += len(page.results)
+        time.sleep(processing_seconds)
+
+    return page_count, row_count
+
+
+def main(client, customer_id, query, page_size, depth, processing_ms):
+    ga_service = client.get_service('GoogleAdsService', version='v2')
+    processing_seconds = processing_ms / 1000.0
+
+    def sequential():
+        results = ga_service.search(customer_id, query, page_size=page_size)
+        return _consume(results.pages, processing_seconds)
+
+    def prefetching():
+        results = ga_service.search(customer_id, query, page_size=page_size)
+        with PrefetchingPageIterator(results, depth=depth) as iterator:
+            return _consume(iterator.pages, processing_seconds)
+
+    for label, run in (('sequential', sequential),
+                       ('prefetching (depth %d)' % depth, prefetching)):
+        start = timeit.default_timer()
+        page_count, row_count = run()
+        elapsed = timeit.default_timer() - start
+        print('%s: %d page(s), %d row(s) in %.2f s' %
+              (label, page_count, row_count, elapsed))
+
+
+if __name__ == '__main__':
+    # GoogleAdsClient will read the google-ads.yaml configuration file in the
+    # home directory if none is specified.
+    google_ads_client = (google.ads.google_ads.client.GoogleAdsClient
+                         .load_from_storage())
+
+    parser = argparse.ArgumentParser(
+        description=('Measures the wall time of a paged search with and '
+                     'without background page prefetching.'))
+    # The following argument(s) should be provided to run the benchmark.
+    parser.add_argument('-c', '--customer_id', type=six.text_type,
+                        required=True, help='The Google Ads customer ID.')
+    parser.add_argument('-q', '--query', type=six.text_type,
+                        default=_DEFAULT_QUERY, help='The GAQL query to run.')
+    parser.add_argument('-p', '--page_size', type=int, default=1000,
+                        help='The number of rows in each page.')
+    parser.add_argument('-d', '--depth', type=int, default=2,
+                        help='How many pages are fetched ahead.')
+    parser.add_argument('-t', '--processing_ms', type=float, default=100,
+                        help='Simulated processing time per page in ms.')
+    args = parser.parse_args()
+
+    main(google_ads_client, args.customer_id, args.query, args.page_size,
+         args.depth, args.processing_ms)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the cold start cost of retrieving each service client.
+
+Each service is retrieved with get_service in a new interpreter, which reports
+the time taken, the peak resident set size and the number of generated
+protobuf modules imported. No requests are made, and anonymous credentials
+are used so that no configuration is needed.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+_MEASURE_SCRIPT = '''
+import json
+import resource
+import sys
+import timeit
+
+start = timeit.default_timer()
+from google.auth.credentials import AnonymousCredentials
+from google.ads.google_ads.client import GoogleAdsClient
+client = GoogleAdsClient(AnonymousCredentials(), 'developer-token')
+if sys.argv[2]:
+    client.get_service(sys.argv[2], version=sys.argv[1])
+elapsed = timeit.default_timer() - start
+
+print(json.dumps({
+    'seconds': elapsed,
+    # Reported in kilobytes on Linux.
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'pb2_modules': sum(1 for name in sys.modules if name.endswith('_pb2')),
+}))
+'''
+
+_DEFAULT_SERVICES = ('GoogleAdsService', 'CampaignService', 'AdGroupService',
+                     'CustomerService', 'GoogleAdsFieldService')
+
+
+def _measure(version, service_name, repeat):
+    """Returns the fastest of repeat measurements in new interpreters."""
+    results = []
+
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _MEASURE_SCRIPT, version, service_name])
+        results.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+    return min(results, key=lambda result: result['seconds'])
+
+
+def _get_all_services(version):
+    from importlib import import_module
+    api_module = import_module('google.ads.google_ads.%s' % version)
+    return sorted(name[:-len('Client')] for name in dir(api_module)
+                  if name.endswith('ServiceClient'))
+
+
+def main(version, service_names, repeat):
+    baseline = _measure(version, '', repeat)
+    print('%-45s %10s %12s %12s' % ('service', 'time (ms)', 'max RSS (MB)',
+                                    '*_pb2 count'))
+    print('%-45s %10.0f %12.1f %12d' % (
+        '(client only)', baseline['seconds'] * 1000,
+        baseline['max_rss_kb'] / 1024.0, baseline['pb2_modules']))
+
+    for service_name in service_names:
+        result = _measure(version, service_name, repeat)
+        print('%-45s %10.0f %12.1f %12d' % (
+            service_name, result['seconds'] * 1000,
+            result['max_rss_kb'] / 1024.0, result['pb2_modules']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=('Measures import time, peak RSS and imported modules '
+                     'when retrieving a service in a new process.'))
+    parser.add_argument('-v', '--version', default='v2',
+                        help='The Google Ads API version.')
+    parser.add_argument('-s', '--services', nargs='+',
+                        default=list(_DEFAULT_SERVICES),
+                        help='The names of the services to retrieve.')
+    parser.add_argument('-a', '--all', action='store_true',
+                        help='Measure every service of the version.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='How many times each measurement is taken.')
+    args = parser.parse_args()
+
+    services = (_get_all_services(args.version) if args.all
+                else args.services)
+    main(args.version, services, args.repeat)
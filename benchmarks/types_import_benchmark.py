@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the cold start cost of retrieving types with get_type.
+
+Each measurement runs in a new interpreter, which imports the library,
+retrieves the given types and reports the time taken along with the number of
+generated protobuf modules that were imported. Retrieving every type shows the
+cost of importing all of them, as the types module used to do up front.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+_MEASURE_SCRIPT = '''
+import json
+import sys
+import timeit
+
+start = timeit.default_timer()
+from google.ads.google_ads.client import GoogleAdsClient
+from importlib import import_module
+names = sys.argv[2:] or import_module(
+    'google.ads.google_ads.%s.types' % sys.argv[1]).names
+for name in names:
+    GoogleAdsClient.get_type(name, version=sys.argv[1])
+elapsed = timeit.default_timer() - start
+
+print(json.dumps({
+    'seconds': elapsed,
+    'pb2_modules': sum(1 for name in sys.modules if name.endswith('_pb2')),
+}))
+'''
+
+
+def _measure(version, names):
+    """Runs the measure script in a new interpreter and returns its results."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', _MEASURE_SCRIPT, version] + names)
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+def main(version, names, repeat):
+    for label, run_names in ((', '.join(names), names),
+                             ('all types', [])):
+        results = [_measure(version, run_names) for _ in range(repeat)]
+        print('%s: %.0f ms (best of %d), %d *_pb2 modules imported' %
+              (label, min(result['seconds'] for result in results) * 1000,
+               repeat, results[0]['pb2_modules']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=('Measures import time and imported modules when '
+                     'retrieving types in a new process.'))
+    parser.add_argument('-v', '--version', default='v2',
+                        help='The Google Ads API version.')
+    parser.add_argument('-t', '--types', nargs='+',
+                        default=['CampaignOperation'],
+                        help='The names of the types to retrieve.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='How many times each measurement is taken.')
+    args = parser.parse_args()
+
+    main(args.version, args.types, args.repeat)
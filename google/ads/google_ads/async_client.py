@@ -0,0 +1,387 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An asyncio client for the Google Ads API built on grpc.aio.
+
+This module requires Python 3.7+ and grpcio 1.32.0+.
+"""
+
+import asyncio
+import functools
+import logging
+
+import google.auth.transport.grpc
+import google.auth.transport.requests
+import grpc
+from grpc import aio
+from google.api_core import page_iterator
+
+from google.ads.google_ads import client
+from google.ads.google_ads import util
+
+
+class GoogleAdsAsyncClient(client.GoogleAdsClient):
+    """Google Ads client whose services are driven by an asyncio event loop.
+
+    Service clients are retrieved the same way as with GoogleAdsClient, but
+    their methods return awaitables instead of blocking, and paged methods
+    such as GoogleAdsService.search return an AsyncPageIterator. A single event
+    loop can therefore have many requests in flight at once:
+
+        ga_service = client.get_service('GoogleAdsService')
+        response = await ga_service.mutate(customer_id, operations)
+        async for row in ga_service.search(customer_id, query):
+            ...
+
+    Methods that return long-running operations aren't supported.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initializer for the GoogleAdsAsyncClient.
+
+        Accepts the same arguments as GoogleAdsClient.
+
+        Raises:
+            ValueError: If a channel_pool is given, since a grpc.aio channel
+                already multiplexes any number of concurrent requests, or if
+                rate_limits, concurrency_limiter, retry or metrics_registry
+                are given, since their interceptors only intercept
+                synchronous channels.
+        """
+        super(GoogleAdsAsyncClient, self).__init__(*args, **kwargs)
+
+        if self.channel_pool:
+            raise ValueError('GoogleAdsAsyncClient does not support channel '
+                             'pools.')
+
+        unsupported = [name for name, value in (
+            ('rate_limits', self.rate_limiter),
+            ('concurrency_limiter', self.concurrency_limiter),
+            ('retry', self.retrier),
+            ('metrics_registry', self.metrics_registry)) if value is not None]
+
+        if unsupported:
+            raise ValueError('GoogleAdsAsyncClient does not support %s.'
+                             % ', '.join(unsupported))
+
+    def _create_service(self, name, version):
+        """Creates an asynchronous service client.
+
+        Args:
+            name: a str indicating the name of the service.
+            version: a str indicating the version of the Google Ads API.
+
+        Returns:
+            A tuple of the AsyncServiceClient and a callable taking no
+            arguments that schedules its channel to be closed.
+
+        Raises:
+            ValueError: If the specified name or version doesn't exist.
+        """
+        service_client, service_transport_class = (
+            client._get_service_classes(name, version))
+        endpoint = (self.endpoint if self.endpoint
+                    else service_client.SERVICE_ADDRESS)
+
+        channel = aio.secure_channel(
+            endpoint,
+            _get_channel_credentials(self.credentials),
+            options=client.GRPC_CHANNEL_OPTIONS,
+            interceptors=[
+                AsyncMetadataInterceptor(self.developer_token,
+                                         self.login_customer_id),
+                AsyncLoggingInterceptor(
+                    endpoint=endpoint, sample_rate=self.logging_sample_rate),
+                AsyncExceptionInterceptor(version)])
+
+        service_transport = service_transport_class(channel=channel)
+        service = AsyncServiceClient(
+            service_client(transport=service_transport), channel=channel)
+
+        return service, functools.partial(_schedule_close, channel)
+
+
+class AsyncServiceClient(object):
+    """Wraps a service client whose transport uses a grpc.aio channel.
+
+    Unary methods of the wrapped client already return awaitable calls when
+    its transport is backed by a grpc.aio channel. Paged methods return an
+    AsyncPageIterator in place of google.api_core.page_iterator.GRPCIterator.
+    Every other attribute is taken from the wrapped service client.
+    """
+
+    def __init__(self, service, channel=None):
+        """Initializer for the AsyncServiceClient.
+
+        Args:
+            service: a service client instance with a grpc.aio transport.
+            channel: an optional grpc.aio.Channel instance of the transport,
+                closed by close.
+        """
+        self.service = service
+        self.channel = channel
+
+    async def close(self):
+        """Closes the service client's channel.
+
+        Service clients released without a running event loop, e.g. when
+        evicted from the service cache by a synchronous caller, keep their
+        channel open until this method is awaited.
+        """
+        if self.channel is not None:
+            await self.channel.close()
+
+    def __getattr__(self, name):
+        attr = getattr(self.service, name)
+
+        if name.startswith('_') or isinstance(attr, type) or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def method(*args, **kwargs):
+            result = attr(*args, **kwargs)
+
+            if isinstance(result, page_iterator.GRPCIterator):
+                return AsyncPageIterator(result)
+
+            return result
+
+        return method
+
+
+class AsyncPageIterator(object):
+    """Asynchronously iterates over the results of a paged request.
+
+    Iterating over the instance yields individual results, e.g. GoogleAdsRow
+    instances, while iterating over its pages attribute yields each response
+    message, e.g. SearchGoogleAdsResponse instances.
+    """
+
+    def __init__(self, iterator):
+        """Initializer for the AsyncPageIterator.
+
+        Args:
+            iterator: a google.api_core.page_iterator.GRPCIterator whose method
+                returns awaitable responses.
+        """
+        self._paged_request = util.get_paged_request(iterator)
+
+    def __aiter__(self):
+        return self._results()
+
+    @property
+    def pages(self):
+        """An async iterator over each response page."""
+        return self._pages()
+
+    async def _pages(self):
+        paged_request = self._paged_request
+        request = paged_request.request
+
+        while True:
+            response = await paged_request.method(request)
+            yield response
+            page_token = getattr(response,
+                                 paged_request.response_token_field)
+
+            if not page_token:
+                return
+
+            setattr(request, paged_request.request_token_field, page_token)
+
+    async def _results(self):
+        items_field = self._paged_request.items_field
+
+        async for response in self._pages():
+            for item in getattr(response, items_field):
+                yield item
+
+
+class AsyncExceptionInterceptor(client.ExceptionInterceptor,
+                                aio.UnaryUnaryClientInterceptor):
+    """An asyncio interceptor that wraps rpc exceptions."""
+
+    async def intercept_unary_unary(self, continuation, client_call_details,
+                                    request):
+        """Intercepts and wraps exceptions in the rpc response.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Returns:
+            A grpc.aio.Call instance representing a service response.
+
+        Raises:
+            GoogleAdsException: If the exception's trailing metadata
+                indicates that it is a GoogleAdsException.
+            RpcError: If the exception's trailing metadata is empty or is not
+                indicative of a GoogleAdsException, or if the exception has a
+                status code of INTERNAL or RESOURCE_EXHAUSTED.
+        """
+        call = await continuation(client_call_details, request)
+
+        try:
+            await call
+        except grpc.RpcError as exception:
+            self._handle_grpc_failure(_CompletedCall(exception=exception))
+
+        return call
+
+
+class AsyncLoggingInterceptor(client.LoggingInterceptor,
+                              aio.UnaryUnaryClientInterceptor):
+    """An asyncio interceptor that logs rpc requests and responses."""
+
+    def _get_call_method(self, client_call_details):
+        """Retrieves the call method from client_call_details as a str.
+
+        Returns:
+            A str with the call method or None if it isn't present.
+
+        Args:
+            client_call_details: An instance of grpc.aio.ClientCallDetails.
+        """
+        method = super(AsyncLoggingInterceptor, self)._get_call_method(
+            client_call_details)
+
+        if isinstance(method, bytes):
+            return method.decode()
+
+        return method
+
+    async def intercept_unary_unary(self, continuation, client_call_details,
+                                    request):
+        """Intercepts and logs API interactions.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Returns:
+            A grpc.aio.Call instance representing a service response.
+        """
+        try:
+            call = await continuation(client_call_details, request)
+            response = await call
+        except Exception as exception:
+            if client._logger.isEnabledFor(logging.WARNING):
+                self._log_request(client_call_details, request,
+                                  _CompletedCall(exception=exception))
+            raise
+
+        # Successful requests are only logged at the INFO level and below.
+        if client._logger.isEnabledFor(logging.INFO):
+            trailing_metadata = await call.trailing_metadata()
+            self._log_request(client_call_details, request,
+                              _CompletedCall(response, None, trailing_metadata))
+
+        return call
+
+
+class AsyncMetadataInterceptor(client.MetadataInterceptor,
+                               aio.UnaryUnaryClientInterceptor):
+    """An asyncio interceptor that appends custom metadata to requests."""
+
+    def _update_client_call_details_metadata(
+            self, client_call_details, metadata):
+        return aio.ClientCallDetails(
+            client_call_details.method, client_call_details.timeout, metadata,
+            client_call_details.credentials,
+            client_call_details.wait_for_ready)
+
+    async def intercept_unary_unary(self, continuation, client_call_details,
+                                    request):
+        """Intercepts and appends custom metadata.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Returns:
+            A grpc.aio.Call instance representing a service response.
+        """
+        return await super(AsyncMetadataInterceptor, self).intercept_unary_unary(
+            continuation, client_call_details, request)
+
+
+class _CompletedCall(object):
+    """A finished grpc.aio call exposed through synchronous accessors.
+
+    The synchronous interceptors read results from grpc.Call/grpc.Future
+    instances, whose accessors block until the call is complete. This exposes
+    the outcome of an awaited grpc.aio call through the same accessors so that
+    their logic can be reused.
+    """
+
+    def __init__(self, response=None, exception=None, trailing_metadata=None):
+        self._response = response
+        self._exception = exception
+        self._trailing_metadata = trailing_metadata
+
+    def code(self):
+        if self._exception is None:
+            return grpc.StatusCode.OK
+
+        return self._exception.code()
+
+    def exception(self):
+        return self._exception
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+
+        return self._response
+
+    def trailing_metadata(self):
+        if self._trailing_metadata is None and self._exception is not None:
+            return client._get_trailing_metadata_from_interceptor_exception(
+                self._exception)
+
+        return self._trailing_metadata
+
+    def done(self):
+        return True
+
+
+def _get_channel_credentials(credentials):
+    """Creates gRPC channel credentials that authorize with credentials.
+
+    Args:
+        credentials: a google.auth.credentials.Credentials instance.
+
+    Returns:
+        A grpc.ChannelCredentials instance using SSL and the given credentials.
+    """
+    metadata_plugin = google.auth.transport.grpc.AuthMetadataPlugin(
+        credentials, google.auth.transport.requests.Request())
+
+    return grpc.composite_channel_credentials(
+        grpc.ssl_channel_credentials(),
+        grpc.metadata_call_credentials(metadata_plugin))
+
+
+def _schedule_close(channel):
+    """Schedules a grpc.aio channel to be closed on the running event loop.
+
+    Without a running event loop the channel is left open, to be closed by
+    awaiting AsyncServiceClient.close, since a loop the caller doesn't own
+    can't be run.
+
+    Args:
+        channel: a grpc.aio.Channel instance.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    loop.create_task(channel.close())
@@ -0,0 +1,374 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Creates trees of related resources with GoogleAdsService.mutate.
+
+An AtomicMutateBuilder gives every created resource a temp resource name, so
+that resources can reference each other before they exist:
+
+    builder = AtomicMutateBuilder(customer_id)
+    budget = builder.create('campaign_budget')
+    budget.amount_micros.value = 500000
+    campaign = builder.create('campaign')
+    campaign.campaign_budget.value = budget.resource_name
+    ad_group = builder.create('ad_group')
+    ad_group.campaign.value = campaign.resource_name
+
+    builder.mutate(ga_service)
+    print(campaign.resource_name)
+
+Operations that reference each other, directly or not, are sent in the same
+request, so that they're created atomically, and requests are packed with
+as many independent trees as their limits allow. Once a request completes,
+temp resource names are replaced by the real resource names everywhere in
+the builder's operations, including the resources returned by create.
+"""
+
+import logging
+import threading
+from importlib import import_module
+
+from google.ads.google_ads import client as client_module
+from google.ads.google_ads import mutate_plan
+from google.ads.google_ads import util
+from google.ads.google_ads.batching import MAX_OPERATIONS
+
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Collections of the resources whose IDs can be temp IDs, by the field of
+# their operation in a MutateOperation. Other resources, such as ad group ads
+# and criteria, have composite IDs and are created without a resource name.
+_TEMP_NAME_COLLECTIONS = {
+    'ad_group_operation': 'adGroups',
+    'asset_operation': 'assets',
+    'bidding_strategy_operation': 'biddingStrategies',
+    'campaign_budget_operation': 'campaignBudgets',
+    'campaign_operation': 'campaigns',
+    'conversion_action_operation': 'conversionActions',
+    'extension_feed_item_operation': 'extensionFeedItems',
+    'feed_operation': 'feeds',
+    'label_operation': 'labels',
+    'media_file_operation': 'mediaFiles',
+    'remarketing_action_operation': 'remarketingActions',
+    'shared_set_operation': 'sharedSets',
+    'user_list_operation': 'userLists',
+}
+
+
+class TempResourceNameAllocator(object):
+    """Allocates temp resource names with unique negative IDs.
+
+    Temp IDs must be unique within a request, even across resource types. An
+    allocator can be shared by builders whose operations are sent together.
+    """
+
+    def __init__(self, start=-1):
+        """Initializer.
+
+        Args:
+            start: a negative int of the first temp ID.
+
+        Raises:
+            ValueError: If start isn't negative.
+        """
+        if start >= 0:
+            raise ValueError('Temp IDs must be negative, got %s.' % start)
+
+        self._next_id = start
+        self._lock = threading.Lock()
+
+    def allocate(self, customer_id, collection):
+        """Returns a new temp resource name.
+
+        Args:
+            customer_id: a str customer ID.
+            collection: a str resource collection such as "campaigns".
+
+        Returns:
+            A str such as "customers/123/campaigns/-1".
+        """
+        with self._lock:
+            temp_id = self._next_id
+            self._next_id -= 1
+
+        return 'customers/%s/%s/%d' % (customer_id, collection, temp_id)
+
+
+class AtomicMutateBuilder(object):
+    """Builds GoogleAdsService.mutate requests of related resources."""
+
+    def __init__(self, customer_id, max_operations=MAX_OPERATIONS,
+                 max_bytes=_DEFAULT_MAX_BYTES, allocator=None, version=None):
+        """Initializer for the AtomicMutateBuilder.
+
+        Args:
+            customer_id: a str ID of the customer whose resources are mutated.
+            max_operations: an int of the maximum number of operations per
+                request, up to MAX_OPERATIONS.
+            max_bytes: an int of the maximum serialized size of the
+                operations of a request.
+            allocator: an optional TempResourceNameAllocator. If None the
+                builder uses its own.
+            version: an optional str indicating the version of the Google Ads
+                API to use, which defaults to the client's default version.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if not 1 <= max_operations <= MAX_OPERATIONS:
+            raise ValueError('max_operations must be between 1 and %d, got %s.'
+                             % (MAX_OPERATIONS, max_operations))
+
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1.')
+
+        self.customer_id = customer_id
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.allocator = allocator or TempResourceNameAllocator()
+        self.operations = []
+        # Real resource names by the temp resource names they replaced.
+        self.resource_names = {}
+        self._version = version or client_module._DEFAULT_VERSION
+        self._mutate_operation_type = import_module(
+            'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+            % self._version).MutateOperation
+
+    def create(self, resource_type):
+        """Adds an operation creating a resource.
+
+        Args:
+            resource_type: a str such as "campaign_budget", the name of the
+                resource's operation field in a MutateOperation, with or
+                without its "_operation" suffix.
+
+        Returns:
+            The resource message of the create operation, whose
+            resource_name is a temp resource name if the resource type
+            supports them.
+
+        Raises:
+            ValueError: If the resource type can't be mutated with
+                GoogleAdsService.mutate or can't be created.
+        """
+        field_name = (resource_type if resource_type.endswith('_operation')
+                      else '%s_operation' % resource_type)
+        field = self._mutate_operation_type.DESCRIPTOR.fields_by_name.get(
+            field_name)
+
+        if field is None or 'create' not in field.message_type.fields_by_name:
+            raise ValueError('"%s" resources cannot be created with '
+                             'GoogleAdsService.mutate.' % resource_type)
+
+        operation = self._mutate_operation_type()
+        resource = getattr(operation, field_name).create
+        collection = _TEMP_NAME_COLLECTIONS.get(field_name)
+
+        if collection:
+            resource.resource_name = self.allocator.allocate(self.customer_id,
+                                                             collection)
+        else:
+            # Sets the create operation, even if the resource stays empty.
+            resource.SetInParent()
+
+        self.operations.append(operation)
+        return resource
+
+    def add(self, mutate_operation):
+        """Adds an operation, such as an update of an existing resource.
+
+        Args:
+            mutate_operation: a MutateOperation message. Its temp resource
+                names are replaced by real names like those of created
+                resources.
+
+        Returns:
+            The given MutateOperation.
+        """
+        self.operations.append(mutate_operation)
+        return mutate_operation
+
+    def get_requests(self):
+        """Splits the operations into the fewest requests that fit the limits.
+
+        Operations connected by resource names are kept in the same request,
+        unless together they exceed the limits, in which case they're split
+        into consecutive requests, in their original order.
+
+        Returns:
+            A list of lists of MutateOperation messages, in the order they
+            must be sent.
+        """
+        return [[self.operations[index] for index in indexes]
+                for indexes in self._get_request_indexes()]
+
+    def mutate(self, service, **kwargs):
+        """Sends the operations and resolves their temp resource names.
+
+        Operations of each request are grouped by resource type, see
+        mutate_plan.MutatePlan. If a request fails, the requests before it
+        remain applied, and their resource names are resolved.
+
+        Args:
+            service: a GoogleAdsService client.
+            kwargs: other arguments of GoogleAdsService.mutate.
+
+        Returns:
+            A list of the MutateGoogleAdsResponse of each request, with the
+            results in the order of get_requests.
+        """
+        responses = []
+
+        for operations in self.get_requests():
+            response = mutate_plan.mutate(service, self.customer_id,
+                                          operations, version=self._version,
+                                          **kwargs)
+            self._resolve(operations, response)
+            responses.append(response)
+
+        return responses
+
+    def _get_request_indexes(self):
+        """Returns the indexes of the operations of each request."""
+        components = _get_components(
+            mutate_plan.get_dependencies(self.operations))
+        sizes = [util.get_encoded_size(operation)
+                 for operation in self.operations]
+        requests = []
+        items = []
+
+        for component in components:
+            chunks = self._split(component, sizes)
+
+            if len(chunks) > 1:
+                _logger.warning('%d related operations exceed the limits of '
+                                'a request and are sent in %d requests, which '
+                                'aren\'t atomic.', len(component),
+                                len(chunks))
+                requests.extend(chunks[:-1])
+
+            items.append(chunks[-1])
+
+        # First fit decreasing, which packs the independent components into
+        # few requests after the requests of split components.
+        bins = []
+
+        for item in sorted(items, key=len, reverse=True):
+            size = sum(sizes[index] for index in item)
+
+            for request in bins:
+                if (len(request[0]) + len(item) <= self.max_operations
+                        and request[1] + size <= self.max_bytes):
+                    request[0].extend(item)
+                    request[1] += size
+                    break
+            else:
+                bins.append([list(item), size])
+
+        requests.extend(sorted(indexes) for indexes, _ in bins)
+        return requests
+
+    def _split(self, indexes, sizes):
+        """Splits sorted operation indexes into chunks within the limits."""
+        chunks = [[]]
+        size = 0
+
+        for index in indexes:
+            if chunks[-1] and (len(chunks[-1]) >= self.max_operations
+                               or size + sizes[index] > self.max_bytes):
+                chunks.append([])
+                size = 0
+
+            chunks[-1].append(index)
+            size += sizes[index]
+
+        return chunks
+
+    def _resolve(self, operations, response):
+        """Replaces the temp resource names created by a request."""
+        names = {}
+
+        for operation, result in zip(operations,
+                                     response.mutate_operation_responses):
+            temp_name = mutate_plan.get_target_resource_name(operation)
+            result_type = result.WhichOneof('response')
+
+            if temp_name and result_type:
+                name = getattr(result, result_type).resource_name
+
+                if name and name != temp_name:
+                    names[temp_name] = name
+
+        if names:
+            self.resource_names.update(names)
+
+            for operation in self.operations:
+                _replace_strings(operation, names)
+
+
+def _get_components(dependencies):
+    """Groups operations connected by dependencies.
+
+    Args:
+        dependencies: a list with a set of int indexes of earlier operations
+            per operation.
+
+    Returns:
+        A list of sorted lists of int operation indexes, ordered by their
+        first index.
+    """
+    parents = list(range(len(dependencies)))
+
+    def find(index):
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+
+        return index
+
+    for index, depends_on in enumerate(dependencies):
+        for dependency in depends_on:
+            parents[find(index)] = find(dependency)
+
+    components = {}
+
+    for index in range(len(dependencies)):
+        components.setdefault(find(index), []).append(index)
+
+    return sorted(components.values())
+
+
+def _replace_strings(message, names):
+    """Replaces string values of a message and its submessages in place.
+
+    Args:
+        message: a protobuf message.
+        names: a dict mapping the str values to replace to their replacement.
+    """
+    for field, value in message.ListFields():
+        if field.type == field.TYPE_MESSAGE:
+            if field.label == field.LABEL_REPEATED:
+                for item in value:
+                    _replace_strings(item, names)
+            else:
+                _replace_strings(value, names)
+        elif field.type == field.TYPE_STRING:
+            if field.label == field.LABEL_REPEATED:
+                for index, item in enumerate(value):
+                    if item in names:
+                        value[index] = names[item]
+            elif value in names:
+                setattr(message, field.name, names[value])
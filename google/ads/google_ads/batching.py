@@ -0,0 +1,318 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batches operations from many callers into few mutate requests."""
+
+import logging
+import threading
+import time
+from concurrent import futures
+
+from google.ads.google_ads import partial_failure as partial_failure_module
+from google.ads.google_ads import util
+from google.ads.google_ads.errors import MutateOperationError
+
+
+_logger = logging.getLogger(__name__)
+
+# The Google Ads API accepts at most 5,000 operations per mutate request.
+MAX_OPERATIONS = 5000
+_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+
+class BatchingMutator(object):
+    """Gathers operations into batched requests of a mutate method.
+
+    Operations can be added from any number of threads. They are buffered per
+    customer ID and sent in a single request once a buffer holds max_operations
+    operations, once adding an operation would take it over max_bytes, or once
+    its oldest operation has waited max_delay seconds:
+
+        service = client.get_service('AdGroupCriterionService')
+
+        with BatchingMutator(service.mutate_ad_group_criteria) as mutator:
+            future = mutator.add(customer_id, operation)
+            ...
+
+        print(future.result().resource_name)
+
+    Each operation gets a concurrent.futures.Future of its result. Requests are
+    made with partial failure enabled by default, so that an invalid
+    operation only fails its own future, with a MutateOperationError.
+
+    Requests of count and size flushes are made on the thread adding the
+    operation that triggered them, which slows producers down to the rate at
+    which requests complete. Requests of time flushes are made on a
+    background thread.
+    """
+
+    def __init__(self, mutate, max_operations=1000,
+                 max_bytes=_DEFAULT_MAX_BYTES, max_delay=1.0,
+                 partial_failure=True, version=None, clock=time.monotonic):
+        """Initializer for the BatchingMutator.
+
+        Args:
+            mutate: a service client mutate method taking a str customer ID,
+                a list of operations and a partial_failure keyword argument,
+                such as CampaignService.mutate_campaigns.
+            max_operations: an int of the maximum number of operations per
+                request, up to MAX_OPERATIONS.
+            max_bytes: an optional int of the maximum serialized size of the
+                operations of a request. An operation larger than max_bytes is
+                sent on its own. If None the size isn't limited.
+            max_delay: an optional float of the maximum number of seconds an
+                operation is buffered before it's sent. If None operations are
+                only sent once a buffer is full, or on flush and close.
+            partial_failure: a bool indicating whether requests are made with
+                partial failure enabled. If False an invalid operation fails
+                every operation of its request.
+            version: an optional str indicating the version of the Google Ads
+                API of the mutate method, which defaults to the client's
+                default version.
+            clock: a callable returning the current time in seconds.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if not 1 <= max_operations <= MAX_OPERATIONS:
+            raise ValueError('max_operations must be between 1 and %d, got %s.'
+                             % (MAX_OPERATIONS, max_operations))
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1.')
+
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError('max_delay must be positive.')
+
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.partial_failure = partial_failure
+        self._mutate = mutate
+        self._version = version
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._batches = {}
+        self._closed = False
+        self._stats = {'operations': 0, 'requests': 0, 'failed_operations': 0,
+                       'failed_requests': 0,
+                       'flushes': {'count': 0, 'bytes': 0, 'time': 0,
+                                   'flush': 0}}
+
+        if max_delay is not None:
+            self._timer = threading.Thread(target=self._flush_expired)
+            self._timer.daemon = True
+            self._timer.start()
+        else:
+            self._timer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, customer_id, operation):
+        """Adds an operation to the buffer of its customer ID.
+
+        Args:
+            customer_id: a str customer ID.
+            operation: an operation message of the mutate method.
+
+        Returns:
+            A concurrent.futures.Future of the operation's result message,
+            such as a MutateCampaignResult. If the operation fails its
+            exception is a MutateOperationError, or the exception of its
+            request if the whole request failed.
+
+        Raises:
+            ValueError: If the mutator is closed.
+        """
+        future = futures.Future()
+        size = util.get_encoded_size(operation) if self.max_bytes else 0
+        ready = []
+
+        with self._condition:
+            if self._closed:
+                raise ValueError('Operations cannot be added to a closed '
+                                 'BatchingMutator.')
+
+            batch = self._batches.get(customer_id)
+
+            if (batch and self.max_bytes
+                    and batch.size + size > self.max_bytes):
+                ready.append(self._pop_batch(customer_id, 'bytes'))
+                batch = None
+
+            if batch is None:
+                batch = _Batch(customer_id, self._get_deadline())
+                self._batches[customer_id] = batch
+                # The timer thread may be waiting without a deadline.
+                self._condition.notify()
+
+            batch.add(operation, future, size)
+            self._stats['operations'] += 1
+
+            if len(batch.operations) >= self.max_operations:
+                ready.append(self._pop_batch(customer_id, 'count'))
+
+        for batch in ready:
+            self._send(batch)
+
+        return future
+
+    def flush(self):
+        """Sends the buffered operations of every customer ID.
+
+        Returns once their requests have completed.
+        """
+        with self._condition:
+            ready = [self._pop_batch(customer_id, 'flush')
+                     for customer_id in list(self._batches)]
+
+        for batch in ready:
+            self._send(batch)
+
+    def close(self):
+        """Sends the buffered operations and stops accepting new ones."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self.flush()
+
+        if self._timer:
+            self._timer.join()
+
+    def get_stats(self):
+        """Returns statistics about the batched operations.
+
+        Returns:
+            A dict with the number of "operations" added, the number of
+            "requests" made, the numbers of "failed_operations" and
+            "failed_requests", and the number of "flushes" by reason, a dict
+            with the keys "count", "bytes", "time" and "flush".
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['flushes'] = dict(self._stats['flushes'])
+            return stats
+
+    def _get_deadline(self):
+        if self.max_delay is None:
+            return None
+
+        return self._clock() + self.max_delay
+
+    def _pop_batch(self, customer_id, reason):
+        """Removes the batch of a customer ID, recording why it's flushed.
+
+        Must be called with the lock held.
+        """
+        self._stats['flushes'][reason] += 1
+        return self._batches.pop(customer_id)
+
+    def _flush_expired(self):
+        """Sends batches whose deadline has passed, until closed."""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    deadlines = [batch.deadline
+                                 for batch in self._batches.values()]
+                    timeout = (min(deadlines) - self._clock() if deadlines
+                               else None)
+
+                    if timeout is not None and timeout <= 0:
+                        break
+
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+
+                now = self._clock()
+                ready = [self._pop_batch(customer_id, 'time')
+                         for customer_id, batch in list(self._batches.items())
+                         if batch.deadline <= now]
+
+            for batch in ready:
+                self._send(batch)
+
+    def _send(self, batch):
+        """Makes the request of a batch and completes its futures."""
+        operations = []
+        pending = []
+
+        for operation, future in zip(batch.operations, batch.futures):
+            # Operations whose future was cancelled aren't sent.
+            if future.set_running_or_notify_cancel():
+                operations.append(operation)
+                pending.append(future)
+
+        if not operations:
+            return
+
+        try:
+            response = self._mutate(batch.customer_id, operations,
+                                    partial_failure=self.partial_failure)
+        except Exception as exception:
+            _logger.warning('Mutate request of %d operations for customer ID '
+                            '%s failed: %s', len(operations),
+                            batch.customer_id, exception)
+            self._record_request(len(operations), failed_request=True)
+
+            for future in pending:
+                future.set_exception(exception)
+            return
+
+        errors = partial_failure_module.get_operation_errors(
+            response, version=self._version)
+        unindexed = errors.pop(None, ())
+
+        for error in unindexed:
+            _logger.warning('Partial failure error without an operation '
+                            'index: %s', error.message)
+
+        self._record_request(len(errors))
+
+        for index, future in enumerate(pending):
+            if index in errors:
+                future.set_exception(
+                    MutateOperationError(errors[index], index))
+            else:
+                future.set_result(response.results[index])
+
+    def _record_request(self, failed_operations, failed_request=False):
+        with self._condition:
+            self._stats['requests'] += 1
+            self._stats['failed_operations'] += failed_operations
+
+            if failed_request:
+                self._stats['failed_requests'] += 1
+
+
+class _Batch(object):
+    """The buffered operations of a customer ID."""
+
+    def __init__(self, customer_id, deadline):
+        self.customer_id = customer_id
+        self.deadline = deadline
+        self.operations = []
+        self.futures = []
+        self.size = 0
+
+    def add(self, operation, future, size):
+        self.operations.append(operation)
+        self.futures.append(future)
+        self.size += size
+
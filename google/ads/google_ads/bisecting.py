@@ -0,0 +1,265 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sends many operations in as few mutate requests as the API accepts."""
+
+import collections
+import logging
+import threading
+from importlib import import_module
+
+from google.ads.google_ads import client as client_module
+from google.ads.google_ads import partial_failure
+from google.ads.google_ads import retry as retry_module
+from google.ads.google_ads import util
+from google.ads.google_ads.batching import MAX_OPERATIONS
+from google.ads.google_ads.errors import GoogleAdsException
+
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Error codes of requests rejected for their size, which may succeed in
+# smaller requests.
+_SIZE_ERROR_CODES = frozenset([
+    'request_error.TOO_MANY_MUTATE_OPERATIONS',
+    'size_limit_error.REQUEST_SIZE_LIMIT_EXCEEDED',
+    'size_limit_error.RESPONSE_SIZE_LIMIT_EXCEEDED',
+])
+
+
+class BisectingMutator(object):
+    """Sends operations of a mutate method in requests that fit its limits.
+
+    Operations are packed in their order into requests of at most
+    max_operations operations and max_bytes bytes, estimated with ByteSize
+    before sending. A request rejected for its size is split in half, and its
+    halves are sent in its place, recursively, so that operations aren't
+    sent in smaller requests than needed:
+
+        mutator = BisectingMutator(service.mutate_ad_group_criteria)
+        response = mutator.mutate(customer_id, operations,
+                                  partial_failure=True)
+
+    The responses of the requests are merged into a single response, whose
+    results and partial failure error indexes match the given operations.
+    """
+
+    def __init__(self, mutate, max_operations=MAX_OPERATIONS,
+                 max_bytes=_DEFAULT_MAX_BYTES, version=None):
+        """Initializer for the BisectingMutator.
+
+        Args:
+            mutate: a service client mutate method taking a str customer ID
+                and a list of operations, such as
+                CampaignService.mutate_campaigns or GoogleAdsService.mutate.
+            max_operations: an int of the maximum number of operations per
+                request, up to MAX_OPERATIONS.
+            max_bytes: an int of the maximum serialized size of the
+                operations of a request. An operation larger than max_bytes is
+                sent on its own.
+            version: an optional str indicating the version of the Google Ads
+                API of the mutate method, which defaults to the client's
+                default version.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if not 1 <= max_operations <= MAX_OPERATIONS:
+            raise ValueError('max_operations must be between 1 and %d, got %s.'
+                             % (MAX_OPERATIONS, max_operations))
+
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1.')
+
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self._mutate = mutate
+        self._failure_type = import_module(
+            'google.ads.google_ads.%s.proto.errors.errors_pb2'
+            % (version or client_module._DEFAULT_VERSION)).GoogleAdsFailure
+        self._lock = threading.Lock()
+        self._stats = {'operations': 0, 'requests': 0, 'splits': 0}
+
+    def mutate(self, customer_id, operations, **kwargs):
+        """Sends operations in as few requests as they fit in.
+
+        Requests are made one at a time, in the order of the operations.
+
+        Args:
+            customer_id: a str customer ID.
+            operations: a non-empty list of operation messages of the mutate
+                method.
+            kwargs: other arguments of the mutate method, such as
+                partial_failure.
+
+        Returns:
+            A response message of the mutate method with a result per
+            operation, in their order, and a partial failure error holding
+            the errors of every request.
+
+        Raises:
+            ValueError: If operations is empty.
+            GoogleAdsException: If a request fails for another reason than
+                its size, or a single operation is too large. The requests
+                before it remain applied, and the indexes of its failure match
+                operations.
+        """
+        operations = list(operations)
+
+        if not operations:
+            raise ValueError('At least one operation is required.')
+
+        sizes = [util.get_encoded_size(operation) for operation in operations]
+        pending = collections.deque(self._pack(sizes))
+        responses = []
+
+        with self._lock:
+            self._stats['operations'] += len(operations)
+
+        while pending:
+            start, end = pending.popleft()
+
+            try:
+                response = self._send(customer_id, operations[start:end],
+                                      start, kwargs)
+            except Exception as exception:
+                if end - start < 2 or not is_size_error(exception):
+                    raise
+
+                middle = (start + end) // 2
+                _logger.info('Mutate request of %d operations is too large, '
+                             'splitting it in two.', end - start)
+                pending.extendleft([(middle, end), (start, middle)])
+
+                with self._lock:
+                    self._stats['splits'] += 1
+                continue
+
+            responses.append((start, response))
+
+        return self._merge(responses)
+
+    def get_stats(self):
+        """Returns statistics about the sent operations.
+
+        Returns:
+            A dict with the number of "operations" given, the number of
+            "requests" made, including rejected ones, and the number of
+            "splits" of rejected requests.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _pack(self, sizes):
+        """Returns (start, end) index ranges of requests within the limits."""
+        ranges = []
+        start = 0
+        size = 0
+
+        for index, operation_size in enumerate(sizes):
+            if index > start and (index - start >= self.max_operations or
+                                  size + operation_size > self.max_bytes):
+                ranges.append((start, index))
+                start = index
+                size = 0
+
+            size += operation_size
+
+        ranges.append((start, len(sizes)))
+        return ranges
+
+    def _send(self, customer_id, operations, offset, kwargs):
+        """Makes a request, shifting the indexes of its failure by offset."""
+        with self._lock:
+            self._stats['requests'] += 1
+
+        try:
+            return self._mutate(customer_id, operations, **kwargs)
+        except GoogleAdsException as exception:
+            if exception.failure is not None and offset:
+                _shift_indexes(exception.failure, offset)
+            raise
+
+    def _merge(self, responses):
+        """Merges responses of consecutive requests into one response.
+
+        Args:
+            responses: a list of (int index of the first operation, response)
+                tuples, in the order of the operations.
+
+        Returns:
+            A response message of the same type.
+        """
+        merged = type(responses[0][1])()
+        results = partial_failure.get_results(merged)
+        failure = self._failure_type()
+
+        for start, response in responses:
+            results.extend(partial_failure.get_results(response))
+            status = response.partial_failure_error
+
+            if not status.code:
+                continue
+
+            if not merged.partial_failure_error.code:
+                merged.partial_failure_error.code = status.code
+                merged.partial_failure_error.message = status.message
+
+            for detail in status.details:
+                if detail.Is(self._failure_type.DESCRIPTOR):
+                    request_failure = self._failure_type.FromString(
+                        detail.value)
+                    _shift_indexes(request_failure, start)
+                    failure.errors.extend(request_failure.errors)
+
+        if failure.errors:
+            merged.partial_failure_error.details.add().Pack(failure)
+
+        return merged
+
+
+def is_size_error(exception):
+    """Returns whether a request failed because it was too large.
+
+    Args:
+        exception: the exception of a failed mutate request.
+
+    Returns:
+        True if the request could succeed split into smaller requests.
+    """
+    failure = getattr(exception, 'failure', None)
+
+    if failure is not None and _SIZE_ERROR_CODES.intersection(
+            retry_module.get_google_ads_error_codes(failure)):
+        return True
+
+    # gRPC rejects messages larger than the channel's limits before they're
+    # sent, with a RESOURCE_EXHAUSTED status.
+    error = getattr(exception, 'error', exception)
+    code = getattr(error, 'code', None)
+    details = getattr(error, 'details', None)
+
+    return bool(callable(code) and callable(details) and
+                getattr(code(), 'name', None) == 'RESOURCE_EXHAUSTED' and
+                'larger than max' in (details() or ''))
+
+
+def _shift_indexes(failure, offset):
+    """Adds an offset to the operation indexes of a GoogleAdsFailure."""
+    for error in failure.errors:
+        path = error.location.field_path_elements
+
+        if path and path[0].HasField('index'):
+            path[0].index.value += offset
@@ -0,0 +1,187 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A pool of gRPC channels shared by the service clients of a client."""
+
+import threading
+import time
+
+_DEFAULT_POOL_SIZE = 1
+
+
+class ChannelPool(object):
+    """Shares a bounded number of gRPC channels between service clients.
+
+    Channels are grouped by endpoint and credentials, and each group holds at
+    most "size" channels. A channel is leased to a service client when it is
+    acquired and returned to the pool when it is released. New service clients
+    are given the least leased channel in their group, so all service clients
+    using the same endpoint and credentials are multiplexed over a small number
+    of HTTP/2 connections.
+
+    Channels that have no active leases and have not been used for longer than
+    "idle_timeout" seconds are closed the next time the pool is accessed, or
+    when evict_idle is called explicitly.
+    """
+
+    def __init__(self, size=_DEFAULT_POOL_SIZE, idle_timeout=None):
+        """Initializer for the ChannelPool.
+
+        Args:
+            size: an int indicating the maximum number of channels kept for
+                each endpoint and credentials pair.
+            idle_timeout: an optional number of seconds after which an unleased
+                channel is closed. If None idle channels are never evicted.
+
+        Raises:
+            ValueError: If the size is less than one or the idle_timeout is
+                negative.
+        """
+        if size < 1:
+            raise ValueError('The channel pool size must be at least 1.')
+
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError('The channel pool idle_timeout must not be '
+                             'negative.')
+
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # Maps (endpoint, credentials) keys to a list of _PooledChannels.
+        self._pools = {}
+        self._closed = False
+
+    def acquire(self, endpoint, credentials, create_channel):
+        """Leases a channel for the given endpoint and credentials.
+
+        Args:
+            endpoint: a str of the address the channel connects to.
+            credentials: a google.auth.credentials.Credentials instance.
+            create_channel: a callable taking no arguments that returns a new
+                grpc.Channel. It is only called if the pool needs to grow.
+
+        Returns:
+            A grpc.Channel instance that must be given back with release once
+            it is no longer in use.
+
+        Raises:
+            ValueError: If the pool has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError('Cannot acquire a channel from a closed '
+                                 'ChannelPool.')
+
+            self._evict_idle_locked()
+            pooled_channels = self._pools.setdefault(
+                (endpoint, credentials), [])
+            pooled = min(pooled_channels, key=lambda p: p.leases,
+                         default=None)
+
+            if pooled is None or (pooled.leases and
+                                  len(pooled_channels) < self.size):
+                pooled = _PooledChannel(create_channel())
+                pooled_channels.append(pooled)
+
+            pooled.leases += 1
+            pooled.last_used = time.monotonic()
+            return pooled.channel
+
+    def release(self, channel):
+        """Returns a leased channel to the pool.
+
+        Releasing a channel that is not part of the pool, for example because
+        it was already evicted or the pool was closed, has no effect.
+
+        Args:
+            channel: a grpc.Channel previously returned by acquire.
+        """
+        with self._lock:
+            for pooled_channels in self._pools.values():
+                for pooled in pooled_channels:
+                    if pooled.channel is channel and pooled.leases:
+                        pooled.leases -= 1
+                        pooled.last_used = time.monotonic()
+                        return
+
+    def evict_idle(self):
+        """Closes channels that have been unleased for too long.
+
+        Returns:
+            An int of the number of channels that were closed.
+        """
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self):
+        """Closes idle channels; the caller must hold the pool lock.
+
+        Returns:
+            An int of the number of channels that were closed.
+        """
+        if self.idle_timeout is None:
+            return 0
+
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = 0
+
+        for key in list(self._pools):
+            kept = []
+            for pooled in self._pools[key]:
+                if not pooled.leases and pooled.last_used <= deadline:
+                    pooled.channel.close()
+                    evicted += 1
+                else:
+                    kept.append(pooled)
+
+            if kept:
+                self._pools[key] = kept
+            else:
+                del self._pools[key]
+
+        return evicted
+
+    def get_stats(self):
+        """Returns a summary of the channels currently held by the pool.
+
+        Returns:
+            A dict with the number of open "channels" and active "leases".
+        """
+        with self._lock:
+            pooled = [p for ps in self._pools.values() for p in ps]
+            return {'channels': len(pooled),
+                    'leases': sum(p.leases for p in pooled)}
+
+    def close(self):
+        """Closes every channel in the pool.
+
+        Service clients still holding channels from the pool can't be used
+        after the pool is closed, and no further channels can be acquired.
+        """
+        with self._lock:
+            self._closed = True
+            for pooled_channels in self._pools.values():
+                for pooled in pooled_channels:
+                    pooled.channel.close()
+            self._pools.clear()
+
+
+class _PooledChannel(object):
+    """A channel held by a ChannelPool along with its lease bookkeeping."""
+
+    __slots__ = ('channel', 'leases', 'last_used')
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.leases = 0
+        self.last_used = time.monotonic()
@@ -13,27 +13,47 @@
 # limitations under the License.
 """A client and common configurations for the Google Ads API."""
 
+import atexit
+import functools
 import logging
 import logging.config
+import logging.handlers
 import json
+import queue
+import random
+import threading
+import time
+import weakref
 import grpc
 from collections import namedtuple
 from importlib import import_module
 
+import google.api_core.gapic_v1.method
+from google.api_core import page_iterator
 from google.protobuf.message import DecodeError
 
 from google.ads.google_ads import config
 from google.ads.google_ads import oauth2
+from google.ads.google_ads import rate_limit
+from google.ads.google_ads import retry as retry_module
+from google.ads.google_ads import util
 from google.ads.google_ads.errors import GoogleAdsException
 
 _logger = logging.getLogger(__name__)
 
 _SERVICE_CLIENT_TEMPLATE = '%sClient'
 _SERVICE_GRPC_TRANSPORT_TEMPLATE = '%sGrpcTransport'
+_FUTURE_METHOD_TEMPLATE = '%s_future'
 _PROTO_TEMPLATE = '%s_pb2'
 _VALID_API_VERSIONS = ['v2', 'v1']
 _DEFAULT_VERSION = _VALID_API_VERSIONS[0]
 _REQUEST_ID_KEY = 'request-id'
+# Message classes returned by get_type, keyed by API version and type name.
+_type_registry = {}
+# The logger whose records enable_async_logging hands to a background thread.
+_LOGGER_PACKAGE = 'google.ads.google_ads'
+_async_logging = None
+_async_logging_lock = threading.Lock()
 GRPC_CHANNEL_OPTIONS = [
     ('grpc.max_metadata_size', 16 * 1024 * 1024),
     ('grpc.max_receive_message_length', 64 * 1024 * 1024)]
@@ -59,7 +79,9 @@ class GoogleAdsClient(object):
                 'developer_token': config_data.get('developer_token'),
                 'endpoint': config_data.get('endpoint'),
                 'login_customer_id': config_data.get('login_customer_id'),
-                'logging_config': config_data.get('logging')}
+                'logging_config': config_data.get('logging'),
+                'rate_limits': config_data.get('rate_limits'),
+                'retry': config_data.get('retry')}
 
     @classmethod
     def load_from_env(cls):
@@ -120,6 +142,11 @@ class GoogleAdsClient(object):
     def get_type(cls, name, version=_DEFAULT_VERSION):
         """Returns the specified common, enum, error, or resource type.
 
+        Message classes are resolved once per version and kept in a registry,
+        so repeated calls only cost a dictionary lookup and the construction
+        of the message. To create copies of messages with pre-populated
+        fields instead, use a TypePrototypes instance.
+
         Args:
             name: a str indicating the name of the type that is being retrieved;
                 e.g. you may specify "CampaignOperation" to retrieve a
@@ -130,18 +157,19 @@ class GoogleAdsClient(object):
             A Message instance representing the desired type.
 
         Raises:
-            AttributeError: If the type for the specified name doesn't exist
+            ValueError: If the type for the specified name doesn't exist
                 in the given version.
         """
-        try:
-            message_type = getattr(_get_version(version).types, name)
-        except AttributeError:
-            raise ValueError('Specified type "{}" does not exist in Google Ads '
-                             'API %s.'.format(name, version))
+        message_type = (_type_registry.get((version, name)) or
+                        _resolve_type(name, version))
         return message_type()
 
     def __init__(self, credentials, developer_token, endpoint=None,
-                 login_customer_id=None, logging_config=None):
+                 login_customer_id=None, logging_config=None,
+                 channel_pool=None, service_cache_size=None,
+                 rate_limits=None, concurrency_limiter=None, retry=None,
+                 metrics_registry=None, logging_sample_rate=1.0,
+                 async_logging=False):
         """Initializer for the GoogleAdsClient.
 
         Args:
@@ -149,17 +177,81 @@ class GoogleAdsClient(object):
             developer_token: a str developer token.
             endpoint: a str specifying an optional alternative API endpoint.
             login_customer_id: a str specifying a login customer ID.
-            logging_config: a dict specifying logging config options.
+            logging_config: a dict specifying logging config options, which
+                is applied once with logging.config.dictConfig.
+            channel_pool: an optional channel_pool.ChannelPool instance used
+                to share gRPC channels between service clients. If None each
+                service client opens its own channel.
+            service_cache_size: an optional int enabling a cache of up to this
+                many service clients, keyed by service name, version and
+                login customer ID. If None service clients aren't cached.
+            rate_limits: an optional dict of rate limit options, see the
+                rate_limit module for details, or a rate_limit.RateLimiter
+                instance to share rate limits between clients. If None requests
+                aren't rate limited.
+            concurrency_limiter: an optional
+                concurrency_limit.AdaptiveConcurrencyLimiter instance shared by
+                all service clients retrieved from this client, which adapts
+                the number of in-flight requests per customer ID and method.
+                If None the number of in-flight requests isn't limited.
+            retry: an optional dict of retry options, see the retry module for
+                details, or a retry.Retrier instance to share a retry budget
+                between clients. If set it replaces the retries of the service
+                clients' method configs. If None the default retries of the
+                service clients are used.
+            metrics_registry: an optional metrics.MetricsRegistry instance
+                that records metrics about every request made by service
+                clients retrieved from this client.
+            logging_sample_rate: a float between 0 and 1 of the fraction of
+                successful requests that are logged. Failed requests are
+                always logged.
+            async_logging: a bool indicating whether log records are emitted
+                by a background thread, see enable_async_logging.
         """
         self.credentials = credentials
         self.developer_token = developer_token
         self.endpoint = endpoint
         self.login_customer_id = login_customer_id
         self.logging_config = logging_config
+        self.logging_sample_rate = logging_sample_rate
+        self.channel_pool = channel_pool
+        self._service_cache = (
+            util.LRUCache(service_cache_size, _release_cached_service)
+            if service_cache_size else None)
+
+        if isinstance(rate_limits, dict):
+            rate_limits = rate_limit.RateLimiter.from_config(rate_limits)
+
+        self.rate_limiter = rate_limits
+        self.concurrency_limiter = concurrency_limiter
+
+        if isinstance(retry, dict):
+            retry = retry_module.Retrier.from_config(retry)
+
+        self.retrier = retry
+        self.metrics_registry = metrics_registry
+
+        if logging_config:
+            logging.config.dictConfig(logging_config)
+
+        if async_logging:
+            enable_async_logging()
 
     def get_service(self, name, version=_DEFAULT_VERSION):
         """Returns a service client instance for the specified service_name.
 
+        Each method of the returned service client has a non-blocking
+        variant with a "_future" suffix, e.g. mutate_campaigns_future, that
+        accepts the same arguments and returns a grpc.Future. Paged methods
+        such as search_future resolve to the first response page, and
+        long-running methods resolve to the google.longrunning Operation
+        message.
+
+        If the client was initialized with a service_cache_size, service
+        clients are reused for the same service name, version and
+        login_customer_id. When a cached service client is evicted its channel
+        is closed, or given back to the channel pool if one is used.
+
         Args:
             name: a str indicating the name of the service for which a
                 service client is being retrieved; e.g. you may specify
@@ -173,40 +265,192 @@ class GoogleAdsClient(object):
         Raises:
             AttributeError: If the specified name doesn't exist.
         """
-        api_module = _get_version(version)
+        if self._service_cache is None:
+            service, _ = self._create_service(name, version)
+            return service
 
-        try:
-            service_client = getattr(api_module,
-                                     _SERVICE_CLIENT_TEMPLATE % name)
-        except AttributeError:
-            raise ValueError('Specified service "%s" does not exist in Google '
-                             'Ads API %s.' % (name, version))
+        key = (name, version, self.login_customer_id)
+        cached = self._service_cache.get(key)
 
-        try:
-            service_transport_class = getattr(
-                api_module, _SERVICE_GRPC_TRANSPORT_TEMPLATE % name)
-        except AttributeError:
-            raise ValueError('Grpc transport does not exist for the specified '
-                             'service "%s".' % name)
+        if cached is None:
+            created = self._create_service(name, version)
+            # Another thread may have cached the same service meanwhile, in
+            # which case its service client is kept, since it may already be
+            # in use, and the one just created is released.
+            cached = self._service_cache.setdefault(key, created)
+
+            if cached is not created:
+                created[1]()
+
+        return cached[0]
+
+    def _create_service(self, name, version):
+        """Creates a service client along with a callable that releases it.
+
+        Args:
+            name: a str indicating the name of the service.
+            version: a str indicating the version of the Google Ads API.
+
+        Returns:
+            A tuple of the service client and a callable taking no arguments
+            that closes the service client's channel, or gives it back to the
+            channel pool.
+
+        Raises:
+            ValueError: If the specified name or version doesn't exist.
+        """
+        service_client, service_transport_class = _get_service_classes(
+            name, version)
 
         endpoint = (self.endpoint if self.endpoint
                     else service_client.SERVICE_ADDRESS)
 
-        channel = service_transport_class.create_channel(
+        create_channel = functools.partial(
+            service_transport_class.create_channel,
             address=endpoint,
             credentials=self.credentials,
             options=GRPC_CHANNEL_OPTIONS)
 
-        channel = grpc.intercept_channel(
-            channel,
+        if self.channel_pool:
+            base_channel = self.channel_pool.acquire(
+                endpoint, self.credentials, create_channel)
+        else:
+            base_channel = create_channel()
+
+        interceptors = [
             MetadataInterceptor(self.developer_token, self.login_customer_id),
-            LoggingInterceptor(self.logging_config, endpoint),
-            ExceptionInterceptor(version)
-        )
+            LoggingInterceptor(endpoint=endpoint,
+                               sample_rate=self.logging_sample_rate),
+            ExceptionInterceptor(version)]
+
+        if self.metrics_registry:
+            interceptors.insert(0, MetricsInterceptor(self.metrics_registry,
+                                                      version))
+
+        if self.concurrency_limiter:
+            interceptors.insert(0, ConcurrencyLimitInterceptor(
+                self.concurrency_limiter))
+
+        if self.rate_limiter:
+            interceptors.insert(0, RateLimitInterceptor(
+                self.rate_limiter, self.developer_token))
+
+        if self.retrier:
+            interceptors.insert(0, RetryInterceptor(
+                self.retrier, version, self.metrics_registry))
+
+        channel = grpc.intercept_channel(base_channel, *interceptors)
 
         service_transport = service_transport_class(channel=channel)
+        service = service_client(transport=service_transport)
+        _add_future_methods(service)
+
+        if self.retrier:
+            # The RetryInterceptor retries failed requests instead, and
+            # retrying in both places would multiply the attempts.
+            for method_name, method_config in service._method_configs.items():
+                service._method_configs[method_name] = method_config._replace(
+                    retry=None)
+
+        if self.channel_pool:
+            # Hand the channel back to the pool once the service client is
+            # garbage collected so that it can be evicted when idle. The
+            # finalizer runs at most once, so it can also be called early.
+            release = weakref.finalize(
+                service, self.channel_pool.release, base_channel)
+        else:
+            release = base_channel.close
+
+        return service, release
+
+    def close(self):
+        """Closes the channels held by this client.
+
+        Cached service clients and service clients that were retrieved from
+        this client with a channel pool can't be used after it is closed.
+        """
+        if self._service_cache is not None:
+            self._service_cache.clear()
+
+        if self.channel_pool:
+            self.channel_pool.close()
 
-        return service_client(transport=service_transport)
+
+class TypePrototypes(object):
+    """Creates messages as copies of pre-populated template messages.
+
+    This is useful when many messages share the same default fields, for
+    example operations creating campaigns with the same status and bidding
+    strategy. Prototypes only apply to messages created by the instance they
+    are set on, so GoogleAdsClient.get_type keeps returning empty messages:
+
+        prototypes = TypePrototypes()
+        prototypes.set_prototype('CampaignOperation', template)
+        operation = prototypes.get_type('CampaignOperation')
+    """
+
+    def __init__(self, version=_DEFAULT_VERSION):
+        """Initializer for the TypePrototypes.
+
+        Args:
+            version: a str indicating the the Google Ads API version to be used.
+        """
+        self.version = version
+        self._prototypes = {}
+
+    def set_prototype(self, name, prototype):
+        """Sets the template message copied by get_type for the given type.
+
+        The prototype is copied when it is set, so changing it afterwards has
+        no effect.
+
+        Args:
+            name: a str indicating the name of the type; e.g. you may specify
+                "CampaignOperation".
+            prototype: a Message instance of the given type, or None to remove
+                the prototype so that get_type returns empty messages again.
+
+        Raises:
+            ValueError: If the type for the specified name doesn't exist, or if
+                the prototype is of a different type.
+        """
+        if prototype is None:
+            self._prototypes.pop(name, None)
+            return
+
+        message_type = (_type_registry.get((self.version, name)) or
+                        _resolve_type(name, self.version))
+
+        if not isinstance(prototype, message_type):
+            raise ValueError('Prototype for type "%s" must be a %s instance, '
+                             'not %s.' % (name, message_type.__name__,
+                                          type(prototype).__name__))
+
+        message = message_type()
+        message.CopyFrom(prototype)
+        self._prototypes[name] = message
+
+    def get_type(self, name):
+        """Returns a copy of the prototype of the given type.
+
+        Args:
+            name: a str indicating the name of the type; e.g. you may specify
+                "CampaignOperation".
+
+        Returns:
+            A Message instance of the given type, holding the fields of its
+            prototype, or empty if the type has no prototype.
+
+        Raises:
+            ValueError: If the type for the specified name doesn't exist.
+        """
+        message = GoogleAdsClient.get_type(name, self.version)
+        prototype = self._prototypes.get(name)
+
+        if prototype is not None:
+            message.CopyFrom(prototype)
+
+        return message
 
 
 class ExceptionInterceptor(grpc.UnaryUnaryClientInterceptor):
@@ -243,10 +487,10 @@ class ExceptionInterceptor(grpc.UnaryUnaryClientInterceptor):
             for kv in trailing_metadata:
                 if kv[0] == self._failure_key:
                     try:
-                        error_protos = import_module(
-                            'google.ads.google_ads.%s.proto.errors' %
+                        errors_pb2 = import_module(
+                            'google.ads.google_ads.%s.proto.errors.errors_pb2' %
                                 self._version)
-                        ga_failure = error_protos.errors_pb2.GoogleAdsFailure()
+                        ga_failure = errors_pb2.GoogleAdsFailure()
                         ga_failure.ParseFromString(kv[1])
                         return ga_failure
                     except DecodeError:
@@ -314,6 +558,12 @@ class ExceptionInterceptor(grpc.UnaryUnaryClientInterceptor):
                 status code of INTERNAL or RESOURCE_EXHAUSTED.
         """
         response = continuation(client_call_details, request)
+
+        if not response.done():
+            # The request was made with future(), so failures are translated
+            # once it completes instead of blocking until then.
+            return _GoogleAdsFuture(response, self._handle_grpc_failure)
+
         exception = response.exception()
 
         if exception:
@@ -335,14 +585,26 @@ class LoggingInterceptor(grpc.UnaryUnaryClientInterceptor):
                          'Method: {}, RequestId: {}, IsFault: {}, '
                          'FaultMessage: {}')
 
-    def __init__(self, logging_config=None, endpoint=None):
+    def __init__(self, logging_config=None, endpoint=None, sample_rate=1.0):
         """Initializer for the LoggingInterceptor.
 
         Args:
-            logging_config: configuration dict for logging.
+            logging_config: configuration dict for logging. GoogleAdsClient
+                applies its logging configuration once and doesn't pass it to
+                its interceptors.
             endpoint: a str specifying an optional alternative API endpoint.
+            sample_rate: a float between 0 and 1 of the fraction of successful
+                requests that are logged. Failed requests are always logged.
+
+        Raises:
+            ValueError: If the sample_rate is out of range.
         """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be between 0 and 1, got %s.'
+                             % sample_rate)
+
         self.endpoint = endpoint
+        self.sample_rate = sample_rate
         if logging_config:
             logging.config.dictConfig(logging_config)
 
@@ -458,76 +720,96 @@ class LoggingInterceptor(grpc.UnaryUnaryClientInterceptor):
             except AttributeError:
                 return None
 
-    def _log_successful_request(self, method, customer_id, metadata_json,
-                                request_id, request, trailing_metadata_json,
+    def _log_successful_request(self, method, customer_id, initial_metadata,
+                                request_id, request, trailing_metadata,
                                 response):
         """Handles logging of a successful request.
 
+        Messages are only formatted if a handler emits them.
+
         Args:
             method: The method of the request.
             customer_id: The customer ID associated with the request.
-            metadata_json: A JSON str of initial_metadata.
+            initial_metadata: A tuple of metadatum of the request.
             request_id: A unique ID for the request provided in the response.
             request: An instance of a request proto message.
-            trailing_metadata_json: A JSON str of trailing_metadata.
+            trailing_metadata: A tuple of metadatum of the response.
             response: A grpc.Call/grpc.Future instance.
         """
-        _logger.debug(self._FULL_REQUEST_LOG_LINE.format(method, self.endpoint,
-                      metadata_json, request, trailing_metadata_json,
-                      response.result()))
-
-        _logger.info(self._SUMMARY_LOG_LINE.format(customer_id, self.endpoint,
-                     method, request_id, False, None))
-
-    def _log_failed_request(self, method, customer_id, metadata_json,
-                            request_id, request, trailing_metadata_json,
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(_DeferredLogMessage(
+                self._FULL_REQUEST_LOG_LINE.format, method, self.endpoint,
+                _DeferredLogMessage(_parse_metadata_to_json, initial_metadata),
+                request,
+                _DeferredLogMessage(_parse_metadata_to_json, trailing_metadata),
+                _DeferredLogMessage(response.result)))
+
+        _logger.info(_DeferredLogMessage(
+            self._SUMMARY_LOG_LINE.format, customer_id, self.endpoint, method,
+            request_id, False, None))
+
+    def _log_failed_request(self, method, customer_id, initial_metadata,
+                            request_id, request, trailing_metadata,
                             response):
         """Handles logging of a failed request.
 
+        Messages are only formatted if a handler emits them.
+
         Args:
             method: The method of the request.
             customer_id: The customer ID associated with the request.
-            metadata_json: A JSON str of initial_metadata.
+            initial_metadata: A tuple of metadatum of the request.
             request_id: A unique ID for the request provided in the response.
             request: An instance of a request proto message.
-            trailing_metadata_json: A JSON str of trailing_metadata.
-            response: A JSON str of the the response message.
+            trailing_metadata: A tuple of metadatum of the response.
+            response: A grpc.Call/grpc.Future instance.
         """
-        exception_str = self._parse_exception_to_str(response.exception())
-        fault_message = self._get_fault_message(response.exception())
+        exception = response.exception()
 
-        _logger.info(self._FULL_FAULT_LOG_LINE.format(method, self.endpoint,
-                     metadata_json, request, trailing_metadata_json,
-                     exception_str))
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(_DeferredLogMessage(
+                self._FULL_FAULT_LOG_LINE.format, method, self.endpoint,
+                _DeferredLogMessage(_parse_metadata_to_json, initial_metadata),
+                request,
+                _DeferredLogMessage(_parse_metadata_to_json, trailing_metadata),
+                _DeferredLogMessage(self._parse_exception_to_str, exception)))
 
-        _logger.warning(self._SUMMARY_LOG_LINE.format(customer_id, self.endpoint,
-                        method, request_id, True, fault_message))
+        _logger.warning(_DeferredLogMessage(
+            self._SUMMARY_LOG_LINE.format, customer_id, self.endpoint, method,
+            request_id, True, self._get_fault_message(exception)))
 
     def _log_request(self, client_call_details, request, response):
         """Handles logging all requests.
 
+        Successful requests are only logged at the INFO level and below, so
+        nothing is done for them when INFO is disabled, or when they aren't
+        sampled.
+
         Args:
             client_call_details: An instance of grpc.ClientCallDetails.
             request: An instance of a request proto message.
             response: A grpc.Call/grpc.Future instance.
         """
+        failed = response.exception() is not None
+
+        if not failed and (not _logger.isEnabledFor(logging.INFO) or (
+                self.sample_rate < 1 and random.random() >= self.sample_rate)):
+            return
+
         method = self._get_call_method(client_call_details)
         customer_id = self._get_customer_id(request)
         initial_metadata = self._get_initial_metadata(client_call_details)
-        initial_metadata_json = _parse_metadata_to_json(initial_metadata)
         trailing_metadata = self._get_trailing_metadata(response)
         request_id = _get_request_id_from_metadata(trailing_metadata)
-        trailing_metadata_json = _parse_metadata_to_json(trailing_metadata)
 
-        if response.exception():
-            self._log_failed_request(method, customer_id, initial_metadata_json,
-                                     request_id, request,
-                                     trailing_metadata_json, response)
+        if failed:
+            self._log_failed_request(method, customer_id, initial_metadata,
+                                     request_id, request, trailing_metadata,
+                                     response)
         else:
             self._log_successful_request(method, customer_id,
-                                         initial_metadata_json, request_id,
-                                         request, trailing_metadata_json,
-                                         response)
+                                         initial_metadata, request_id,
+                                         request, trailing_metadata, response)
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """Intercepts and logs API interactions.
@@ -540,7 +822,13 @@ class LoggingInterceptor(grpc.UnaryUnaryClientInterceptor):
         response = continuation(client_call_details, request)
 
         if _logger.isEnabledFor(logging.WARNING):
-            self._log_request(client_call_details, request, response)
+            if response.done():
+                self._log_request(client_call_details, request, response)
+            else:
+                # Log requests made with future() once they complete.
+                response.add_done_callback(
+                    lambda response: self._log_request(
+                        client_call_details, request, response))
 
         return response
 
@@ -587,6 +875,368 @@ class MetadataInterceptor(grpc.UnaryUnaryClientInterceptor):
         return continuation(client_call_details, request)
 
 
+class RetryInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """An interceptor that retries requests that failed transiently."""
+
+    def __init__(self, retrier, version=_DEFAULT_VERSION,
+                 metrics_registry=None):
+        """Initializer for the RetryInterceptor.
+
+        Args:
+            retrier: a retry.Retrier instance.
+            version: a str of the API version of the request.
+            metrics_registry: an optional metrics.MetricsRegistry instance
+                that retries are recorded in.
+        """
+        self.retrier = retrier
+        self.metrics_registry = metrics_registry
+        self._exception_interceptor = ExceptionInterceptor(version)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Retries the request while its failures are retried by policy.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+        Requests made with future() aren't retried.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response,
+            which is the response of the last attempt.
+        """
+        attempt = 1
+        delay = None
+
+        while True:
+            self.retrier.record_request()
+            response = continuation(client_call_details, request)
+
+            if not response.done():
+                return response
+
+            exception = response.exception()
+
+            if exception is None:
+                return response
+
+            error_codes = _get_google_ads_error_codes(
+                exception, self._exception_interceptor)
+            error_codes.append(_get_status_name(exception))
+            delay = self.retrier.get_retry_delay(
+                error_codes, client_call_details.method,
+                attempt, delay)
+
+            if delay is None:
+                return response
+
+            if self.metrics_registry:
+                self.metrics_registry.record_retry(
+                    util.get_method_name(client_call_details.method))
+
+            self.retrier.sleep(delay)
+            attempt += 1
+
+
+class MetricsInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """An interceptor that records metrics about requests."""
+
+    def __init__(self, metrics_registry, version=_DEFAULT_VERSION):
+        """Initializer for the MetricsInterceptor.
+
+        Args:
+            metrics_registry: a metrics.MetricsRegistry instance.
+            version: a str of the API version of the request.
+        """
+        self.metrics_registry = metrics_registry
+        self._exception_interceptor = ExceptionInterceptor(version)
+
+    def _record(self, method, customer_id, request_bytes, start, response):
+        """Records the metrics of a completed request.
+
+        Args:
+            method: a str method name such as "GoogleAdsService/Search".
+            customer_id: the customer ID of the request, or None.
+            request_bytes: an int serialized size of the request, or None.
+            start: a float of the time the request was made.
+            response: a grpc.Call/grpc.Future instance that is done.
+        """
+        latency = time.monotonic() - start
+        exception = response.exception()
+
+        if exception is None:
+            result = response.result()
+            byte_size = getattr(result, 'ByteSize', None)
+            results = getattr(result, 'results', None)
+            self.metrics_registry.record_request(
+                method, 'OK', latency, customer_id=customer_id,
+                request_bytes=request_bytes,
+                response_bytes=byte_size() if byte_size else None,
+                results=len(results) if results is not None else None)
+        else:
+            self.metrics_registry.record_request(
+                method, _get_status_name(exception), latency,
+                customer_id=customer_id, request_bytes=request_bytes,
+                error_codes=_get_google_ads_error_codes(
+                    exception, self._exception_interceptor))
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Records the latency, sizes and outcome of the request.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+        Requests made with future() are recorded once they complete.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        method = util.get_method_name(client_call_details.method)
+        customer_id = getattr(request, 'customer_id', None)
+        byte_size = getattr(request, 'ByteSize', None)
+        request_bytes = byte_size() if byte_size else None
+        start = time.monotonic()
+
+        response = continuation(client_call_details, request)
+        record = functools.partial(self._record, method, customer_id,
+                                   request_bytes, start)
+
+        if response.done():
+            record(response)
+        else:
+            response.add_done_callback(record)
+
+        return response
+
+
+class RateLimitInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """An interceptor that waits for rate limits before making requests."""
+
+    def __init__(self, rate_limiter, developer_token):
+        """Initializer for the RateLimitInterceptor.
+
+        Args:
+            rate_limiter: a rate_limit.RateLimiter instance.
+            developer_token: a str developer token used for requests.
+        """
+        self.rate_limiter = rate_limiter
+        self.developer_token = developer_token
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Acquires the rate limits of the request before it's made.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+        Requests made with future() also wait for the rate limits in the
+        calling thread.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+
+        Raises:
+            RateLimitExceededError: If the rate limiter doesn't block, or the
+                request would have to wait longer than its timeout.
+        """
+        self.rate_limiter.acquire(
+            developer_token=self.developer_token,
+            customer_id=getattr(request, 'customer_id', None),
+            method=client_call_details.method)
+
+        return continuation(client_call_details, request)
+
+
+class ConcurrencyLimitInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """An interceptor that adapts the number of in-flight requests."""
+
+    def __init__(self, concurrency_limiter):
+        """Initializer for the ConcurrencyLimitInterceptor.
+
+        Args:
+            concurrency_limiter: a
+                concurrency_limit.AdaptiveConcurrencyLimiter instance.
+        """
+        self.concurrency_limiter = concurrency_limiter
+
+    def _release(self, permit, response):
+        """Releases the permit of a completed request.
+
+        Args:
+            permit: the permit acquired for the request.
+            response: a grpc.Call/grpc.Future instance that is done.
+        """
+        exception = response.exception()
+        code = getattr(exception, 'code', None)
+        dropped = (callable(code) and
+                   code() == grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.concurrency_limiter.release(permit, dropped=dropped)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Waits for the concurrency limit before making the request.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+        Requests made with future() also wait in the calling thread, and count
+        as in flight until they complete.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        permit = self.concurrency_limiter.acquire(
+            customer_id=getattr(request, 'customer_id', None),
+            method=client_call_details.method)
+
+        try:
+            response = continuation(client_call_details, request)
+        except Exception:
+            self.concurrency_limiter.release(permit)
+            raise
+
+        if response.done():
+            self._release(permit, response)
+        else:
+            response.add_done_callback(
+                functools.partial(self._release, permit))
+
+        return response
+
+
+class _GoogleAdsFuture(grpc.Future):
+    """A grpc.Future that translates failures into GoogleAdsExceptions.
+
+    Wraps the future of a request that hasn't completed yet. Once complete its
+    exception is converted the same way ExceptionInterceptor converts the
+    exceptions of blocking requests. Other attributes, such as the grpc.Call
+    methods, are taken from the wrapped future.
+    """
+
+    def __init__(self, future, handle_failure):
+        """Initializer for the _GoogleAdsFuture.
+
+        Args:
+            future: a grpc.Future/grpc.Call instance.
+            handle_failure: a callable accepting a failed future that raises
+                the exception it should be translated into.
+        """
+        self._future = future
+        self._handle_failure = handle_failure
+        self._exception = None
+
+    def __getattr__(self, name):
+        return getattr(self._future, name)
+
+    def cancel(self):
+        return self._future.cancel()
+
+    def cancelled(self):
+        return self._future.cancelled()
+
+    def running(self):
+        return self._future.running()
+
+    def done(self):
+        return self._future.done()
+
+    def exception(self, timeout=None):
+        exception = self._future.exception(timeout=timeout)
+
+        if exception is None:
+            return None
+
+        if self._exception is None:
+            try:
+                self._handle_failure(self._future)
+            except Exception as translated:
+                self._exception = translated
+
+        return self._exception
+
+    def result(self, timeout=None):
+        exception = self.exception(timeout=timeout)
+
+        if exception is not None:
+            raise exception
+
+        return self._future.result(timeout=timeout)
+
+    def traceback(self, timeout=None):
+        return self._future.traceback(timeout=timeout)
+
+    def add_done_callback(self, fn):
+        self._future.add_done_callback(lambda future: fn(self))
+
+
+class _FutureCreated(Exception):
+    """Carries the future of a request out of a generated service method."""
+
+    def __init__(self, future):
+        super(_FutureCreated, self).__init__()
+        self.future = future
+
+
+class _FutureMethodCaller(object):
+    """Calls service client methods without waiting for their response.
+
+    Generated service methods build a request from their arguments and pass it
+    to a wrapped transport stub. This calls them on a second service client,
+    sharing the same transport, whose wrapped stubs start the request with
+    the stub's future() method instead. The resulting future is carried out
+    of the generated method so that no post-processing blocks on it.
+    """
+
+    def __init__(self, service):
+        """Initializer for the _FutureMethodCaller.
+
+        Args:
+            service: a service client instance.
+        """
+        self._service_client_class = type(service)
+        self._transport = service.transport
+        self._client = None
+
+    def _get_client(self, name):
+        """Returns the service client used to start requests for a method.
+
+        Args:
+            name: a str of the service client method's name.
+        """
+        if self._client is None:
+            self._client = self._service_client_class(
+                transport=self._transport)
+
+        client = self._client
+
+        if name not in client._inner_api_calls:
+            rpc_name = ''.join(part.capitalize() for part in name.split('_'))
+            method_config = client._method_configs.get(rpc_name)
+            wrapped_future = google.api_core.gapic_v1.method.wrap_method(
+                getattr(self._transport, name).future,
+                default_timeout=(method_config.timeout if method_config
+                                 else None),
+                client_info=client._client_info)
+
+            def start_request(*args, **kwargs):
+                raise _FutureCreated(wrapped_future(*args, **kwargs))
+
+            client._inner_api_calls[name] = start_request
+
+        return client
+
+    def __call__(self, name, *args, **kwargs):
+        """Starts a request with the given service client method.
+
+        Args:
+            name: a str of the service client method's name.
+            args: the positional arguments of the method.
+            kwargs: the keyword arguments of the method.
+
+        Returns:
+            A grpc.Future instance for the method's response.
+        """
+        try:
+            result = getattr(self._get_client(name), name)(*args, **kwargs)
+
+            if isinstance(result, page_iterator.GRPCIterator):
+                paged_request = util.get_paged_request(result)
+                paged_request.method(paged_request.request)
+        except _FutureCreated as created:
+            return created.future
+
+        raise ValueError('Method "%s" did not start a request.' % name)
+
+
 class _ClientCallDetails(
         namedtuple(
             '_ClientCallDetails',
@@ -596,6 +1246,42 @@ class _ClientCallDetails(
     pass
 
 
+class _DeferredLogMessage(object):
+    """A log message that is only formatted when it's converted to a str.
+
+    Logging converts messages to str when a handler emits the record, so
+    records that are filtered out by levels, or that are handed to another
+    thread by an asynchronous handler, aren't formatted by the caller.
+    """
+
+    __slots__ = ('_format', '_args')
+
+    def __init__(self, format_function, *args):
+        """Initializer.
+
+        Args:
+            format_function: a callable returning the message as a str.
+            args: the arguments passed to format_function.
+        """
+        self._format = format_function
+        self._args = args
+
+    def __str__(self):
+        return str(self._format(*self._args))
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """A QueueHandler that leaves the formatting to the listener's handlers.
+
+    QueueHandler formats records before queueing them, so that they can be
+    pickled. Records of the library stay in-process, so formatting them is
+    left to the handlers of the listener's thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 def _get_trailing_metadata_from_interceptor_exception(exception):
     """Retrieves trailing metadata from an exception object.
 
@@ -620,6 +1306,230 @@ def _get_trailing_metadata_from_interceptor_exception(exception):
             return tuple()
 
 
+def _get_google_ads_error_codes(exception, exception_interceptor):
+    """Returns the Google Ads API error codes of a failed request.
+
+    Args:
+        exception: the exception of the failed request.
+        exception_interceptor: an ExceptionInterceptor of the request's API
+            version, used to parse GoogleAdsFailures from trailing metadata.
+
+    Returns:
+        A list of str error codes such as "quota_error.RESOURCE_EXHAUSTED",
+        empty if the exception has no GoogleAdsFailure.
+    """
+    failure = getattr(exception, 'failure', None)
+
+    if failure is None:
+        try:
+            # INTERNAL and RESOURCE_EXHAUSTED errors aren't translated by the
+            # ExceptionInterceptor, but may carry a failure as well.
+            failure = exception_interceptor._get_google_ads_failure(
+                exception.trailing_metadata())
+        except AttributeError:
+            pass
+
+    return retry_module.get_google_ads_error_codes(failure) if failure else []
+
+
+def _get_status_name(exception):
+    """Returns the name of the gRPC status code of a failed request.
+
+    Args:
+        exception: the exception of the failed request, either a
+            grpc.RpcError or a GoogleAdsException.
+
+    Returns:
+        A str such as "UNAVAILABLE", or "UNKNOWN" if the exception has no
+        status code.
+    """
+    error = getattr(exception, 'error', exception)
+
+    try:
+        return error.code().name
+    except AttributeError:
+        return grpc.StatusCode.UNKNOWN.name
+
+
+def enable_async_logging():
+    """Hands the library's log records to a background thread.
+
+    The handlers of the "google.ads.google_ads" logger, and of its ancestors
+    that it propagates to, are moved to a logging.handlers.QueueListener and
+    replaced with a handler that only queues records, so that requests aren't
+    slowed down by formatting and writing logs.
+
+    The logger's propagate attribute is set to False until logging is
+    stopped, so handlers added to its ancestors afterwards, such as handlers
+    of the root logger, don't receive the library's records. Calling stop on
+    the returned handle, which is done when the interpreter exits, flushes
+    the queued records and restores the logger's handlers and propagation.
+    Calling this function again while enabled has no effect.
+
+    Returns:
+        The AsyncLogging handle, or None if there are no handlers to hand
+        records to.
+    """
+    global _async_logging
+
+    with _async_logging_lock:
+        if _async_logging is not None:
+            return _async_logging
+
+        package_logger = logging.getLogger(_LOGGER_PACKAGE)
+        handlers = []
+        current = package_logger
+
+        while current:
+            handlers.extend(current.handlers)
+            current = current.parent if current.propagate else None
+
+        if not handlers:
+            return None
+
+        _async_logging = AsyncLogging(package_logger, handlers)
+        atexit.register(_async_logging.stop)
+        return _async_logging
+
+
+class AsyncLogging(object):
+    """Emits a logger's records on a background thread until stopped."""
+
+    def __init__(self, logger, handlers):
+        """Initializer for the AsyncLogging.
+
+        Starts the listener and replaces the logger's handlers with a handler
+        queueing records for it.
+
+        Args:
+            logger: the logging.Logger whose records are queued.
+            handlers: a list of the logging.Handler instances emitting the
+                queued records.
+        """
+        self.logger = logger
+        log_queue = queue.Queue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True)
+        self._handlers = list(logger.handlers)
+        self._propagate = logger.propagate
+        self._queue_handler = _DeferredQueueHandler(log_queue)
+        self._stopped = False
+        self.listener.start()
+
+        for handler in self._handlers:
+            logger.removeHandler(handler)
+
+        logger.addHandler(self._queue_handler)
+        logger.propagate = False
+
+    def stop(self):
+        """Emits the queued records and restores the logger.
+
+        The logger's original handlers and propagate attribute are restored,
+        so that enable_async_logging can be called again. Calling this method
+        again has no effect.
+        """
+        global _async_logging
+
+        with _async_logging_lock:
+            if self._stopped:
+                return
+
+            self._stopped = True
+            self.logger.removeHandler(self._queue_handler)
+
+            for handler in self._handlers:
+                self.logger.addHandler(handler)
+
+            self.logger.propagate = self._propagate
+            self.listener.stop()
+
+            if _async_logging is self:
+                _async_logging = None
+
+
+def _release_cached_service(key, cached):
+    """Releases the channel of a service client evicted from the cache.
+
+    Args:
+        key: the (name, version, login_customer_id) tuple of the service.
+        cached: a (service client, release callable) tuple.
+    """
+    del key
+    cached[1]()
+
+
+def _add_future_methods(service):
+    """Adds a non-blocking "_future" variant of each service client method.
+
+    Args:
+        service: a service client instance.
+    """
+    caller = _FutureMethodCaller(service)
+    transport_class = type(service.transport)
+
+    for name in dir(transport_class):
+        if (isinstance(getattr(transport_class, name), property) and
+                name != 'channel' and hasattr(service, name)):
+            setattr(service, _FUTURE_METHOD_TEMPLATE % name,
+                    functools.partial(caller, name))
+
+
+def _get_service_classes(name, version):
+    """Returns the service client and gRPC transport classes of a service.
+
+    Args:
+        name: a str indicating the name of the service.
+        version: a str indicating the version of the Google Ads API.
+
+    Returns:
+        A tuple of the service client class and its gRPC transport class.
+
+    Raises:
+        ValueError: If the specified name or version doesn't exist.
+    """
+    api_module = _get_version(version)
+
+    try:
+        service_client = getattr(api_module, _SERVICE_CLIENT_TEMPLATE % name)
+    except AttributeError:
+        raise ValueError('Specified service "%s" does not exist in Google '
+                         'Ads API %s.' % (name, version))
+
+    try:
+        service_transport_class = getattr(
+            api_module, _SERVICE_GRPC_TRANSPORT_TEMPLATE % name)
+    except AttributeError:
+        raise ValueError('Grpc transport does not exist for the specified '
+                         'service "%s".' % name)
+
+    return service_client, service_transport_class
+
+
+def _resolve_type(name, version):
+    """Resolves the given type and adds it to the type registry.
+
+    Args:
+        name: a str indicating the name of the type.
+        version: a str indicating the Google Ads API version.
+
+    Returns:
+        The message class of the given type.
+
+    Raises:
+        ValueError: If the type for the specified name doesn't exist in the
+            given version.
+    """
+    try:
+        message_type = getattr(_get_version(version).types, name)
+    except AttributeError:
+        raise ValueError('Specified type "%s" does not exist in Google Ads '
+                         'API %s.' % (name, version))
+
+    _type_registry[(version, name)] = message_type
+    return message_type
+
+
 def _get_version(name):
     """Returns the given API version.
 
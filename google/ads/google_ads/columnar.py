@@ -0,0 +1,272 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Materializes search results as NumPy column arrays.
+
+This module requires NumPy, which can be installed along with the library by
+running "pip install google-ads[numpy]".
+"""
+
+from collections import OrderedDict
+
+from google.protobuf.descriptor import FieldDescriptor
+
+from google.ads.google_ads.rows import RowFlattener
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_INT_TYPES = frozenset((
+    FieldDescriptor.TYPE_FIXED32,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_INT32,
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_SFIXED32,
+    FieldDescriptor.TYPE_SFIXED64,
+    FieldDescriptor.TYPE_SINT32,
+    FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_UINT32,
+))
+
+_FLOAT_TYPES = frozenset((
+    FieldDescriptor.TYPE_DOUBLE,
+    FieldDescriptor.TYPE_FLOAT,
+))
+
+
+class ColumnarBuilder(object):
+    """Builds NumPy arrays holding each selected field of search results.
+
+    A typed buffer is allocated for each field in the query's SELECT clause:
+    int64 for IDs, counts and micros amounts, float64 for ratios, bool for
+    booleans and object for strings and messages. Enum fields hold their
+    int32 enum values, and strings can be dictionary encoded as int32 codes
+    instead; get_categories maps the values of either back to names.
+
+    Buffers start at initial_capacity rows and grow geometrically as pages are
+    added, or are sized up front from the total_results_count of the first
+    response when it's available:
+
+        builder = ColumnarBuilder(query)
+        builder.extend(ga_service.search(customer_id, query, page_size=1000))
+        columns = builder.build()
+        clicks = columns['metrics.clicks']
+    """
+
+    def __init__(self, query, version=None, dictionary_encode_strings=False,
+                 initial_capacity=1024, growth_factor=2):
+        """Initializer for the ColumnarBuilder.
+
+        Args:
+            query: a str GAQL query.
+            version: an optional str indicating the version of the Google Ads
+                API, which defaults to the client's default version.
+            dictionary_encode_strings: a bool indicating whether string
+                fields are stored as int32 codes into a list of categories.
+            initial_capacity: an int number of rows allocated up front.
+            growth_factor: a number by which buffers grow when full.
+
+        Raises:
+            ImportError: If NumPy isn't installed.
+            ValueError: If the query doesn't have a SELECT clause or selects a
+                field that doesn't exist, if initial_capacity is less than 1 or
+                if growth_factor isn't greater than 1.
+        """
+        if numpy is None:
+            raise ImportError('ColumnarBuilder requires NumPy, which can be '
+                              'installed by running "pip install '
+                              'google-ads[numpy]".')
+
+        if initial_capacity < 1:
+            raise ValueError('initial_capacity must be at least 1.')
+
+        if growth_factor <= 1:
+            raise ValueError('growth_factor must be greater than 1.')
+
+        self.growth_factor = growth_factor
+        self._flattener = RowFlattener(query, version)
+        self._capacity = initial_capacity
+        self._count = 0
+        self._columns = [
+            _Column(descriptor, initial_capacity, dictionary_encode_strings)
+            for descriptor in self._flattener.field_descriptors]
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def fields(self):
+        """The list of str field names in the order they're selected."""
+        return self._flattener.fields
+
+    def extend(self, iterator):
+        """Adds every page of a search response iterator.
+
+        Args:
+            iterator: a paged response iterator such as the
+                google.api_core.page_iterator.GRPCIterator returned by
+                GoogleAdsService.search, or a PrefetchingPageIterator.
+        """
+        for page in iterator.pages:
+            # GRPCIterator yields google.api_core.page_iterator.Page
+            # instances, which only wrap the response in newer releases.
+            response = getattr(page, 'raw_page', None)
+
+            if response is None and hasattr(page, 'results'):
+                response = page
+
+            if response is None:
+                self.add_rows(list(page))
+            else:
+                self.add_response(response)
+
+    def add_response(self, response):
+        """Adds the rows of a single response page.
+
+        Args:
+            response: a SearchGoogleAdsResponse instance.
+        """
+        total_results_count = getattr(response, 'total_results_count', 0)
+
+        if total_results_count > self._capacity:
+            self._reserve(total_results_count)
+
+        self.add_rows(response.results)
+
+    def add_rows(self, rows):
+        """Adds rows to the end of each column.
+
+        Args:
+            rows: a sequence of GoogleAdsRow instances.
+        """
+        values = list(self._flattener.tuples(rows))
+
+        if not values:
+            return
+
+        start = self._count
+        end = start + len(values)
+
+        if end > self._capacity:
+            self._reserve(max(end, int(self._capacity * self.growth_factor)))
+
+        for column, column_values in zip(self._columns, zip(*values)):
+            column.set(start, end, column_values)
+
+        self._count = end
+
+    def build(self):
+        """Returns the column arrays holding the rows added so far.
+
+        The arrays are views of the builder's buffers, so building is cheap
+        and rows added afterwards aren't reflected in them.
+
+        Returns:
+            An OrderedDict mapping each str field name to a numpy.ndarray.
+        """
+        return OrderedDict(
+            (field, column.buffer[:self._count])
+            for field, column in zip(self.fields, self._columns))
+
+    def get_categories(self, field):
+        """Returns the values that the codes of an encoded column stand for.
+
+        Args:
+            field: a str field name of an enum field, or of a string field if
+                dictionary_encode_strings is set.
+
+        Returns:
+            A dict mapping each int code in the column to its str value.
+
+        Raises:
+            ValueError: If the field isn't selected or isn't encoded.
+        """
+        if field not in self.fields:
+            raise ValueError('Field "%s" is not selected.' % field)
+
+        categories = self._columns[self.fields.index(field)].categories
+
+        if categories is None:
+            raise ValueError('Field "%s" is not encoded.' % field)
+
+        return dict(categories)
+
+    def _reserve(self, capacity):
+        """Grows every buffer to hold at least capacity rows."""
+        for column in self._columns:
+            column.resize(capacity, self._count)
+
+        self._capacity = capacity
+
+
+class _Column(object):
+    """A typed buffer holding the values of a single field."""
+
+    def __init__(self, descriptor, capacity, dictionary_encode_strings):
+        self.categories = None
+        self._codes = None
+        self._repeated = descriptor.label == FieldDescriptor.LABEL_REPEATED
+
+        if self._repeated:
+            dtype = object
+        elif descriptor.type in _INT_TYPES:
+            dtype = numpy.int64
+        elif descriptor.type == FieldDescriptor.TYPE_UINT64:
+            dtype = numpy.uint64
+        elif descriptor.type in _FLOAT_TYPES:
+            dtype = numpy.float64
+        elif descriptor.type == FieldDescriptor.TYPE_BOOL:
+            dtype = numpy.bool_
+        elif descriptor.type == FieldDescriptor.TYPE_ENUM:
+            dtype = numpy.int32
+            self.categories = OrderedDict(
+                (value.number, value.name)
+                for value in descriptor.enum_type.values)
+        elif (descriptor.type == FieldDescriptor.TYPE_STRING and
+              dictionary_encode_strings):
+            dtype = numpy.int32
+            self.categories = OrderedDict()
+            self._codes = {}
+        else:
+            dtype = object
+
+        self.buffer = numpy.empty(capacity, dtype=dtype)
+
+    def resize(self, capacity, count):
+        buffer = numpy.empty(capacity, dtype=self.buffer.dtype)
+        buffer[:count] = self.buffer[:count]
+        self.buffer = buffer
+
+    def set(self, start, end, values):
+        if self._codes is not None:
+            values = [self._encode(value) for value in values]
+
+        if self._repeated:
+            # Assigning a sequence of repeated fields to an object array
+            # slice would broadcast the inner sequences.
+            for index, value in enumerate(values, start):
+                self.buffer[index] = value
+        else:
+            self.buffer[start:end] = values
+
+    def _encode(self, value):
+        code = self._codes.get(value)
+
+        if code is None:
+            code = self._codes[value] = len(self._codes)
+            self.categories[code] = value
+
+        return code
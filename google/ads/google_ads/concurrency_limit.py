@@ -0,0 +1,186 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Adaptive limits on the number of in-flight Google Ads API requests.
+
+The limit for each customer ID and method is adjusted with additive increase,
+multiplicative decrease (AIMD): while requests succeed the limit grows by about
+one request per round trip, and when the API responds with RESOURCE_EXHAUSTED,
+or latency grows well beyond the lowest latency seen, the limit is cut by a
+constant ratio. Requests beyond the current limit wait for others to complete.
+"""
+
+import collections
+import logging
+import math
+import threading
+import time
+
+from google.ads.google_ads import util
+
+_logger = logging.getLogger(__name__)
+
+_Permit = collections.namedtuple('_Permit', ('key', 'start'))
+
+
+class _Limit(object):
+    """The adaptive limit of a single customer ID and method."""
+
+    def __init__(self, limit, lock):
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.min_latency = None
+        self.last_decrease = None
+        self.completed = 0
+        self.dropped = 0
+        self.condition = threading.Condition(lock)
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """Limits in-flight requests per customer ID and method with AIMD.
+
+    A single limiter is shared by every service client retrieved from a
+    GoogleAdsClient, and can also be shared between GoogleAdsClient instances.
+    """
+
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=100,
+                 backoff_ratio=0.5, latency_tolerance=2.0,
+                 clock=time.monotonic):
+        """Initializer.
+
+        Args:
+            initial_limit: a number of in-flight requests allowed for a
+                customer ID and method before any of them complete.
+            min_limit: a number the limit is never decreased below.
+            max_limit: a number the limit is never increased above.
+            backoff_ratio: a float between 0 and 1 the limit is multiplied by
+                when it is decreased.
+            latency_tolerance: an optional float; requests that take longer
+                than this many times the lowest latency seen for the customer
+                ID and method decrease the limit. If None only
+                RESOURCE_EXHAUSTED errors decrease the limit.
+            clock: a callable returning the current time in seconds.
+
+        Raises:
+            ValueError: If the limits or ratio are out of range.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('Concurrency limits must satisfy 1 <= min_limit '
+                             '<= initial_limit <= max_limit, got %s, %s and '
+                             '%s.' % (min_limit, initial_limit, max_limit))
+
+        if not 0 < backoff_ratio < 1:
+            raise ValueError('backoff_ratio must be between 0 and 1, got %s.'
+                             % backoff_ratio)
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limits = {}
+
+    def _get_limit(self, key):
+        limit = self._limits.get(key)
+
+        if limit is None:
+            limit = _Limit(self.initial_limit, self._lock)
+            self._limits[key] = limit
+
+        return limit
+
+    def acquire(self, customer_id=None, method=None):
+        """Waits until a request may be made for the customer ID and method.
+
+        Args:
+            customer_id: an optional str customer ID of the request.
+            method: an optional str of the request's method, either a full gRPC
+                method such as
+                "/google.ads.googleads.v2.services.GoogleAdsService/Mutate" or
+                just "GoogleAdsService/Mutate".
+
+        Returns:
+            A permit that must be passed to release once the request completes.
+        """
+        key = (customer_id, util.get_method_name(method) if method else None)
+
+        with self._lock:
+            limit = self._get_limit(key)
+
+            while limit.in_flight >= math.floor(limit.limit):
+                limit.condition.wait()
+
+            limit.in_flight += 1
+            return _Permit(key, self._clock())
+
+    def release(self, permit, dropped=False):
+        """Records the completion of a request and adjusts its limit.
+
+        Args:
+            permit: the permit returned by acquire for the request.
+            dropped: a bool indicating whether the request failed with
+                RESOURCE_EXHAUSTED.
+        """
+        now = self._clock()
+        latency = now - permit.start
+
+        with self._lock:
+            limit = self._limits[permit.key]
+            in_flight = limit.in_flight
+            limit.in_flight -= 1
+            limit.completed += 1
+
+            if dropped:
+                limit.dropped += 1
+            elif limit.min_latency is None or latency < limit.min_latency:
+                limit.min_latency = latency
+
+            overloaded = dropped or (
+                self.latency_tolerance is not None and
+                latency > limit.min_latency * self.latency_tolerance)
+
+            if overloaded:
+                # Requests that started before the last decrease were made
+                # under the previous limit, so they don't decrease it again.
+                if (limit.last_decrease is None or
+                        permit.start >= limit.last_decrease):
+                    limit.limit = max(self.min_limit,
+                                      limit.limit * self.backoff_ratio)
+                    limit.last_decrease = now
+                    _logger.debug('Decreased concurrency limit of %s to %.2f.',
+                                  permit.key, limit.limit)
+            elif in_flight * 2 >= limit.limit:
+                # Only grow the limit while it is actually being used.
+                limit.limit = min(self.max_limit,
+                                  limit.limit + 1.0 / limit.limit)
+
+            limit.condition.notify_all()
+
+    def get_limits(self):
+        """Returns the current limits, e.g. to be exported to dashboards.
+
+        Returns:
+            A dict mapping (customer_id, method) tuples to dicts with the
+            current "limit", the number of requests "in_flight", the number of
+            "completed" and "dropped" requests and the lowest latency seen in
+            seconds as "min_latency".
+        """
+        with self._lock:
+            return {key: {'limit': limit.limit,
+                          'in_flight': limit.in_flight,
+                          'completed': limit.completed,
+                          'dropped': limit.dropped,
+                          'min_latency': limit.min_latency}
+                    for key, limit in self._limits.items()}
@@ -20,7 +20,8 @@ import yaml
 
 _ENV_PREFIX = 'GOOGLE_ADS_'
 _REQUIRED_KEYS = ('developer_token',)
-_OPTIONAL_KEYS = ('login_customer_id', 'endpoint', 'logging')
+_OPTIONAL_KEYS = ('login_customer_id', 'endpoint', 'logging', 'rate_limits',
+                  'retry')
 _OAUTH2_INSTALLED_APP_KEYS = ('client_id', 'client_secret', 'refresh_token')
 _OAUTH2_SERVICE_ACCOUNT_KEYS = ('path_to_private_key_file', 'delegated_account')
 _KEYS_ENV_VARIABLES_MAP = {
@@ -170,6 +171,18 @@ def load_from_env():
         except json.JSONDecodeError:
             raise ValueError(
                 'GOOGLE_ADS_LOGGING env variable should be in JSON format.')
+    if 'rate_limits' in config_data.keys():
+        try:
+            config_data['rate_limits'] = json.loads(config_data['rate_limits'])
+        except json.JSONDecodeError:
+            raise ValueError(
+                'GOOGLE_ADS_RATE_LIMITS env variable should be in JSON format.')
+    if 'retry' in config_data.keys():
+        try:
+            config_data['retry'] = json.loads(config_data['retry'])
+        except json.JSONDecodeError:
+            raise ValueError(
+                'GOOGLE_ADS_RETRY env variable should be in JSON format.')
 
     return config_data
 
@@ -31,3 +31,19 @@ class GoogleAdsException(Exception):
         self.call = call
         self.failure = failure
         self.request_id = request_id
+
+
+class MutateOperationError(Exception):
+    """Exception of an operation that failed in a partial failure request."""
+
+    def __init__(self, errors, index):
+        """Initializer.
+
+        Args:
+            errors: a list of the GoogleAdsError messages of the operation.
+            index: an int of the operation's index in its request.
+        """
+        super(MutateOperationError, self).__init__(
+            '; '.join(error.message for error in errors))
+        self.errors = errors
+        self.index = index
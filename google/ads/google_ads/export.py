@@ -0,0 +1,314 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streams search results to CSV, JSON Lines or delimited protobuf files."""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import time
+
+from google.protobuf import json_format
+from google.protobuf.message import Message
+
+from google.ads.google_ads.rows import RowFlattener
+
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_CHUNK_BYTES = 1 << 20
+
+
+class SearchExporter(object):
+    """Writes rows from a search response iterator to files as they arrive.
+
+    Rows are formatted into an in-memory chunk that is written out whenever
+    it reaches chunk_bytes, so memory use depends on the chunk and page sizes
+    rather than on the number of rows exported:
+
+        exporter = SearchExporter('search_terms-{index:03d}.csv.gz', query,
+                                  compress=True, max_file_bytes=100 << 20)
+        stats = exporter.export(ga_service.search(customer_id, query))
+
+    Supported formats are 'csv' and 'jsonl', which hold the fields selected
+    by the query, and 'pb', which holds each serialized GoogleAdsRow
+    preceded by its varint encoded length. Enum fields are written as ints.
+    """
+
+    def __init__(self, path, query=None, file_format='csv', version=None,
+                 compress=False, max_file_bytes=None,
+                 chunk_bytes=_DEFAULT_CHUNK_BYTES):
+        """Initializer for the SearchExporter.
+
+        Args:
+            path: a str path of the file to write. When max_file_bytes is set
+                it must include an {index} replacement field, which is
+                formatted with the index of each file starting at 0.
+            query: a str GAQL query whose selected fields are written. It's
+                required by the 'csv' and 'jsonl' formats.
+            file_format: a str indicating the file format, one of 'csv',
+                'jsonl' or 'pb'.
+            version: an optional str indicating the version of the Google Ads
+                API, which defaults to the client's default version.
+            compress: a bool indicating whether files are gzip compressed.
+            max_file_bytes: an optional int size after which a new file is
+                started. Files are rotated between chunks, so they can exceed
+                it by up to one chunk.
+            chunk_bytes: an int size in bytes of the chunks written to files,
+                before compression.
+
+        Raises:
+            ValueError: If the format is unknown, the query is missing or
+                invalid, or path has no {index} field when files are rotated.
+        """
+        if file_format == 'csv':
+            self._formatter = _CsvFormatter(_get_flattener(query, version))
+        elif file_format == 'jsonl':
+            self._formatter = _JsonLinesFormatter(
+                _get_flattener(query, version))
+        elif file_format == 'pb':
+            self._formatter = _DelimitedProtobufFormatter()
+        else:
+            raise ValueError('Unknown export format "%s".' % file_format)
+
+        if max_file_bytes is not None and '{index' not in path:
+            raise ValueError('path must include an {index} field when files '
+                             'are rotated.')
+
+        self.path = path
+        self.compress = compress
+        self.max_file_bytes = max_file_bytes
+        self.chunk_bytes = chunk_bytes
+
+    def export(self, rows):
+        """Writes every row, then closes the files.
+
+        Args:
+            rows: an iterable of GoogleAdsRow instances, such as the iterator
+                returned by GoogleAdsService.search.
+
+        Returns:
+            A dict with the number of "rows" and "bytes" written, the "paths"
+            of the files written, the "elapsed_seconds" taken and the
+            resulting "rows_per_second" and "bytes_per_second". Byte counts
+            are of the files on disk, after compression.
+        """
+        start = time.monotonic()
+        sink = _RotatingFileSink(self.path, self.compress, self.max_file_bytes,
+                                 self._formatter.header())
+        formatter = self._formatter
+        # Chunks are bytes buffers, so that their size is in encoded bytes.
+        chunk = formatter.create_chunk()
+        row_count = 0
+
+        try:
+            for row in rows:
+                formatter.write(chunk, row)
+                row_count += 1
+
+                if chunk.tell() >= self.chunk_bytes:
+                    sink.write(chunk.getvalue())
+                    chunk = formatter.create_chunk()
+
+            if chunk.tell():
+                sink.write(chunk.getvalue())
+        finally:
+            sink.close()
+
+        elapsed = time.monotonic() - start
+        byte_count = sum(os.path.getsize(path) for path in sink.paths)
+        stats = {
+            'rows': row_count,
+            'bytes': byte_count,
+            'paths': sink.paths,
+            'elapsed_seconds': elapsed,
+            'rows_per_second': row_count / elapsed if elapsed else 0.0,
+            'bytes_per_second': byte_count / elapsed if elapsed else 0.0,
+        }
+
+        _logger.info('Exported %d row(s), %d byte(s) to %d file(s) in '
+                     '%.2f seconds (%.0f rows/s, %.0f bytes/s).', row_count,
+                     byte_count, len(sink.paths), elapsed,
+                     stats['rows_per_second'], stats['bytes_per_second'])
+
+        return stats
+
+
+class _RotatingFileSink(object):
+    """Writes chunks to a series of optionally compressed files."""
+
+    def __init__(self, path, compress, max_file_bytes, header):
+        self.paths = []
+        self._path = path
+        self._compress = compress
+        self._max_file_bytes = max_file_bytes
+        self._header = header
+        self._raw_file = None
+        self._file = None
+
+    def write(self, data):
+        if self._file is None:
+            self._open()
+        elif (self._max_file_bytes is not None and
+              self._raw_file.tell() >= self._max_file_bytes):
+            self._close_file()
+            self._open()
+
+        self._file.write(data)
+
+    def close(self):
+        if self._file is None and not self.paths:
+            # Always leave a file behind, even if there were no rows.
+            self._open()
+
+        self._close_file()
+
+    def _open(self):
+        path = self._path
+
+        if self._max_file_bytes is not None:
+            path = path.format(index=len(self.paths))
+
+        self._raw_file = open(path, 'wb')
+
+        if self._compress:
+            self._file = gzip.GzipFile(fileobj=self._raw_file, mode='wb')
+        else:
+            self._file = self._raw_file
+
+        self.paths.append(path)
+
+        if self._header:
+            self._file.write(self._header)
+
+    def _close_file(self):
+        if self._file is None:
+            return
+
+        if self._file is not self._raw_file:
+            self._file.close()
+
+        self._raw_file.close()
+        self._file = None
+        self._raw_file = None
+
+
+class _CsvFormatter(object):
+    """Formats the selected fields of rows as CSV."""
+
+    def __init__(self, flattener):
+        self._flattener = flattener
+        self._writer = None
+
+    def header(self):
+        chunk = self.create_chunk()
+        self._writer.writerow(self._flattener.fields)
+        return chunk.getvalue()
+
+    def create_chunk(self):
+        # Only the most recently created chunk is written to.
+        chunk = io.BytesIO()
+        self._writer = csv.writer(_Utf8Writer(chunk))
+        return chunk
+
+    def write(self, chunk, row):
+        self._writer.writerow(self._flattener.to_tuple(row))
+
+
+class _JsonLinesFormatter(object):
+    """Formats the selected fields of rows as JSON objects, one per line."""
+
+    def __init__(self, flattener):
+        self._flattener = flattener
+
+    def header(self):
+        return None
+
+    def create_chunk(self):
+        return io.BytesIO()
+
+    def write(self, chunk, row):
+        line = json.dumps(self._flattener.to_dict(row), default=_to_json_value)
+        chunk.write(line.encode('utf-8'))
+        chunk.write(b'\n')
+
+
+class _DelimitedProtobufFormatter(object):
+    """Formats rows as serialized messages preceded by their length."""
+
+    def header(self):
+        return None
+
+    def create_chunk(self):
+        return io.BytesIO()
+
+    def write(self, chunk, row):
+        data = row.SerializeToString()
+        chunk.write(_encode_varint(len(data)))
+        chunk.write(data)
+
+
+class _Utf8Writer(object):
+    """Writes str to a bytes buffer encoded as UTF-8, e.g. for csv.writer."""
+
+    def __init__(self, chunk):
+        self._chunk = chunk
+
+    def write(self, text):
+        return self._chunk.write(text.encode('utf-8'))
+
+
+def _get_flattener(query, version):
+    """Returns a RowFlattener for the query.
+
+    Raises:
+        ValueError: If the query is missing or invalid.
+    """
+    if not query:
+        raise ValueError('A query is required to export selected fields.')
+
+    return RowFlattener(query, version)
+
+
+def _to_json_value(value):
+    """Converts values that json can't serialize, such as messages."""
+    if isinstance(value, Message):
+        return json_format.MessageToDict(value)
+
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+
+    # Repeated fields.
+    return list(value)
+
+
+def _encode_varint(value):
+    """Encodes a non-negative int as a protobuf varint.
+
+    Args:
+        value: a non-negative int.
+
+    Returns:
+        The encoded bytes.
+    """
+    encoded = bytearray()
+
+    while value > 0x7f:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+    return bytes(encoded)
@@ -0,0 +1,280 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs a query across the client accounts of a manager account."""
+
+import logging
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent import futures
+
+
+_logger = logging.getLogger(__name__)
+
+_CLIENT_QUERY = ('SELECT customer_client.client_customer, '
+                 'customer_client.level, customer_client.hidden '
+                 'FROM customer_client')
+
+# How often, in seconds, a blocked worker checks whether the search was
+# abandoned by its caller.
+_STOP_POLL_INTERVAL = 0.1
+
+# A row returned by a fan-out search, tagged with the account it came from.
+CustomerRow = namedtuple('CustomerRow', ('customer_id', 'row'))
+
+# An exception raised while searching a single account.
+AccountError = namedtuple('AccountError', ('customer_id', 'exception'))
+
+
+class FanOutExecutor(object):
+    """Runs the same query against many customer accounts concurrently.
+
+    Each account is searched on its own worker thread, with at most
+    max_workers accounts searched at once, and rows are streamed back to the
+    caller as soon as their page arrives. Rows from different accounts are
+    interleaved, so each is tagged with the ID of the account it came from:
+
+        executor = FanOutExecutor(client, max_workers=20)
+        for customer_id, row in executor.search_hierarchy(manager_id, query):
+            ...
+
+    An exception raised while searching one account doesn't stop the others;
+    it's recorded in the errors attribute instead, and rows already streamed
+    from that account are kept. The GoogleAdsClient's login_customer_id must
+    be set to the manager account when searching its client accounts.
+    """
+
+    def __init__(self, client, max_workers=10, version=None,
+                 max_buffered_pages=None):
+        """Initializer for the FanOutExecutor.
+
+        Args:
+            client: a GoogleAdsClient instance.
+            max_workers: an int indicating how many accounts can be searched
+                at once.
+            version: an optional str indicating the version of the Google Ads
+                API to use, which defaults to the client's default version.
+            max_buffered_pages: an optional int indicating how many fetched
+                pages can wait to be consumed before workers stop requesting
+                more, which defaults to twice max_workers.
+
+        Raises:
+            ValueError: If max_workers or max_buffered_pages is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+
+        if max_buffered_pages is not None and max_buffered_pages < 1:
+            raise ValueError('max_buffered_pages must be at least 1.')
+
+        self.max_workers = max_workers
+        self.max_buffered_pages = max_buffered_pages or max_workers * 2
+        self.errors = []
+
+        if version:
+            self._service = client.get_service('GoogleAdsService',
+                                               version=version)
+        else:
+            self._service = client.get_service('GoogleAdsService')
+
+        self._lock = threading.Lock()
+        self._reset_stats(0)
+
+    def get_client_customer_ids(self, manager_customer_id,
+                                include_hidden=False, max_level=None):
+        """Finds the client accounts below a manager account.
+
+        Args:
+            manager_customer_id: a str ID of the manager account.
+            include_hidden: a bool indicating whether hidden accounts are
+                included.
+            max_level: an optional int limiting how far below the manager
+                account clients are found, where 1 only includes its direct
+                clients. All levels are included by default.
+
+        Returns:
+            A list of str customer IDs, excluding the manager account itself.
+        """
+        customer_ids = []
+
+        for row in self._service.search(manager_customer_id, _CLIENT_QUERY):
+            customer_client = row.customer_client
+            level = customer_client.level.value
+
+            if level == 0:
+                continue
+
+            if max_level is not None and level > max_level:
+                continue
+
+            if customer_client.hidden.value and not include_hidden:
+                continue
+
+            customer_ids.append(
+                customer_client.client_customer.value.split('/')[-1])
+
+        return customer_ids
+
+    def search_hierarchy(self, manager_customer_id, query,
+                         include_hidden=False, max_level=None,
+                         page_size=None):
+        """Searches every client account below a manager account.
+
+        Args:
+            manager_customer_id: a str ID of the manager account.
+            query: a str GAQL query, or a callable taking a str customer ID
+                and returning the query to run against that account.
+            include_hidden: a bool indicating whether hidden accounts are
+                searched.
+            max_level: an optional int limiting how far below the manager
+                account clients are searched.
+            page_size: an optional int number of rows in each page.
+
+        Returns:
+            An iterator over CustomerRow instances.
+        """
+        customer_ids = self.get_client_customer_ids(
+            manager_customer_id, include_hidden, max_level)
+
+        return self.search(query, customer_ids, page_size)
+
+    def search(self, query, customer_ids, page_size=None):
+        """Searches each of the given accounts concurrently.
+
+        Accounts are searched once the returned iterator is first advanced.
+        Abandoning the iterator before it's exhausted stops searching
+        accounts that haven't started yet and unblocks the running workers.
+
+        Args:
+            query: a str GAQL query, or a callable taking a str customer ID
+                and returning the query to run against that account.
+            customer_ids: an iterable of str customer IDs.
+            page_size: an optional int number of rows in each page.
+
+        Returns:
+            An iterator over CustomerRow instances.
+        """
+        customer_ids = list(customer_ids)
+        pages = queue.Queue(maxsize=self.max_buffered_pages)
+        stopped = threading.Event()
+        executor = futures.ThreadPoolExecutor(self.max_workers)
+
+        self.errors = []
+        self._reset_stats(len(customer_ids))
+
+        try:
+            for customer_id in customer_ids:
+                executor.submit(self._search_account, query, customer_id,
+                                page_size, pages, stopped)
+
+            remaining = len(customer_ids)
+
+            while remaining:
+                customer_id, rows = pages.get()
+
+                if rows is None:
+                    remaining -= 1
+                    continue
+
+                for row in rows:
+                    yield CustomerRow(customer_id, row)
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+            # Unblock workers waiting to enqueue a page.
+            while True:
+                try:
+                    pages.get_nowait()
+                except queue.Empty:
+                    break
+
+    def get_stats(self):
+        """Returns the progress of the current or most recent search.
+
+        Returns:
+            A dict with the number of "accounts", "accounts_completed" and
+            "accounts_failed", the number of "rows" fetched, the
+            "elapsed_seconds" since the search started and the resulting
+            "rows_per_second".
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        if self._start_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = time.monotonic() - self._start_time
+
+        stats['elapsed_seconds'] = elapsed
+        stats['rows_per_second'] = stats['rows'] / elapsed if elapsed else 0.0
+        return stats
+
+    def _reset_stats(self, accounts):
+        with self._lock:
+            self._stats = {'accounts': accounts, 'accounts_completed': 0,
+                           'accounts_failed': 0, 'rows': 0}
+            self._start_time = time.monotonic() if accounts else None
+
+    def _search_account(self, query, customer_id, page_size, pages, stopped):
+        """Searches a single account and enqueues each page of its rows.
+
+        A (customer_id, None) entry is always enqueued last to mark the
+        account as finished.
+        """
+        if stopped.is_set():
+            return
+
+        try:
+            account_query = query(customer_id) if callable(query) else query
+            results = self._service.search(customer_id, account_query,
+                                           page_size=page_size)
+
+            for page in results.pages:
+                rows = list(page)
+
+                with self._lock:
+                    self._stats['rows'] += len(rows)
+
+                if not _put(pages, (customer_id, rows), stopped):
+                    return
+        except Exception as exception:
+            _logger.warning('Search failed for customer ID %s: %s',
+                            customer_id, exception)
+
+            with self._lock:
+                self.errors.append(AccountError(customer_id, exception))
+                self._stats['accounts_failed'] += 1
+        else:
+            with self._lock:
+                self._stats['accounts_completed'] += 1
+
+        _put(pages, (customer_id, None), stopped)
+
+
+def _put(pages, entry, stopped):
+    """Enqueues an entry, waiting for room unless the search was stopped.
+
+    Returns:
+        True if the entry was enqueued, False if the search was stopped.
+    """
+    while not stopped.is_set():
+        try:
+            pages.put(entry, timeout=_STOP_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+
+    return False
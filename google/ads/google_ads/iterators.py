@@ -0,0 +1,181 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Iterators over the results of paged Google Ads API requests."""
+
+import queue
+import threading
+
+from google.ads.google_ads import util
+
+
+# How often, in seconds, a blocked background fetch checks whether the
+# iterator was closed.
+_CLOSE_POLL_INTERVAL = 0.1
+
+
+class PrefetchingPageIterator(object):
+    """Iterates over a paged request while fetching pages in the background.
+
+    A google.api_core.page_iterator.GRPCIterator only requests a page once the
+    previous one has been consumed, so the time spent processing results and
+    the time spent waiting on the network add up. This iterator requests pages
+    from a background thread instead, keeping up to depth pages ready ahead of
+    the caller:
+
+        results = ga_service.search(customer_id, query, page_size=1000)
+        with PrefetchingPageIterator(results, depth=2) as iterator:
+            for row in iterator:
+                ...
+
+    Iterating over the instance yields individual results, e.g. GoogleAdsRow
+    instances, while iterating over its pages attribute yields each response
+    message, e.g. SearchGoogleAdsResponse instances. Exceptions raised while
+    fetching a page are raised to the caller in place of that page. Since
+    each request needs the page token of the previous response, pages are
+    still requested one at a time.
+    """
+
+    def __init__(self, iterator, depth=1):
+        """Initializer for the PrefetchingPageIterator.
+
+        Args:
+            iterator: a google.api_core.page_iterator.GRPCIterator that hasn't
+                been iterated over yet.
+            depth: an int indicating how many fetched pages can wait to be
+                consumed before the background thread stops requesting more.
+
+        Raises:
+            ValueError: If depth is less than 1.
+        """
+        if depth < 1:
+            raise ValueError('depth must be at least 1.')
+
+        self.depth = depth
+        self._paged_request = util.get_paged_request(iterator)
+        self._queue = queue.Queue(maxsize=depth)
+        self._closed = threading.Event()
+        self._thread = None
+
+    def __iter__(self):
+        return self._results()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pages(self):
+        """An iterator over each response page."""
+        return self._pages()
+
+    def close(self):
+        """Stops fetching pages in the background.
+
+        Pages that were already fetched but not yet consumed are discarded.
+        """
+        self._closed.set()
+
+        # Unblock a background thread that is waiting to enqueue a page.
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _start(self):
+        """Starts the background thread.
+
+        Raises:
+            ValueError: If the iterator was already started or closed.
+        """
+        if self._thread is not None:
+            raise ValueError('Iterator has already started.')
+
+        if self._closed.is_set():
+            raise ValueError('Iterator is closed.')
+
+        self._thread = threading.Thread(target=self._fetch_pages)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _pages(self):
+        self._start()
+
+        try:
+            while True:
+                response, exception = self._queue.get()
+
+                if exception is not None:
+                    raise exception
+
+                if response is None:
+                    return
+
+                yield response
+        finally:
+            self.close()
+
+    def _results(self):
+        items_field = self._paged_request.items_field
+
+        for response in self._pages():
+            for item in getattr(response, items_field):
+                yield item
+
+    def _fetch_pages(self):
+        """Requests each page in turn and enqueues it for the caller.
+
+        A (None, None) entry marks the last page, while (None, exception)
+        entries carry the exception raised while requesting a page.
+        """
+        paged_request = self._paged_request
+        request = paged_request.request
+
+        try:
+            while not self._closed.is_set():
+                response = paged_request.method(request)
+
+                if not self._put((response, None)):
+                    return
+
+                page_token = getattr(response,
+                                     paged_request.response_token_field)
+
+                if not page_token:
+                    break
+
+                setattr(request, paged_request.request_token_field,
+                        page_token)
+        except Exception as exception:
+            self._put((None, exception))
+            return
+
+        self._put((None, None))
+
+    def _put(self, entry):
+        """Enqueues an entry, waiting for room unless the iterator is closed.
+
+        Returns:
+            True if the entry was enqueued, False if the iterator was closed.
+        """
+        while not self._closed.is_set():
+            try:
+                self._queue.put(entry, timeout=_CLOSE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+
+        return False
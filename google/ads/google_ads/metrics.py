@@ -0,0 +1,368 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Metrics about Google Ads API requests.
+
+A MetricsRegistry passed to a GoogleAdsClient records, per method, the
+latency of requests, the size of requests and responses, the number of
+results per response, such as rows per Search page, the number of requests
+by status, the number of Google Ads API errors by error code and the number
+of retries. Metrics can be read in-process with get_metrics, or exported in
+the Prometheus text exposition format to a file or over HTTP.
+"""
+
+import bisect
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+
+_PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60,
+                   300)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+                 16777216, 67108864)
+RESULTS_BUCKETS = (0, 1, 10, 100, 1000, 5000, 10000)
+
+
+class Counter(object):
+    """A counter per combination of label values."""
+
+    type_name = 'counter'
+
+    def __init__(self, name, description, label_names):
+        """Initializer.
+
+        Args:
+            name: a str metric name.
+            description: a str describing the metric.
+            label_names: a tuple of str label names.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values = {}
+
+    def inc(self, label_values, value=1):
+        """Increments the counter of the given label values.
+
+        Args:
+            label_values: a tuple of label values, in the order of the label
+                names.
+            value: a number to add to the counter.
+        """
+        self._values[label_values] = self._values.get(label_values, 0) + value
+
+    def get(self):
+        """Returns a dict mapping label value tuples to counts."""
+        return dict(self._values)
+
+    def render(self):
+        """Returns the Prometheus text exposition lines of the counter."""
+        return ['%s%s %s' % (self.name,
+                             _format_labels(self.label_names, label_values),
+                             _format_value(value))
+                for label_values, value in sorted(self._values.items())]
+
+
+class Histogram(object):
+    """A histogram with fixed buckets per combination of label values."""
+
+    type_name = 'histogram'
+
+    def __init__(self, name, description, label_names, buckets):
+        """Initializer.
+
+        Args:
+            name: a str metric name.
+            description: a str describing the metric.
+            label_names: a tuple of str label names.
+            buckets: a sorted tuple of the upper bounds of the buckets.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._values = {}
+
+    def observe(self, label_values, value):
+        """Records a value for the given label values.
+
+        Args:
+            label_values: a tuple of label values, in the order of the label
+                names.
+            value: a number to record.
+        """
+        values = self._values.get(label_values)
+
+        if values is None:
+            # Bucket counts, with a final bucket for values above all bounds,
+            # followed by the sum of the values.
+            values = [0] * (len(self.buckets) + 1) + [0]
+            self._values[label_values] = values
+
+        values[bisect.bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def get(self):
+        """Returns the histograms of all label values.
+
+        Returns:
+            A dict mapping label value tuples to dicts with the "count" and
+            "sum" of the values, and the cumulative "buckets" as a list of
+            (upper bound, count) tuples ending with an infinite upper bound.
+        """
+        result = {}
+
+        for label_values, values in self._values.items():
+            cumulative = []
+            count = 0
+
+            for bound, bucket_count in zip(self.buckets + (float('inf'),),
+                                           values[:-1]):
+                count += bucket_count
+                cumulative.append((bound, count))
+
+            result[label_values] = {'buckets': cumulative, 'count': count,
+                                    'sum': values[-1]}
+
+        return result
+
+    def render(self):
+        """Returns the Prometheus text exposition lines of the histogram."""
+        lines = []
+        bucket_label_names = self.label_names + ('le',)
+
+        for label_values, histogram in sorted(self.get().items()):
+            for bound, count in histogram['buckets']:
+                lines.append('%s_bucket%s %d' % (
+                    self.name,
+                    _format_labels(bucket_label_names,
+                                   label_values + (_format_value(bound),)),
+                    count))
+
+            labels = _format_labels(self.label_names, label_values)
+            lines.append('%s_sum%s %s' % (self.name, labels,
+                                          _format_value(histogram['sum'])))
+            lines.append('%s_count%s %d' % (self.name, labels,
+                                            histogram['count']))
+
+        return lines
+
+
+class MetricsRegistry(object):
+    """Records metrics about requests and exports them.
+
+    A registry can be shared between GoogleAdsClient instances.
+    """
+
+    def __init__(self, customer_labels=False, prefix='google_ads'):
+        """Initializer.
+
+        Args:
+            customer_labels: a bool indicating whether request counts and
+                latencies are also labeled with the customer ID of requests.
+                This makes it possible to find slow customers, but creates
+                metrics for every customer ID.
+            prefix: a str prepended to the metric names.
+        """
+        self.customer_labels = customer_labels
+        self._lock = threading.Lock()
+        request_labels = (('method', 'customer_id') if customer_labels
+                          else ('method',))
+
+        self._requests = Counter(
+            '%s_requests_total' % prefix,
+            'Requests made, by gRPC status code.',
+            request_labels + ('status',))
+        self._latency = Histogram(
+            '%s_request_latency_seconds' % prefix,
+            'Request latency in seconds.', request_labels, LATENCY_BUCKETS)
+        self._request_bytes = Histogram(
+            '%s_request_bytes' % prefix, 'Serialized request size in bytes.',
+            ('method',), BYTES_BUCKETS)
+        self._response_bytes = Histogram(
+            '%s_response_bytes' % prefix,
+            'Serialized response size in bytes.', ('method',), BYTES_BUCKETS)
+        self._results = Histogram(
+            '%s_response_results' % prefix,
+            'Results per response, e.g. rows per Search page.', ('method',),
+            RESULTS_BUCKETS)
+        self._errors = Counter(
+            '%s_errors_total' % prefix,
+            'Google Ads API errors, by error code.', ('method', 'error_code'))
+        self._retries = Counter(
+            '%s_retries_total' % prefix, 'Retried requests.', ('method',))
+        self._metrics = (self._requests, self._latency, self._request_bytes,
+                         self._response_bytes, self._results, self._errors,
+                         self._retries)
+
+    def record_request(self, method, status, latency, customer_id=None,
+                       request_bytes=None, response_bytes=None, results=None,
+                       error_codes=()):
+        """Records a completed request.
+
+        Args:
+            method: a str method name such as "GoogleAdsService/Search".
+            status: a str gRPC status code name such as "OK".
+            latency: a float of the request's latency in seconds.
+            customer_id: an optional str customer ID of the request.
+            request_bytes: an optional int serialized size of the request.
+            response_bytes: an optional int serialized size of the response.
+            results: an optional int number of results in the response.
+            error_codes: an iterable of str Google Ads API error codes of a
+                failed request, such as "quota_error.RESOURCE_EXHAUSTED".
+        """
+        request_labels = ((method, customer_id or '') if self.customer_labels
+                          else (method,))
+
+        with self._lock:
+            self._requests.inc(request_labels + (status,))
+            self._latency.observe(request_labels, latency)
+
+            if request_bytes is not None:
+                self._request_bytes.observe((method,), request_bytes)
+
+            if response_bytes is not None:
+                self._response_bytes.observe((method,), response_bytes)
+
+            if results is not None:
+                self._results.observe((method,), results)
+
+            for error_code in error_codes:
+                self._errors.inc((method, error_code))
+
+    def record_retry(self, method):
+        """Records a retry of a request.
+
+        Args:
+            method: a str method name such as "GoogleAdsService/Search".
+        """
+        with self._lock:
+            self._retries.inc((method,))
+
+    def get_metrics(self):
+        """Returns a snapshot of the recorded metrics.
+
+        Returns:
+            A dict mapping metric names to dicts that map tuples of label
+            values to values. Counter values are numbers and histogram values
+            are dicts, see Histogram.get.
+        """
+        with self._lock:
+            return {metric.name: metric.get() for metric in self._metrics}
+
+    def render_prometheus(self):
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            A str with the HELP, TYPE and sample lines of every metric.
+        """
+        lines = []
+
+        with self._lock:
+            for metric in self._metrics:
+                lines.append('# HELP %s %s' % (metric.name,
+                                               metric.description))
+                lines.append('# TYPE %s %s' % (metric.name, metric.type_name))
+                lines.extend(metric.render())
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Writes the metrics in the Prometheus text exposition format.
+
+        The file is replaced atomically, so that it can be read at any time,
+        e.g. by the node exporter's textfile collector.
+
+        Args:
+            path: a str path of the file to write.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temporary_path = tempfile.mkstemp(dir=directory,
+                                                  suffix='.tmp')
+
+        try:
+            with os.fdopen(handle, 'w') as metrics_file:
+                metrics_file.write(self.render_prometheus())
+            os.replace(temporary_path, path)
+        except Exception:
+            os.remove(temporary_path)
+            raise
+
+    def get_http_handler(self):
+        """Returns an HTTP request handler class serving the metrics.
+
+        The handler can be used with http.server.HTTPServer, e.g.
+        HTTPServer(('', 8000), registry.get_http_handler()).serve_forever().
+
+        Returns:
+            A http.server.BaseHTTPRequestHandler subclass that responds to GET
+            requests with the metrics in the Prometheus text exposition format.
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', _PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrapes are too frequent to be worth logging.
+                pass
+
+        return MetricsHandler
+
+
+def _format_labels(label_names, label_values):
+    """Formats label names and values as a Prometheus label set.
+
+    Args:
+        label_names: a tuple of str label names.
+        label_values: a tuple of label values.
+
+    Returns:
+        A str such as '{method="GoogleAdsService/Search"}', or an empty str if
+        there are no labels.
+    """
+    if not label_names:
+        return ''
+
+    return '{%s}' % ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\')
+                     .replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in zip(label_names, label_values))
+
+
+def _format_value(value):
+    """Formats a sample value or bucket bound for Prometheus.
+
+    Args:
+        value: a number.
+
+    Returns:
+        A str such as "1", "0.25" or "+Inf".
+    """
+    if value == float('inf'):
+        return '+Inf'
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
@@ -0,0 +1,344 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs mutate jobs from creation to results with MutateJobService."""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent import futures
+
+from google.ads.google_ads import util
+from google.ads.google_ads.batching import MAX_OPERATIONS
+
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+
+class MutateJobPipeline(object):
+    """Creates, uploads, runs and polls mutate jobs, and streams their results.
+
+    Each job is created, filled and run on the thread submitting it:
+
+        service = client.get_service('MutateJobService')
+
+        with MutateJobPipeline(service) as pipeline:
+            for customer_id, operations in jobs:
+                pipeline.submit(customer_id, operations, sink.write)
+
+    Operations are read from any iterable and uploaded in chunks of at most
+    max_operations operations and max_bytes bytes, each chunk passing the
+    sequence token returned by the previous one, so that the operations of a
+    job never need to be held in memory at once.
+
+    Running jobs are polled by a single scheduler thread, each with its own
+    exponential backoff between polls, so that many jobs can be waited on
+    without a thread per job. Once a job is done its results are listed page
+    by page on a worker thread and passed to the job's callback as they
+    arrive.
+    """
+
+    def __init__(self, service, max_operations=MAX_OPERATIONS,
+                 max_bytes=_DEFAULT_MAX_BYTES, page_size=None,
+                 initial_poll_delay=1.0, max_poll_delay=60.0,
+                 poll_multiplier=2.0, max_workers=4, clock=time.monotonic):
+        """Initializer for the MutateJobPipeline.
+
+        Args:
+            service: a MutateJobService client.
+            max_operations: an int of the maximum number of operations per
+                AddMutateJobOperations request, up to MAX_OPERATIONS.
+            max_bytes: an int of the maximum serialized size of the
+                operations of an AddMutateJobOperations request. An operation
+                larger than max_bytes is uploaded on its own.
+            page_size: an optional int of the number of results per
+                ListMutateJobResults page.
+            initial_poll_delay: a float of the number of seconds between
+                running a job and polling it for the first time.
+            max_poll_delay: a float of the maximum number of seconds between
+                two polls of a job.
+            poll_multiplier: a float by which the delay between two polls of
+                a job grows after each poll.
+            max_workers: an int of the number of jobs whose results can be
+                listed at once.
+            clock: a callable returning the current time in seconds.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if not 1 <= max_operations <= MAX_OPERATIONS:
+            raise ValueError('max_operations must be between 1 and %d, got %s.'
+                             % (MAX_OPERATIONS, max_operations))
+
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1.')
+
+        if not 0 < initial_poll_delay <= max_poll_delay:
+            raise ValueError('Poll delays must satisfy 0 < initial_poll_delay '
+                             '<= max_poll_delay, got %s and %s.'
+                             % (initial_poll_delay, max_poll_delay))
+
+        if poll_multiplier < 1:
+            raise ValueError('poll_multiplier must be at least 1.')
+
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.page_size = page_size
+        self.initial_poll_delay = initial_poll_delay
+        self.max_poll_delay = max_poll_delay
+        self.poll_multiplier = poll_multiplier
+        self._service = service
+        self._clock = clock
+        self._condition = threading.Condition()
+        # (poll time, sequence number, job) tuples of the running jobs.
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._futures = []
+        self._closed = False
+        self._scheduler = None
+        self._executor = futures.ThreadPoolExecutor(max_workers)
+        self._stats = {'jobs': 0, 'operations': 0, 'upload_requests': 0,
+                       'polls': 0, 'results': 0, 'failed_jobs': 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, customer_id, operations, callback):
+        """Creates, fills and runs a mutate job.
+
+        Args:
+            customer_id: a str customer ID.
+            operations: an iterable of MutateOperation messages, which is
+                consumed as the operations are uploaded.
+            callback: a callable taking each MutateJobResult message of the
+                job, called on a worker thread once the job is done, in the
+                order results are listed.
+
+        Returns:
+            A concurrent.futures.Future of the str resource name of the job,
+            set once every result was passed to callback. Its exception is the
+            error the job's operation failed with, or the exception raised
+            while polling the job, listing its results or by callback.
+
+        Raises:
+            ValueError: If the pipeline is closed.
+            GoogleAdsException: If creating, filling or running the job fails,
+                in which case the job isn't polled.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError('Jobs cannot be submitted to a closed '
+                                 'MutateJobPipeline.')
+
+        resource_name = self._service.create_mutate_job(
+            customer_id).resource_name
+        operation_count = self.upload(resource_name, operations)
+        job = _Job(resource_name, self._service.run_mutate_job(resource_name),
+                   callback, self.initial_poll_delay)
+        _logger.info('Running mutate job %s of %d operations.', resource_name,
+                     operation_count)
+
+        with self._condition:
+            self._stats['jobs'] += 1
+            self._futures.append(job.future)
+            self._schedule_poll(job)
+
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._poll)
+                self._scheduler.daemon = True
+                self._scheduler.start()
+
+        return job.future
+
+    def upload(self, resource_name, operations, sequence_token=None):
+        """Adds operations to a mutate job in size-bounded chunks.
+
+        Args:
+            resource_name: a str resource name of a mutate job.
+            operations: an iterable of MutateOperation messages.
+            sequence_token: an optional str sequence token of the first
+                chunk, needed if operations were already added to the job.
+
+        Returns:
+            An int of the number of operations added.
+        """
+        chunk = []
+        size = 0
+        count = 0
+
+        for operation in operations:
+            operation_size = util.get_encoded_size(operation)
+
+            if chunk and size + operation_size > self.max_bytes:
+                sequence_token = self._add_operations(resource_name,
+                                                      sequence_token, chunk)
+                chunk = []
+                size = 0
+
+            chunk.append(operation)
+            size += operation_size
+            count += 1
+
+            if len(chunk) >= self.max_operations:
+                sequence_token = self._add_operations(resource_name,
+                                                      sequence_token, chunk)
+                chunk = []
+                size = 0
+
+        if chunk:
+            self._add_operations(resource_name, sequence_token, chunk)
+
+        return count
+
+    def wait(self, timeout=None):
+        """Waits for the submitted jobs to complete.
+
+        Args:
+            timeout: an optional float of the maximum number of seconds to
+                wait.
+
+        Returns:
+            A bool indicating whether every job completed.
+        """
+        with self._condition:
+            pending = list(self._futures)
+
+        _, not_done = futures.wait(pending, timeout)
+        return not not_done
+
+    def close(self):
+        """Waits for the submitted jobs and stops the scheduler."""
+        with self._condition:
+            self._closed = True
+
+        self.wait()
+
+        with self._condition:
+            self._condition.notify()
+
+        if self._scheduler:
+            self._scheduler.join()
+
+        self._executor.shutdown()
+
+    def get_stats(self):
+        """Returns statistics about the submitted jobs.
+
+        Returns:
+            A dict with the numbers of "jobs" submitted, "operations"
+            uploaded, AddMutateJobOperations "upload_requests", "polls" of
+            running jobs, "results" passed to callbacks and "failed_jobs".
+        """
+        with self._condition:
+            return dict(self._stats)
+
+    def _add_operations(self, resource_name, sequence_token, operations):
+        """Makes an AddMutateJobOperations request, returning the next token."""
+        response = self._service.add_mutate_job_operations(
+            resource_name, sequence_token, operations)
+
+        with self._condition:
+            self._stats['upload_requests'] += 1
+            self._stats['operations'] += len(operations)
+
+        return response.next_sequence_token
+
+    def _schedule_poll(self, job):
+        """Schedules the next poll of a job. Must be called with the lock."""
+        heapq.heappush(self._schedule, (self._clock() + job.poll_delay,
+                                        next(self._sequence), job))
+        self._condition.notify()
+
+    def _poll(self):
+        """Polls the running jobs as they're due, until closed."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._schedule:
+                        if self._closed:
+                            return
+
+                        self._condition.wait()
+                        continue
+
+                    timeout = self._schedule[0][0] - self._clock()
+
+                    if timeout <= 0:
+                        break
+
+                    self._condition.wait(timeout)
+
+                _, _, job = heapq.heappop(self._schedule)
+                self._stats['polls'] += 1
+
+            try:
+                done = job.operation.done()
+                # The operation is also done when the job itself failed.
+                error = job.operation.exception() if done else None
+            except Exception as exception:
+                self._fail(job, exception)
+                continue
+
+            if error is not None:
+                self._fail(job, error)
+            elif done:
+                self._executor.submit(self._stream_results, job)
+            else:
+                with self._condition:
+                    job.poll_delay = min(self.max_poll_delay,
+                                         job.poll_delay * self.poll_multiplier)
+                    self._schedule_poll(job)
+
+    def _stream_results(self, job):
+        """Passes the results of a done job to its callback."""
+        try:
+            for result in self._service.list_mutate_job_results(
+                    job.resource_name, page_size=self.page_size):
+                job.callback(result)
+
+                with self._condition:
+                    self._stats['results'] += 1
+        except Exception as exception:
+            self._fail(job, exception)
+        else:
+            job.future.set_result(job.resource_name)
+
+    def _fail(self, job, exception):
+        _logger.warning('Mutate job %s failed: %s', job.resource_name,
+                        exception)
+
+        with self._condition:
+            self._stats['failed_jobs'] += 1
+
+        job.future.set_exception(exception)
+
+
+class _Job(object):
+    """A running mutate job."""
+
+    def __init__(self, resource_name, operation, callback, poll_delay):
+        self.resource_name = resource_name
+        self.operation = operation
+        self.callback = callback
+        self.poll_delay = poll_delay
+        self.future = futures.Future()
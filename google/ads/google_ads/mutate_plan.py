@@ -0,0 +1,398 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Orders GoogleAdsService.mutate operations to group them by resource type.
+
+The latency of GoogleAdsService.mutate is roughly that of a series of calls
+to the individual mutate methods, one per change of resource type between
+consecutive operations. A MutatePlan reorders operations into as few runs of
+the same resource type as it can find, while keeping every operation after
+the operations it depends on:
+
+    plan = MutatePlan(mutate_operations)
+    response = ga_service.mutate(customer_id, plan.operations)
+    response = plan.restore_response(response)
+
+or, equivalently:
+
+    response = mutate_plan.mutate(ga_service, customer_id, mutate_operations)
+
+Dependencies are found through resource names. An operation that references
+a resource name, such as a campaign whose budget is a temp resource name,
+stays after the operation that creates, updates or removes that resource,
+and an operation that updates or removes a resource stays after the
+operations that reference it before.
+"""
+
+import heapq
+from importlib import import_module
+
+from google.ads.google_ads import client as client_module
+from google.ads.google_ads.errors import GoogleAdsException
+
+
+class MutatePlan(object):
+    """An order of mutate operations with few changes of resource type."""
+
+    def __init__(self, mutate_operations, version=None):
+        """Initializer for the MutatePlan.
+
+        Args:
+            mutate_operations: a list of MutateOperation messages in the order
+                the caller would send them.
+            version: an optional str indicating the version of the Google Ads
+                API of the operations, which defaults to the client's default
+                version.
+        """
+        self._failure_type = import_module(
+            'google.ads.google_ads.%s.proto.errors.errors_pb2'
+            % (version or client_module._DEFAULT_VERSION)).GoogleAdsFailure
+        operations = list(mutate_operations)
+        self.order = _get_grouped_order(
+            [get_operation_type(operation) for operation in operations],
+            get_dependencies(operations))
+        self.operations = [operations[index] for index in self.order]
+
+    def get_runs(self):
+        """Returns the runs of operations of the same resource type.
+
+        Returns:
+            A list of (operation type, number of operations) tuples in the
+            planned order, where the operation type is the name of the
+            MutateOperation field such as "campaign_operation".
+        """
+        runs = []
+
+        for operation in self.operations:
+            operation_type = get_operation_type(operation)
+
+            if runs and runs[-1][0] == operation_type:
+                runs[-1] = (operation_type, runs[-1][1] + 1)
+            else:
+                runs.append((operation_type, 1))
+
+        return runs
+
+    def get_original_index(self, index):
+        """Returns the caller's index of an operation of the plan.
+
+        Args:
+            index: an int index in the planned operations, such as the index
+                of a partial failure error.
+
+        Returns:
+            An int index in the operations given to the plan.
+        """
+        return self.order[index]
+
+    def restore_results(self, results):
+        """Puts a list of per-operation results back in the caller's order.
+
+        Args:
+            results: a sequence with an item per planned operation.
+
+        Returns:
+            A list with the item of each operation at the operation's index
+            in the operations given to the plan.
+        """
+        restored = [None] * len(results)
+
+        for index, result in zip(self.order, results):
+            restored[index] = result
+
+        return restored
+
+    def restore_response(self, response):
+        """Puts a MutateGoogleAdsResponse back in the caller's order.
+
+        Args:
+            response: the MutateGoogleAdsResponse of the planned operations.
+
+        Returns:
+            A new MutateGoogleAdsResponse whose mutate_operation_responses
+            and partial failure error indexes match the operations given to
+            the plan.
+        """
+        restored = type(response)()
+        restored.mutate_operation_responses.extend(
+            self.restore_results(response.mutate_operation_responses))
+
+        if response.HasField('partial_failure_error'):
+            restored.partial_failure_error.CopyFrom(
+                response.partial_failure_error)
+
+            for detail in restored.partial_failure_error.details:
+                if detail.Is(self._failure_type.DESCRIPTOR):
+                    failure = self._failure_type()
+                    detail.Unpack(failure)
+                    self.restore_failure(failure)
+                    detail.Pack(failure)
+
+        return restored
+
+    def restore_failure(self, failure):
+        """Changes the operation indexes of a GoogleAdsFailure in place.
+
+        Args:
+            failure: a GoogleAdsFailure of the planned operations, such as the
+                failure of a GoogleAdsException.
+        """
+        for error in failure.errors:
+            path = error.location.field_path_elements
+
+            if path and path[0].HasField('index'):
+                path[0].index.value = self.order[path[0].index.value]
+
+
+def mutate(service, customer_id, mutate_operations, version=None, **kwargs):
+    """Makes a GoogleAdsService.mutate request with grouped operations.
+
+    Args:
+        service: a GoogleAdsService client.
+        customer_id: a str customer ID.
+        mutate_operations: a list of MutateOperation messages.
+        version: an optional str indicating the version of the Google Ads API
+            of the service, which defaults to the client's default version.
+        kwargs: other arguments of GoogleAdsService.mutate, such as
+            partial_failure.
+
+    Returns:
+        The MutateGoogleAdsResponse, in the order of mutate_operations.
+
+    Raises:
+        GoogleAdsException: If the request fails. The indexes of its failure
+            match mutate_operations.
+    """
+    plan = MutatePlan(mutate_operations, version=version)
+
+    try:
+        response = service.mutate(customer_id, plan.operations, **kwargs)
+    except GoogleAdsException as exception:
+        if exception.failure is not None:
+            plan.restore_failure(exception.failure)
+        raise
+
+    return plan.restore_response(response)
+
+
+def get_operation_type(mutate_operation):
+    """Returns the name of the operation set on a MutateOperation.
+
+    Args:
+        mutate_operation: a MutateOperation message.
+
+    Returns:
+        A str such as "campaign_operation", or None if none is set.
+    """
+    return mutate_operation.WhichOneof('operation')
+
+
+def get_target_resource_name(operation):
+    """Returns the resource name that an operation creates, updates or removes.
+
+    Args:
+        operation: a MutateOperation message, or a resource operation message
+            such as a CampaignOperation.
+
+    Returns:
+        A str resource name, or None if the operation has none, such as a
+        create operation whose resource name is set by the server.
+    """
+    operation = _get_resource_operation(operation)
+    kind = _get_operation_kind(operation)
+
+    if kind == 'remove':
+        return operation.remove or None
+
+    if kind in ('create', 'update'):
+        return getattr(operation, kind).resource_name or None
+
+    return None
+
+
+def get_referenced_resource_names(operation):
+    """Returns the strings set on the resource of an operation.
+
+    Every string field of the created or updated resource, other than its own
+    resource name, is returned, since any of them can be a resource name.
+
+    Args:
+        operation: a MutateOperation message, or a resource operation message
+            such as a CampaignOperation.
+
+    Returns:
+        A set of str values.
+    """
+    operation = _get_resource_operation(operation)
+    kind = _get_operation_kind(operation)
+    values = set()
+
+    if kind in ('create', 'update'):
+        resource = getattr(operation, kind)
+        _add_strings(resource, values)
+        values.discard(resource.resource_name)
+
+    return values
+
+
+def get_dependencies(operations):
+    """Finds the operations each operation must come after.
+
+    An operation depends on the latest earlier operation targeting a resource
+    name that it references or targets itself, and on the earlier operations
+    referencing the resource name it targets since that operation.
+
+    Args:
+        operations: a list of MutateOperation or resource operation messages,
+            in the order the caller would send them.
+
+    Returns:
+        A list with a set of int indexes of earlier operations per operation.
+    """
+    last_targeted = {}
+    references = {}
+    dependencies = []
+
+    for index, operation in enumerate(operations):
+        target = get_target_resource_name(operation)
+        depends_on = set()
+
+        for name in get_referenced_resource_names(operation):
+            if name in last_targeted:
+                depends_on.add(last_targeted[name])
+
+            references.setdefault(name, []).append(index)
+
+        if target is not None:
+            if target in last_targeted:
+                depends_on.add(last_targeted[target])
+
+            depends_on.update(references.pop(target, ()))
+            last_targeted[target] = index
+
+        depends_on.discard(index)
+        dependencies.append(depends_on)
+
+    return dependencies
+
+
+def _get_grouped_order(types, dependencies):
+    """Orders operations topologically, with few changes of type.
+
+    Operations of the current type are taken while any is ready, in their
+    original order. When none is left, the next type is one whose remaining
+    operations are all ready, if any, so that it's finished in a single run,
+    and otherwise the type of the earliest ready operation.
+
+    Args:
+        types: a list with the type of each operation.
+        dependencies: a list with a set of int indexes of earlier operations
+            per operation.
+
+    Returns:
+        A list of the int indexes of the operations in the planned order.
+    """
+    waiting = [len(depends_on) for depends_on in dependencies]
+    dependents = [[] for _ in types]
+    remaining = {}
+    ready = {}
+
+    for index, depends_on in enumerate(dependencies):
+        remaining[types[index]] = remaining.get(types[index], 0) + 1
+
+        for dependency in depends_on:
+            dependents[dependency].append(index)
+
+        if not depends_on:
+            ready.setdefault(types[index], []).append(index)
+
+    order = []
+    current = None
+
+    while len(order) < len(types):
+        if not ready.get(current):
+            current = min(
+                (operation_type for operation_type, indexes in ready.items()
+                 if indexes),
+                key=lambda operation_type: (
+                    len(ready[operation_type]) < remaining[operation_type],
+                    ready[operation_type][0]))
+
+        index = heapq.heappop(ready[current])
+        order.append(index)
+        remaining[current] -= 1
+
+        for dependent in dependents[index]:
+            waiting[dependent] -= 1
+
+            if not waiting[dependent]:
+                heapq.heappush(ready.setdefault(types[dependent], []),
+                               dependent)
+
+    return order
+
+
+def _get_resource_operation(operation):
+    """Returns the resource operation set on a MutateOperation.
+
+    Args:
+        operation: a MutateOperation message, or a resource operation message
+            such as a CampaignOperation, which is returned as is.
+
+    Returns:
+        A resource operation message, or None if a MutateOperation has none.
+    """
+    if operation.DESCRIPTOR.name != 'MutateOperation':
+        return operation
+
+    operation_type = operation.WhichOneof('operation')
+    return getattr(operation, operation_type) if operation_type else None
+
+
+def _get_operation_kind(operation):
+    """Returns which of create, update or remove a resource operation sets.
+
+    Args:
+        operation: a resource operation message such as a CampaignOperation,
+            or None.
+
+    Returns:
+        A str "create", "update" or "remove", or None if none is set.
+    """
+    if operation is None:
+        return None
+
+    if 'operation' in operation.DESCRIPTOR.oneofs_by_name:
+        return operation.WhichOneof('operation')
+
+    # CustomerOperation only has an update field, outside of a oneof.
+    if operation.HasField('update'):
+        return 'update'
+
+    return None
+
+
+def _add_strings(message, values):
+    """Adds the string values of a message and its submessages to a set."""
+    for field, value in message.ListFields():
+        if field.type == field.TYPE_MESSAGE:
+            if field.label == field.LABEL_REPEATED:
+                for item in value:
+                    _add_strings(item, values)
+            else:
+                _add_strings(value, values)
+        elif field.type == field.TYPE_STRING:
+            if field.label == field.LABEL_REPEATED:
+                values.update(value)
+            else:
+                values.add(value)
@@ -0,0 +1,212 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reads and retries the failed operations of partial failure requests.
+
+A mutate request made with partial_failure=True applies its valid operations
+and reports the errors of the others in its response's
+partial_failure_error, whose details are GoogleAdsFailure messages locating
+each error at an operation index:
+
+    errors = partial_failure.get_operation_errors(response)
+    for index, operation_errors in errors.items():
+        ...
+
+mutate_with_retry sends the operations that failed with transient errors
+again, until they succeed or fail permanently:
+
+    outcomes = partial_failure.mutate_with_retry(
+        service.mutate_ad_group_criteria, customer_id, operations)
+"""
+
+import logging
+import time
+from collections import namedtuple
+from importlib import import_module
+
+from google.ads.google_ads import client as client_module
+from google.ads.google_ads import retry as retry_module
+
+
+_logger = logging.getLogger(__name__)
+
+# Error codes of operations that may succeed when sent again. Errors whose
+# default retry policy is limited to idempotent requests aren't included,
+# since operations are only retried in new mutate requests.
+RETRYABLE_ERROR_CODES = frozenset(
+    code for code, policy in retry_module.DEFAULT_POLICIES.items()
+    if '.' in code and not policy.idempotent_only)
+
+# The fields of mutate responses holding a result per operation.
+_RESULT_FIELDS = ('results', 'mutate_operation_responses')
+
+# The final outcome of an operation sent by mutate_with_retry. result is the
+# operation's result message, or None if it failed with errors, a list of
+# GoogleAdsError messages. attempts is the number of requests it was sent in.
+OperationOutcome = namedtuple('OperationOutcome',
+                              ('result', 'errors', 'attempts'))
+
+
+def get_operation_errors(response, version=None):
+    """Groups the partial failure errors of a response by operation.
+
+    Args:
+        response: a mutate response message.
+        version: an optional str indicating the version of the Google Ads API
+            of the response, which defaults to the client's default version.
+
+    Returns:
+        A dict mapping int operation indexes to lists of GoogleAdsError
+        messages. Errors without an operation index are mapped to None.
+    """
+    status = getattr(response, 'partial_failure_error', None)
+    errors = {}
+
+    if status is None or not status.code:
+        return errors
+
+    failure_type = _get_failure_type(version)
+
+    for detail in status.details:
+        if not detail.Is(failure_type.DESCRIPTOR):
+            continue
+
+        for error in failure_type.FromString(detail.value).errors:
+            path = error.location.field_path_elements
+            index = path[0].index.value if (
+                path and path[0].HasField('index')) else None
+            errors.setdefault(index, []).append(error)
+
+    return errors
+
+
+def is_retryable(errors, retryable_codes=RETRYABLE_ERROR_CODES):
+    """Returns whether an operation that failed may succeed when sent again.
+
+    Args:
+        errors: a non-empty list of the GoogleAdsError messages of an
+            operation.
+        retryable_codes: a collection of str error codes such as
+            "quota_error.RESOURCE_TEMPORARILY_EXHAUSTED".
+
+    Returns:
+        True if every error of the operation has a retryable error code.
+    """
+    return all(retry_module.get_google_ads_error_code(error)
+               in retryable_codes for error in errors)
+
+
+def get_results(response):
+    """Returns the repeated field of a mutate response's per-operation results.
+
+    Args:
+        response: a mutate response message, such as a MutateCampaignsResponse
+            or a MutateGoogleAdsResponse.
+
+    Returns:
+        The repeated field of result messages, in the order of the operations.
+
+    Raises:
+        ValueError: If the response has no results field.
+    """
+    for field in _RESULT_FIELDS:
+        if field in response.DESCRIPTOR.fields_by_name:
+            return getattr(response, field)
+
+    raise ValueError('%s has no results.' % response.DESCRIPTOR.name)
+
+
+def mutate_with_retry(mutate, customer_id, operations, policy=None,
+                      retryable_codes=RETRYABLE_ERROR_CODES, version=None,
+                      sleep=time.sleep, **kwargs):
+    """Makes a partial failure request, then retries its transient failures.
+
+    Operations that failed only with retryable errors are sent again in a
+    single follow-up request, in their original order, after a delay with
+    decorrelated jitter. Operations that succeeded or failed permanently
+    aren't sent again.
+
+    Args:
+        mutate: a service client mutate method taking a str customer ID, a
+            list of operations and a partial_failure keyword argument, such as
+            CampaignService.mutate_campaigns.
+        customer_id: a str customer ID.
+        operations: a list of operation messages of the mutate method.
+        policy: an optional retry.RetryPolicy setting the number of attempts
+            and the delays between them.
+        retryable_codes: a collection of str error codes of the operations to
+            retry.
+        version: an optional str indicating the version of the Google Ads API
+            of the mutate method, which defaults to the client's default
+            version.
+        sleep: a callable taking a float number of seconds to wait.
+        kwargs: other arguments of the mutate method.
+
+    Returns:
+        A list with an OperationOutcome per operation, in their order.
+
+    Raises:
+        GoogleAdsException: If a whole request fails. Outcomes of earlier
+            requests are lost, but their operations remain applied.
+    """
+    policy = policy or retry_module.RetryPolicy()
+    operations = list(operations)
+    outcomes = [None] * len(operations)
+    pending = list(range(len(operations)))
+    attempt = 0
+    delay = None
+
+    while pending:
+        if attempt:
+            delay = policy.get_delay(delay)
+            _logger.info('Retrying %d failed operations in %.2f seconds.',
+                         len(pending), delay)
+            sleep(delay)
+
+        attempt += 1
+        response = mutate(customer_id,
+                          [operations[index] for index in pending],
+                          partial_failure=True, **kwargs)
+        errors = get_operation_errors(response, version=version)
+        results = get_results(response)
+        retry = []
+
+        for position, index in enumerate(pending):
+            operation_errors = errors.get(position)
+
+            if not operation_errors:
+                outcomes[index] = OperationOutcome(results[position], [],
+                                                   attempt)
+                continue
+
+            outcomes[index] = OperationOutcome(None, operation_errors,
+                                               attempt)
+
+            if (attempt < policy.max_attempts and
+                    is_retryable(operation_errors, retryable_codes)):
+                retry.append(index)
+
+        if None in errors:
+            _logger.warning('Partial failure errors without an operation '
+                            'index: %s', '; '.join(
+                                error.message for error in errors[None]))
+
+        pending = retry
+
+    return outcomes
+
+
+def _get_failure_type(version):
+    return import_module(
+        'google.ads.google_ads.%s.proto.errors.errors_pb2'
+        % (version or client_module._DEFAULT_VERSION)).GoogleAdsFailure
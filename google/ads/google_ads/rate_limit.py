@@ -0,0 +1,370 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Client-side rate limiting for Google Ads API requests.
+
+Requests are throttled with token buckets, which allow short bursts of up to
+the bucket's size and then limit the sustained rate of requests. Separate
+buckets can be configured for each developer token, for each customer ID and
+for individual methods, and a request has to take a token from every bucket
+that applies to it.
+
+Rate limits can be set in the "rate_limits" section of a google-ads.yaml file:
+
+    rate_limits:
+      developer_token:
+        rate: 50
+        burst: 100
+      customer:
+        rate: 10
+      methods:
+        GoogleAdsService/Mutate:
+          rate: 2
+      blocking: True
+      timeout: 60
+
+Rates are given in requests per second. The burst defaults to the rate,
+rounded up to at least one request.
+"""
+
+import logging
+import math
+import threading
+import time
+
+from google.ads.google_ads import util
+
+_logger = logging.getLogger(__name__)
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a request can't be made without exceeding a rate limit."""
+
+    def __init__(self, message, wait_seconds):
+        """Initializer.
+
+        Args:
+            message: a str describing which rate limit was exceeded.
+            wait_seconds: a float of the number of seconds until the request
+                could be made.
+        """
+        super(RateLimitExceededError, self).__init__(message)
+        self.wait_seconds = wait_seconds
+
+
+class TokenBucket(object):
+    """A token bucket, refilled at a constant rate up to its burst size.
+
+    Token buckets aren't thread-safe on their own; RateLimiter guards the
+    buckets it holds with a lock.
+    """
+
+    def __init__(self, rate, burst=None, now=None):
+        """Initializer.
+
+        Args:
+            rate: a positive float of the number of tokens added per second.
+            burst: an optional positive float of the maximum number of tokens
+                the bucket holds. Defaults to the rate, and to one token if
+                the rate is lower than that.
+            now: an optional float of the current time in seconds, used as the
+                time the bucket was last refilled. The bucket starts full.
+
+        Raises:
+            ValueError: If the rate or burst isn't positive.
+        """
+        if burst is None:
+            burst = max(math.ceil(rate), 1)
+
+        if rate <= 0 or burst <= 0:
+            raise ValueError('Token bucket rate and burst must be positive, '
+                             'got rate %s and burst %s.' % (rate, burst))
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic() if now is None else now
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def get_delay(self, now, tokens=1):
+        """Returns how many seconds until the given tokens are available.
+
+        Args:
+            now: a float of the current time in seconds.
+            tokens: a float of the number of tokens that are needed.
+
+        Returns:
+            A float of the number of seconds to wait, 0 if the tokens are
+            available now.
+        """
+        self._refill(now)
+        missing = tokens - self._tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, now, tokens=1):
+        """Removes the given tokens, which must be available.
+
+        Args:
+            now: a float of the current time in seconds.
+            tokens: a float of the number of tokens to remove.
+        """
+        self._refill(now)
+        self._tokens -= tokens
+
+
+class RateLimiter(object):
+    """Limits requests per developer token, customer ID and method.
+
+    A RateLimiter can be shared between GoogleAdsClient instances, in which
+    case their requests count towards the same limits.
+    """
+
+    def __init__(self, developer_token_limit=None, customer_limit=None,
+                 method_limits=None, blocking=True, timeout=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        """Initializer.
+
+        Args:
+            developer_token_limit: an optional dict with the "rate" and
+                optional "burst" of the bucket shared by all requests using the
+                same developer token.
+            customer_limit: an optional dict with the "rate" and optional
+                "burst" of the bucket shared by all requests for the same
+                customer ID.
+            method_limits: an optional dict mapping method names, e.g.
+                "GoogleAdsService/Mutate", to dicts with the "rate" and
+                optional "burst" of the bucket shared by all requests to that
+                method.
+            blocking: a bool indicating whether acquire waits for rate limits
+                by default, or raises RateLimitExceededError right away.
+            timeout: an optional float of the default maximum number of seconds
+                acquire waits before raising RateLimitExceededError. If None it
+                waits for as long as necessary.
+            clock: a callable returning the current time in seconds.
+            sleep: a callable taking a number of seconds to sleep for.
+
+        Raises:
+            ValueError: If a limit has no rate, or a rate or burst isn't
+                positive.
+        """
+        self.developer_token_limit = _validate_limit(developer_token_limit)
+        self.customer_limit = _validate_limit(customer_limit)
+        self.method_limits = {
+            method: _validate_limit(limit)
+            for method, limit in (method_limits or {}).items()}
+        self.blocking = blocking
+        self.timeout = timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._acquired = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Creates a RateLimiter from the "rate_limits" configuration section.
+
+        Args:
+            config_data: a dict with the optional keys "developer_token",
+                "customer", "methods", "blocking" and "timeout".
+
+        Returns:
+            A RateLimiter initialized with the given configuration.
+
+        Raises:
+            ValueError: If the configuration contains unknown keys or invalid
+                limits.
+        """
+        unknown_keys = set(config_data) - set(_CONFIG_KEYS)
+
+        if unknown_keys:
+            raise ValueError('Unknown rate_limits configuration keys: %s. '
+                             'Valid keys are: %s' % (
+                                 ', '.join(sorted(unknown_keys)),
+                                 ', '.join(_CONFIG_KEYS)))
+
+        return cls(developer_token_limit=config_data.get('developer_token'),
+                   customer_limit=config_data.get('customer'),
+                   method_limits=config_data.get('methods'),
+                   blocking=config_data.get('blocking', True),
+                   timeout=config_data.get('timeout'))
+
+    def _get_bucket_keys(self, developer_token, customer_id, method):
+        """Returns the keys and limits of the buckets a request draws from."""
+        keys = []
+
+        if self.developer_token_limit and developer_token:
+            keys.append((('developer_token', developer_token),
+                         self.developer_token_limit))
+
+        if self.customer_limit and customer_id:
+            keys.append((('customer', customer_id), self.customer_limit))
+
+        if method:
+            method_name = util.get_method_name(method)
+            method_limit = self.method_limits.get(method_name)
+
+            if method_limit:
+                keys.append((('method', method_name), method_limit))
+
+        return keys
+
+    def _get_buckets(self, keys, now):
+        buckets = []
+
+        for key, limit in keys:
+            bucket = self._buckets.get(key)
+
+            if bucket is None:
+                bucket = TokenBucket(limit['rate'], limit.get('burst'), now)
+                self._buckets[key] = bucket
+
+            buckets.append((key, bucket))
+
+        return buckets
+
+    def acquire(self, developer_token=None, customer_id=None, method=None,
+                blocking=None, timeout=None):
+        """Takes a token for a request from every bucket that applies to it.
+
+        Tokens are only taken once all of the buckets have one available, so a
+        request that is rejected or times out doesn't use up any tokens.
+
+        Args:
+            developer_token: an optional str developer token of the request.
+            customer_id: an optional str customer ID of the request.
+            method: an optional str of the request's method, either a full gRPC
+                method such as
+                "/google.ads.googleads.v2.services.GoogleAdsService/Mutate" or
+                just "GoogleAdsService/Mutate".
+            blocking: an optional bool overriding whether to wait for the
+                tokens or raise right away.
+            timeout: an optional float overriding the maximum number of
+                seconds to wait.
+
+        Returns:
+            A float of the number of seconds spent waiting.
+
+        Raises:
+            RateLimitExceededError: If the tokens aren't available and blocking
+                is disabled, or the timeout would be exceeded.
+        """
+        if blocking is None:
+            blocking = self.blocking
+
+        if timeout is None:
+            timeout = self.timeout
+
+        keys = self._get_bucket_keys(developer_token, customer_id, method)
+
+        if not keys:
+            return 0.0
+
+        start = self._clock()
+        deadline = None if timeout is None else start + timeout
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                buckets = self._get_buckets(keys, now)
+                delay, limited_key = max(
+                    (bucket.get_delay(now), key) for key, bucket in buckets)
+
+                if delay <= 0:
+                    for _, bucket in buckets:
+                        bucket.take(now)
+                    waited = now - start
+                    self._acquired += 1
+                    self._wait_seconds += waited
+                    return waited
+
+                if not blocking or (deadline is not None and
+                                    now + delay > deadline):
+                    self._rejected += 1
+                    raise RateLimitExceededError(
+                        'Rate limit for %s "%s" exceeded, the request could be '
+                        'made in %.3f seconds.' % (limited_key[0],
+                                                   limited_key[1], delay),
+                        delay)
+
+            _logger.debug('Waiting %.3f seconds for the rate limit of %s "%s".',
+                          delay, limited_key[0], limited_key[1])
+            self._sleep(delay)
+
+    def try_acquire(self, developer_token=None, customer_id=None, method=None):
+        """Takes a token for a request only if one is available right away.
+
+        Args:
+            developer_token: an optional str developer token of the request.
+            customer_id: an optional str customer ID of the request.
+            method: an optional str of the request's method.
+
+        Returns:
+            True if the request can be made, False otherwise.
+        """
+        try:
+            self.acquire(developer_token, customer_id, method, blocking=False)
+        except RateLimitExceededError:
+            return False
+
+        return True
+
+    def get_stats(self):
+        """Returns statistics about the requests that were rate limited.
+
+        Returns:
+            A dict with the number of "acquired" and "rejected" requests, the
+            total "wait_seconds" spent waiting for tokens and the number of
+            "buckets" in use.
+        """
+        with self._lock:
+            return {'acquired': self._acquired,
+                    'rejected': self._rejected,
+                    'wait_seconds': self._wait_seconds,
+                    'buckets': len(self._buckets)}
+
+
+_CONFIG_KEYS = ('developer_token', 'customer', 'methods', 'blocking',
+                'timeout')
+
+
+def _validate_limit(limit):
+    """Checks that a limit dict has a rate, and returns it.
+
+    Args:
+        limit: a dict with a "rate" and optional "burst", or None.
+
+    Returns:
+        The given limit.
+
+    Raises:
+        ValueError: If the limit has no rate, or its rate or burst isn't
+            positive.
+    """
+    if limit is None:
+        return None
+
+    if 'rate' not in limit:
+        raise ValueError('Rate limits must specify a "rate", got: %s' % limit)
+
+    # Raises a ValueError if the rate or burst is invalid.
+    TokenBucket(limit['rate'], limit.get('burst'), now=0)
+    return limit
@@ -0,0 +1,211 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Creates update operations holding only the fields that changed.
+
+Given the current state of a resource, such as a row returned by Search, and
+its desired state, create_update_operation returns an operation whose
+update_mask lists only the fields whose values differ, and whose update
+message only holds those fields:
+
+    operation = resource_diff.create_update_operation(row.campaign, desired)
+    if operation is not None:
+        operations.append(operation)
+
+Fields are compared through the resources' descriptors, so that any resource
+type with an update operation is supported. Wrapper fields such as
+StringValue, repeated fields and map fields are compared as a whole, since
+the API replaces them as a whole, while other message fields are compared
+field by field.
+"""
+
+import posixpath
+from importlib import import_module
+
+
+_SERVICES_MODULE = 'google.ads.google_ads.%s.proto.services.%s_service_pb2'
+
+
+def get_changed_fields(current, desired, clear_unset=False):
+    """Finds the fields whose desired values differ from their current values.
+
+    Args:
+        current: a resource message of the current state of a resource.
+        desired: a resource message of the same type with its desired state.
+        clear_unset: a bool indicating whether fields set in current but not
+            in desired are cleared. By default only the fields set in
+            desired are compared, so that desired can hold only the fields
+            the caller manages.
+
+    Returns:
+        A list of str field mask paths such as
+        "network_settings.target_search_network", in the order of the
+        fields in the resource's descriptor. The resource_name field is never
+        included.
+
+    Raises:
+        ValueError: If the messages have different types.
+    """
+    if current.DESCRIPTOR is not desired.DESCRIPTOR:
+        raise ValueError('Cannot compare a %s to a %s.' % (
+            current.DESCRIPTOR.name, desired.DESCRIPTOR.name))
+
+    paths = []
+    _add_changed_fields(current, desired, '', paths, clear_unset)
+    return [path for path in paths if path != 'resource_name']
+
+
+def create_update_operation(current, desired, clear_unset=False):
+    """Creates an update operation of the fields that changed.
+
+    Args:
+        current: a resource message of the current state of a resource, whose
+            resource_name is set.
+        desired: a resource message of the same type with its desired state.
+            Its resource_name, if set, must match current's.
+        clear_unset: a bool indicating whether fields set in current but not
+            in desired are cleared, see get_changed_fields.
+
+    Returns:
+        A resource operation message such as a CampaignOperation, whose update
+        only holds the resource name and the changed fields, listed in its
+        update_mask, or None if no field changed.
+
+    Raises:
+        ValueError: If the messages have different types or resource names,
+            or the resource type can't be updated.
+    """
+    if desired.resource_name and desired.resource_name != (
+            current.resource_name):
+        raise ValueError('Cannot update %s to %s.' % (current.resource_name,
+                                                      desired.resource_name))
+
+    paths = get_changed_fields(current, desired, clear_unset=clear_unset)
+
+    if not paths:
+        return None
+
+    operation = get_operation_type(desired)()
+
+    if 'update' not in operation.DESCRIPTOR.fields_by_name:
+        raise ValueError('%s resources cannot be updated.'
+                         % desired.DESCRIPTOR.name)
+
+    operation.update_mask.paths.extend(paths)
+    operation.update_mask.MergeMessage(desired, operation.update,
+                                       replace_message_field=True,
+                                       replace_repeated_field=True)
+    operation.update.resource_name = current.resource_name
+    return operation
+
+
+def get_operation_type(resource):
+    """Returns the operation message class of a resource type.
+
+    Args:
+        resource: a resource message, or message class, such as a Campaign.
+
+    Returns:
+        The operation message class of the resource's service, such as
+        CampaignOperation.
+
+    Raises:
+        ValueError: If the resource type has no mutate service.
+    """
+    descriptor = resource.DESCRIPTOR
+    # Resources are mutated with <Resource>Operation messages of
+    # <resource>_service.proto.
+    version = descriptor.file.package.split('.')[3]
+    module_name = _SERVICES_MODULE % (version, get_resource_type(resource))
+
+    try:
+        return getattr(import_module(module_name),
+                       '%sOperation' % descriptor.name)
+    except (ImportError, AttributeError):
+        raise ValueError('%s resources cannot be mutated.' % descriptor.name)
+
+
+def get_resource_type(resource):
+    """Returns the name of a resource type in GAQL and GoogleAdsRow fields.
+
+    Args:
+        resource: a resource message, or message class, such as an AdGroup.
+
+    Returns:
+        A str such as "ad_group".
+    """
+    # Resources are defined in google/ads/googleads_<version>/proto/resources/
+    # <resource>.proto.
+    return posixpath.splitext(posixpath.basename(
+        resource.DESCRIPTOR.file.name))[0]
+
+
+def to_mutate_operation(operation):
+    """Wraps a resource operation into a MutateOperation.
+
+    Args:
+        operation: a resource operation message such as a CampaignOperation.
+
+    Returns:
+        A MutateOperation message of GoogleAdsService.mutate holding a copy
+        of the operation.
+
+    Raises:
+        ValueError: If GoogleAdsService.mutate doesn't support the operation
+            type.
+    """
+    version = operation.DESCRIPTOR.file.package.split('.')[3]
+    mutate_operation = import_module(
+        _SERVICES_MODULE % (version, 'google_ads')).MutateOperation()
+
+    for field in mutate_operation.DESCRIPTOR.fields:
+        if field.message_type is operation.DESCRIPTOR:
+            getattr(mutate_operation, field.name).CopyFrom(operation)
+            return mutate_operation
+
+    raise ValueError('GoogleAdsService.mutate does not support %s messages.'
+                     % operation.DESCRIPTOR.name)
+
+
+def _add_changed_fields(current, desired, prefix, paths, clear_unset):
+    """Adds the paths of the fields that differ between two messages."""
+    for field in desired.DESCRIPTOR.fields:
+        path = prefix + field.name
+        current_value = getattr(current, field.name)
+        desired_value = getattr(desired, field.name)
+
+        if field.label == field.LABEL_REPEATED:
+            if (desired_value or clear_unset) and (
+                    current_value != desired_value):
+                paths.append(path)
+        elif field.type == field.TYPE_MESSAGE:
+            current_set = current.HasField(field.name)
+
+            if not desired.HasField(field.name):
+                if clear_unset and current_set:
+                    paths.append(path)
+            elif (_is_atomic(field.message_type) or
+                  not desired_value.ListFields()):
+                if not current_set or current_value != desired_value:
+                    paths.append(path)
+            else:
+                _add_changed_fields(current_value, desired_value, path + '.',
+                                    paths, clear_unset)
+        elif current_value != desired_value and (
+                clear_unset or desired_value != field.default_value):
+            paths.append(path)
+
+
+def _is_atomic(message_descriptor):
+    """Returns whether a message type is compared and replaced as a whole."""
+    return message_descriptor.full_name.startswith('google.protobuf.')
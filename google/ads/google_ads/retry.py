@@ -0,0 +1,381 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retries of transient Google Ads API failures.
+
+Failures are matched to retry policies by their error codes, most specific
+first: the Google Ads API errors of a GoogleAdsFailure, written as
+"<error type>.<error code>" such as
+"quota_error.RESOURCE_TEMPORARILY_EXHAUSTED", and then the gRPC status code
+such as "UNAVAILABLE". Delays between attempts use decorrelated jitter, so
+that clients that failed at the same time don't retry at the same time. A
+retry budget shared by all requests limits retries to a fraction of the
+requests made, which keeps retries from multiplying the load on the API
+during an outage.
+
+Retries can be configured in the "retry" section of a google-ads.yaml file,
+where the given policies replace the default policies of the same codes:
+
+    retry:
+      policies:
+        RESOURCE_EXHAUSTED:
+          max_attempts: 3
+          initial_delay: 10
+          max_delay: 120
+      budget:
+        ratio: 0.1
+        min_retries_per_second: 1
+"""
+
+import logging
+import random
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+# Read-only methods can be retried after failures that may have happened
+# after the request was applied, such as DEADLINE_EXCEEDED.
+_IDEMPOTENT_METHOD_PREFIXES = ('Get', 'List', 'Search', 'Generate', 'Suggest')
+_CONFIG_KEYS = ('policies', 'budget')
+
+
+class RetryPolicy(object):
+    """How failures with a given error code are retried."""
+
+    def __init__(self, max_attempts=3, initial_delay=1.0, max_delay=60.0,
+                 idempotent_only=False):
+        """Initializer.
+
+        Args:
+            max_attempts: an int of the total number of attempts, including the
+                first one. 1 disables retries.
+            initial_delay: a float of the minimum number of seconds to wait
+                before a retry.
+            max_delay: a float of the maximum number of seconds to wait before
+                a retry.
+            idempotent_only: a bool indicating whether only read-only methods
+                are retried, because the failed request may have been applied.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1, got %s.'
+                             % max_attempts)
+
+        if not 0 <= initial_delay <= max_delay:
+            raise ValueError('Retry delays must satisfy 0 <= initial_delay <= '
+                             'max_delay, got %s and %s.' % (initial_delay,
+                                                            max_delay))
+
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.idempotent_only = idempotent_only
+
+    def get_delay(self, previous_delay, uniform=random.uniform):
+        """Returns the delay before a retry, with decorrelated jitter.
+
+        Args:
+            previous_delay: a float of the delay before the previous retry, or
+                None before the first retry.
+            uniform: a callable returning a random float between its two
+                arguments.
+
+        Returns:
+            A float of the number of seconds to wait.
+        """
+        previous_delay = previous_delay or self.initial_delay
+        return min(self.max_delay,
+                   uniform(self.initial_delay, previous_delay * 3))
+
+
+DEFAULT_POLICIES = {
+    'UNAVAILABLE': RetryPolicy(max_attempts=5, idempotent_only=True),
+    'DEADLINE_EXCEEDED': RetryPolicy(idempotent_only=True),
+    'INTERNAL': RetryPolicy(idempotent_only=True),
+    'RESOURCE_EXHAUSTED': RetryPolicy(initial_delay=5.0, max_delay=120.0),
+    'internal_error.TRANSIENT_ERROR': RetryPolicy(),
+    'internal_error.INTERNAL_ERROR': RetryPolicy(idempotent_only=True),
+    'quota_error.RESOURCE_TEMPORARILY_EXHAUSTED': RetryPolicy(
+        max_attempts=5, initial_delay=5.0, max_delay=120.0),
+    'database_error.CONCURRENT_MODIFICATION': RetryPolicy(),
+}
+
+
+class RetryBudget(object):
+    """Limits retries to a fraction of requests, shared by all requests.
+
+    Every request deposits ratio tokens and every retry withdraws one, so that
+    at most about ratio retries are made per request. The budget also refills
+    by min_retries_per_second so that clients making few requests can still
+    retry.
+    """
+
+    def __init__(self, ratio=0.1, min_retries_per_second=1.0, max_tokens=100,
+                 clock=time.monotonic):
+        """Initializer.
+
+        Args:
+            ratio: a float of the number of retries allowed per request.
+            min_retries_per_second: a float of the rate at which retries are
+                allowed regardless of the number of requests.
+            max_tokens: a float of the maximum number of retries that can be
+                saved up. The budget starts full.
+            clock: a callable returning the current time in seconds.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = float(max_tokens)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.max_tokens
+        self._updated = clock()
+
+    def _refill(self, tokens):
+        now = self._clock()
+        self._tokens = min(self.max_tokens, self._tokens + tokens + (
+            now - self._updated) * self.min_retries_per_second)
+        self._updated = now
+
+    def deposit(self):
+        """Records a request, adding to the budget."""
+        with self._lock:
+            self._refill(self.ratio)
+
+    def withdraw(self):
+        """Takes a retry from the budget if one is available.
+
+        Returns:
+            True if the retry may be made, False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill(0)
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+    def get_balance(self):
+        """Returns a float of the number of retries currently available."""
+        with self._lock:
+            self._refill(0)
+            return self._tokens
+
+
+class Retrier(object):
+    """Decides whether and when failed requests are retried."""
+
+    def __init__(self, policies=None, budget=None, sleep=time.sleep,
+                 uniform=random.uniform):
+        """Initializer.
+
+        Args:
+            policies: an optional dict mapping error codes to RetryPolicy
+                instances, which replace the DEFAULT_POLICIES of the same
+                codes. A None value removes the default policy of a code.
+            budget: an optional RetryBudget shared by the retried requests. If
+                None a RetryBudget with the default settings is used.
+            sleep: a callable taking a number of seconds to sleep for.
+            uniform: a callable returning a random float between its two
+                arguments.
+        """
+        self.policies = dict(DEFAULT_POLICIES)
+
+        for code, policy in (policies or {}).items():
+            if policy is None:
+                self.policies.pop(code, None)
+            else:
+                self.policies[code] = policy
+
+        self.budget = budget if budget is not None else RetryBudget()
+        self.sleep = sleep
+        self._uniform = uniform
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._budget_exhausted = 0
+        self._retries_by_code = {}
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Creates a Retrier from the "retry" configuration section.
+
+        Args:
+            config_data: a dict with the optional keys "policies", a dict
+                mapping error codes to dicts of RetryPolicy arguments, and
+                "budget", a dict of RetryBudget arguments.
+
+        Returns:
+            A Retrier initialized with the given configuration.
+
+        Raises:
+            ValueError: If the configuration contains unknown keys or invalid
+                policies.
+        """
+        unknown_keys = set(config_data) - set(_CONFIG_KEYS)
+
+        if unknown_keys:
+            raise ValueError('Unknown retry configuration keys: %s. Valid '
+                             'keys are: %s' % (', '.join(sorted(unknown_keys)),
+                                               ', '.join(_CONFIG_KEYS)))
+
+        policies_data = config_data.get('policies') or {}
+
+        try:
+            policies = {
+                code: RetryPolicy(**policy) if policy is not None else None
+                for code, policy in policies_data.items()}
+            budget = RetryBudget(**(config_data.get('budget') or {}))
+        except TypeError as error:
+            raise ValueError('Invalid retry configuration: %s' % error)
+
+        return cls(policies=policies, budget=budget)
+
+    def get_policy(self, error_codes, method=None):
+        """Returns the policy of the most specific error code that has one.
+
+        A failure with Google Ads API errors is only retried if every one of
+        them has a policy, so that a request with a permanent error isn't sent
+        again, in which case the policy of the first one is used. Otherwise
+        the policy of its gRPC status code is used.
+
+        Args:
+            error_codes: a list of str error codes, most specific first.
+            method: an optional str of the request's gRPC method.
+
+        Returns:
+            A tuple of the matching error code and its RetryPolicy, or
+            (None, None) if the failure isn't retried.
+        """
+        method_name = method.rsplit('/', 1)[-1] if method else ''
+        idempotent = method_name.startswith(_IDEMPOTENT_METHOD_PREFIXES)
+        # Google Ads API error codes are written as
+        # "<error type>.<error code>", unlike gRPC status codes.
+        google_ads_codes = [code for code in error_codes if '.' in code]
+        candidates = google_ads_codes or error_codes
+        matches = []
+
+        for code in candidates:
+            policy = self.policies.get(code)
+
+            if policy is None:
+                if google_ads_codes:
+                    return None, None
+                continue
+
+            if policy.idempotent_only and not idempotent:
+                return None, None
+
+            matches.append((code, policy))
+
+        return matches[0] if matches else (None, None)
+
+    def record_request(self):
+        """Records an attempt of a request, adding to the retry budget."""
+        self.budget.deposit()
+
+        with self._lock:
+            self._requests += 1
+
+    def get_retry_delay(self, error_codes, method, attempt, previous_delay):
+        """Returns how long to wait before retrying a failed attempt.
+
+        Args:
+            error_codes: a list of str error codes of the failure, most
+                specific first.
+            method: a str of the request's gRPC method.
+            attempt: an int of the number of the failed attempt, starting at 1.
+            previous_delay: a float of the delay before the failed attempt, or
+                None if it was the first attempt.
+
+        Returns:
+            A float of the number of seconds to wait before retrying, or None
+            if the request shouldn't be retried.
+        """
+        code, policy = self.get_policy(error_codes, method)
+
+        if policy is None or attempt >= policy.max_attempts:
+            return None
+
+        if not self.budget.withdraw():
+            with self._lock:
+                self._budget_exhausted += 1
+            _logger.warning('Not retrying %s after %s, the retry budget is '
+                            'exhausted.', method, code)
+            return None
+
+        with self._lock:
+            self._retries += 1
+            self._retries_by_code[code] = (
+                self._retries_by_code.get(code, 0) + 1)
+
+        delay = policy.get_delay(previous_delay, self._uniform)
+        _logger.info('Retrying %s in %.2f seconds after %s (attempt %d of '
+                     '%d).', method, delay, code, attempt + 1,
+                     policy.max_attempts)
+        return delay
+
+    def get_stats(self):
+        """Returns statistics about retries.
+
+        Returns:
+            A dict with the number of "requests" attempted, the number of
+            "retries", the number of retries skipped because the budget was
+            exhausted as "budget_exhausted", the number of retries per error
+            code as "retries_by_code" and the "budget_balance".
+        """
+        with self._lock:
+            return {'requests': self._requests,
+                    'retries': self._retries,
+                    'budget_exhausted': self._budget_exhausted,
+                    'retries_by_code': dict(self._retries_by_code),
+                    'budget_balance': self.budget.get_balance()}
+
+
+def get_google_ads_error_codes(failure):
+    """Returns the error codes of the errors in a GoogleAdsFailure.
+
+    Args:
+        failure: a GoogleAdsFailure message.
+
+    Returns:
+        A list of str error codes such as
+        "quota_error.RESOURCE_TEMPORARILY_EXHAUSTED".
+    """
+    codes = [get_google_ads_error_code(error) for error in failure.errors]
+    return [code for code in codes if code]
+
+
+def get_google_ads_error_code(error):
+    """Returns the error code of a GoogleAdsError.
+
+    Args:
+        error: a GoogleAdsError message.
+
+    Returns:
+        A str error code such as "quota_error.RESOURCE_TEMPORARILY_EXHAUSTED",
+        or None if the error has none.
+    """
+    error_code = error.error_code
+    error_type = error_code.WhichOneof('error_code')
+
+    if not error_type:
+        return None
+
+    enum_type = error_code.DESCRIPTOR.fields_by_name[error_type].enum_type
+    value = enum_type.values_by_number.get(getattr(error_code, error_type))
+    return '%s.%s' % (error_type, value.name if value else 'UNKNOWN')
@@ -0,0 +1,260 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for turning GoogleAdsRow messages into flat records."""
+
+import keyword
+import re
+from collections import Counter
+from importlib import import_module
+
+from google.ads.google_ads import client
+
+
+_SELECT_CLAUSE = re.compile(r'^\s*SELECT\s+(.+?)\s+FROM\s', re.I | re.S)
+
+# Wrapper types whose "value" field holds the selected value.
+_WRAPPER_TYPES = frozenset((
+    'google.protobuf.BoolValue',
+    'google.protobuf.BytesValue',
+    'google.protobuf.DoubleValue',
+    'google.protobuf.FloatValue',
+    'google.protobuf.Int32Value',
+    'google.protobuf.Int64Value',
+    'google.protobuf.StringValue',
+    'google.protobuf.UInt32Value',
+    'google.protobuf.UInt64Value',
+))
+
+# The source of the functions compiled for each RowFlattener. The
+# assignments hoist messages shared by several selected fields into locals.
+_FLATTENER_TEMPLATE = """
+def to_tuple(row):
+    {function_assignments}
+    return ({values},)
+
+def tuples(rows):
+    for row in rows:
+        {loop_assignments}
+        yield ({values},)
+"""
+
+
+def get_select_fields(query):
+    """Returns the fields in the SELECT clause of a GAQL query.
+
+    Args:
+        query: a str GAQL query.
+
+    Returns:
+        A list of str field names in the order they're selected, for example
+        ['campaign.id', 'metrics.clicks'].
+
+    Raises:
+        ValueError: If the query doesn't have a SELECT clause.
+    """
+    match = _SELECT_CLAUSE.match(query)
+
+    if not match:
+        raise ValueError('Query has no SELECT clause: "%s"' % query)
+
+    return [field.strip() for field in match.group(1).split(',')]
+
+
+def get_field_descriptor(field, version=None):
+    """Returns the descriptor of the value held by a GoogleAdsRow field.
+
+    Fields holding a wrapper type such as google.protobuf.StringValue resolve
+    to the wrapper's "value" field.
+
+    Args:
+        field: a str GAQL field name, for example 'campaign.id'.
+        version: an optional str indicating the version of the Google Ads
+            API, which defaults to the client's default version.
+
+    Returns:
+        A tuple of the attribute path of the value, for example
+        'campaign.id.value', and its
+        google.protobuf.descriptor.FieldDescriptor.
+
+    Raises:
+        ValueError: If the field doesn't exist on a GoogleAdsRow.
+    """
+    message_descriptor = _get_row_class(version).DESCRIPTOR
+    field_descriptor = None
+
+    for name in field.split('.'):
+        if message_descriptor is None:
+            raise ValueError('Field "%s" does not exist.' % field)
+
+        field_descriptor = message_descriptor.fields_by_name.get(name)
+
+        if field_descriptor is None:
+            raise ValueError('Field "%s" does not exist.' % field)
+
+        message_descriptor = field_descriptor.message_type
+
+    if (message_descriptor is not None and
+            message_descriptor.full_name in _WRAPPER_TYPES):
+        return ('%s.value' % field,
+                message_descriptor.fields_by_name['value'])
+
+    return field, field_descriptor
+
+
+class RowFlattener(object):
+    """Turns GoogleAdsRow messages into flat tuples or dicts.
+
+    The SELECT clause of a query is parsed once and compiled into a function
+    that reads every selected value, unwrapping wrapper types, with each
+    message shared by several fields, e.g. row.campaign, read only once:
+
+        flattener = RowFlattener(query)
+        for campaign_id, clicks in flattener.tuples(ga_service.search(
+                customer_id, query)):
+            ...
+
+    Enum fields are returned as ints, while repeated and message fields are
+    returned as is.
+    """
+
+    def __init__(self, query, version=None):
+        """Initializer for the RowFlattener.
+
+        Args:
+            query: a str GAQL query.
+            version: an optional str indicating the version of the Google Ads
+                API, which defaults to the client's default version.
+
+        Raises:
+            ValueError: If the query doesn't have a SELECT clause or selects a
+                field that doesn't exist.
+        """
+        self.fields = get_select_fields(query)
+        paths, self.field_descriptors = zip(
+            *(get_field_descriptor(field, version) for field in self.fields))
+
+        namespace = {}
+        exec(_get_flattener_source(paths), namespace)
+        self._to_tuple = namespace['to_tuple']
+        self._tuples = namespace['tuples']
+
+    def to_tuple(self, row):
+        """Returns the selected values of a row as a tuple.
+
+        Args:
+            row: a GoogleAdsRow instance.
+
+        Returns:
+            A tuple of values in the order they're selected.
+        """
+        return self._to_tuple(row)
+
+    def to_dict(self, row):
+        """Returns the selected values of a row as a dict.
+
+        Args:
+            row: a GoogleAdsRow instance.
+
+        Returns:
+            A dict mapping each str field name to its value.
+        """
+        return dict(zip(self.fields, self.to_tuple(row)))
+
+    def tuples(self, rows):
+        """Returns an iterator over the selected values of each row as tuples.
+
+        Args:
+            rows: an iterable of GoogleAdsRow instances, for example a search
+                response iterator or a page of results.
+        """
+        return self._tuples(rows)
+
+    def dicts(self, rows):
+        """Returns an iterator over the selected values of each row as dicts.
+
+        Args:
+            rows: an iterable of GoogleAdsRow instances, for example a search
+                response iterator or a page of results.
+        """
+        fields = self.fields
+        return (dict(zip(fields, values)) for values in self.tuples(rows))
+
+
+def _get_row_class(version):
+    """Returns the GoogleAdsRow class of a version of the Google Ads API."""
+    google_ads_service_pb2 = import_module(
+        'google.ads.google_ads.%s.proto.services.google_ads_service_pb2' %
+        (version or client._DEFAULT_VERSION))
+    return google_ads_service_pb2.GoogleAdsRow
+
+
+def _get_flattener_source(paths):
+    """Generates the source of the functions used by a RowFlattener.
+
+    Args:
+        paths: a sequence of str attribute paths from a GoogleAdsRow, for
+            example ('campaign.id.value', 'campaign.name.value').
+
+    Returns:
+        A str of Python source defining to_tuple and tuples functions.
+    """
+    split_paths = [path.split('.') for path in paths]
+    prefix_counts = Counter(tuple(parts[:index])
+                            for parts in split_paths
+                            for index in range(1, len(parts)))
+    local_names = {}
+    assignments = []
+
+    for parts in split_paths:
+        for index in range(1, len(parts)):
+            prefix = tuple(parts[:index])
+
+            if prefix_counts[prefix] > 1 and prefix not in local_names:
+                local_names[prefix] = '_%d' % len(local_names)
+                assignments.append('%s = %s' % (
+                    local_names[prefix],
+                    _get_access_source(prefix, local_names)))
+
+    values = [_get_access_source(parts, local_names)
+              for parts in split_paths]
+
+    return _FLATTENER_TEMPLATE.format(
+        function_assignments='\n    '.join(assignments),
+        loop_assignments='\n        '.join(assignments),
+        values=', '.join(values))
+
+
+def _get_access_source(parts, local_names):
+    """Generates an expression reading an attribute path from a row.
+
+    The expression starts from the local holding the longest already hoisted
+    prefix of the path, or from the row itself.
+    """
+    for index in range(len(parts) - 1, 0, -1):
+        local_name = local_names.get(tuple(parts[:index]))
+
+        if local_name:
+            break
+    else:
+        index, local_name = 0, 'row'
+
+    expression = local_name
+
+    for name in parts[index:]:
+        if keyword.iskeyword(name):
+            expression = 'getattr(%s, %r)' % (expression, name)
+        else:
+            expression = '%s.%s' % (expression, name)
+
+    return expression
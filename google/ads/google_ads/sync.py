@@ -0,0 +1,356 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Syncs the resources of an account with a desired state.
+
+An AccountSync reads the current state of each managed resource type with a
+single query, compares it with the desired resources, and applies the
+differences with GoogleAdsService.mutate:
+
+    sync = AccountSync(ga_service, customer_id)
+    sync.manage('campaign', 'SELECT campaign.resource_name, campaign.name, '
+                'campaign.status FROM campaign '
+                'WHERE campaign.status != "REMOVED"',
+                key=lambda campaign: campaign.name.value)
+    sync.manage('ad_group', ...)
+
+    plan = sync.sync(desired_resources, dry_run=True)
+    print(plan.get_summary())
+
+Desired resources are matched to current resources by resource name, or by
+the key of their type if they have none. Matched resources are updated with
+only their changed fields, see resource_diff. Desired resources without a
+match are created; they can reference each other through temp resource
+names, such as names allocated with an
+atomic_mutate.TempResourceNameAllocator. Current resources of a managed type
+without a desired match are removed, unless the type is managed with
+remove_missing=False.
+
+Operations are sent with an atomic_mutate.AtomicMutateBuilder, which keeps
+related operations in the same request and packs the others into as few
+requests as the limits allow.
+"""
+
+import logging
+import re
+
+from google.ads.google_ads import mutate_plan
+from google.ads.google_ads import resource_diff
+from google.ads.google_ads.atomic_mutate import AtomicMutateBuilder
+from google.ads.google_ads.batching import MAX_OPERATIONS
+
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+_DEFAULT_PAGE_SIZE = 10000
+
+# Temp IDs are negative, including the IDs of composite resource names such
+# as "customers/123/adGroupCriteria/-1~-2".
+_TEMP_ID_PATTERN = re.compile(r'[/~]-\d')
+
+
+class SyncPlan(object):
+    """The operations that bring an account to its desired state."""
+
+    def __init__(self, builder, creates, updates, removes, unchanged):
+        """Initializer for the SyncPlan.
+
+        Args:
+            builder: an AtomicMutateBuilder holding the plan's operations.
+            creates: a list of create MutateOperation messages.
+            updates: a list of update MutateOperation messages.
+            removes: a list of remove MutateOperation messages.
+            unchanged: an int of the number of desired resources that are
+                already in their desired state.
+        """
+        self.creates = creates
+        self.updates = updates
+        self.removes = removes
+        self.unchanged = unchanged
+        # The MutateGoogleAdsResponse of each request, once applied.
+        self.responses = None
+        self._builder = builder
+
+    @property
+    def operations(self):
+        """The list of MutateOperation messages of the plan."""
+        return self._builder.operations
+
+    @property
+    def resource_names(self):
+        """The real resource names by temp resource name, once applied."""
+        return self._builder.resource_names
+
+    def get_requests(self):
+        """Returns the operations of each request the plan is applied with.
+
+        Returns:
+            A list of lists of MutateOperation messages.
+        """
+        return self._builder.get_requests()
+
+    def get_expected_rpc_count(self):
+        """Returns the number of mutate requests needed to apply the plan."""
+        return len(self.get_requests())
+
+    def get_summary(self):
+        """Summarizes the plan.
+
+        Returns:
+            A dict mapping "creates", "updates" and "removes" to dicts of the
+            number of operations by resource type, with the number of
+            "unchanged" resources and the "expected_rpc_count".
+        """
+        summary = {'unchanged': self.unchanged,
+                   'expected_rpc_count': self.get_expected_rpc_count()}
+
+        for kind, operations in (('creates', self.creates),
+                                 ('updates', self.updates),
+                                 ('removes', self.removes)):
+            counts = summary[kind] = {}
+
+            for operation in operations:
+                resource_type = mutate_plan.get_operation_type(
+                    operation)[:-len('_operation')]
+                counts[resource_type] = counts.get(resource_type, 0) + 1
+
+        return summary
+
+    def apply(self, service, **kwargs):
+        """Sends the operations of the plan.
+
+        Args:
+            service: a GoogleAdsService client.
+            kwargs: other arguments of GoogleAdsService.mutate.
+
+        Returns:
+            A list of the MutateGoogleAdsResponse of each request, also set as
+            the plan's responses.
+        """
+        self.responses = self._builder.mutate(service, **kwargs)
+        return self.responses
+
+
+class AccountSync(object):
+    """Plans and applies the changes bringing an account to a desired state."""
+
+    def __init__(self, service, customer_id, max_operations=MAX_OPERATIONS,
+                 max_bytes=_DEFAULT_MAX_BYTES, page_size=_DEFAULT_PAGE_SIZE,
+                 version=None):
+        """Initializer for the AccountSync.
+
+        Args:
+            service: a GoogleAdsService client.
+            customer_id: a str ID of the synced customer.
+            max_operations: an int of the maximum number of operations per
+                mutate request, up to MAX_OPERATIONS.
+            max_bytes: an int of the maximum serialized size of the
+                operations of a mutate request.
+            page_size: an int of the number of rows per page of the queries
+                of the current state.
+            version: an optional str indicating the version of the Google Ads
+                API to use, which defaults to the client's default version.
+
+        Raises:
+            ValueError: If the arguments are out of range.
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1.')
+
+        self.customer_id = customer_id
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.page_size = page_size
+        self._service = service
+        self._version = version
+        self._types = {}
+        # Current resources by resource name, and by key if their type has
+        # one, per resource type.
+        self._current = {}
+        self._current_by_key = {}
+        # Check the limits before any query is made.
+        self._create_builder()
+
+    def manage(self, resource_type, query, key=None, remove_missing=True):
+        """Adds a resource type whose resources are synced.
+
+        Args:
+            resource_type: a str resource type such as "ad_group", the name of
+                the resource's field in GoogleAdsRow messages.
+            query: a str GAQL query selecting the resource name, and every
+                field set in desired resources, of the current resources of
+                the type. Fields that aren't selected are seen as unset, and
+                are updated whenever they're desired.
+            key: an optional callable taking a resource message and returning
+                a hashable value identifying it, used to match desired
+                resources without a resource name, such as a name.
+            remove_missing: a bool indicating whether current resources that
+                aren't desired are removed.
+        """
+        self._types[resource_type] = (query, key, remove_missing)
+
+    def fetch(self):
+        """Reads the current state of the managed resource types.
+
+        Makes one search per managed resource type, with as many pages as
+        its rows need.
+        """
+        self._current = {}
+        self._current_by_key = {}
+
+        for resource_type, (query, key, _) in self._types.items():
+            resources = self._current[resource_type] = {}
+            by_key = self._current_by_key[resource_type] = {}
+
+            for row in self._service.search(self.customer_id, query,
+                                            page_size=self.page_size):
+                resource = getattr(row, resource_type)
+                resources[resource.resource_name] = resource
+
+                if key:
+                    by_key[key(resource)] = resource
+
+            _logger.info('Fetched %d current %s resources.', len(resources),
+                         resource_type)
+
+    def plan(self, desired):
+        """Computes the operations that bring the fetched state to desired.
+
+        Args:
+            desired: an iterable of resource messages such as Campaigns.
+
+        Returns:
+            A SyncPlan.
+        """
+        creates = []
+        updates = []
+        unchanged = 0
+        matched = set()
+
+        for resource in desired:
+            resource_type = resource_diff.get_resource_type(resource)
+            current = self._match(resource_type, resource)
+
+            if current is None:
+                operation = resource_diff.get_operation_type(resource)()
+                operation.create.CopyFrom(resource)
+                creates.append(resource_diff.to_mutate_operation(operation))
+                continue
+
+            matched.add(current.resource_name)
+            operation = resource_diff.create_update_operation(current,
+                                                              resource)
+
+            if operation is None:
+                unchanged += 1
+            else:
+                updates.append(resource_diff.to_mutate_operation(operation))
+
+        missing = [resource
+                   for resource_type, resources in self._current.items()
+                   if self._types[resource_type][2]
+                   for name, resource in resources.items()
+                   if name not in matched]
+        removes = self._get_removes(missing)
+
+        builder = self._create_builder()
+
+        for operation in creates + updates + removes:
+            builder.add(operation)
+
+        return SyncPlan(builder, creates, updates, removes, unchanged)
+
+    def sync(self, desired, dry_run=False, **kwargs):
+        """Fetches the current state, plans the changes and applies them.
+
+        Args:
+            desired: an iterable of resource messages such as Campaigns.
+            dry_run: a bool indicating whether the plan is only computed, and
+                not applied.
+            kwargs: other arguments of GoogleAdsService.mutate.
+
+        Returns:
+            The SyncPlan, whose responses are set unless dry_run is True.
+        """
+        self.fetch()
+        plan = self.plan(desired)
+        summary = plan.get_summary()
+        _logger.info('Sync plan of customer ID %s: %s.', self.customer_id,
+                     summary)
+
+        if not dry_run and plan.operations:
+            plan.apply(self._service, **kwargs)
+
+        return plan
+
+    def _create_builder(self):
+        return AtomicMutateBuilder(self.customer_id,
+                                   max_operations=self.max_operations,
+                                   max_bytes=self.max_bytes,
+                                   version=self._version)
+
+    def _match(self, resource_type, resource):
+        """Returns the current resource a desired resource matches, or None."""
+        name = resource.resource_name
+
+        if name and not _TEMP_ID_PATTERN.search(name):
+            current = self._current.get(resource_type, {}).get(name)
+
+            if current is None:
+                _logger.warning('%s was not fetched, its set fields are all '
+                                'updated.', name)
+                current = type(resource)(resource_name=name)
+
+            return current
+
+        if name or resource_type not in self._types:
+            return None
+
+        key = self._types[resource_type][1]
+        return self._current_by_key[resource_type].get(
+            key(resource)) if key else None
+
+    def _get_removes(self, resources):
+        """Creates the remove operations of current resources.
+
+        Resources that reference another removed resource, such as ad groups
+        of a removed campaign, are left to be removed with it.
+
+        Raises:
+            ValueError: If the resource type can't be removed.
+        """
+        names = set(resource.resource_name for resource in resources)
+        removes = []
+
+        for resource in resources:
+            operation = resource_diff.get_operation_type(resource)()
+            fields = operation.DESCRIPTOR.fields_by_name
+
+            if 'remove' not in fields:
+                raise ValueError('%s resources cannot be removed, manage them '
+                                 'with remove_missing=False.'
+                                 % resource.DESCRIPTOR.name)
+
+            getattr(operation, 'create' if 'create' in fields
+                    else 'update').CopyFrom(resource)
+
+            if names.intersection(
+                    mutate_plan.get_referenced_resource_names(operation)):
+                continue
+
+            operation.Clear()
+            operation.remove = resource.resource_name
+            removes.append(resource_diff.to_mutate_operation(operation))
+
+        return removes
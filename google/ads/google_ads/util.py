@@ -13,6 +13,17 @@
 # limitations under the License.
 """Common utilities for the Google Ads API client library."""
 
+import threading
+from collections import namedtuple
+from collections import OrderedDict
+
+
+# The details of the request behind a paged response iterator.
+PagedRequest = namedtuple(
+    'PagedRequest',
+    ('method', 'request', 'items_field', 'request_token_field',
+     'response_token_field'))
+
 
 class ResourceName:
 
@@ -41,3 +52,180 @@ class ResourceName:
         """
         return cls._COMPOSITE_DELIMITER.join(arg)
 
+
+class LRUCache(object):
+    """A thread-safe mapping that holds a bounded number of entries.
+
+    When the cache is full, adding an entry evicts the least recently used one.
+    An optional callback is invoked with the key and value of every entry that
+    is evicted, replaced or cleared from the cache.
+    """
+
+    def __init__(self, max_size, on_evict=None):
+        """Initializer for the LRUCache.
+
+        Args:
+            max_size: an int indicating the maximum number of entries.
+            on_evict: an optional callable accepting a key and a value that is
+                called whenever an entry leaves the cache.
+
+        Raises:
+            ValueError: If max_size is less than one.
+        """
+        if max_size < 1:
+            raise ValueError('The LRUCache max_size must be at least 1.')
+
+        self.max_size = max_size
+        self._on_evict = on_evict
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Returns the value for the given key and marks it recently used.
+
+        Args:
+            key: a hashable key.
+            default: the value returned if the key isn't in the cache.
+
+        Returns:
+            The cached value, or default if the key isn't present.
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                return default
+            self._entries[key] = value
+            return value
+
+    def put(self, key, value):
+        """Adds or replaces the entry for the given key.
+
+        Args:
+            key: a hashable key.
+            value: the value to cache.
+        """
+        evicted = []
+
+        with self._lock:
+            if key in self._entries:
+                previous = self._entries.pop(key)
+                if previous is not value:
+                    evicted.append((key, previous))
+            elif len(self._entries) >= self.max_size:
+                evicted.append(self._entries.popitem(last=False))
+            self._entries[key] = value
+
+        self._notify(evicted)
+
+    def setdefault(self, key, value):
+        """Adds an entry unless the key is present, and marks it recently used.
+
+        Unlike put, an existing entry is kept, so that a value already handed
+        out isn't evicted by a concurrent caller adding its own.
+
+        Args:
+            key: a hashable key.
+            value: the value to cache if the key isn't present.
+
+        Returns:
+            The cached value, which is value unless the key was present.
+        """
+        evicted = []
+
+        with self._lock:
+            if key in self._entries:
+                value = self._entries.pop(key)
+            elif len(self._entries) >= self.max_size:
+                evicted.append(self._entries.popitem(last=False))
+            self._entries[key] = value
+
+        self._notify(evicted)
+        return value
+
+    def pop(self, key, default=None):
+        """Removes the entry for the given key without calling on_evict.
+
+        Args:
+            key: a hashable key.
+            default: the value returned if the key isn't in the cache.
+
+        Returns:
+            The removed value, or default if the key isn't present.
+        """
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """Removes every entry, calling on_evict for each of them."""
+        with self._lock:
+            evicted = list(self._entries.items())
+            self._entries.clear()
+
+        self._notify(evicted)
+
+    def _notify(self, evicted):
+        """Calls on_evict outside of the lock for the given entries.
+
+        Args:
+            evicted: a list of (key, value) tuples that left the cache.
+        """
+        if self._on_evict:
+            for key, value in evicted:
+                self._on_evict(key, value)
+
+
+def get_paged_request(iterator):
+    """Returns the details of the request behind a paged response iterator.
+
+    Paged methods such as GoogleAdsService.search return a
+    google.api_core.page_iterator.GRPCIterator that requests each page
+    lazily. This exposes the wrapped method and request so that pages can be
+    requested by other means, for example asynchronously or ahead of time.
+
+    Args:
+        iterator: a google.api_core.page_iterator.GRPCIterator instance.
+
+    Returns:
+        A PagedRequest describing the request behind the iterator.
+    """
+    return PagedRequest(iterator._method, iterator._request,
+                        iterator._items_field, iterator._request_token_field,
+                        iterator._response_token_field)
+
+
+def get_method_name(method):
+    """Returns the service and method name of a gRPC method.
+
+    Args:
+        method: a str such as
+            "/google.ads.googleads.v2.services.GoogleAdsService/Mutate".
+
+    Returns:
+        A str such as "GoogleAdsService/Mutate".
+    """
+    return method.rsplit('.', 1)[-1]
+
+
+def get_encoded_size(message):
+    """Returns the size of a message encoded in a repeated field.
+
+    Args:
+        message: a protobuf message, such as an operation.
+
+    Returns:
+        An int of the message's size, plus its field tag and length prefix.
+    """
+    size = message.ByteSize()
+    length_prefix = 1
+
+    while size >= 1 << (7 * length_prefix):
+        length_prefix += 1
+
+    return 1 + length_prefix + size
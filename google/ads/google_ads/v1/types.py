@@ -16,1096 +16,2119 @@
 
 from __future__ import absolute_import
 import sys
+from importlib import import_module
 
-from google.api_core.protobuf_helpers import get_messages
 
-from google.ads.google_ads.v1.proto.common import ad_asset_pb2
-from google.ads.google_ads.v1.proto.common import ad_type_infos_pb2
-from google.ads.google_ads.v1.proto.common import asset_types_pb2
-from google.ads.google_ads.v1.proto.common import bidding_pb2
-from google.ads.google_ads.v1.proto.common import click_location_pb2
-from google.ads.google_ads.v1.proto.common import criteria_pb2
-from google.ads.google_ads.v1.proto.common import criterion_category_availability_pb2
-from google.ads.google_ads.v1.proto.common import custom_parameter_pb2
-from google.ads.google_ads.v1.proto.common import dates_pb2
-from google.ads.google_ads.v1.proto.common import explorer_auto_optimizer_setting_pb2
-from google.ads.google_ads.v1.proto.common import extensions_pb2
-from google.ads.google_ads.v1.proto.common import feed_common_pb2
-from google.ads.google_ads.v1.proto.common import final_app_url_pb2
-from google.ads.google_ads.v1.proto.common import frequency_cap_pb2
-from google.ads.google_ads.v1.proto.common import keyword_plan_common_pb2
-from google.ads.google_ads.v1.proto.common import matching_function_pb2
-from google.ads.google_ads.v1.proto.common import metrics_pb2
-from google.ads.google_ads.v1.proto.common import policy_pb2
-from google.ads.google_ads.v1.proto.common import real_time_bidding_setting_pb2
-from google.ads.google_ads.v1.proto.common import segments_pb2
-from google.ads.google_ads.v1.proto.common import simulation_pb2
-from google.ads.google_ads.v1.proto.common import tag_snippet_pb2
-from google.ads.google_ads.v1.proto.common import targeting_setting_pb2
-from google.ads.google_ads.v1.proto.common import text_label_pb2
-from google.ads.google_ads.v1.proto.common import url_collection_pb2
-from google.ads.google_ads.v1.proto.common import user_lists_pb2
-from google.ads.google_ads.v1.proto.common import value_pb2
-from google.ads.google_ads.v1.proto.enums import access_reason_pb2
-from google.ads.google_ads.v1.proto.enums import account_budget_proposal_status_pb2
-from google.ads.google_ads.v1.proto.enums import account_budget_proposal_type_pb2
-from google.ads.google_ads.v1.proto.enums import account_budget_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_customizer_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_ad_rotation_mode_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_ad_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_criterion_approval_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_criterion_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_group_type_pb2
-from google.ads.google_ads.v1.proto.enums import ad_network_type_pb2
-from google.ads.google_ads.v1.proto.enums import ad_serving_optimization_status_pb2
-from google.ads.google_ads.v1.proto.enums import ad_strength_pb2
-from google.ads.google_ads.v1.proto.enums import ad_type_pb2
-from google.ads.google_ads.v1.proto.enums import advertising_channel_sub_type_pb2
-from google.ads.google_ads.v1.proto.enums import advertising_channel_type_pb2
-from google.ads.google_ads.v1.proto.enums import affiliate_location_feed_relationship_type_pb2
-from google.ads.google_ads.v1.proto.enums import affiliate_location_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import age_range_type_pb2
-from google.ads.google_ads.v1.proto.enums import app_campaign_app_store_pb2
-from google.ads.google_ads.v1.proto.enums import app_campaign_bidding_strategy_goal_type_pb2
-from google.ads.google_ads.v1.proto.enums import app_payment_model_type_pb2
-from google.ads.google_ads.v1.proto.enums import app_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import app_store_pb2
-from google.ads.google_ads.v1.proto.enums import app_url_operating_system_type_pb2
-from google.ads.google_ads.v1.proto.enums import asset_type_pb2
-from google.ads.google_ads.v1.proto.enums import attribution_model_pb2
-from google.ads.google_ads.v1.proto.enums import bid_modifier_source_pb2
-from google.ads.google_ads.v1.proto.enums import bidding_source_pb2
-from google.ads.google_ads.v1.proto.enums import bidding_strategy_status_pb2
-from google.ads.google_ads.v1.proto.enums import bidding_strategy_type_pb2
-from google.ads.google_ads.v1.proto.enums import billing_setup_status_pb2
-from google.ads.google_ads.v1.proto.enums import brand_safety_suitability_pb2
-from google.ads.google_ads.v1.proto.enums import budget_delivery_method_pb2
-from google.ads.google_ads.v1.proto.enums import budget_period_pb2
-from google.ads.google_ads.v1.proto.enums import budget_status_pb2
-from google.ads.google_ads.v1.proto.enums import budget_type_pb2
-from google.ads.google_ads.v1.proto.enums import call_conversion_reporting_state_pb2
-from google.ads.google_ads.v1.proto.enums import call_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import callout_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_criterion_status_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_draft_status_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_experiment_status_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_experiment_traffic_split_type_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_experiment_type_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_serving_status_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_shared_set_status_pb2
-from google.ads.google_ads.v1.proto.enums import campaign_status_pb2
-from google.ads.google_ads.v1.proto.enums import change_status_operation_pb2
-from google.ads.google_ads.v1.proto.enums import change_status_resource_type_pb2
-from google.ads.google_ads.v1.proto.enums import click_type_pb2
-from google.ads.google_ads.v1.proto.enums import content_label_type_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_action_category_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_action_counting_type_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_action_status_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_action_type_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_adjustment_type_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_attribution_event_type_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_lag_bucket_pb2
-from google.ads.google_ads.v1.proto.enums import conversion_or_adjustment_lag_bucket_pb2
-from google.ads.google_ads.v1.proto.enums import criterion_category_channel_availability_mode_pb2
-from google.ads.google_ads.v1.proto.enums import criterion_category_locale_availability_mode_pb2
-from google.ads.google_ads.v1.proto.enums import criterion_system_serving_status_pb2
-from google.ads.google_ads.v1.proto.enums import criterion_type_pb2
-from google.ads.google_ads.v1.proto.enums import custom_interest_member_type_pb2
-from google.ads.google_ads.v1.proto.enums import custom_interest_status_pb2
-from google.ads.google_ads.v1.proto.enums import custom_interest_type_pb2
-from google.ads.google_ads.v1.proto.enums import custom_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import customer_match_upload_key_type_pb2
-from google.ads.google_ads.v1.proto.enums import customer_pay_per_conversion_eligibility_failure_reason_pb2
-from google.ads.google_ads.v1.proto.enums import data_driven_model_status_pb2
-from google.ads.google_ads.v1.proto.enums import day_of_week_pb2
-from google.ads.google_ads.v1.proto.enums import device_pb2
-from google.ads.google_ads.v1.proto.enums import display_ad_format_setting_pb2
-from google.ads.google_ads.v1.proto.enums import display_upload_product_type_pb2
-from google.ads.google_ads.v1.proto.enums import dsa_page_feed_criterion_field_pb2
-from google.ads.google_ads.v1.proto.enums import education_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import extension_setting_device_pb2
-from google.ads.google_ads.v1.proto.enums import extension_type_pb2
-from google.ads.google_ads.v1.proto.enums import external_conversion_source_pb2
-from google.ads.google_ads.v1.proto.enums import feed_attribute_type_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_quality_approval_status_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_quality_disapproval_reason_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_status_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_target_device_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_target_type_pb2
-from google.ads.google_ads.v1.proto.enums import feed_item_validation_status_pb2
-from google.ads.google_ads.v1.proto.enums import feed_link_status_pb2
-from google.ads.google_ads.v1.proto.enums import feed_mapping_criterion_type_pb2
-from google.ads.google_ads.v1.proto.enums import feed_mapping_status_pb2
-from google.ads.google_ads.v1.proto.enums import feed_origin_pb2
-from google.ads.google_ads.v1.proto.enums import feed_status_pb2
-from google.ads.google_ads.v1.proto.enums import flight_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import frequency_cap_event_type_pb2
-from google.ads.google_ads.v1.proto.enums import frequency_cap_level_pb2
-from google.ads.google_ads.v1.proto.enums import frequency_cap_time_unit_pb2
-from google.ads.google_ads.v1.proto.enums import gender_type_pb2
-from google.ads.google_ads.v1.proto.enums import geo_target_constant_status_pb2
-from google.ads.google_ads.v1.proto.enums import geo_targeting_restriction_pb2
-from google.ads.google_ads.v1.proto.enums import geo_targeting_type_pb2
-from google.ads.google_ads.v1.proto.enums import google_ads_field_category_pb2
-from google.ads.google_ads.v1.proto.enums import google_ads_field_data_type_pb2
-from google.ads.google_ads.v1.proto.enums import hotel_date_selection_type_pb2
-from google.ads.google_ads.v1.proto.enums import hotel_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import hotel_rate_type_pb2
-from google.ads.google_ads.v1.proto.enums import income_range_type_pb2
-from google.ads.google_ads.v1.proto.enums import interaction_event_type_pb2
-from google.ads.google_ads.v1.proto.enums import interaction_type_pb2
-from google.ads.google_ads.v1.proto.enums import job_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import keyword_match_type_pb2
-from google.ads.google_ads.v1.proto.enums import keyword_plan_competition_level_pb2
-from google.ads.google_ads.v1.proto.enums import keyword_plan_forecast_interval_pb2
-from google.ads.google_ads.v1.proto.enums import keyword_plan_network_pb2
-from google.ads.google_ads.v1.proto.enums import label_status_pb2
-from google.ads.google_ads.v1.proto.enums import legacy_app_install_ad_app_store_pb2
-from google.ads.google_ads.v1.proto.enums import listing_custom_attribute_index_pb2
-from google.ads.google_ads.v1.proto.enums import listing_group_type_pb2
-from google.ads.google_ads.v1.proto.enums import local_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import location_extension_targeting_criterion_field_pb2
-from google.ads.google_ads.v1.proto.enums import location_group_radius_units_pb2
-from google.ads.google_ads.v1.proto.enums import location_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import manager_link_status_pb2
-from google.ads.google_ads.v1.proto.enums import matching_function_context_type_pb2
-from google.ads.google_ads.v1.proto.enums import matching_function_operator_pb2
-from google.ads.google_ads.v1.proto.enums import media_type_pb2
-from google.ads.google_ads.v1.proto.enums import merchant_center_link_status_pb2
-from google.ads.google_ads.v1.proto.enums import message_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import mime_type_pb2
-from google.ads.google_ads.v1.proto.enums import minute_of_hour_pb2
-from google.ads.google_ads.v1.proto.enums import mobile_device_type_pb2
-from google.ads.google_ads.v1.proto.enums import month_of_year_pb2
-from google.ads.google_ads.v1.proto.enums import mutate_job_status_pb2
-from google.ads.google_ads.v1.proto.enums import negative_geo_target_type_pb2
-from google.ads.google_ads.v1.proto.enums import operating_system_version_operator_type_pb2
-from google.ads.google_ads.v1.proto.enums import page_one_promoted_strategy_goal_pb2
-from google.ads.google_ads.v1.proto.enums import parental_status_type_pb2
-from google.ads.google_ads.v1.proto.enums import payment_mode_pb2
-from google.ads.google_ads.v1.proto.enums import placeholder_type_pb2
-from google.ads.google_ads.v1.proto.enums import placement_type_pb2
-from google.ads.google_ads.v1.proto.enums import policy_approval_status_pb2
-from google.ads.google_ads.v1.proto.enums import policy_review_status_pb2
-from google.ads.google_ads.v1.proto.enums import policy_topic_entry_type_pb2
-from google.ads.google_ads.v1.proto.enums import policy_topic_evidence_destination_mismatch_url_type_pb2
-from google.ads.google_ads.v1.proto.enums import policy_topic_evidence_destination_not_working_device_pb2
-from google.ads.google_ads.v1.proto.enums import positive_geo_target_type_pb2
-from google.ads.google_ads.v1.proto.enums import preferred_content_type_pb2
-from google.ads.google_ads.v1.proto.enums import price_extension_price_qualifier_pb2
-from google.ads.google_ads.v1.proto.enums import price_extension_price_unit_pb2
-from google.ads.google_ads.v1.proto.enums import price_extension_type_pb2
-from google.ads.google_ads.v1.proto.enums import price_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import product_bidding_category_level_pb2
-from google.ads.google_ads.v1.proto.enums import product_bidding_category_status_pb2
-from google.ads.google_ads.v1.proto.enums import product_channel_exclusivity_pb2
-from google.ads.google_ads.v1.proto.enums import product_channel_pb2
-from google.ads.google_ads.v1.proto.enums import product_condition_pb2
-from google.ads.google_ads.v1.proto.enums import product_type_level_pb2
-from google.ads.google_ads.v1.proto.enums import promotion_extension_discount_modifier_pb2
-from google.ads.google_ads.v1.proto.enums import promotion_extension_occasion_pb2
-from google.ads.google_ads.v1.proto.enums import promotion_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import proximity_radius_units_pb2
-from google.ads.google_ads.v1.proto.enums import quality_score_bucket_pb2
-from google.ads.google_ads.v1.proto.enums import real_estate_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import recommendation_type_pb2
-from google.ads.google_ads.v1.proto.enums import search_engine_results_page_type_pb2
-from google.ads.google_ads.v1.proto.enums import search_term_match_type_pb2
-from google.ads.google_ads.v1.proto.enums import search_term_targeting_status_pb2
-from google.ads.google_ads.v1.proto.enums import served_asset_field_type_pb2
-from google.ads.google_ads.v1.proto.enums import shared_set_status_pb2
-from google.ads.google_ads.v1.proto.enums import shared_set_type_pb2
-from google.ads.google_ads.v1.proto.enums import simulation_modification_method_pb2
-from google.ads.google_ads.v1.proto.enums import simulation_type_pb2
-from google.ads.google_ads.v1.proto.enums import sitelink_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import slot_pb2
-from google.ads.google_ads.v1.proto.enums import spending_limit_type_pb2
-from google.ads.google_ads.v1.proto.enums import structured_snippet_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import system_managed_entity_source_pb2
-from google.ads.google_ads.v1.proto.enums import target_cpa_opt_in_recommendation_goal_pb2
-from google.ads.google_ads.v1.proto.enums import target_impression_share_location_pb2
-from google.ads.google_ads.v1.proto.enums import targeting_dimension_pb2
-from google.ads.google_ads.v1.proto.enums import time_type_pb2
-from google.ads.google_ads.v1.proto.enums import tracking_code_page_format_pb2
-from google.ads.google_ads.v1.proto.enums import tracking_code_type_pb2
-from google.ads.google_ads.v1.proto.enums import travel_placeholder_field_pb2
-from google.ads.google_ads.v1.proto.enums import user_interest_taxonomy_type_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_access_status_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_closing_reason_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_combined_rule_operator_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_crm_data_source_type_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_date_rule_item_operator_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_logical_rule_operator_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_membership_status_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_number_rule_item_operator_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_prepopulation_status_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_rule_type_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_size_range_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_string_rule_item_operator_pb2
-from google.ads.google_ads.v1.proto.enums import user_list_type_pb2
-from google.ads.google_ads.v1.proto.enums import vanity_pharma_display_url_mode_pb2
-from google.ads.google_ads.v1.proto.enums import vanity_pharma_text_pb2
-from google.ads.google_ads.v1.proto.enums import webpage_condition_operand_pb2
-from google.ads.google_ads.v1.proto.enums import webpage_condition_operator_pb2
-from google.ads.google_ads.v1.proto.errors import account_budget_proposal_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_customizer_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_group_ad_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_group_bid_modifier_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_group_criterion_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_group_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_group_feed_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_parameter_error_pb2
-from google.ads.google_ads.v1.proto.errors import ad_sharing_error_pb2
-from google.ads.google_ads.v1.proto.errors import adx_error_pb2
-from google.ads.google_ads.v1.proto.errors import asset_error_pb2
-from google.ads.google_ads.v1.proto.errors import authentication_error_pb2
-from google.ads.google_ads.v1.proto.errors import authorization_error_pb2
-from google.ads.google_ads.v1.proto.errors import bidding_error_pb2
-from google.ads.google_ads.v1.proto.errors import bidding_strategy_error_pb2
-from google.ads.google_ads.v1.proto.errors import billing_setup_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_budget_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_criterion_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_draft_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_experiment_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_feed_error_pb2
-from google.ads.google_ads.v1.proto.errors import campaign_shared_set_error_pb2
-from google.ads.google_ads.v1.proto.errors import change_status_error_pb2
-from google.ads.google_ads.v1.proto.errors import collection_size_error_pb2
-from google.ads.google_ads.v1.proto.errors import context_error_pb2
-from google.ads.google_ads.v1.proto.errors import conversion_action_error_pb2
-from google.ads.google_ads.v1.proto.errors import conversion_adjustment_upload_error_pb2
-from google.ads.google_ads.v1.proto.errors import conversion_upload_error_pb2
-from google.ads.google_ads.v1.proto.errors import country_code_error_pb2
-from google.ads.google_ads.v1.proto.errors import criterion_error_pb2
-from google.ads.google_ads.v1.proto.errors import custom_interest_error_pb2
-from google.ads.google_ads.v1.proto.errors import customer_client_link_error_pb2
-from google.ads.google_ads.v1.proto.errors import customer_error_pb2
-from google.ads.google_ads.v1.proto.errors import customer_feed_error_pb2
-from google.ads.google_ads.v1.proto.errors import customer_manager_link_error_pb2
-from google.ads.google_ads.v1.proto.errors import database_error_pb2
-from google.ads.google_ads.v1.proto.errors import date_error_pb2
-from google.ads.google_ads.v1.proto.errors import date_range_error_pb2
-from google.ads.google_ads.v1.proto.errors import distinct_error_pb2
-from google.ads.google_ads.v1.proto.errors import enum_error_pb2
-from google.ads.google_ads.v1.proto.errors import errors_pb2
-from google.ads.google_ads.v1.proto.errors import extension_feed_item_error_pb2
-from google.ads.google_ads.v1.proto.errors import extension_setting_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_attribute_reference_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_item_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_item_target_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_item_validation_error_pb2
-from google.ads.google_ads.v1.proto.errors import feed_mapping_error_pb2
-from google.ads.google_ads.v1.proto.errors import field_error_pb2
-from google.ads.google_ads.v1.proto.errors import field_mask_error_pb2
-from google.ads.google_ads.v1.proto.errors import function_error_pb2
-from google.ads.google_ads.v1.proto.errors import function_parsing_error_pb2
-from google.ads.google_ads.v1.proto.errors import geo_target_constant_suggestion_error_pb2
-from google.ads.google_ads.v1.proto.errors import header_error_pb2
-from google.ads.google_ads.v1.proto.errors import id_error_pb2
-from google.ads.google_ads.v1.proto.errors import image_error_pb2
-from google.ads.google_ads.v1.proto.errors import internal_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_ad_group_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_campaign_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_idea_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_keyword_error_pb2
-from google.ads.google_ads.v1.proto.errors import keyword_plan_negative_keyword_error_pb2
-from google.ads.google_ads.v1.proto.errors import label_error_pb2
-from google.ads.google_ads.v1.proto.errors import language_code_error_pb2
-from google.ads.google_ads.v1.proto.errors import list_operation_error_pb2
-from google.ads.google_ads.v1.proto.errors import manager_link_error_pb2
-from google.ads.google_ads.v1.proto.errors import media_bundle_error_pb2
-from google.ads.google_ads.v1.proto.errors import media_file_error_pb2
-from google.ads.google_ads.v1.proto.errors import media_upload_error_pb2
-from google.ads.google_ads.v1.proto.errors import multiplier_error_pb2
-from google.ads.google_ads.v1.proto.errors import mutate_error_pb2
-from google.ads.google_ads.v1.proto.errors import mutate_job_error_pb2
-from google.ads.google_ads.v1.proto.errors import new_resource_creation_error_pb2
-from google.ads.google_ads.v1.proto.errors import not_empty_error_pb2
-from google.ads.google_ads.v1.proto.errors import not_whitelisted_error_pb2
-from google.ads.google_ads.v1.proto.errors import null_error_pb2
-from google.ads.google_ads.v1.proto.errors import operation_access_denied_error_pb2
-from google.ads.google_ads.v1.proto.errors import operator_error_pb2
-from google.ads.google_ads.v1.proto.errors import partial_failure_error_pb2
-from google.ads.google_ads.v1.proto.errors import policy_finding_error_pb2
-from google.ads.google_ads.v1.proto.errors import policy_validation_parameter_error_pb2
-from google.ads.google_ads.v1.proto.errors import policy_violation_error_pb2
-from google.ads.google_ads.v1.proto.errors import query_error_pb2
-from google.ads.google_ads.v1.proto.errors import quota_error_pb2
-from google.ads.google_ads.v1.proto.errors import range_error_pb2
-from google.ads.google_ads.v1.proto.errors import recommendation_error_pb2
-from google.ads.google_ads.v1.proto.errors import region_code_error_pb2
-from google.ads.google_ads.v1.proto.errors import request_error_pb2
-from google.ads.google_ads.v1.proto.errors import resource_access_denied_error_pb2
-from google.ads.google_ads.v1.proto.errors import resource_count_limit_exceeded_error_pb2
-from google.ads.google_ads.v1.proto.errors import setting_error_pb2
-from google.ads.google_ads.v1.proto.errors import shared_criterion_error_pb2
-from google.ads.google_ads.v1.proto.errors import shared_set_error_pb2
-from google.ads.google_ads.v1.proto.errors import size_limit_error_pb2
-from google.ads.google_ads.v1.proto.errors import string_format_error_pb2
-from google.ads.google_ads.v1.proto.errors import string_length_error_pb2
-from google.ads.google_ads.v1.proto.errors import url_field_error_pb2
-from google.ads.google_ads.v1.proto.errors import user_list_error_pb2
-from google.ads.google_ads.v1.proto.errors import youtube_video_registration_error_pb2
-from google.ads.google_ads.v1.proto.resources import account_budget_pb2
-from google.ads.google_ads.v1.proto.resources import account_budget_proposal_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_ad_label_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_ad_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_audience_view_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_bid_modifier_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_criterion_label_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_criterion_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_criterion_simulation_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_extension_setting_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_feed_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_label_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_pb2
-from google.ads.google_ads.v1.proto.resources import ad_group_simulation_pb2
-from google.ads.google_ads.v1.proto.resources import ad_parameter_pb2
-from google.ads.google_ads.v1.proto.resources import ad_pb2
-from google.ads.google_ads.v1.proto.resources import ad_schedule_view_pb2
-from google.ads.google_ads.v1.proto.resources import age_range_view_pb2
-from google.ads.google_ads.v1.proto.resources import asset_pb2
-from google.ads.google_ads.v1.proto.resources import bidding_strategy_pb2
-from google.ads.google_ads.v1.proto.resources import billing_setup_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_audience_view_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_bid_modifier_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_budget_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_criterion_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_criterion_simulation_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_draft_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_experiment_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_extension_setting_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_feed_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_label_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_pb2
-from google.ads.google_ads.v1.proto.resources import campaign_shared_set_pb2
-from google.ads.google_ads.v1.proto.resources import carrier_constant_pb2
-from google.ads.google_ads.v1.proto.resources import change_status_pb2
-from google.ads.google_ads.v1.proto.resources import click_view_pb2
-from google.ads.google_ads.v1.proto.resources import conversion_action_pb2
-from google.ads.google_ads.v1.proto.resources import custom_interest_pb2
-from google.ads.google_ads.v1.proto.resources import customer_client_link_pb2
-from google.ads.google_ads.v1.proto.resources import customer_client_pb2
-from google.ads.google_ads.v1.proto.resources import customer_extension_setting_pb2
-from google.ads.google_ads.v1.proto.resources import customer_feed_pb2
-from google.ads.google_ads.v1.proto.resources import customer_label_pb2
-from google.ads.google_ads.v1.proto.resources import customer_manager_link_pb2
-from google.ads.google_ads.v1.proto.resources import customer_negative_criterion_pb2
-from google.ads.google_ads.v1.proto.resources import customer_pb2
-from google.ads.google_ads.v1.proto.resources import detail_placement_view_pb2
-from google.ads.google_ads.v1.proto.resources import display_keyword_view_pb2
-from google.ads.google_ads.v1.proto.resources import domain_category_pb2
-from google.ads.google_ads.v1.proto.resources import dynamic_search_ads_search_term_view_pb2
-from google.ads.google_ads.v1.proto.resources import expanded_landing_page_view_pb2
-from google.ads.google_ads.v1.proto.resources import extension_feed_item_pb2
-from google.ads.google_ads.v1.proto.resources import feed_item_pb2
-from google.ads.google_ads.v1.proto.resources import feed_item_target_pb2
-from google.ads.google_ads.v1.proto.resources import feed_mapping_pb2
-from google.ads.google_ads.v1.proto.resources import feed_pb2
-from google.ads.google_ads.v1.proto.resources import feed_placeholder_view_pb2
-from google.ads.google_ads.v1.proto.resources import gender_view_pb2
-from google.ads.google_ads.v1.proto.resources import geo_target_constant_pb2
-from google.ads.google_ads.v1.proto.resources import geographic_view_pb2
-from google.ads.google_ads.v1.proto.resources import google_ads_field_pb2
-from google.ads.google_ads.v1.proto.resources import group_placement_view_pb2
-from google.ads.google_ads.v1.proto.resources import hotel_group_view_pb2
-from google.ads.google_ads.v1.proto.resources import hotel_performance_view_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_plan_ad_group_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_plan_campaign_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_plan_keyword_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_plan_negative_keyword_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_plan_pb2
-from google.ads.google_ads.v1.proto.resources import keyword_view_pb2
-from google.ads.google_ads.v1.proto.resources import label_pb2
-from google.ads.google_ads.v1.proto.resources import landing_page_view_pb2
-from google.ads.google_ads.v1.proto.resources import language_constant_pb2
-from google.ads.google_ads.v1.proto.resources import location_view_pb2
-from google.ads.google_ads.v1.proto.resources import managed_placement_view_pb2
-from google.ads.google_ads.v1.proto.resources import media_file_pb2
-from google.ads.google_ads.v1.proto.resources import merchant_center_link_pb2
-from google.ads.google_ads.v1.proto.resources import mobile_app_category_constant_pb2
-from google.ads.google_ads.v1.proto.resources import mobile_device_constant_pb2
-from google.ads.google_ads.v1.proto.resources import mutate_job_pb2
-from google.ads.google_ads.v1.proto.resources import operating_system_version_constant_pb2
-from google.ads.google_ads.v1.proto.resources import paid_organic_search_term_view_pb2
-from google.ads.google_ads.v1.proto.resources import parental_status_view_pb2
-from google.ads.google_ads.v1.proto.resources import payments_account_pb2
-from google.ads.google_ads.v1.proto.resources import product_bidding_category_constant_pb2
-from google.ads.google_ads.v1.proto.resources import product_group_view_pb2
-from google.ads.google_ads.v1.proto.resources import recommendation_pb2
-from google.ads.google_ads.v1.proto.resources import remarketing_action_pb2
-from google.ads.google_ads.v1.proto.resources import search_term_view_pb2
-from google.ads.google_ads.v1.proto.resources import shared_criterion_pb2
-from google.ads.google_ads.v1.proto.resources import shared_set_pb2
-from google.ads.google_ads.v1.proto.resources import shopping_performance_view_pb2
-from google.ads.google_ads.v1.proto.resources import topic_constant_pb2
-from google.ads.google_ads.v1.proto.resources import topic_view_pb2
-from google.ads.google_ads.v1.proto.resources import user_interest_pb2
-from google.ads.google_ads.v1.proto.resources import user_list_pb2
-from google.ads.google_ads.v1.proto.resources import video_pb2
-from google.ads.google_ads.v1.proto.services import account_budget_proposal_service_pb2
-from google.ads.google_ads.v1.proto.services import account_budget_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_ad_label_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_ad_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_audience_view_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_bid_modifier_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_criterion_label_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_criterion_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_criterion_simulation_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_extension_setting_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_feed_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_label_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_group_simulation_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_parameter_service_pb2
-from google.ads.google_ads.v1.proto.services import ad_schedule_view_service_pb2
-from google.ads.google_ads.v1.proto.services import age_range_view_service_pb2
-from google.ads.google_ads.v1.proto.services import asset_service_pb2
-from google.ads.google_ads.v1.proto.services import bidding_strategy_service_pb2
-from google.ads.google_ads.v1.proto.services import billing_setup_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_audience_view_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_bid_modifier_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_budget_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_criterion_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_criterion_simulation_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_draft_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_experiment_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_extension_setting_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_feed_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_label_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_service_pb2
-from google.ads.google_ads.v1.proto.services import campaign_shared_set_service_pb2
-from google.ads.google_ads.v1.proto.services import carrier_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import change_status_service_pb2
-from google.ads.google_ads.v1.proto.services import click_view_service_pb2
-from google.ads.google_ads.v1.proto.services import conversion_action_service_pb2
-from google.ads.google_ads.v1.proto.services import conversion_adjustment_upload_service_pb2
-from google.ads.google_ads.v1.proto.services import conversion_upload_service_pb2
-from google.ads.google_ads.v1.proto.services import custom_interest_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_client_link_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_client_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_extension_setting_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_feed_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_label_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_manager_link_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_negative_criterion_service_pb2
-from google.ads.google_ads.v1.proto.services import customer_service_pb2
-from google.ads.google_ads.v1.proto.services import detail_placement_view_service_pb2
-from google.ads.google_ads.v1.proto.services import display_keyword_view_service_pb2
-from google.ads.google_ads.v1.proto.services import domain_category_service_pb2
-from google.ads.google_ads.v1.proto.services import dynamic_search_ads_search_term_view_service_pb2
-from google.ads.google_ads.v1.proto.services import expanded_landing_page_view_service_pb2
-from google.ads.google_ads.v1.proto.services import extension_feed_item_service_pb2
-from google.ads.google_ads.v1.proto.services import feed_item_service_pb2
-from google.ads.google_ads.v1.proto.services import feed_item_target_service_pb2
-from google.ads.google_ads.v1.proto.services import feed_mapping_service_pb2
-from google.ads.google_ads.v1.proto.services import feed_placeholder_view_service_pb2
-from google.ads.google_ads.v1.proto.services import feed_service_pb2
-from google.ads.google_ads.v1.proto.services import gender_view_service_pb2
-from google.ads.google_ads.v1.proto.services import geo_target_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import geographic_view_service_pb2
-from google.ads.google_ads.v1.proto.services import google_ads_field_service_pb2
-from google.ads.google_ads.v1.proto.services import google_ads_service_pb2
-from google.ads.google_ads.v1.proto.services import group_placement_view_service_pb2
-from google.ads.google_ads.v1.proto.services import hotel_group_view_service_pb2
-from google.ads.google_ads.v1.proto.services import hotel_performance_view_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_ad_group_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_campaign_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_idea_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_keyword_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_negative_keyword_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_plan_service_pb2
-from google.ads.google_ads.v1.proto.services import keyword_view_service_pb2
-from google.ads.google_ads.v1.proto.services import label_service_pb2
-from google.ads.google_ads.v1.proto.services import landing_page_view_service_pb2
-from google.ads.google_ads.v1.proto.services import language_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import location_view_service_pb2
-from google.ads.google_ads.v1.proto.services import managed_placement_view_service_pb2
-from google.ads.google_ads.v1.proto.services import media_file_service_pb2
-from google.ads.google_ads.v1.proto.services import merchant_center_link_service_pb2
-from google.ads.google_ads.v1.proto.services import mobile_app_category_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import mobile_device_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import mutate_job_service_pb2
-from google.ads.google_ads.v1.proto.services import operating_system_version_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import paid_organic_search_term_view_service_pb2
-from google.ads.google_ads.v1.proto.services import parental_status_view_service_pb2
-from google.ads.google_ads.v1.proto.services import payments_account_service_pb2
-from google.ads.google_ads.v1.proto.services import product_bidding_category_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import product_group_view_service_pb2
-from google.ads.google_ads.v1.proto.services import recommendation_service_pb2
-from google.ads.google_ads.v1.proto.services import remarketing_action_service_pb2
-from google.ads.google_ads.v1.proto.services import search_term_view_service_pb2
-from google.ads.google_ads.v1.proto.services import shared_criterion_service_pb2
-from google.ads.google_ads.v1.proto.services import shared_set_service_pb2
-from google.ads.google_ads.v1.proto.services import shopping_performance_view_service_pb2
-from google.ads.google_ads.v1.proto.services import topic_constant_service_pb2
-from google.ads.google_ads.v1.proto.services import topic_view_service_pb2
-from google.ads.google_ads.v1.proto.services import user_interest_service_pb2
-from google.ads.google_ads.v1.proto.services import user_list_service_pb2
-from google.ads.google_ads.v1.proto.services import video_service_pb2
-from google.longrunning import operations_pb2
-from google.protobuf import any_pb2
-from google.protobuf import empty_pb2
-from google.protobuf import field_mask_pb2
-from google.protobuf import wrappers_pb2
-from google.rpc import status_pb2
-
-_shared_modules = [
-    ad_asset_pb2,
-    ad_type_infos_pb2,
-    asset_types_pb2,
-    bidding_pb2,
-    click_location_pb2,
-    criteria_pb2,
-    criterion_category_availability_pb2,
-    custom_parameter_pb2,
-    dates_pb2,
-    explorer_auto_optimizer_setting_pb2,
-    extensions_pb2,
-    feed_common_pb2,
-    final_app_url_pb2,
-    frequency_cap_pb2,
-    keyword_plan_common_pb2,
-    matching_function_pb2,
-    metrics_pb2,
-    policy_pb2,
-    real_time_bidding_setting_pb2,
-    segments_pb2,
-    simulation_pb2,
-    tag_snippet_pb2,
-    targeting_setting_pb2,
-    text_label_pb2,
-    url_collection_pb2,
-    user_lists_pb2,
-    value_pb2,
-    access_reason_pb2,
-    account_budget_proposal_status_pb2,
-    account_budget_proposal_type_pb2,
-    account_budget_status_pb2,
-    ad_customizer_placeholder_field_pb2,
-    ad_group_ad_rotation_mode_pb2,
-    ad_group_ad_status_pb2,
-    ad_group_criterion_approval_status_pb2,
-    ad_group_criterion_status_pb2,
-    ad_group_status_pb2,
-    ad_group_type_pb2,
-    ad_network_type_pb2,
-    ad_serving_optimization_status_pb2,
-    ad_strength_pb2,
-    ad_type_pb2,
-    advertising_channel_sub_type_pb2,
-    advertising_channel_type_pb2,
-    affiliate_location_feed_relationship_type_pb2,
-    affiliate_location_placeholder_field_pb2,
-    age_range_type_pb2,
-    app_campaign_app_store_pb2,
-    app_campaign_bidding_strategy_goal_type_pb2,
-    app_payment_model_type_pb2,
-    app_placeholder_field_pb2,
-    app_store_pb2,
-    app_url_operating_system_type_pb2,
-    asset_type_pb2,
-    attribution_model_pb2,
-    bid_modifier_source_pb2,
-    bidding_source_pb2,
-    bidding_strategy_status_pb2,
-    bidding_strategy_type_pb2,
-    billing_setup_status_pb2,
-    brand_safety_suitability_pb2,
-    budget_delivery_method_pb2,
-    budget_period_pb2,
-    budget_status_pb2,
-    budget_type_pb2,
-    call_conversion_reporting_state_pb2,
-    call_placeholder_field_pb2,
-    callout_placeholder_field_pb2,
-    campaign_criterion_status_pb2,
-    campaign_draft_status_pb2,
-    campaign_experiment_status_pb2,
-    campaign_experiment_traffic_split_type_pb2,
-    campaign_experiment_type_pb2,
-    campaign_serving_status_pb2,
-    campaign_shared_set_status_pb2,
-    campaign_status_pb2,
-    change_status_operation_pb2,
-    change_status_resource_type_pb2,
-    click_type_pb2,
-    content_label_type_pb2,
-    conversion_action_category_pb2,
-    conversion_action_counting_type_pb2,
-    conversion_action_status_pb2,
-    conversion_action_type_pb2,
-    conversion_adjustment_type_pb2,
-    conversion_attribution_event_type_pb2,
-    conversion_lag_bucket_pb2,
-    conversion_or_adjustment_lag_bucket_pb2,
-    criterion_category_channel_availability_mode_pb2,
-    criterion_category_locale_availability_mode_pb2,
-    criterion_system_serving_status_pb2,
-    criterion_type_pb2,
-    custom_interest_member_type_pb2,
-    custom_interest_status_pb2,
-    custom_interest_type_pb2,
-    custom_placeholder_field_pb2,
-    customer_match_upload_key_type_pb2,
-    customer_pay_per_conversion_eligibility_failure_reason_pb2,
-    data_driven_model_status_pb2,
-    day_of_week_pb2,
-    device_pb2,
-    display_ad_format_setting_pb2,
-    display_upload_product_type_pb2,
-    dsa_page_feed_criterion_field_pb2,
-    education_placeholder_field_pb2,
-    extension_setting_device_pb2,
-    extension_type_pb2,
-    external_conversion_source_pb2,
-    feed_attribute_type_pb2,
-    feed_item_quality_approval_status_pb2,
-    feed_item_quality_disapproval_reason_pb2,
-    feed_item_status_pb2,
-    feed_item_target_device_pb2,
-    feed_item_target_type_pb2,
-    feed_item_validation_status_pb2,
-    feed_link_status_pb2,
-    feed_mapping_criterion_type_pb2,
-    feed_mapping_status_pb2,
-    feed_origin_pb2,
-    feed_status_pb2,
-    flight_placeholder_field_pb2,
-    frequency_cap_event_type_pb2,
-    frequency_cap_level_pb2,
-    frequency_cap_time_unit_pb2,
-    gender_type_pb2,
-    geo_target_constant_status_pb2,
-    geo_targeting_restriction_pb2,
-    geo_targeting_type_pb2,
-    google_ads_field_category_pb2,
-    google_ads_field_data_type_pb2,
-    hotel_date_selection_type_pb2,
-    hotel_placeholder_field_pb2,
-    hotel_rate_type_pb2,
-    income_range_type_pb2,
-    interaction_event_type_pb2,
-    interaction_type_pb2,
-    job_placeholder_field_pb2,
-    keyword_match_type_pb2,
-    keyword_plan_competition_level_pb2,
-    keyword_plan_forecast_interval_pb2,
-    keyword_plan_network_pb2,
-    label_status_pb2,
-    legacy_app_install_ad_app_store_pb2,
-    listing_custom_attribute_index_pb2,
-    listing_group_type_pb2,
-    local_placeholder_field_pb2,
-    location_extension_targeting_criterion_field_pb2,
-    location_group_radius_units_pb2,
-    location_placeholder_field_pb2,
-    manager_link_status_pb2,
-    matching_function_context_type_pb2,
-    matching_function_operator_pb2,
-    media_type_pb2,
-    merchant_center_link_status_pb2,
-    message_placeholder_field_pb2,
-    mime_type_pb2,
-    minute_of_hour_pb2,
-    mobile_device_type_pb2,
-    month_of_year_pb2,
-    mutate_job_status_pb2,
-    negative_geo_target_type_pb2,
-    operating_system_version_operator_type_pb2,
-    page_one_promoted_strategy_goal_pb2,
-    parental_status_type_pb2,
-    payment_mode_pb2,
-    placeholder_type_pb2,
-    placement_type_pb2,
-    policy_approval_status_pb2,
-    policy_review_status_pb2,
-    policy_topic_entry_type_pb2,
-    policy_topic_evidence_destination_mismatch_url_type_pb2,
-    policy_topic_evidence_destination_not_working_device_pb2,
-    positive_geo_target_type_pb2,
-    preferred_content_type_pb2,
-    price_extension_price_qualifier_pb2,
-    price_extension_price_unit_pb2,
-    price_extension_type_pb2,
-    price_placeholder_field_pb2,
-    product_bidding_category_level_pb2,
-    product_bidding_category_status_pb2,
-    product_channel_exclusivity_pb2,
-    product_channel_pb2,
-    product_condition_pb2,
-    product_type_level_pb2,
-    promotion_extension_discount_modifier_pb2,
-    promotion_extension_occasion_pb2,
-    promotion_placeholder_field_pb2,
-    proximity_radius_units_pb2,
-    quality_score_bucket_pb2,
-    real_estate_placeholder_field_pb2,
-    recommendation_type_pb2,
-    search_engine_results_page_type_pb2,
-    search_term_match_type_pb2,
-    search_term_targeting_status_pb2,
-    served_asset_field_type_pb2,
-    shared_set_status_pb2,
-    shared_set_type_pb2,
-    simulation_modification_method_pb2,
-    simulation_type_pb2,
-    sitelink_placeholder_field_pb2,
-    slot_pb2,
-    spending_limit_type_pb2,
-    structured_snippet_placeholder_field_pb2,
-    system_managed_entity_source_pb2,
-    target_cpa_opt_in_recommendation_goal_pb2,
-    target_impression_share_location_pb2,
-    targeting_dimension_pb2,
-    time_type_pb2,
-    tracking_code_page_format_pb2,
-    tracking_code_type_pb2,
-    travel_placeholder_field_pb2,
-    user_interest_taxonomy_type_pb2,
-    user_list_access_status_pb2,
-    user_list_closing_reason_pb2,
-    user_list_combined_rule_operator_pb2,
-    user_list_crm_data_source_type_pb2,
-    user_list_date_rule_item_operator_pb2,
-    user_list_logical_rule_operator_pb2,
-    user_list_membership_status_pb2,
-    user_list_number_rule_item_operator_pb2,
-    user_list_prepopulation_status_pb2,
-    user_list_rule_type_pb2,
-    user_list_size_range_pb2,
-    user_list_string_rule_item_operator_pb2,
-    user_list_type_pb2,
-    vanity_pharma_display_url_mode_pb2,
-    vanity_pharma_text_pb2,
-    webpage_condition_operand_pb2,
-    webpage_condition_operator_pb2,
-    account_budget_proposal_error_pb2,
-    ad_customizer_error_pb2,
-    ad_error_pb2,
-    ad_group_ad_error_pb2,
-    ad_group_bid_modifier_error_pb2,
-    ad_group_criterion_error_pb2,
-    ad_group_error_pb2,
-    ad_group_feed_error_pb2,
-    ad_parameter_error_pb2,
-    ad_sharing_error_pb2,
-    adx_error_pb2,
-    asset_error_pb2,
-    authentication_error_pb2,
-    authorization_error_pb2,
-    bidding_error_pb2,
-    bidding_strategy_error_pb2,
-    billing_setup_error_pb2,
-    campaign_budget_error_pb2,
-    campaign_criterion_error_pb2,
-    campaign_draft_error_pb2,
-    campaign_error_pb2,
-    campaign_experiment_error_pb2,
-    campaign_feed_error_pb2,
-    campaign_shared_set_error_pb2,
-    change_status_error_pb2,
-    collection_size_error_pb2,
-    context_error_pb2,
-    conversion_action_error_pb2,
-    conversion_adjustment_upload_error_pb2,
-    conversion_upload_error_pb2,
-    country_code_error_pb2,
-    criterion_error_pb2,
-    custom_interest_error_pb2,
-    customer_client_link_error_pb2,
-    customer_error_pb2,
-    customer_feed_error_pb2,
-    customer_manager_link_error_pb2,
-    database_error_pb2,
-    date_error_pb2,
-    date_range_error_pb2,
-    distinct_error_pb2,
-    enum_error_pb2,
-    errors_pb2,
-    extension_feed_item_error_pb2,
-    extension_setting_error_pb2,
-    feed_attribute_reference_error_pb2,
-    feed_error_pb2,
-    feed_item_error_pb2,
-    feed_item_target_error_pb2,
-    feed_item_validation_error_pb2,
-    feed_mapping_error_pb2,
-    field_error_pb2,
-    field_mask_error_pb2,
-    function_error_pb2,
-    function_parsing_error_pb2,
-    geo_target_constant_suggestion_error_pb2,
-    header_error_pb2,
-    id_error_pb2,
-    image_error_pb2,
-    internal_error_pb2,
-    keyword_plan_ad_group_error_pb2,
-    keyword_plan_campaign_error_pb2,
-    keyword_plan_error_pb2,
-    keyword_plan_idea_error_pb2,
-    keyword_plan_keyword_error_pb2,
-    keyword_plan_negative_keyword_error_pb2,
-    label_error_pb2,
-    language_code_error_pb2,
-    list_operation_error_pb2,
-    manager_link_error_pb2,
-    media_bundle_error_pb2,
-    media_file_error_pb2,
-    media_upload_error_pb2,
-    multiplier_error_pb2,
-    mutate_error_pb2,
-    mutate_job_error_pb2,
-    new_resource_creation_error_pb2,
-    not_empty_error_pb2,
-    not_whitelisted_error_pb2,
-    null_error_pb2,
-    operation_access_denied_error_pb2,
-    operator_error_pb2,
-    partial_failure_error_pb2,
-    policy_finding_error_pb2,
-    policy_validation_parameter_error_pb2,
-    policy_violation_error_pb2,
-    query_error_pb2,
-    quota_error_pb2,
-    range_error_pb2,
-    recommendation_error_pb2,
-    region_code_error_pb2,
-    request_error_pb2,
-    resource_access_denied_error_pb2,
-    resource_count_limit_exceeded_error_pb2,
-    setting_error_pb2,
-    shared_criterion_error_pb2,
-    shared_set_error_pb2,
-    size_limit_error_pb2,
-    string_format_error_pb2,
-    string_length_error_pb2,
-    url_field_error_pb2,
-    user_list_error_pb2,
-    youtube_video_registration_error_pb2,
-    account_budget_pb2,
-    account_budget_proposal_pb2,
-    ad_group_ad_label_pb2,
-    ad_group_ad_pb2,
-    ad_group_audience_view_pb2,
-    ad_group_bid_modifier_pb2,
-    ad_group_criterion_label_pb2,
-    ad_group_criterion_pb2,
-    ad_group_criterion_simulation_pb2,
-    ad_group_extension_setting_pb2,
-    ad_group_feed_pb2,
-    ad_group_label_pb2,
-    ad_group_pb2,
-    ad_group_simulation_pb2,
-    ad_parameter_pb2,
-    ad_pb2,
-    ad_schedule_view_pb2,
-    age_range_view_pb2,
-    asset_pb2,
-    bidding_strategy_pb2,
-    billing_setup_pb2,
-    campaign_audience_view_pb2,
-    campaign_bid_modifier_pb2,
-    campaign_budget_pb2,
-    campaign_criterion_pb2,
-    campaign_criterion_simulation_pb2,
-    campaign_draft_pb2,
-    campaign_experiment_pb2,
-    campaign_extension_setting_pb2,
-    campaign_feed_pb2,
-    campaign_label_pb2,
-    campaign_pb2,
-    campaign_shared_set_pb2,
-    carrier_constant_pb2,
-    change_status_pb2,
-    click_view_pb2,
-    conversion_action_pb2,
-    custom_interest_pb2,
-    customer_client_link_pb2,
-    customer_client_pb2,
-    customer_extension_setting_pb2,
-    customer_feed_pb2,
-    customer_label_pb2,
-    customer_manager_link_pb2,
-    customer_negative_criterion_pb2,
-    customer_pb2,
-    detail_placement_view_pb2,
-    display_keyword_view_pb2,
-    domain_category_pb2,
-    dynamic_search_ads_search_term_view_pb2,
-    expanded_landing_page_view_pb2,
-    extension_feed_item_pb2,
-    feed_item_pb2,
-    feed_item_target_pb2,
-    feed_mapping_pb2,
-    feed_pb2,
-    feed_placeholder_view_pb2,
-    gender_view_pb2,
-    geo_target_constant_pb2,
-    geographic_view_pb2,
-    google_ads_field_pb2,
-    group_placement_view_pb2,
-    hotel_group_view_pb2,
-    hotel_performance_view_pb2,
-    keyword_plan_ad_group_pb2,
-    keyword_plan_campaign_pb2,
-    keyword_plan_keyword_pb2,
-    keyword_plan_negative_keyword_pb2,
-    keyword_plan_pb2,
-    keyword_view_pb2,
-    label_pb2,
-    landing_page_view_pb2,
-    language_constant_pb2,
-    location_view_pb2,
-    managed_placement_view_pb2,
-    media_file_pb2,
-    merchant_center_link_pb2,
-    mobile_app_category_constant_pb2,
-    mobile_device_constant_pb2,
-    mutate_job_pb2,
-    operating_system_version_constant_pb2,
-    paid_organic_search_term_view_pb2,
-    parental_status_view_pb2,
-    payments_account_pb2,
-    product_bidding_category_constant_pb2,
-    product_group_view_pb2,
-    recommendation_pb2,
-    remarketing_action_pb2,
-    search_term_view_pb2,
-    shared_criterion_pb2,
-    shared_set_pb2,
-    shopping_performance_view_pb2,
-    topic_constant_pb2,
-    topic_view_pb2,
-    user_interest_pb2,
-    user_list_pb2,
-    video_pb2,
-    operations_pb2,
-    any_pb2,
-    empty_pb2,
-    field_mask_pb2,
-    wrappers_pb2,
-    status_pb2,
-]
-
-_local_modules = [
-    account_budget_proposal_service_pb2,
-    account_budget_service_pb2,
-    ad_group_ad_label_service_pb2,
-    ad_group_ad_service_pb2,
-    ad_group_audience_view_service_pb2,
-    ad_group_bid_modifier_service_pb2,
-    ad_group_criterion_label_service_pb2,
-    ad_group_criterion_service_pb2,
-    ad_group_criterion_simulation_service_pb2,
-    ad_group_extension_setting_service_pb2,
-    ad_group_feed_service_pb2,
-    ad_group_label_service_pb2,
-    ad_group_service_pb2,
-    ad_group_simulation_service_pb2,
-    ad_parameter_service_pb2,
-    ad_schedule_view_service_pb2,
-    age_range_view_service_pb2,
-    asset_service_pb2,
-    bidding_strategy_service_pb2,
-    billing_setup_service_pb2,
-    campaign_audience_view_service_pb2,
-    campaign_bid_modifier_service_pb2,
-    campaign_budget_service_pb2,
-    campaign_criterion_service_pb2,
-    campaign_criterion_simulation_service_pb2,
-    campaign_draft_service_pb2,
-    campaign_experiment_service_pb2,
-    campaign_extension_setting_service_pb2,
-    campaign_feed_service_pb2,
-    campaign_label_service_pb2,
-    campaign_service_pb2,
-    campaign_shared_set_service_pb2,
-    carrier_constant_service_pb2,
-    change_status_service_pb2,
-    click_view_service_pb2,
-    conversion_action_service_pb2,
-    conversion_adjustment_upload_service_pb2,
-    conversion_upload_service_pb2,
-    custom_interest_service_pb2,
-    customer_client_link_service_pb2,
-    customer_client_service_pb2,
-    customer_extension_setting_service_pb2,
-    customer_feed_service_pb2,
-    customer_label_service_pb2,
-    customer_manager_link_service_pb2,
-    customer_negative_criterion_service_pb2,
-    customer_service_pb2,
-    detail_placement_view_service_pb2,
-    display_keyword_view_service_pb2,
-    domain_category_service_pb2,
-    dynamic_search_ads_search_term_view_service_pb2,
-    expanded_landing_page_view_service_pb2,
-    extension_feed_item_service_pb2,
-    feed_item_service_pb2,
-    feed_item_target_service_pb2,
-    feed_mapping_service_pb2,
-    feed_placeholder_view_service_pb2,
-    feed_service_pb2,
-    gender_view_service_pb2,
-    geo_target_constant_service_pb2,
-    geographic_view_service_pb2,
-    google_ads_field_service_pb2,
-    google_ads_service_pb2,
-    group_placement_view_service_pb2,
-    hotel_group_view_service_pb2,
-    hotel_performance_view_service_pb2,
-    keyword_plan_ad_group_service_pb2,
-    keyword_plan_campaign_service_pb2,
-    keyword_plan_idea_service_pb2,
-    keyword_plan_keyword_service_pb2,
-    keyword_plan_negative_keyword_service_pb2,
-    keyword_plan_service_pb2,
-    keyword_view_service_pb2,
-    label_service_pb2,
-    landing_page_view_service_pb2,
-    language_constant_service_pb2,
-    location_view_service_pb2,
-    managed_placement_view_service_pb2,
-    media_file_service_pb2,
-    merchant_center_link_service_pb2,
-    mobile_app_category_constant_service_pb2,
-    mobile_device_constant_service_pb2,
-    mutate_job_service_pb2,
-    operating_system_version_constant_service_pb2,
-    paid_organic_search_term_view_service_pb2,
-    parental_status_view_service_pb2,
-    payments_account_service_pb2,
-    product_bidding_category_constant_service_pb2,
-    product_group_view_service_pb2,
-    recommendation_service_pb2,
-    remarketing_action_service_pb2,
-    search_term_view_service_pb2,
-    shared_criterion_service_pb2,
-    shared_set_service_pb2,
-    shopping_performance_view_service_pb2,
-    topic_constant_service_pb2,
-    topic_view_service_pb2,
-    user_interest_service_pb2,
-    user_list_service_pb2,
-    video_service_pb2,
-]
+# The types defined by each module, which is only imported once one of its
+# types is first accessed.
+_shared_modules = {
+    'google.ads.google_ads.v1.proto.common.ad_asset_pb2': (
+        'AdImageAsset',
+        'AdMediaBundleAsset',
+        'AdTextAsset',
+        'AdVideoAsset',
+    ),
+    'google.ads.google_ads.v1.proto.common.ad_type_infos_pb2': (
+        'AppAdInfo',
+        'AppEngagementAdInfo',
+        'CallOnlyAdInfo',
+        'DisplayCallToAction',
+        'DisplayUploadAdInfo',
+        'ExpandedDynamicSearchAdInfo',
+        'ExpandedTextAdInfo',
+        'GmailAdInfo',
+        'GmailTeaser',
+        'HotelAdInfo',
+        'ImageAdInfo',
+        'LegacyAppInstallAdInfo',
+        'LegacyResponsiveDisplayAdInfo',
+        'ProductImage',
+        'ProductVideo',
+        'ResponsiveDisplayAdInfo',
+        'ResponsiveSearchAdInfo',
+        'ShoppingComparisonListingAdInfo',
+        'ShoppingProductAdInfo',
+        'ShoppingSmartAdInfo',
+        'TextAdInfo',
+        'VideoAdInfo',
+        'VideoBumperInStreamAdInfo',
+        'VideoNonSkippableInStreamAdInfo',
+        'VideoOutstreamAdInfo',
+        'VideoTrueViewInStreamAdInfo',
+    ),
+    'google.ads.google_ads.v1.proto.common.asset_types_pb2': (
+        'ImageAsset',
+        'ImageDimension',
+        'MediaBundleAsset',
+        'TextAsset',
+        'YoutubeVideoAsset',
+    ),
+    'google.ads.google_ads.v1.proto.common.bidding_pb2': (
+        'Commission',
+        'EnhancedCpc',
+        'ManualCpc',
+        'ManualCpm',
+        'ManualCpv',
+        'MaximizeConversionValue',
+        'MaximizeConversions',
+        'PageOnePromoted',
+        'PercentCpc',
+        'TargetCpa',
+        'TargetCpm',
+        'TargetImpressionShare',
+        'TargetOutrankShare',
+        'TargetRoas',
+        'TargetSpend',
+    ),
+    'google.ads.google_ads.v1.proto.common.click_location_pb2': (
+        'ClickLocation',
+    ),
+    'google.ads.google_ads.v1.proto.common.criteria_pb2': (
+        'AdScheduleInfo',
+        'AddressInfo',
+        'AgeRangeInfo',
+        'AppPaymentModelInfo',
+        'CarrierInfo',
+        'ContentLabelInfo',
+        'CustomAffinityInfo',
+        'CustomIntentInfo',
+        'DeviceInfo',
+        'GenderInfo',
+        'GeoPointInfo',
+        'HotelAdvanceBookingWindowInfo',
+        'HotelCheckInDayInfo',
+        'HotelCityInfo',
+        'HotelClassInfo',
+        'HotelCountryRegionInfo',
+        'HotelDateSelectionTypeInfo',
+        'HotelIdInfo',
+        'HotelLengthOfStayInfo',
+        'HotelStateInfo',
+        'IncomeRangeInfo',
+        'InteractionTypeInfo',
+        'IpBlockInfo',
+        'KeywordInfo',
+        'LanguageInfo',
+        'ListingBrandInfo',
+        'ListingCustomAttributeInfo',
+        'ListingDimensionInfo',
+        'ListingGroupInfo',
+        'ListingScopeInfo',
+        'LocationGroupInfo',
+        'LocationInfo',
+        'MobileAppCategoryInfo',
+        'MobileApplicationInfo',
+        'MobileDeviceInfo',
+        'OperatingSystemVersionInfo',
+        'ParentalStatusInfo',
+        'PlacementInfo',
+        'PreferredContentInfo',
+        'ProductBiddingCategoryInfo',
+        'ProductChannelExclusivityInfo',
+        'ProductChannelInfo',
+        'ProductConditionInfo',
+        'ProductItemIdInfo',
+        'ProductTypeInfo',
+        'ProximityInfo',
+        'TopicInfo',
+        'UnknownListingDimensionInfo',
+        'UserInterestInfo',
+        'UserListInfo',
+        'WebpageConditionInfo',
+        'WebpageInfo',
+        'YouTubeChannelInfo',
+        'YouTubeVideoInfo',
+    ),
+    'google.ads.google_ads.v1.proto.common.criterion_category_availability_pb2': (
+        'CriterionCategoryAvailability',
+        'CriterionCategoryChannelAvailability',
+        'CriterionCategoryLocaleAvailability',
+    ),
+    'google.ads.google_ads.v1.proto.common.custom_parameter_pb2': (
+        'CustomParameter',
+    ),
+    'google.ads.google_ads.v1.proto.common.dates_pb2': (
+        'DateRange',
+    ),
+    'google.ads.google_ads.v1.proto.common.explorer_auto_optimizer_setting_pb2': (
+        'ExplorerAutoOptimizerSetting',
+    ),
+    'google.ads.google_ads.v1.proto.common.extensions_pb2': (
+        'AffiliateLocationFeedItem',
+        'AppFeedItem',
+        'CallFeedItem',
+        'CalloutFeedItem',
+        'LocationFeedItem',
+        'PriceFeedItem',
+        'PriceOffer',
+        'PromotionFeedItem',
+        'SitelinkFeedItem',
+        'StructuredSnippetFeedItem',
+        'TextMessageFeedItem',
+    ),
+    'google.ads.google_ads.v1.proto.common.feed_common_pb2': (
+        'Money',
+    ),
+    'google.ads.google_ads.v1.proto.common.final_app_url_pb2': (
+        'FinalAppUrl',
+    ),
+    'google.ads.google_ads.v1.proto.common.frequency_cap_pb2': (
+        'FrequencyCapEntry',
+        'FrequencyCapKey',
+    ),
+    'google.ads.google_ads.v1.proto.common.keyword_plan_common_pb2': (
+        'KeywordPlanHistoricalMetrics',
+    ),
+    'google.ads.google_ads.v1.proto.common.matching_function_pb2': (
+        'MatchingFunction',
+        'Operand',
+    ),
+    'google.ads.google_ads.v1.proto.common.metrics_pb2': (
+        'Metrics',
+    ),
+    'google.ads.google_ads.v1.proto.common.policy_pb2': (
+        'PolicyTopicConstraint',
+        'PolicyTopicEntry',
+        'PolicyTopicEvidence',
+        'PolicyValidationParameter',
+        'PolicyViolationKey',
+    ),
+    'google.ads.google_ads.v1.proto.common.real_time_bidding_setting_pb2': (
+        'RealTimeBiddingSetting',
+    ),
+    'google.ads.google_ads.v1.proto.common.segments_pb2': (
+        'Keyword',
+        'Segments',
+    ),
+    'google.ads.google_ads.v1.proto.common.simulation_pb2': (
+        'BidModifierSimulationPoint',
+        'BidModifierSimulationPointList',
+        'CpcBidSimulationPoint',
+        'CpcBidSimulationPointList',
+        'CpvBidSimulationPoint',
+        'CpvBidSimulationPointList',
+        'TargetCpaSimulationPoint',
+        'TargetCpaSimulationPointList',
+    ),
+    'google.ads.google_ads.v1.proto.common.tag_snippet_pb2': (
+        'TagSnippet',
+    ),
+    'google.ads.google_ads.v1.proto.common.targeting_setting_pb2': (
+        'TargetRestriction',
+        'TargetingSetting',
+    ),
+    'google.ads.google_ads.v1.proto.common.text_label_pb2': (
+        'TextLabel',
+    ),
+    'google.ads.google_ads.v1.proto.common.url_collection_pb2': (
+        'UrlCollection',
+    ),
+    'google.ads.google_ads.v1.proto.common.user_lists_pb2': (
+        'BasicUserListInfo',
+        'CombinedRuleUserListInfo',
+        'CrmBasedUserListInfo',
+        'DateSpecificRuleUserListInfo',
+        'ExpressionRuleUserListInfo',
+        'LogicalUserListInfo',
+        'LogicalUserListOperandInfo',
+        'RuleBasedUserListInfo',
+        'SimilarUserListInfo',
+        'UserListActionInfo',
+        'UserListDateRuleItemInfo',
+        'UserListLogicalRuleInfo',
+        'UserListNumberRuleItemInfo',
+        'UserListRuleInfo',
+        'UserListRuleItemGroupInfo',
+        'UserListRuleItemInfo',
+        'UserListStringRuleItemInfo',
+    ),
+    'google.ads.google_ads.v1.proto.common.value_pb2': (
+        'Value',
+    ),
+    'google.ads.google_ads.v1.proto.enums.access_reason_pb2': (
+        'AccessReasonEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.account_budget_proposal_status_pb2': (
+        'AccountBudgetProposalStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.account_budget_proposal_type_pb2': (
+        'AccountBudgetProposalTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.account_budget_status_pb2': (
+        'AccountBudgetStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_customizer_placeholder_field_pb2': (
+        'AdCustomizerPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_ad_rotation_mode_pb2': (
+        'AdGroupAdRotationModeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_ad_status_pb2': (
+        'AdGroupAdStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_criterion_approval_status_pb2': (
+        'AdGroupCriterionApprovalStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_criterion_status_pb2': (
+        'AdGroupCriterionStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_status_pb2': (
+        'AdGroupStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_group_type_pb2': (
+        'AdGroupTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_network_type_pb2': (
+        'AdNetworkTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_serving_optimization_status_pb2': (
+        'AdServingOptimizationStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_strength_pb2': (
+        'AdStrengthEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.ad_type_pb2': (
+        'AdTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.advertising_channel_sub_type_pb2': (
+        'AdvertisingChannelSubTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.advertising_channel_type_pb2': (
+        'AdvertisingChannelTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.affiliate_location_feed_relationship_type_pb2': (
+        'AffiliateLocationFeedRelationshipTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.affiliate_location_placeholder_field_pb2': (
+        'AffiliateLocationPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.age_range_type_pb2': (
+        'AgeRangeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_campaign_app_store_pb2': (
+        'AppCampaignAppStoreEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_campaign_bidding_strategy_goal_type_pb2': (
+        'AppCampaignBiddingStrategyGoalTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_payment_model_type_pb2': (
+        'AppPaymentModelTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_placeholder_field_pb2': (
+        'AppPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_store_pb2': (
+        'AppStoreEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.app_url_operating_system_type_pb2': (
+        'AppUrlOperatingSystemTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.asset_type_pb2': (
+        'AssetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.attribution_model_pb2': (
+        'AttributionModelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.bid_modifier_source_pb2': (
+        'BidModifierSourceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.bidding_source_pb2': (
+        'BiddingSourceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.bidding_strategy_status_pb2': (
+        'BiddingStrategyStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.bidding_strategy_type_pb2': (
+        'BiddingStrategyTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.billing_setup_status_pb2': (
+        'BillingSetupStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.brand_safety_suitability_pb2': (
+        'BrandSafetySuitabilityEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.budget_delivery_method_pb2': (
+        'BudgetDeliveryMethodEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.budget_period_pb2': (
+        'BudgetPeriodEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.budget_status_pb2': (
+        'BudgetStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.budget_type_pb2': (
+        'BudgetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.call_conversion_reporting_state_pb2': (
+        'CallConversionReportingStateEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.call_placeholder_field_pb2': (
+        'CallPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.callout_placeholder_field_pb2': (
+        'CalloutPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_criterion_status_pb2': (
+        'CampaignCriterionStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_draft_status_pb2': (
+        'CampaignDraftStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_experiment_status_pb2': (
+        'CampaignExperimentStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_experiment_traffic_split_type_pb2': (
+        'CampaignExperimentTrafficSplitTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_experiment_type_pb2': (
+        'CampaignExperimentTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_serving_status_pb2': (
+        'CampaignServingStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_shared_set_status_pb2': (
+        'CampaignSharedSetStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.campaign_status_pb2': (
+        'CampaignStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.change_status_operation_pb2': (
+        'ChangeStatusOperationEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.change_status_resource_type_pb2': (
+        'ChangeStatusResourceTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.click_type_pb2': (
+        'ClickTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.content_label_type_pb2': (
+        'ContentLabelTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_action_category_pb2': (
+        'ConversionActionCategoryEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_action_counting_type_pb2': (
+        'ConversionActionCountingTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_action_status_pb2': (
+        'ConversionActionStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_action_type_pb2': (
+        'ConversionActionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_adjustment_type_pb2': (
+        'ConversionAdjustmentTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_attribution_event_type_pb2': (
+        'ConversionAttributionEventTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_lag_bucket_pb2': (
+        'ConversionLagBucketEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.conversion_or_adjustment_lag_bucket_pb2': (
+        'ConversionOrAdjustmentLagBucketEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.criterion_category_channel_availability_mode_pb2': (
+        'CriterionCategoryChannelAvailabilityModeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.criterion_category_locale_availability_mode_pb2': (
+        'CriterionCategoryLocaleAvailabilityModeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.criterion_system_serving_status_pb2': (
+        'CriterionSystemServingStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.criterion_type_pb2': (
+        'CriterionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.custom_interest_member_type_pb2': (
+        'CustomInterestMemberTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.custom_interest_status_pb2': (
+        'CustomInterestStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.custom_interest_type_pb2': (
+        'CustomInterestTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.custom_placeholder_field_pb2': (
+        'CustomPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.customer_match_upload_key_type_pb2': (
+        'CustomerMatchUploadKeyTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.customer_pay_per_conversion_eligibility_failure_reason_pb2': (
+        'CustomerPayPerConversionEligibilityFailureReasonEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.data_driven_model_status_pb2': (
+        'DataDrivenModelStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.day_of_week_pb2': (
+        'DayOfWeekEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.device_pb2': (
+        'DeviceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.display_ad_format_setting_pb2': (
+        'DisplayAdFormatSettingEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.display_upload_product_type_pb2': (
+        'DisplayUploadProductTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.dsa_page_feed_criterion_field_pb2': (
+        'DsaPageFeedCriterionFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.education_placeholder_field_pb2': (
+        'EducationPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.extension_setting_device_pb2': (
+        'ExtensionSettingDeviceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.extension_type_pb2': (
+        'ExtensionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.external_conversion_source_pb2': (
+        'ExternalConversionSourceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_attribute_type_pb2': (
+        'FeedAttributeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_quality_approval_status_pb2': (
+        'FeedItemQualityApprovalStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_quality_disapproval_reason_pb2': (
+        'FeedItemQualityDisapprovalReasonEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_status_pb2': (
+        'FeedItemStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_target_device_pb2': (
+        'FeedItemTargetDeviceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_target_type_pb2': (
+        'FeedItemTargetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_item_validation_status_pb2': (
+        'FeedItemValidationStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_link_status_pb2': (
+        'FeedLinkStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_mapping_criterion_type_pb2': (
+        'FeedMappingCriterionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_mapping_status_pb2': (
+        'FeedMappingStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_origin_pb2': (
+        'FeedOriginEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.feed_status_pb2': (
+        'FeedStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.flight_placeholder_field_pb2': (
+        'FlightPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.frequency_cap_event_type_pb2': (
+        'FrequencyCapEventTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.frequency_cap_level_pb2': (
+        'FrequencyCapLevelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.frequency_cap_time_unit_pb2': (
+        'FrequencyCapTimeUnitEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.gender_type_pb2': (
+        'GenderTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.geo_target_constant_status_pb2': (
+        'GeoTargetConstantStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.geo_targeting_restriction_pb2': (
+        'GeoTargetingRestrictionEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.geo_targeting_type_pb2': (
+        'GeoTargetingTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.google_ads_field_category_pb2': (
+        'GoogleAdsFieldCategoryEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.google_ads_field_data_type_pb2': (
+        'GoogleAdsFieldDataTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.hotel_date_selection_type_pb2': (
+        'HotelDateSelectionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.hotel_placeholder_field_pb2': (
+        'HotelPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.hotel_rate_type_pb2': (
+        'HotelRateTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.income_range_type_pb2': (
+        'IncomeRangeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.interaction_event_type_pb2': (
+        'InteractionEventTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.interaction_type_pb2': (
+        'InteractionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.job_placeholder_field_pb2': (
+        'JobPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.keyword_match_type_pb2': (
+        'KeywordMatchTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.keyword_plan_competition_level_pb2': (
+        'KeywordPlanCompetitionLevelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.keyword_plan_forecast_interval_pb2': (
+        'KeywordPlanForecastIntervalEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.keyword_plan_network_pb2': (
+        'KeywordPlanNetworkEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.label_status_pb2': (
+        'LabelStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.legacy_app_install_ad_app_store_pb2': (
+        'LegacyAppInstallAdAppStoreEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.listing_custom_attribute_index_pb2': (
+        'ListingCustomAttributeIndexEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.listing_group_type_pb2': (
+        'ListingGroupTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.local_placeholder_field_pb2': (
+        'LocalPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.location_extension_targeting_criterion_field_pb2': (
+        'LocationExtensionTargetingCriterionFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.location_group_radius_units_pb2': (
+        'LocationGroupRadiusUnitsEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.location_placeholder_field_pb2': (
+        'LocationPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.manager_link_status_pb2': (
+        'ManagerLinkStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.matching_function_context_type_pb2': (
+        'MatchingFunctionContextTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.matching_function_operator_pb2': (
+        'MatchingFunctionOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.media_type_pb2': (
+        'MediaTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.merchant_center_link_status_pb2': (
+        'MerchantCenterLinkStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.message_placeholder_field_pb2': (
+        'MessagePlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.mime_type_pb2': (
+        'MimeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.minute_of_hour_pb2': (
+        'MinuteOfHourEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.mobile_device_type_pb2': (
+        'MobileDeviceTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.month_of_year_pb2': (
+        'MonthOfYearEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.mutate_job_status_pb2': (
+        'MutateJobStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.negative_geo_target_type_pb2': (
+        'NegativeGeoTargetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.operating_system_version_operator_type_pb2': (
+        'OperatingSystemVersionOperatorTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.page_one_promoted_strategy_goal_pb2': (
+        'PageOnePromotedStrategyGoalEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.parental_status_type_pb2': (
+        'ParentalStatusTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.payment_mode_pb2': (
+        'PaymentModeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.placeholder_type_pb2': (
+        'PlaceholderTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.placement_type_pb2': (
+        'PlacementTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.policy_approval_status_pb2': (
+        'PolicyApprovalStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.policy_review_status_pb2': (
+        'PolicyReviewStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.policy_topic_entry_type_pb2': (
+        'PolicyTopicEntryTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.policy_topic_evidence_destination_mismatch_url_type_pb2': (
+        'PolicyTopicEvidenceDestinationMismatchUrlTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.policy_topic_evidence_destination_not_working_device_pb2': (
+        'PolicyTopicEvidenceDestinationNotWorkingDeviceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.positive_geo_target_type_pb2': (
+        'PositiveGeoTargetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.preferred_content_type_pb2': (
+        'PreferredContentTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.price_extension_price_qualifier_pb2': (
+        'PriceExtensionPriceQualifierEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.price_extension_price_unit_pb2': (
+        'PriceExtensionPriceUnitEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.price_extension_type_pb2': (
+        'PriceExtensionTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.price_placeholder_field_pb2': (
+        'PricePlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_bidding_category_level_pb2': (
+        'ProductBiddingCategoryLevelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_bidding_category_status_pb2': (
+        'ProductBiddingCategoryStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_channel_exclusivity_pb2': (
+        'ProductChannelExclusivityEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_channel_pb2': (
+        'ProductChannelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_condition_pb2': (
+        'ProductConditionEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.product_type_level_pb2': (
+        'ProductTypeLevelEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.promotion_extension_discount_modifier_pb2': (
+        'PromotionExtensionDiscountModifierEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.promotion_extension_occasion_pb2': (
+        'PromotionExtensionOccasionEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.promotion_placeholder_field_pb2': (
+        'PromotionPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.proximity_radius_units_pb2': (
+        'ProximityRadiusUnitsEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.quality_score_bucket_pb2': (
+        'QualityScoreBucketEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.real_estate_placeholder_field_pb2': (
+        'RealEstatePlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.recommendation_type_pb2': (
+        'RecommendationTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.search_engine_results_page_type_pb2': (
+        'SearchEngineResultsPageTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.search_term_match_type_pb2': (
+        'SearchTermMatchTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.search_term_targeting_status_pb2': (
+        'SearchTermTargetingStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.served_asset_field_type_pb2': (
+        'ServedAssetFieldTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.shared_set_status_pb2': (
+        'SharedSetStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.shared_set_type_pb2': (
+        'SharedSetTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.simulation_modification_method_pb2': (
+        'SimulationModificationMethodEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.simulation_type_pb2': (
+        'SimulationTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.sitelink_placeholder_field_pb2': (
+        'SitelinkPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.slot_pb2': (
+        'SlotEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.spending_limit_type_pb2': (
+        'SpendingLimitTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.structured_snippet_placeholder_field_pb2': (
+        'StructuredSnippetPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.system_managed_entity_source_pb2': (
+        'SystemManagedResourceSourceEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.target_cpa_opt_in_recommendation_goal_pb2': (
+        'TargetCpaOptInRecommendationGoalEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.target_impression_share_location_pb2': (
+        'TargetImpressionShareLocationEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.targeting_dimension_pb2': (
+        'TargetingDimensionEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.time_type_pb2': (
+        'TimeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.tracking_code_page_format_pb2': (
+        'TrackingCodePageFormatEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.tracking_code_type_pb2': (
+        'TrackingCodeTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.travel_placeholder_field_pb2': (
+        'TravelPlaceholderFieldEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_interest_taxonomy_type_pb2': (
+        'UserInterestTaxonomyTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_access_status_pb2': (
+        'UserListAccessStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_closing_reason_pb2': (
+        'UserListClosingReasonEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_combined_rule_operator_pb2': (
+        'UserListCombinedRuleOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_crm_data_source_type_pb2': (
+        'UserListCrmDataSourceTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_date_rule_item_operator_pb2': (
+        'UserListDateRuleItemOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_logical_rule_operator_pb2': (
+        'UserListLogicalRuleOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_membership_status_pb2': (
+        'UserListMembershipStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_number_rule_item_operator_pb2': (
+        'UserListNumberRuleItemOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_prepopulation_status_pb2': (
+        'UserListPrepopulationStatusEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_rule_type_pb2': (
+        'UserListRuleTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_size_range_pb2': (
+        'UserListSizeRangeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_string_rule_item_operator_pb2': (
+        'UserListStringRuleItemOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.user_list_type_pb2': (
+        'UserListTypeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.vanity_pharma_display_url_mode_pb2': (
+        'VanityPharmaDisplayUrlModeEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.vanity_pharma_text_pb2': (
+        'VanityPharmaTextEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.webpage_condition_operand_pb2': (
+        'WebpageConditionOperandEnum',
+    ),
+    'google.ads.google_ads.v1.proto.enums.webpage_condition_operator_pb2': (
+        'WebpageConditionOperatorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.account_budget_proposal_error_pb2': (
+        'AccountBudgetProposalErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_customizer_error_pb2': (
+        'AdCustomizerErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_error_pb2': (
+        'AdErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_group_ad_error_pb2': (
+        'AdGroupAdErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_group_bid_modifier_error_pb2': (
+        'AdGroupBidModifierErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_group_criterion_error_pb2': (
+        'AdGroupCriterionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_group_error_pb2': (
+        'AdGroupErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_group_feed_error_pb2': (
+        'AdGroupFeedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_parameter_error_pb2': (
+        'AdParameterErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.ad_sharing_error_pb2': (
+        'AdSharingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.adx_error_pb2': (
+        'AdxErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.asset_error_pb2': (
+        'AssetErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.authentication_error_pb2': (
+        'AuthenticationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.authorization_error_pb2': (
+        'AuthorizationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.bidding_error_pb2': (
+        'BiddingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.bidding_strategy_error_pb2': (
+        'BiddingStrategyErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.billing_setup_error_pb2': (
+        'BillingSetupErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_budget_error_pb2': (
+        'CampaignBudgetErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_criterion_error_pb2': (
+        'CampaignCriterionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_draft_error_pb2': (
+        'CampaignDraftErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_error_pb2': (
+        'CampaignErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_experiment_error_pb2': (
+        'CampaignExperimentErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_feed_error_pb2': (
+        'CampaignFeedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.campaign_shared_set_error_pb2': (
+        'CampaignSharedSetErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.change_status_error_pb2': (
+        'ChangeStatusErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.collection_size_error_pb2': (
+        'CollectionSizeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.context_error_pb2': (
+        'ContextErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.conversion_action_error_pb2': (
+        'ConversionActionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.conversion_adjustment_upload_error_pb2': (
+        'ConversionAdjustmentUploadErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.conversion_upload_error_pb2': (
+        'ConversionUploadErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.country_code_error_pb2': (
+        'CountryCodeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.criterion_error_pb2': (
+        'CriterionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.custom_interest_error_pb2': (
+        'CustomInterestErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.customer_client_link_error_pb2': (
+        'CustomerClientLinkErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.customer_error_pb2': (
+        'CustomerErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.customer_feed_error_pb2': (
+        'CustomerFeedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.customer_manager_link_error_pb2': (
+        'CustomerManagerLinkErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.database_error_pb2': (
+        'DatabaseErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.date_error_pb2': (
+        'DateErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.date_range_error_pb2': (
+        'DateRangeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.distinct_error_pb2': (
+        'DistinctErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.enum_error_pb2': (
+        'EnumErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.errors_pb2': (
+        'ErrorCode',
+        'ErrorDetails',
+        'ErrorLocation',
+        'GoogleAdsError',
+        'GoogleAdsFailure',
+        'PolicyFindingDetails',
+        'PolicyViolationDetails',
+    ),
+    'google.ads.google_ads.v1.proto.errors.extension_feed_item_error_pb2': (
+        'ExtensionFeedItemErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.extension_setting_error_pb2': (
+        'ExtensionSettingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_attribute_reference_error_pb2': (
+        'FeedAttributeReferenceErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_error_pb2': (
+        'FeedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_item_error_pb2': (
+        'FeedItemErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_item_target_error_pb2': (
+        'FeedItemTargetErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_item_validation_error_pb2': (
+        'FeedItemValidationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.feed_mapping_error_pb2': (
+        'FeedMappingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.field_error_pb2': (
+        'FieldErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.field_mask_error_pb2': (
+        'FieldMaskErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.function_error_pb2': (
+        'FunctionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.function_parsing_error_pb2': (
+        'FunctionParsingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.geo_target_constant_suggestion_error_pb2': (
+        'GeoTargetConstantSuggestionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.header_error_pb2': (
+        'HeaderErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.id_error_pb2': (
+        'IdErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.image_error_pb2': (
+        'ImageErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.internal_error_pb2': (
+        'InternalErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_ad_group_error_pb2': (
+        'KeywordPlanAdGroupErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_campaign_error_pb2': (
+        'KeywordPlanCampaignErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_error_pb2': (
+        'KeywordPlanErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_idea_error_pb2': (
+        'KeywordPlanIdeaErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_keyword_error_pb2': (
+        'KeywordPlanKeywordErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.keyword_plan_negative_keyword_error_pb2': (
+        'KeywordPlanNegativeKeywordErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.label_error_pb2': (
+        'LabelErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.language_code_error_pb2': (
+        'LanguageCodeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.list_operation_error_pb2': (
+        'ListOperationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.manager_link_error_pb2': (
+        'ManagerLinkErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.media_bundle_error_pb2': (
+        'MediaBundleErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.media_file_error_pb2': (
+        'MediaFileErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.media_upload_error_pb2': (
+        'MediaUploadErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.multiplier_error_pb2': (
+        'MultiplierErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.mutate_error_pb2': (
+        'MutateErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.mutate_job_error_pb2': (
+        'MutateJobErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.new_resource_creation_error_pb2': (
+        'NewResourceCreationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.not_empty_error_pb2': (
+        'NotEmptyErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.not_whitelisted_error_pb2': (
+        'NotWhitelistedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.null_error_pb2': (
+        'NullErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.operation_access_denied_error_pb2': (
+        'OperationAccessDeniedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.operator_error_pb2': (
+        'OperatorErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.partial_failure_error_pb2': (
+        'PartialFailureErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.policy_finding_error_pb2': (
+        'PolicyFindingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.policy_validation_parameter_error_pb2': (
+        'PolicyValidationParameterErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.policy_violation_error_pb2': (
+        'PolicyViolationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.query_error_pb2': (
+        'QueryErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.quota_error_pb2': (
+        'QuotaErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.range_error_pb2': (
+        'RangeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.recommendation_error_pb2': (
+        'RecommendationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.region_code_error_pb2': (
+        'RegionCodeErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.request_error_pb2': (
+        'RequestErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.resource_access_denied_error_pb2': (
+        'ResourceAccessDeniedErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.resource_count_limit_exceeded_error_pb2': (
+        'ResourceCountLimitExceededErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.setting_error_pb2': (
+        'SettingErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.shared_criterion_error_pb2': (
+        'SharedCriterionErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.shared_set_error_pb2': (
+        'SharedSetErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.size_limit_error_pb2': (
+        'SizeLimitErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.string_format_error_pb2': (
+        'StringFormatErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.string_length_error_pb2': (
+        'StringLengthErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.url_field_error_pb2': (
+        'UrlFieldErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.user_list_error_pb2': (
+        'UserListErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.errors.youtube_video_registration_error_pb2': (
+        'YoutubeVideoRegistrationErrorEnum',
+    ),
+    'google.ads.google_ads.v1.proto.resources.account_budget_pb2': (
+        'AccountBudget',
+    ),
+    'google.ads.google_ads.v1.proto.resources.account_budget_proposal_pb2': (
+        'AccountBudgetProposal',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_ad_label_pb2': (
+        'AdGroupAdLabel',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_ad_pb2': (
+        'AdGroupAd',
+        'AdGroupAdPolicySummary',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_audience_view_pb2': (
+        'AdGroupAudienceView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_bid_modifier_pb2': (
+        'AdGroupBidModifier',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_criterion_label_pb2': (
+        'AdGroupCriterionLabel',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_criterion_pb2': (
+        'AdGroupCriterion',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_criterion_simulation_pb2': (
+        'AdGroupCriterionSimulation',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_extension_setting_pb2': (
+        'AdGroupExtensionSetting',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_feed_pb2': (
+        'AdGroupFeed',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_label_pb2': (
+        'AdGroupLabel',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_pb2': (
+        'AdGroup',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_group_simulation_pb2': (
+        'AdGroupSimulation',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_parameter_pb2': (
+        'AdParameter',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_pb2': (
+        'Ad',
+    ),
+    'google.ads.google_ads.v1.proto.resources.ad_schedule_view_pb2': (
+        'AdScheduleView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.age_range_view_pb2': (
+        'AgeRangeView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.asset_pb2': (
+        'Asset',
+    ),
+    'google.ads.google_ads.v1.proto.resources.bidding_strategy_pb2': (
+        'BiddingStrategy',
+    ),
+    'google.ads.google_ads.v1.proto.resources.billing_setup_pb2': (
+        'BillingSetup',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_audience_view_pb2': (
+        'CampaignAudienceView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_bid_modifier_pb2': (
+        'CampaignBidModifier',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_budget_pb2': (
+        'CampaignBudget',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_criterion_pb2': (
+        'CampaignCriterion',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_criterion_simulation_pb2': (
+        'CampaignCriterionSimulation',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_draft_pb2': (
+        'CampaignDraft',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_experiment_pb2': (
+        'CampaignExperiment',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_extension_setting_pb2': (
+        'CampaignExtensionSetting',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_feed_pb2': (
+        'CampaignFeed',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_label_pb2': (
+        'CampaignLabel',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_pb2': (
+        'Campaign',
+    ),
+    'google.ads.google_ads.v1.proto.resources.campaign_shared_set_pb2': (
+        'CampaignSharedSet',
+    ),
+    'google.ads.google_ads.v1.proto.resources.carrier_constant_pb2': (
+        'CarrierConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.change_status_pb2': (
+        'ChangeStatus',
+    ),
+    'google.ads.google_ads.v1.proto.resources.click_view_pb2': (
+        'ClickView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.conversion_action_pb2': (
+        'ConversionAction',
+    ),
+    'google.ads.google_ads.v1.proto.resources.custom_interest_pb2': (
+        'CustomInterest',
+        'CustomInterestMember',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_client_link_pb2': (
+        'CustomerClientLink',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_client_pb2': (
+        'CustomerClient',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_extension_setting_pb2': (
+        'CustomerExtensionSetting',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_feed_pb2': (
+        'CustomerFeed',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_label_pb2': (
+        'CustomerLabel',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_manager_link_pb2': (
+        'CustomerManagerLink',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_negative_criterion_pb2': (
+        'CustomerNegativeCriterion',
+    ),
+    'google.ads.google_ads.v1.proto.resources.customer_pb2': (
+        'CallReportingSetting',
+        'ConversionTrackingSetting',
+        'Customer',
+        'RemarketingSetting',
+    ),
+    'google.ads.google_ads.v1.proto.resources.detail_placement_view_pb2': (
+        'DetailPlacementView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.display_keyword_view_pb2': (
+        'DisplayKeywordView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.domain_category_pb2': (
+        'DomainCategory',
+    ),
+    'google.ads.google_ads.v1.proto.resources.dynamic_search_ads_search_term_view_pb2': (
+        'DynamicSearchAdsSearchTermView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.expanded_landing_page_view_pb2': (
+        'ExpandedLandingPageView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.extension_feed_item_pb2': (
+        'ExtensionFeedItem',
+    ),
+    'google.ads.google_ads.v1.proto.resources.feed_item_pb2': (
+        'FeedItem',
+        'FeedItemAttributeValue',
+        'FeedItemPlaceholderPolicyInfo',
+        'FeedItemValidationError',
+    ),
+    'google.ads.google_ads.v1.proto.resources.feed_item_target_pb2': (
+        'FeedItemTarget',
+    ),
+    'google.ads.google_ads.v1.proto.resources.feed_mapping_pb2': (
+        'AttributeFieldMapping',
+        'FeedMapping',
+    ),
+    'google.ads.google_ads.v1.proto.resources.feed_pb2': (
+        'Feed',
+        'FeedAttribute',
+        'FeedAttributeOperation',
+    ),
+    'google.ads.google_ads.v1.proto.resources.feed_placeholder_view_pb2': (
+        'FeedPlaceholderView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.gender_view_pb2': (
+        'GenderView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.geo_target_constant_pb2': (
+        'GeoTargetConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.geographic_view_pb2': (
+        'GeographicView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.google_ads_field_pb2': (
+        'GoogleAdsField',
+    ),
+    'google.ads.google_ads.v1.proto.resources.group_placement_view_pb2': (
+        'GroupPlacementView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.hotel_group_view_pb2': (
+        'HotelGroupView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.hotel_performance_view_pb2': (
+        'HotelPerformanceView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_plan_ad_group_pb2': (
+        'KeywordPlanAdGroup',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_plan_campaign_pb2': (
+        'KeywordPlanCampaign',
+        'KeywordPlanGeoTarget',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_plan_keyword_pb2': (
+        'KeywordPlanKeyword',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_plan_negative_keyword_pb2': (
+        'KeywordPlanNegativeKeyword',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_plan_pb2': (
+        'KeywordPlan',
+        'KeywordPlanForecastPeriod',
+    ),
+    'google.ads.google_ads.v1.proto.resources.keyword_view_pb2': (
+        'KeywordView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.label_pb2': (
+        'Label',
+    ),
+    'google.ads.google_ads.v1.proto.resources.landing_page_view_pb2': (
+        'LandingPageView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.language_constant_pb2': (
+        'LanguageConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.location_view_pb2': (
+        'LocationView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.managed_placement_view_pb2': (
+        'ManagedPlacementView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.media_file_pb2': (
+        'MediaAudio',
+        'MediaBundle',
+        'MediaFile',
+        'MediaImage',
+        'MediaVideo',
+    ),
+    'google.ads.google_ads.v1.proto.resources.merchant_center_link_pb2': (
+        'MerchantCenterLink',
+    ),
+    'google.ads.google_ads.v1.proto.resources.mobile_app_category_constant_pb2': (
+        'MobileAppCategoryConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.mobile_device_constant_pb2': (
+        'MobileDeviceConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.mutate_job_pb2': (
+        'MutateJob',
+    ),
+    'google.ads.google_ads.v1.proto.resources.operating_system_version_constant_pb2': (
+        'OperatingSystemVersionConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.paid_organic_search_term_view_pb2': (
+        'PaidOrganicSearchTermView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.parental_status_view_pb2': (
+        'ParentalStatusView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.payments_account_pb2': (
+        'PaymentsAccount',
+    ),
+    'google.ads.google_ads.v1.proto.resources.product_bidding_category_constant_pb2': (
+        'ProductBiddingCategoryConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.product_group_view_pb2': (
+        'ProductGroupView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.recommendation_pb2': (
+        'Recommendation',
+    ),
+    'google.ads.google_ads.v1.proto.resources.remarketing_action_pb2': (
+        'RemarketingAction',
+    ),
+    'google.ads.google_ads.v1.proto.resources.search_term_view_pb2': (
+        'SearchTermView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.shared_criterion_pb2': (
+        'SharedCriterion',
+    ),
+    'google.ads.google_ads.v1.proto.resources.shared_set_pb2': (
+        'SharedSet',
+    ),
+    'google.ads.google_ads.v1.proto.resources.shopping_performance_view_pb2': (
+        'ShoppingPerformanceView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.topic_constant_pb2': (
+        'TopicConstant',
+    ),
+    'google.ads.google_ads.v1.proto.resources.topic_view_pb2': (
+        'TopicView',
+    ),
+    'google.ads.google_ads.v1.proto.resources.user_interest_pb2': (
+        'UserInterest',
+    ),
+    'google.ads.google_ads.v1.proto.resources.user_list_pb2': (
+        'UserList',
+    ),
+    'google.ads.google_ads.v1.proto.resources.video_pb2': (
+        'Video',
+    ),
+    'google.longrunning.operations_pb2': (
+        'CancelOperationRequest',
+        'DeleteOperationRequest',
+        'GetOperationRequest',
+        'ListOperationsRequest',
+        'ListOperationsResponse',
+        'Operation',
+        'OperationInfo',
+        'WaitOperationRequest',
+    ),
+    'google.protobuf.any_pb2': (
+        'Any',
+    ),
+    'google.protobuf.empty_pb2': (
+        'Empty',
+    ),
+    'google.protobuf.field_mask_pb2': (
+        'FieldMask',
+    ),
+    'google.protobuf.wrappers_pb2': (
+        'BoolValue',
+        'BytesValue',
+        'DoubleValue',
+        'FloatValue',
+        'Int32Value',
+        'Int64Value',
+        'StringValue',
+        'UInt32Value',
+        'UInt64Value',
+    ),
+    'google.rpc.status_pb2': (
+        'Status',
+    ),
+}
+_local_modules = {
+    'google.ads.google_ads.v1.proto.services.account_budget_proposal_service_pb2': (
+        'AccountBudgetProposalOperation',
+        'GetAccountBudgetProposalRequest',
+        'MutateAccountBudgetProposalRequest',
+        'MutateAccountBudgetProposalResponse',
+        'MutateAccountBudgetProposalResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.account_budget_service_pb2': (
+        'GetAccountBudgetRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_ad_label_service_pb2': (
+        'AdGroupAdLabelOperation',
+        'GetAdGroupAdLabelRequest',
+        'MutateAdGroupAdLabelResult',
+        'MutateAdGroupAdLabelsRequest',
+        'MutateAdGroupAdLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_ad_service_pb2': (
+        'AdGroupAdOperation',
+        'GetAdGroupAdRequest',
+        'MutateAdGroupAdResult',
+        'MutateAdGroupAdsRequest',
+        'MutateAdGroupAdsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_audience_view_service_pb2': (
+        'GetAdGroupAudienceViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_bid_modifier_service_pb2': (
+        'AdGroupBidModifierOperation',
+        'GetAdGroupBidModifierRequest',
+        'MutateAdGroupBidModifierResult',
+        'MutateAdGroupBidModifiersRequest',
+        'MutateAdGroupBidModifiersResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_criterion_label_service_pb2': (
+        'AdGroupCriterionLabelOperation',
+        'GetAdGroupCriterionLabelRequest',
+        'MutateAdGroupCriterionLabelResult',
+        'MutateAdGroupCriterionLabelsRequest',
+        'MutateAdGroupCriterionLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_criterion_service_pb2': (
+        'AdGroupCriterionOperation',
+        'GetAdGroupCriterionRequest',
+        'MutateAdGroupCriteriaRequest',
+        'MutateAdGroupCriteriaResponse',
+        'MutateAdGroupCriterionResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_criterion_simulation_service_pb2': (
+        'GetAdGroupCriterionSimulationRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_extension_setting_service_pb2': (
+        'AdGroupExtensionSettingOperation',
+        'GetAdGroupExtensionSettingRequest',
+        'MutateAdGroupExtensionSettingResult',
+        'MutateAdGroupExtensionSettingsRequest',
+        'MutateAdGroupExtensionSettingsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_feed_service_pb2': (
+        'AdGroupFeedOperation',
+        'GetAdGroupFeedRequest',
+        'MutateAdGroupFeedResult',
+        'MutateAdGroupFeedsRequest',
+        'MutateAdGroupFeedsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_label_service_pb2': (
+        'AdGroupLabelOperation',
+        'GetAdGroupLabelRequest',
+        'MutateAdGroupLabelResult',
+        'MutateAdGroupLabelsRequest',
+        'MutateAdGroupLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_service_pb2': (
+        'AdGroupOperation',
+        'GetAdGroupRequest',
+        'MutateAdGroupResult',
+        'MutateAdGroupsRequest',
+        'MutateAdGroupsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_group_simulation_service_pb2': (
+        'GetAdGroupSimulationRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_parameter_service_pb2': (
+        'AdParameterOperation',
+        'GetAdParameterRequest',
+        'MutateAdParameterResult',
+        'MutateAdParametersRequest',
+        'MutateAdParametersResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.ad_schedule_view_service_pb2': (
+        'GetAdScheduleViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.age_range_view_service_pb2': (
+        'GetAgeRangeViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.asset_service_pb2': (
+        'AssetOperation',
+        'GetAssetRequest',
+        'MutateAssetResult',
+        'MutateAssetsRequest',
+        'MutateAssetsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.bidding_strategy_service_pb2': (
+        'BiddingStrategyOperation',
+        'GetBiddingStrategyRequest',
+        'MutateBiddingStrategiesRequest',
+        'MutateBiddingStrategiesResponse',
+        'MutateBiddingStrategyResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.billing_setup_service_pb2': (
+        'BillingSetupOperation',
+        'GetBillingSetupRequest',
+        'MutateBillingSetupRequest',
+        'MutateBillingSetupResponse',
+        'MutateBillingSetupResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_audience_view_service_pb2': (
+        'GetCampaignAudienceViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_bid_modifier_service_pb2': (
+        'CampaignBidModifierOperation',
+        'GetCampaignBidModifierRequest',
+        'MutateCampaignBidModifierResult',
+        'MutateCampaignBidModifiersRequest',
+        'MutateCampaignBidModifiersResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_budget_service_pb2': (
+        'CampaignBudgetOperation',
+        'GetCampaignBudgetRequest',
+        'MutateCampaignBudgetResult',
+        'MutateCampaignBudgetsRequest',
+        'MutateCampaignBudgetsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_criterion_service_pb2': (
+        'CampaignCriterionOperation',
+        'GetCampaignCriterionRequest',
+        'MutateCampaignCriteriaRequest',
+        'MutateCampaignCriteriaResponse',
+        'MutateCampaignCriterionResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_criterion_simulation_service_pb2': (
+        'GetCampaignCriterionSimulationRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_draft_service_pb2': (
+        'CampaignDraftOperation',
+        'GetCampaignDraftRequest',
+        'ListCampaignDraftAsyncErrorsRequest',
+        'ListCampaignDraftAsyncErrorsResponse',
+        'MutateCampaignDraftResult',
+        'MutateCampaignDraftsRequest',
+        'MutateCampaignDraftsResponse',
+        'PromoteCampaignDraftRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_experiment_service_pb2': (
+        'CampaignExperimentOperation',
+        'CreateCampaignExperimentMetadata',
+        'CreateCampaignExperimentRequest',
+        'EndCampaignExperimentRequest',
+        'GetCampaignExperimentRequest',
+        'GraduateCampaignExperimentRequest',
+        'GraduateCampaignExperimentResponse',
+        'ListCampaignExperimentAsyncErrorsRequest',
+        'ListCampaignExperimentAsyncErrorsResponse',
+        'MutateCampaignExperimentResult',
+        'MutateCampaignExperimentsRequest',
+        'MutateCampaignExperimentsResponse',
+        'PromoteCampaignExperimentRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_extension_setting_service_pb2': (
+        'CampaignExtensionSettingOperation',
+        'GetCampaignExtensionSettingRequest',
+        'MutateCampaignExtensionSettingResult',
+        'MutateCampaignExtensionSettingsRequest',
+        'MutateCampaignExtensionSettingsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_feed_service_pb2': (
+        'CampaignFeedOperation',
+        'GetCampaignFeedRequest',
+        'MutateCampaignFeedResult',
+        'MutateCampaignFeedsRequest',
+        'MutateCampaignFeedsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_label_service_pb2': (
+        'CampaignLabelOperation',
+        'GetCampaignLabelRequest',
+        'MutateCampaignLabelResult',
+        'MutateCampaignLabelsRequest',
+        'MutateCampaignLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_service_pb2': (
+        'CampaignOperation',
+        'GetCampaignRequest',
+        'MutateCampaignResult',
+        'MutateCampaignsRequest',
+        'MutateCampaignsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.campaign_shared_set_service_pb2': (
+        'CampaignSharedSetOperation',
+        'GetCampaignSharedSetRequest',
+        'MutateCampaignSharedSetResult',
+        'MutateCampaignSharedSetsRequest',
+        'MutateCampaignSharedSetsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.carrier_constant_service_pb2': (
+        'GetCarrierConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.change_status_service_pb2': (
+        'GetChangeStatusRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.click_view_service_pb2': (
+        'GetClickViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.conversion_action_service_pb2': (
+        'ConversionActionOperation',
+        'GetConversionActionRequest',
+        'MutateConversionActionResult',
+        'MutateConversionActionsRequest',
+        'MutateConversionActionsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.conversion_adjustment_upload_service_pb2': (
+        'ConversionAdjustment',
+        'ConversionAdjustmentResult',
+        'GclidDateTimePair',
+        'RestatementValue',
+        'UploadConversionAdjustmentsRequest',
+        'UploadConversionAdjustmentsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.conversion_upload_service_pb2': (
+        'CallConversion',
+        'CallConversionResult',
+        'ClickConversion',
+        'ClickConversionResult',
+        'ExternalAttributionData',
+        'UploadCallConversionsRequest',
+        'UploadCallConversionsResponse',
+        'UploadClickConversionsRequest',
+        'UploadClickConversionsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.custom_interest_service_pb2': (
+        'CustomInterestOperation',
+        'GetCustomInterestRequest',
+        'MutateCustomInterestResult',
+        'MutateCustomInterestsRequest',
+        'MutateCustomInterestsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_client_link_service_pb2': (
+        'CustomerClientLinkOperation',
+        'GetCustomerClientLinkRequest',
+        'MutateCustomerClientLinkRequest',
+        'MutateCustomerClientLinkResponse',
+        'MutateCustomerClientLinkResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_client_service_pb2': (
+        'GetCustomerClientRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_extension_setting_service_pb2': (
+        'CustomerExtensionSettingOperation',
+        'GetCustomerExtensionSettingRequest',
+        'MutateCustomerExtensionSettingResult',
+        'MutateCustomerExtensionSettingsRequest',
+        'MutateCustomerExtensionSettingsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_feed_service_pb2': (
+        'CustomerFeedOperation',
+        'GetCustomerFeedRequest',
+        'MutateCustomerFeedResult',
+        'MutateCustomerFeedsRequest',
+        'MutateCustomerFeedsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_label_service_pb2': (
+        'CustomerLabelOperation',
+        'GetCustomerLabelRequest',
+        'MutateCustomerLabelResult',
+        'MutateCustomerLabelsRequest',
+        'MutateCustomerLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_manager_link_service_pb2': (
+        'CustomerManagerLinkOperation',
+        'GetCustomerManagerLinkRequest',
+        'MutateCustomerManagerLinkRequest',
+        'MutateCustomerManagerLinkResponse',
+        'MutateCustomerManagerLinkResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_negative_criterion_service_pb2': (
+        'CustomerNegativeCriterionOperation',
+        'GetCustomerNegativeCriterionRequest',
+        'MutateCustomerNegativeCriteriaRequest',
+        'MutateCustomerNegativeCriteriaResponse',
+        'MutateCustomerNegativeCriteriaResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.customer_service_pb2': (
+        'CreateCustomerClientRequest',
+        'CreateCustomerClientResponse',
+        'CustomerOperation',
+        'GetCustomerRequest',
+        'ListAccessibleCustomersRequest',
+        'ListAccessibleCustomersResponse',
+        'MutateCustomerRequest',
+        'MutateCustomerResponse',
+        'MutateCustomerResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.detail_placement_view_service_pb2': (
+        'GetDetailPlacementViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.display_keyword_view_service_pb2': (
+        'GetDisplayKeywordViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.domain_category_service_pb2': (
+        'GetDomainCategoryRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.dynamic_search_ads_search_term_view_service_pb2': (
+        'GetDynamicSearchAdsSearchTermViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.expanded_landing_page_view_service_pb2': (
+        'GetExpandedLandingPageViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.extension_feed_item_service_pb2': (
+        'ExtensionFeedItemOperation',
+        'GetExtensionFeedItemRequest',
+        'MutateExtensionFeedItemResult',
+        'MutateExtensionFeedItemsRequest',
+        'MutateExtensionFeedItemsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.feed_item_service_pb2': (
+        'FeedItemOperation',
+        'GetFeedItemRequest',
+        'MutateFeedItemResult',
+        'MutateFeedItemsRequest',
+        'MutateFeedItemsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.feed_item_target_service_pb2': (
+        'FeedItemTargetOperation',
+        'GetFeedItemTargetRequest',
+        'MutateFeedItemTargetResult',
+        'MutateFeedItemTargetsRequest',
+        'MutateFeedItemTargetsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.feed_mapping_service_pb2': (
+        'FeedMappingOperation',
+        'GetFeedMappingRequest',
+        'MutateFeedMappingResult',
+        'MutateFeedMappingsRequest',
+        'MutateFeedMappingsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.feed_placeholder_view_service_pb2': (
+        'GetFeedPlaceholderViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.feed_service_pb2': (
+        'FeedOperation',
+        'GetFeedRequest',
+        'MutateFeedResult',
+        'MutateFeedsRequest',
+        'MutateFeedsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.gender_view_service_pb2': (
+        'GetGenderViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.geo_target_constant_service_pb2': (
+        'GeoTargetConstantSuggestion',
+        'GetGeoTargetConstantRequest',
+        'SuggestGeoTargetConstantsRequest',
+        'SuggestGeoTargetConstantsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.geographic_view_service_pb2': (
+        'GetGeographicViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.google_ads_field_service_pb2': (
+        'GetGoogleAdsFieldRequest',
+        'SearchGoogleAdsFieldsRequest',
+        'SearchGoogleAdsFieldsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.google_ads_service_pb2': (
+        'GoogleAdsRow',
+        'MutateGoogleAdsRequest',
+        'MutateGoogleAdsResponse',
+        'MutateOperation',
+        'MutateOperationResponse',
+        'SearchGoogleAdsRequest',
+        'SearchGoogleAdsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.group_placement_view_service_pb2': (
+        'GetGroupPlacementViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.hotel_group_view_service_pb2': (
+        'GetHotelGroupViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.hotel_performance_view_service_pb2': (
+        'GetHotelPerformanceViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_ad_group_service_pb2': (
+        'GetKeywordPlanAdGroupRequest',
+        'KeywordPlanAdGroupOperation',
+        'MutateKeywordPlanAdGroupResult',
+        'MutateKeywordPlanAdGroupsRequest',
+        'MutateKeywordPlanAdGroupsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_campaign_service_pb2': (
+        'GetKeywordPlanCampaignRequest',
+        'KeywordPlanCampaignOperation',
+        'MutateKeywordPlanCampaignResult',
+        'MutateKeywordPlanCampaignsRequest',
+        'MutateKeywordPlanCampaignsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_idea_service_pb2': (
+        'GenerateKeywordIdeaResponse',
+        'GenerateKeywordIdeaResult',
+        'GenerateKeywordIdeasRequest',
+        'KeywordAndUrlSeed',
+        'KeywordSeed',
+        'UrlSeed',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_keyword_service_pb2': (
+        'GetKeywordPlanKeywordRequest',
+        'KeywordPlanKeywordOperation',
+        'MutateKeywordPlanKeywordResult',
+        'MutateKeywordPlanKeywordsRequest',
+        'MutateKeywordPlanKeywordsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_negative_keyword_service_pb2': (
+        'GetKeywordPlanNegativeKeywordRequest',
+        'KeywordPlanNegativeKeywordOperation',
+        'MutateKeywordPlanNegativeKeywordResult',
+        'MutateKeywordPlanNegativeKeywordsRequest',
+        'MutateKeywordPlanNegativeKeywordsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_plan_service_pb2': (
+        'ForecastMetrics',
+        'GenerateForecastMetricsRequest',
+        'GenerateForecastMetricsResponse',
+        'GenerateHistoricalMetricsRequest',
+        'GenerateHistoricalMetricsResponse',
+        'GetKeywordPlanRequest',
+        'KeywordPlanAdGroupForecast',
+        'KeywordPlanCampaignForecast',
+        'KeywordPlanKeywordForecast',
+        'KeywordPlanKeywordHistoricalMetrics',
+        'KeywordPlanOperation',
+        'MutateKeywordPlansRequest',
+        'MutateKeywordPlansResponse',
+        'MutateKeywordPlansResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.keyword_view_service_pb2': (
+        'GetKeywordViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.label_service_pb2': (
+        'GetLabelRequest',
+        'LabelOperation',
+        'MutateLabelResult',
+        'MutateLabelsRequest',
+        'MutateLabelsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.landing_page_view_service_pb2': (
+        'GetLandingPageViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.language_constant_service_pb2': (
+        'GetLanguageConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.location_view_service_pb2': (
+        'GetLocationViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.managed_placement_view_service_pb2': (
+        'GetManagedPlacementViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.media_file_service_pb2': (
+        'GetMediaFileRequest',
+        'MediaFileOperation',
+        'MutateMediaFileResult',
+        'MutateMediaFilesRequest',
+        'MutateMediaFilesResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.merchant_center_link_service_pb2': (
+        'GetMerchantCenterLinkRequest',
+        'ListMerchantCenterLinksRequest',
+        'ListMerchantCenterLinksResponse',
+        'MerchantCenterLinkOperation',
+        'MutateMerchantCenterLinkRequest',
+        'MutateMerchantCenterLinkResponse',
+        'MutateMerchantCenterLinkResult',
+    ),
+    'google.ads.google_ads.v1.proto.services.mobile_app_category_constant_service_pb2': (
+        'GetMobileAppCategoryConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.mobile_device_constant_service_pb2': (
+        'GetMobileDeviceConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.mutate_job_service_pb2': (
+        'AddMutateJobOperationsRequest',
+        'AddMutateJobOperationsResponse',
+        'CreateMutateJobRequest',
+        'CreateMutateJobResponse',
+        'GetMutateJobRequest',
+        'ListMutateJobResultsRequest',
+        'ListMutateJobResultsResponse',
+        'MutateJobResult',
+        'RunMutateJobRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.operating_system_version_constant_service_pb2': (
+        'GetOperatingSystemVersionConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.paid_organic_search_term_view_service_pb2': (
+        'GetPaidOrganicSearchTermViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.parental_status_view_service_pb2': (
+        'GetParentalStatusViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.payments_account_service_pb2': (
+        'ListPaymentsAccountsRequest',
+        'ListPaymentsAccountsResponse',
+    ),
+    'google.ads.google_ads.v1.proto.services.product_bidding_category_constant_service_pb2': (
+        'GetProductBiddingCategoryConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.product_group_view_service_pb2': (
+        'GetProductGroupViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.recommendation_service_pb2': (
+        'ApplyRecommendationOperation',
+        'ApplyRecommendationRequest',
+        'ApplyRecommendationResponse',
+        'ApplyRecommendationResult',
+        'DismissRecommendationRequest',
+        'DismissRecommendationResponse',
+        'GetRecommendationRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.remarketing_action_service_pb2': (
+        'GetRemarketingActionRequest',
+        'MutateRemarketingActionResult',
+        'MutateRemarketingActionsRequest',
+        'MutateRemarketingActionsResponse',
+        'RemarketingActionOperation',
+    ),
+    'google.ads.google_ads.v1.proto.services.search_term_view_service_pb2': (
+        'GetSearchTermViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.shared_criterion_service_pb2': (
+        'GetSharedCriterionRequest',
+        'MutateSharedCriteriaRequest',
+        'MutateSharedCriteriaResponse',
+        'MutateSharedCriterionResult',
+        'SharedCriterionOperation',
+    ),
+    'google.ads.google_ads.v1.proto.services.shared_set_service_pb2': (
+        'GetSharedSetRequest',
+        'MutateSharedSetResult',
+        'MutateSharedSetsRequest',
+        'MutateSharedSetsResponse',
+        'SharedSetOperation',
+    ),
+    'google.ads.google_ads.v1.proto.services.shopping_performance_view_service_pb2': (
+        'GetShoppingPerformanceViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.topic_constant_service_pb2': (
+        'GetTopicConstantRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.topic_view_service_pb2': (
+        'GetTopicViewRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.user_interest_service_pb2': (
+        'GetUserInterestRequest',
+    ),
+    'google.ads.google_ads.v1.proto.services.user_list_service_pb2': (
+        'GetUserListRequest',
+        'MutateUserListResult',
+        'MutateUserListsRequest',
+        'MutateUserListsResponse',
+        'UserListOperation',
+    ),
+    'google.ads.google_ads.v1.proto.services.video_service_pb2': (
+        'GetVideoRequest',
+    ),
+}
 
+_type_modules = {}
 names = []
 
-for module in _shared_modules:
-    for name, message in get_messages(module).items():
-        setattr(sys.modules[__name__], name, message)
+for module_name, module_names in _shared_modules.items():
+    for name in module_names:
+        _type_modules[name] = module_name
         names.append(name)
-for module in _local_modules:
-    for name, message in get_messages(module).items():
-        message.__module__ = 'google.ads.googleads_v1.types'
-        setattr(sys.modules[__name__], name, message)
+for module_name, module_names in _local_modules.items():
+    for name in module_names:
+        _type_modules[name] = module_name
         names.append(name)
 
+
+def __getattr__(name):
+    """Imports the module defining a type on first access.
+
+    Args:
+        name: a str name of a type, e.g. "CampaignOperation".
+
+    Returns:
+        The message class of the type.
+
+    Raises:
+        AttributeError: If no type exists with the given name.
+    """
+    try:
+        module_name = _type_modules[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    message = getattr(import_module(module_name), name)
+
+    if module_name in _local_modules:
+        message.__module__ = 'google.ads.googleads_v1.types'
+
+    setattr(sys.modules[__name__], name, message)
+    return message
+
+
+def __dir__():
+    return sorted(set(globals()) | set(names))
+
+
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    # Module __getattr__ is only supported as of Python 3.7.
+    for name in names:
+        __getattr__(name)
+
+
 __all__ = tuple(sorted(names))
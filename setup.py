@@ -25,6 +25,10 @@ install_requires = [
     'PyYAML >= 5.1, < 6.0',
 ]
 
+extras_require = {
+    'numpy': ['numpy'],
+}
+
 tests_require = [
     'mock >= 3.0.0, < 4.0.0',
     'pyfakefs >= 3.5, < 3.6',
@@ -55,6 +59,7 @@ setup(
     include_package_data=True,
     long_description=long_description,
     install_requires=install_requires,
+    extras_require=extras_require,
     tests_require=tests_require,
     test_suite='tests',
     license='Apache 2.0',
@@ -0,0 +1,341 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API asyncio client."""
+
+import asyncio
+import mock
+from importlib import import_module
+from unittest import TestCase
+
+import grpc
+from grpc import aio
+from google.api_core import page_iterator
+
+from google.ads.google_ads import async_client
+from google.ads.google_ads import client as Client
+from google.ads.google_ads.channel_pool import ChannelPool
+from google.ads.google_ads.errors import GoogleAdsException
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+class _MockCall(object):
+    """An awaitable stand-in for a grpc.aio.UnaryUnaryCall."""
+
+    def __init__(self, response=None, exception=None, trailing_metadata=()):
+        self._response = response
+        self._exception = exception
+        self._trailing_metadata = trailing_metadata
+
+    def __await__(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._response
+        yield
+
+    async def trailing_metadata(self):
+        return self._trailing_metadata
+
+
+class _MockAioRpcError(grpc.RpcError):
+    def __init__(self, code, trailing_metadata=()):
+        self._code = code
+        self._trailing_metadata = trailing_metadata
+
+    def code(self):
+        return self._code
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+    def details(self):
+        return 'details'
+
+
+def _get_continuation(call):
+    async def continuation(client_call_details, request):
+        return call
+    return continuation
+
+
+def _get_client_call_details(metadata=None):
+    return aio.ClientCallDetails(
+        b'/test/method', None, metadata, None, None)
+
+
+class GoogleAdsAsyncClientTest(TestCase):
+
+    def test_init_with_channel_pool(self):
+        self.assertRaises(ValueError, async_client.GoogleAdsAsyncClient,
+                          mock.Mock(), 'abc123', channel_pool=ChannelPool())
+
+    def test_init_with_unsupported_options(self):
+        for kwargs in ({'rate_limits': {'customer': {'rate': 5}}},
+                       {'concurrency_limiter': mock.Mock()},
+                       {'retry': {}},
+                       {'metrics_registry': mock.Mock()}):
+            self.assertRaises(ValueError, async_client.GoogleAdsAsyncClient,
+                              mock.Mock(), 'abc123', **kwargs)
+
+    def test_load_from_string_with_unsupported_options(self):
+        yaml_str = ('developer_token: abc123\n'
+                    'client_id: client_id_123456789\n'
+                    'client_secret: client_secret_987654321\n'
+                    'refresh_token: refresh\n'
+                    'retry: {}\n')
+
+        with mock.patch.object(Client, 'oauth2'):
+            self.assertRaises(
+                ValueError, async_client.GoogleAdsAsyncClient.load_from_string,
+                yaml_str)
+
+    def test_get_service(self):
+        client = async_client.GoogleAdsAsyncClient(mock.Mock(), 'abc123')
+
+        with mock.patch.object(async_client, '_get_channel_credentials'), \
+            mock.patch.object(async_client.aio,
+                              'secure_channel') as mock_secure_channel:
+            service = client.get_service('GoogleAdsService')
+
+        self.assertIsInstance(service, async_client.AsyncServiceClient)
+        self.assertEqual(mock_secure_channel.call_args[0][0],
+                         'googleads.googleapis.com:443')
+        interceptors = mock_secure_channel.call_args[1]['interceptors']
+        self.assertEqual(
+            [type(interceptor) for interceptor in interceptors],
+            [async_client.AsyncMetadataInterceptor,
+             async_client.AsyncLoggingInterceptor,
+             async_client.AsyncExceptionInterceptor])
+
+    def test_get_service_custom_endpoint(self):
+        client = async_client.GoogleAdsAsyncClient(
+            mock.Mock(), 'abc123', endpoint='alt.endpoint.com')
+
+        with mock.patch.object(async_client, '_get_channel_credentials'), \
+            mock.patch.object(async_client.aio,
+                              'secure_channel') as mock_secure_channel:
+            client.get_service('GoogleAdsService')
+
+        self.assertEqual(mock_secure_channel.call_args[0][0],
+                         'alt.endpoint.com')
+
+
+class AsyncServiceClientTest(TestCase):
+
+    def test_paged_method(self):
+        mock_service = mock.Mock()
+        mock_service.search.return_value = page_iterator.GRPCIterator(
+            client=None, method=mock.Mock(), request=mock.Mock(),
+            items_field='results')
+        service = async_client.AsyncServiceClient(mock_service)
+
+        self.assertIsInstance(service.search('123', 'query'),
+                              async_client.AsyncPageIterator)
+
+    def test_unary_method(self):
+        mock_service = mock.Mock()
+        service = async_client.AsyncServiceClient(mock_service)
+
+        self.assertIs(service.mutate('123', []),
+                      mock_service.mutate.return_value)
+        mock_service.mutate.assert_called_once_with('123', [])
+
+    def test_attribute(self):
+        mock_service = mock.Mock()
+        mock_service.SERVICE_ADDRESS = 'test.endpoint.com'
+        service = async_client.AsyncServiceClient(mock_service)
+        self.assertEqual(service.SERVICE_ADDRESS, 'test.endpoint.com')
+
+    def test_close(self):
+        channel = mock.Mock(close=mock.AsyncMock())
+        service = async_client.AsyncServiceClient(mock.Mock(), channel=channel)
+
+        asyncio.run(service.close())
+
+        channel.close.assert_awaited_once_with()
+
+
+class ScheduleCloseTest(TestCase):
+
+    def test_running_loop(self):
+        channel = mock.Mock(close=mock.AsyncMock())
+
+        async def release():
+            async_client._schedule_close(channel)
+            # Lets the scheduled task run.
+            await asyncio.sleep(0)
+
+        asyncio.run(release())
+
+        channel.close.assert_awaited_once_with()
+
+    def test_no_running_loop(self):
+        channel = mock.Mock(close=mock.AsyncMock())
+
+        with mock.patch.object(async_client.asyncio,
+                               'new_event_loop') as mock_new_event_loop:
+            async_client._schedule_close(channel)
+
+        channel.close.assert_not_called()
+        mock_new_event_loop.assert_not_called()
+
+
+class AsyncPageIteratorTest(TestCase):
+
+    def _create_test_iterator(self, pages):
+        responses = []
+        for index, rows in enumerate(pages):
+            response = google_ads_service_pb2.SearchGoogleAdsResponse()
+            for value in rows:
+                response.results.add().campaign.id.value = value
+            if index < len(pages) - 1:
+                response.next_page_token = str(index + 1)
+            responses.append(response)
+
+        self.requested_tokens = []
+
+        async def method(request):
+            self.requested_tokens.append(request.page_token)
+            return responses[int(request.page_token or 0)]
+
+        return async_client.AsyncPageIterator(page_iterator.GRPCIterator(
+            client=None, method=method,
+            request=google_ads_service_pb2.SearchGoogleAdsRequest(),
+            items_field='results'))
+
+    def test_iterate_results(self):
+        iterator = self._create_test_iterator([[1, 2], [3], [4, 5]])
+
+        async def collect():
+            return [row.campaign.id.value async for row in iterator]
+
+        self.assertEqual(asyncio.run(collect()), [1, 2, 3, 4, 5])
+        self.assertEqual(self.requested_tokens, ['', '1', '2'])
+
+    def test_iterate_pages(self):
+        iterator = self._create_test_iterator([[1, 2], [3]])
+
+        async def collect():
+            return [len(page.results) async for page in iterator.pages]
+
+        self.assertEqual(asyncio.run(collect()), [2, 1])
+
+
+class AsyncExceptionInterceptorTest(TestCase):
+
+    _MOCK_FAILURE_VALUE = b"\n \n\x02\x08\x10\x12\x1aInvalid customer ID '123'."
+
+    def test_intercept_unary_unary_successful(self):
+        interceptor = async_client.AsyncExceptionInterceptor(latest_version)
+        call = _MockCall(response='response')
+
+        result = asyncio.run(interceptor.intercept_unary_unary(
+            _get_continuation(call), _get_client_call_details(), 'request'))
+
+        self.assertIs(result, call)
+
+    def test_intercept_unary_unary_google_ads_failure(self):
+        interceptor = async_client.AsyncExceptionInterceptor(latest_version)
+        error = _MockAioRpcError(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            ((interceptor._failure_key, self._MOCK_FAILURE_VALUE),
+             ('request-id', '123456')))
+
+        with self.assertRaises(GoogleAdsException) as context:
+            asyncio.run(interceptor.intercept_unary_unary(
+                _get_continuation(_MockCall(exception=error)),
+                _get_client_call_details(), 'request'))
+
+        self.assertIs(context.exception.error, error)
+        self.assertEqual(context.exception.request_id, '123456')
+
+    def test_intercept_unary_unary_retryable(self):
+        interceptor = async_client.AsyncExceptionInterceptor(latest_version)
+        error = _MockAioRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+        with self.assertRaises(_MockAioRpcError):
+            asyncio.run(interceptor.intercept_unary_unary(
+                _get_continuation(_MockCall(exception=error)),
+                _get_client_call_details(), 'request'))
+
+
+class AsyncLoggingInterceptorTest(TestCase):
+
+    def test_intercept_unary_unary_successful(self):
+        interceptor = async_client.AsyncLoggingInterceptor(
+            endpoint='test.endpoint.com')
+        call = _MockCall(response='response',
+                         trailing_metadata=(('request-id', '654321'),))
+        request = mock.Mock()
+        request.customer_id = '123'
+
+        with mock.patch.object(Client, '_logger') as mock_logger:
+            result = asyncio.run(interceptor.intercept_unary_unary(
+                _get_continuation(call), _get_client_call_details(), request))
+
+        self.assertIs(result, call)
+        mock_logger.info.assert_called_once()
+        self.assertEqual(
+            str(mock_logger.info.call_args[0][0]),
+            interceptor._SUMMARY_LOG_LINE.format(
+                '123', 'test.endpoint.com', '/test/method', '654321', False,
+                None))
+
+    def test_intercept_unary_unary_failed(self):
+        interceptor = async_client.AsyncLoggingInterceptor(
+            endpoint='test.endpoint.com')
+        error = _MockAioRpcError(grpc.StatusCode.UNAVAILABLE,
+                                 (('request-id', '654321'),))
+        request = mock.Mock()
+        request.customer_id = '123'
+
+        with mock.patch.object(Client, '_logger') as mock_logger, \
+            self.assertRaises(_MockAioRpcError):
+            asyncio.run(interceptor.intercept_unary_unary(
+                _get_continuation(_MockCall(exception=error)),
+                _get_client_call_details(), request))
+
+        mock_logger.warning.assert_called_once()
+        self.assertEqual(
+            str(mock_logger.warning.call_args[0][0]),
+            interceptor._SUMMARY_LOG_LINE.format(
+                '123', 'test.endpoint.com', '/test/method', '654321', True,
+                'details'))
+
+
+class AsyncMetadataInterceptorTest(TestCase):
+
+    def test_intercept_unary_unary(self):
+        interceptor = async_client.AsyncMetadataInterceptor(
+            '1234567890', '0987654321')
+        captured = {}
+
+        async def continuation(client_call_details, request):
+            captured['details'] = client_call_details
+            return _MockCall()
+
+        asyncio.run(interceptor.intercept_unary_unary(
+            continuation, _get_client_call_details([('apples', 'oranges')]),
+            'request'))
+
+        details = captured['details']
+        self.assertIsInstance(details, aio.ClientCallDetails)
+        self.assertEqual(details.metadata,
+                         [('apples', 'oranges'),
+                          ('developer-token', '1234567890'),
+                          ('login-customer-id', '0987654321')])
@@ -0,0 +1,169 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library atomic mutate builder."""
+
+from importlib import import_module
+from unittest import TestCase
+
+import mock
+
+from google.ads.google_ads import mutate_plan
+from google.ads.google_ads.atomic_mutate import AtomicMutateBuilder
+from google.ads.google_ads.atomic_mutate import TempResourceNameAllocator
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.v2.proto.services.google_ads_service_pb2')
+
+
+class FakeGoogleAdsService(object):
+    """Returns real resource names for temp ones, made of their -IDs."""
+
+    def __init__(self):
+        self.requests = []
+
+    def mutate(self, customer_id, mutate_operations, **kwargs):
+        self.requests.append([
+            google_ads_service_pb2.MutateOperation.FromString(
+                operation.SerializeToString())
+            for operation in mutate_operations])
+        response = google_ads_service_pb2.MutateGoogleAdsResponse()
+
+        for operation in mutate_operations:
+            operation_type = mutate_plan.get_operation_type(operation)
+            result = getattr(response.mutate_operation_responses.add(),
+                             operation_type.replace('_operation', '_result'))
+            name = mutate_plan.get_target_resource_name(operation)
+            result.resource_name = (name or '').replace('/-', '/')
+
+        return response
+
+
+class TempResourceNameAllocatorTest(TestCase):
+
+    def test_allocate(self):
+        allocator = TempResourceNameAllocator()
+
+        self.assertEqual(allocator.allocate('123', 'campaigns'),
+                         'customers/123/campaigns/-1')
+        self.assertEqual(allocator.allocate('123', 'adGroups'),
+                         'customers/123/adGroups/-2')
+
+    def test_init_invalid_start(self):
+        self.assertRaises(ValueError, TempResourceNameAllocator, 0)
+
+
+class AtomicMutateBuilderTest(TestCase):
+
+    def setUp(self):
+        self.service = FakeGoogleAdsService()
+
+    def _create_tree(self, builder):
+        budget = builder.create('campaign_budget')
+        campaign = builder.create('campaign_operation')
+        campaign.campaign_budget.value = budget.resource_name
+        ad_group = builder.create('ad_group')
+        ad_group.campaign.value = campaign.resource_name
+        return budget, campaign, ad_group
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, AtomicMutateBuilder, '123',
+                          max_operations=0)
+        self.assertRaises(ValueError, AtomicMutateBuilder, '123',
+                          max_bytes=0)
+
+    def test_create(self):
+        builder = AtomicMutateBuilder('123')
+
+        budget = builder.create('campaign_budget')
+        ad_group_ad = builder.create('ad_group_ad')
+
+        self.assertEqual(budget.resource_name,
+                         'customers/123/campaignBudgets/-1')
+        self.assertEqual(ad_group_ad.resource_name, '')
+        self.assertEqual(
+            builder.operations[1].WhichOneof('operation'),
+            'ad_group_ad_operation')
+
+    def test_create_invalid_type(self):
+        builder = AtomicMutateBuilder('123')
+
+        self.assertRaises(ValueError, builder.create, 'ad_group_wizard')
+        self.assertRaises(ValueError, builder.create, 'customer')
+
+    def test_get_requests_packs_trees(self):
+        builder = AtomicMutateBuilder('123', max_operations=6)
+
+        for _ in range(3):
+            self._create_tree(builder)
+
+        requests = builder.get_requests()
+
+        self.assertEqual([len(operations) for operations in requests], [6, 3])
+        # Each tree is sent in a single request.
+        self.assertEqual(requests[1], builder.operations[6:9])
+
+    def test_get_requests_splits_large_trees_in_order(self):
+        builder = AtomicMutateBuilder('123', max_operations=2)
+        self._create_tree(builder)
+
+        with mock.patch('google.ads.google_ads.atomic_mutate._logger') as \
+                mock_logger:
+            requests = builder.get_requests()
+
+        self.assertEqual(requests, [builder.operations[:2],
+                                    builder.operations[2:]])
+        mock_logger.warning.assert_called_once()
+
+    def test_mutate_resolves_resource_names(self):
+        builder = AtomicMutateBuilder('123')
+        budget, campaign, ad_group = self._create_tree(builder)
+
+        responses = builder.mutate(self.service, partial_failure=False)
+
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(budget.resource_name,
+                         'customers/123/campaignBudgets/1')
+        self.assertEqual(campaign.resource_name, 'customers/123/campaigns/2')
+        self.assertEqual(campaign.campaign_budget.value,
+                         'customers/123/campaignBudgets/1')
+        self.assertEqual(ad_group.campaign.value, 'customers/123/campaigns/2')
+        self.assertEqual(builder.resource_names[
+            'customers/123/adGroups/-3'], 'customers/123/adGroups/3')
+
+    def test_mutate_resolves_names_between_requests(self):
+        builder = AtomicMutateBuilder('123', max_operations=2)
+        self._create_tree(builder)
+
+        builder.mutate(self.service)
+
+        # Temp names aren't remembered across requests, so the ad group is
+        # sent with the real name of the campaign.
+        self.assertEqual(len(self.service.requests), 2)
+        self.assertEqual(
+            self.service.requests[1][0].ad_group_operation.create.campaign
+            .value, 'customers/123/campaigns/2')
+
+    def test_add(self):
+        builder = AtomicMutateBuilder('123')
+        budget = builder.create('campaign_budget')
+        update = google_ads_service_pb2.MutateOperation()
+        update.campaign_operation.update.campaign_budget.value = (
+            budget.resource_name)
+
+        self.assertIs(builder.add(update), update)
+        builder.mutate(self.service)
+
+        self.assertEqual(
+            update.campaign_operation.update.campaign_budget.value,
+            'customers/123/campaignBudgets/1')
@@ -0,0 +1,252 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library batching mutator."""
+
+import threading
+from importlib import import_module
+from unittest import TestCase
+
+import mock
+
+from google.ads.google_ads import batching
+from google.ads.google_ads import partial_failure
+from google.ads.google_ads import util
+from google.ads.google_ads.batching import BatchingMutator
+from google.ads.google_ads.errors import MutateOperationError
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+campaign_service_pb2 = import_module(
+    '%s.services.campaign_service_pb2' % _PROTO_PATH)
+errors_pb2 = import_module('%s.errors.errors_pb2' % _PROTO_PATH)
+
+
+def _create_operation(index):
+    operation = campaign_service_pb2.CampaignOperation()
+    operation.create.name.value = 'Campaign %d' % index
+    return operation
+
+
+def _create_response(operations, failed_indexes=()):
+    """Creates a response with a result per operation.
+
+    Operations at failed_indexes get an empty result and a partial failure
+    error.
+    """
+    response = campaign_service_pb2.MutateCampaignsResponse()
+    failure = errors_pb2.GoogleAdsFailure()
+
+    for index, operation in enumerate(operations):
+        result = response.results.add()
+
+        if index in failed_indexes:
+            error = failure.errors.add(message='Invalid %d.' % index)
+            error.location.field_path_elements.add(
+                field_name='operations').index.value = index
+        else:
+            result.resource_name = 'customers/123/campaigns/%s' % (
+                operation.create.name.value.split()[-1])
+
+    if failed_indexes:
+        response.partial_failure_error.code = 3
+        response.partial_failure_error.details.add().Pack(failure)
+
+    return response
+
+
+class FakeMutate(object):
+    """Records requests and returns a result for each operation."""
+
+    def __init__(self, failed_indexes=(), exception=None):
+        self.requests = []
+        self.failed_indexes = failed_indexes
+        self.exception = exception
+        self._lock = threading.Lock()
+
+    def __call__(self, customer_id, operations, partial_failure=None):
+        with self._lock:
+            self.requests.append((customer_id, list(operations),
+                                  partial_failure))
+
+        if self.exception:
+            raise self.exception
+
+        return _create_response(operations, self.failed_indexes)
+
+
+class BatchingMutatorTest(TestCase):
+
+    def setUp(self):
+        self.mutate = FakeMutate()
+
+    def _create_mutator(self, **kwargs):
+        kwargs.setdefault('max_delay', None)
+        mutator = BatchingMutator(self.mutate, **kwargs)
+        self.addCleanup(mutator.close)
+        return mutator
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, BatchingMutator, self.mutate,
+                          max_operations=0)
+        self.assertRaises(ValueError, BatchingMutator, self.mutate,
+                          max_operations=batching.MAX_OPERATIONS + 1)
+        self.assertRaises(ValueError, BatchingMutator, self.mutate,
+                          max_bytes=0)
+        self.assertRaises(ValueError, BatchingMutator, self.mutate,
+                          max_delay=0)
+
+    def test_flush_on_count(self):
+        mutator = self._create_mutator(max_operations=2)
+
+        results = [mutator.add('123', _create_operation(index))
+                   for index in range(3)]
+
+        self.assertEqual(len(self.mutate.requests), 1)
+        self.assertEqual(results[1].result(0).resource_name,
+                         'customers/123/campaigns/1')
+        self.assertFalse(results[2].done())
+
+        mutator.flush()
+
+        self.assertEqual(results[2].result(0).resource_name,
+                         'customers/123/campaigns/2')
+        self.assertEqual(mutator.get_stats()['flushes'],
+                         {'count': 1, 'bytes': 0, 'time': 0, 'flush': 1})
+
+    def test_flush_on_bytes(self):
+        operation_size = util.get_encoded_size(_create_operation(0))
+        mutator = self._create_mutator(max_bytes=operation_size * 2)
+
+        for index in range(3):
+            mutator.add('123', _create_operation(index))
+
+        self.assertEqual([len(operations) for _, operations, _
+                          in self.mutate.requests], [2])
+        self.assertEqual(mutator.get_stats()['flushes']['bytes'], 1)
+
+    def test_flush_on_time(self):
+        mutator = self._create_mutator(max_delay=0.01)
+
+        result = mutator.add('123', _create_operation(0))
+
+        self.assertEqual(result.result(5).resource_name,
+                         'customers/123/campaigns/0')
+        self.assertEqual(mutator.get_stats()['flushes']['time'], 1)
+
+    def test_batches_per_customer_id(self):
+        mutator = self._create_mutator()
+
+        mutator.add('123', _create_operation(0))
+        mutator.add('456', _create_operation(1))
+        mutator.add('123', _create_operation(2))
+        mutator.flush()
+
+        self.assertEqual(
+            sorted((customer_id, len(operations), is_partial_failure)
+                   for customer_id, operations, is_partial_failure
+                   in self.mutate.requests),
+            [('123', 2, True), ('456', 1, True)])
+
+    def test_partial_failure(self):
+        self.mutate.failed_indexes = (1,)
+        mutator = self._create_mutator()
+        results = [mutator.add('123', _create_operation(index))
+                   for index in range(3)]
+
+        mutator.flush()
+
+        self.assertEqual(results[0].result(0).resource_name,
+                         'customers/123/campaigns/0')
+        self.assertEqual(results[2].result(0).resource_name,
+                         'customers/123/campaigns/2')
+        exception = results[1].exception(0)
+        self.assertIsInstance(exception, MutateOperationError)
+        self.assertEqual(exception.index, 1)
+        self.assertEqual([error.message for error in exception.errors],
+                         ['Invalid 1.'])
+        self.assertEqual(mutator.get_stats()['failed_operations'], 1)
+
+    def test_request_failure(self):
+        error = Exception('Unavailable.')
+        self.mutate.exception = error
+        mutator = self._create_mutator()
+        results = [mutator.add('123', _create_operation(index))
+                   for index in range(2)]
+
+        mutator.flush()
+
+        self.assertEqual([result.exception(0) for result in results],
+                         [error, error])
+        self.assertEqual(mutator.get_stats()['failed_requests'], 1)
+
+    def test_cancelled_operations_are_not_sent(self):
+        mutator = self._create_mutator()
+        cancelled = mutator.add('123', _create_operation(0))
+        result = mutator.add('123', _create_operation(1))
+
+        self.assertTrue(cancelled.cancel())
+        mutator.flush()
+
+        self.assertEqual(len(self.mutate.requests[0][1]), 1)
+        # Results are matched to the operations that were sent.
+        self.assertEqual(result.result(0).resource_name,
+                         'customers/123/campaigns/1')
+
+    def test_add_after_close(self):
+        mutator = self._create_mutator()
+        result = mutator.add('123', _create_operation(0))
+
+        mutator.close()
+
+        self.assertTrue(result.done())
+        self.assertRaises(ValueError, mutator.add, '123',
+                          _create_operation(1))
+
+    def test_many_producers(self):
+        mutator = self._create_mutator(max_operations=100)
+        results = []
+
+        def produce(thread_index):
+            for index in range(100):
+                results.append(mutator.add(
+                    '123', _create_operation(thread_index * 100 + index)))
+
+        threads = [threading.Thread(target=produce, args=(thread_index,))
+                   for thread_index in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        mutator.close()
+
+        self.assertEqual(len(self.mutate.requests), 10)
+        self.assertEqual(sorted(result.result(0).resource_name
+                                for result in results),
+                         sorted('customers/123/campaigns/%d' % index
+                                for index in range(1000)))
+        self.assertEqual(mutator.get_stats()['operations'], 1000)
+
+    def test_version(self):
+        self.mutate.failed_indexes = (0,)
+        mutator = self._create_mutator(version='v2')
+
+        with mock.patch.object(
+                partial_failure, 'get_operation_errors',
+                wraps=partial_failure.get_operation_errors) as mock_get:
+            mutator.add('123', _create_operation(0))
+            mutator.flush()
+
+        self.assertEqual(mock_get.call_args[1], {'version': 'v2'})
@@ -0,0 +1,241 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library bisecting mutator."""
+
+from importlib import import_module
+from unittest import TestCase
+
+import grpc
+import mock
+
+from google.ads.google_ads import bisecting
+from google.ads.google_ads import util
+from google.ads.google_ads.bisecting import BisectingMutator
+from google.ads.google_ads.errors import GoogleAdsException
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+campaign_service_pb2 = import_module(
+    '%s.services.campaign_service_pb2' % _PROTO_PATH)
+google_ads_service_pb2 = import_module(
+    '%s.services.google_ads_service_pb2' % _PROTO_PATH)
+errors_pb2 = import_module('%s.errors.errors_pb2' % _PROTO_PATH)
+size_limit_error_pb2 = import_module(
+    '%s.errors.size_limit_error_pb2' % _PROTO_PATH)
+
+
+def _create_operation(index):
+    operation = campaign_service_pb2.CampaignOperation()
+    operation.create.name.value = 'Campaign %d' % index
+    return operation
+
+
+def _get_index(operation):
+    return int(operation.create.name.value.split()[-1])
+
+
+def _create_failure(*indexes):
+    failure = errors_pb2.GoogleAdsFailure()
+
+    for index in indexes:
+        error = failure.errors.add(message='Invalid %d.' % index)
+        error.location.field_path_elements.add(
+            field_name='operations').index.value = index
+
+    return failure
+
+
+def _get_indexes(failure):
+    return [error.location.field_path_elements[0].index.value
+            for error in failure.errors]
+
+
+class FakeMutate(object):
+    """Rejects requests of more than max_operations operations as too large.
+
+    Operations whose index is in failed_indexes fail with a partial failure
+    error.
+    """
+
+    def __init__(self, max_operations=None, failed_indexes=()):
+        self.max_operations = max_operations
+        self.failed_indexes = failed_indexes
+        self.requests = []
+
+    def __call__(self, customer_id, operations, partial_failure=None):
+        indexes = [_get_index(operation) for operation in operations]
+        self.requests.append(indexes)
+
+        if (self.max_operations is not None and
+                len(operations) > self.max_operations):
+            failure = errors_pb2.GoogleAdsFailure()
+            failure.errors.add().error_code.size_limit_error = (
+                size_limit_error_pb2.SizeLimitErrorEnum
+                .REQUEST_SIZE_LIMIT_EXCEEDED)
+            raise GoogleAdsException(None, None, failure, 'request-id')
+
+        response = campaign_service_pb2.MutateCampaignsResponse()
+        failed = [position for position, index in enumerate(indexes)
+                  if index in self.failed_indexes]
+
+        for index in indexes:
+            response.results.add().resource_name = (
+                'customers/123/campaigns/%d' % index)
+
+        if failed:
+            response.partial_failure_error.code = 3
+            response.partial_failure_error.message = 'Invalid operations.'
+            response.partial_failure_error.details.add().Pack(
+                _create_failure(*failed))
+
+        return response
+
+
+class BisectingMutatorTest(TestCase):
+
+    def _get_result_indexes(self, response):
+        return [int(result.resource_name.split('/')[-1])
+                for result in response.results]
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, BisectingMutator, FakeMutate(),
+                          max_operations=0)
+        self.assertRaises(ValueError, BisectingMutator, FakeMutate(),
+                          max_bytes=0)
+
+    def test_packs_by_count_and_bytes(self):
+        mutate = FakeMutate()
+        operation_size = util.get_encoded_size(_create_operation(0))
+        mutator = BisectingMutator(mutate, max_operations=3,
+                                   max_bytes=operation_size * 2)
+
+        response = mutator.mutate('123', [_create_operation(index)
+                                          for index in range(5)])
+
+        self.assertEqual(mutate.requests, [[0, 1], [2, 3], [4]])
+        self.assertEqual(self._get_result_indexes(response), list(range(5)))
+
+        mutator.max_bytes = operation_size * 10
+
+        mutator.mutate('123', [_create_operation(index)
+                               for index in range(5)])
+
+        self.assertEqual(mutate.requests[3:], [[0, 1, 2], [3, 4]])
+
+    def test_bisects_requests_that_are_too_large(self):
+        mutate = FakeMutate(max_operations=2)
+        mutator = BisectingMutator(mutate)
+
+        response = mutator.mutate('123', [_create_operation(index)
+                                          for index in range(7)])
+
+        self.assertEqual(mutate.requests, [
+            list(range(7)), [0, 1, 2], [0], [1, 2], [3, 4, 5, 6], [3, 4],
+            [5, 6]])
+        self.assertEqual(self._get_result_indexes(response), list(range(7)))
+        self.assertEqual(mutator.get_stats(),
+                         {'operations': 7, 'requests': 7, 'splits': 3})
+
+    def test_single_operation_too_large(self):
+        mutate = FakeMutate(max_operations=0)
+        mutator = BisectingMutator(mutate)
+
+        with self.assertRaises(GoogleAdsException) as context:
+            mutator.mutate('123', [_create_operation(0),
+                                   _create_operation(1)])
+
+        self.assertTrue(bisecting.is_size_error(context.exception))
+        self.assertEqual(mutate.requests, [[0, 1], [0]])
+
+    def test_empty_operations(self):
+        self.assertRaises(ValueError, BisectingMutator(FakeMutate()).mutate,
+                          '123', [])
+
+    def test_merges_partial_failures(self):
+        mutate = FakeMutate(max_operations=2, failed_indexes=(1, 3))
+        mutator = BisectingMutator(mutate)
+
+        response = mutator.mutate('123', [_create_operation(index)
+                                          for index in range(4)],
+                                  partial_failure=True)
+
+        status = response.partial_failure_error
+        self.assertEqual((status.code, status.message),
+                         (3, 'Invalid operations.'))
+        self.assertEqual(len(status.details), 1)
+        failure = errors_pb2.GoogleAdsFailure()
+        status.details[0].Unpack(failure)
+        self.assertEqual(_get_indexes(failure), [1, 3])
+        self.assertEqual([error.message for error in failure.errors],
+                         ['Invalid 1.', 'Invalid 1.'])
+
+    def test_failure_indexes_match_operations(self):
+        failure = _create_failure(1)
+        mutate = mock.Mock(side_effect=[
+            campaign_service_pb2.MutateCampaignsResponse(),
+            GoogleAdsException(None, None, failure, 'request-id')])
+        mutator = BisectingMutator(mutate, max_operations=2)
+
+        self.assertRaises(GoogleAdsException, mutator.mutate, '123',
+                          [_create_operation(index) for index in range(4)])
+        self.assertEqual(_get_indexes(failure), [3])
+        self.assertEqual(mutate.call_count, 2)
+
+    def test_google_ads_service_responses(self):
+        def mutate(customer_id, mutate_operations):
+            response = google_ads_service_pb2.MutateGoogleAdsResponse()
+
+            for operation in mutate_operations:
+                response.mutate_operation_responses.add().campaign_result\
+                    .resource_name = operation.campaign_operation.remove
+
+            return response
+
+        operations = []
+
+        for index in range(3):
+            operation = google_ads_service_pb2.MutateOperation()
+            operation.campaign_operation.remove = (
+                'customers/123/campaigns/%d' % index)
+            operations.append(operation)
+
+        response = BisectingMutator(mutate, max_operations=2).mutate(
+            '123', operations)
+
+        self.assertEqual([result.campaign_result.resource_name for result
+                          in response.mutate_operation_responses],
+                         ['customers/123/campaigns/%d' % index
+                          for index in range(3)])
+
+
+class IsSizeErrorTest(TestCase):
+
+    def _create_rpc_error(self, code, details):
+        error = mock.Mock(spec=['code', 'details'])
+        error.code.return_value = code
+        error.details.return_value = details
+        return error
+
+    def test_rpc_errors(self):
+        self.assertTrue(bisecting.is_size_error(self._create_rpc_error(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            'Sent message larger than max (5000000 vs. 4194304)')))
+        self.assertFalse(bisecting.is_size_error(self._create_rpc_error(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, 'Quota exhausted.')))
+        self.assertFalse(bisecting.is_size_error(Exception('Unavailable.')))
+
+    def test_other_google_ads_errors(self):
+        exception = GoogleAdsException(None, None, _create_failure(0),
+                                       'request-id')
+
+        self.assertFalse(bisecting.is_size_error(exception))
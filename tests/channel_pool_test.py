@@ -0,0 +1,130 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library channel pool."""
+
+import mock
+from unittest import TestCase
+
+from google.ads.google_ads import channel_pool
+from google.ads.google_ads.channel_pool import ChannelPool
+
+
+class ChannelPoolTest(TestCase):
+
+    _ENDPOINT = 'test.endpoint.com:443'
+
+    def setUp(self):
+        self.credentials = mock.Mock()
+        self.create_channel = mock.Mock(side_effect=lambda: mock.Mock())
+
+    def test_init_invalid_size(self):
+        self.assertRaises(ValueError, ChannelPool, size=0)
+
+    def test_init_invalid_idle_timeout(self):
+        self.assertRaises(ValueError, ChannelPool, idle_timeout=-1)
+
+    def test_acquire_reuses_channel(self):
+        pool = ChannelPool(size=1)
+        first = pool.acquire(self._ENDPOINT, self.credentials,
+                             self.create_channel)
+        second = pool.acquire(self._ENDPOINT, self.credentials,
+                              self.create_channel)
+        self.assertIs(first, second)
+        self.create_channel.assert_called_once_with()
+        self.assertEqual(pool.get_stats(), {'channels': 1, 'leases': 2})
+
+    def test_acquire_grows_to_size(self):
+        pool = ChannelPool(size=2)
+        channels = [pool.acquire(self._ENDPOINT, self.credentials,
+                                 self.create_channel) for _ in range(4)]
+        self.assertEqual(self.create_channel.call_count, 2)
+        self.assertEqual(len(set(map(id, channels))), 2)
+        # Leases are spread evenly across the pooled channels.
+        self.assertEqual(channels.count(channels[0]), 2)
+
+    def test_acquire_prefers_unleased_channel(self):
+        pool = ChannelPool(size=2)
+        first = pool.acquire(self._ENDPOINT, self.credentials,
+                             self.create_channel)
+        pool.release(first)
+        second = pool.acquire(self._ENDPOINT, self.credentials,
+                              self.create_channel)
+        self.assertIs(first, second)
+        self.create_channel.assert_called_once_with()
+
+    def test_acquire_keyed_by_endpoint_and_credentials(self):
+        pool = ChannelPool()
+        first = pool.acquire(self._ENDPOINT, self.credentials,
+                             self.create_channel)
+        second = pool.acquire('other.endpoint.com:443', self.credentials,
+                              self.create_channel)
+        third = pool.acquire(self._ENDPOINT, mock.Mock(),
+                             self.create_channel)
+        self.assertEqual(len(set(map(id, (first, second, third)))), 3)
+
+    def test_acquire_closed_pool(self):
+        pool = ChannelPool()
+        pool.close()
+        self.assertRaises(ValueError, pool.acquire, self._ENDPOINT,
+                          self.credentials, self.create_channel)
+
+    def test_release_unknown_channel(self):
+        pool = ChannelPool()
+        pool.release(mock.Mock())
+        self.assertEqual(pool.get_stats(), {'channels': 0, 'leases': 0})
+
+    def test_evict_idle(self):
+        pool = ChannelPool(idle_timeout=60)
+
+        with mock.patch.object(channel_pool.time, 'monotonic',
+                               return_value=100):
+            channel = pool.acquire(self._ENDPOINT, self.credentials,
+                                   self.create_channel)
+            pool.release(channel)
+
+        with mock.patch.object(channel_pool.time, 'monotonic',
+                               return_value=130):
+            self.assertEqual(pool.evict_idle(), 0)
+
+        with mock.patch.object(channel_pool.time, 'monotonic',
+                               return_value=161):
+            self.assertEqual(pool.evict_idle(), 1)
+
+        channel.close.assert_called_once_with()
+        self.assertEqual(pool.get_stats(), {'channels': 0, 'leases': 0})
+
+    def test_evict_idle_skips_leased_channels(self):
+        pool = ChannelPool(idle_timeout=0)
+        channel = pool.acquire(self._ENDPOINT, self.credentials,
+                               self.create_channel)
+        self.assertEqual(pool.evict_idle(), 0)
+        channel.close.assert_not_called()
+
+    def test_evict_idle_without_timeout(self):
+        pool = ChannelPool()
+        channel = pool.acquire(self._ENDPOINT, self.credentials,
+                               self.create_channel)
+        pool.release(channel)
+        self.assertEqual(pool.evict_idle(), 0)
+
+    def test_close(self):
+        pool = ChannelPool(size=2)
+        channels = [pool.acquire(self._ENDPOINT, self.credentials,
+                                 self.create_channel) for _ in range(2)]
+        pool.close()
+
+        for channel in channels:
+            channel.close.assert_called_once_with()
+
+        self.assertEqual(pool.get_stats(), {'channels': 0, 'leases': 0})
@@ -18,6 +18,7 @@ import mock
 import yaml
 import json
 import logging
+import threading
 from unittest import TestCase
 from importlib import import_module
 
@@ -25,6 +26,8 @@ import grpc
 from pyfakefs.fake_filesystem_unittest import TestCase as FileTestCase
 
 from google.ads.google_ads import client as Client
+from google.ads.google_ads import concurrency_limit
+from google.ads.google_ads.channel_pool import ChannelPool
 from google.ads.google_ads.errors import GoogleAdsException
 
 latest_version = Client._DEFAULT_VERSION
@@ -33,11 +36,18 @@ valid_versions = Client._VALID_API_VERSIONS
 errors_path = 'google.ads.google_ads.{}.proto.errors'.format(latest_version)
 services_path = 'google.ads.google_ads.{}.proto.services'.format(latest_version)
 
-errors = import_module(errors_path)
-services = import_module(services_path)
+error_protos = import_module('%s.errors_pb2' % errors_path)
+google_ads_service_pb2 = import_module(
+    '%s.google_ads_service_pb2' % services_path)
 
-error_protos = errors.errors_pb2
-google_ads_service_pb2 = services.google_ads_service_pb2
+# Service client modules are imported on first access and read the installed
+# distribution's metadata when they are. Import them before any test sets up
+# a fake filesystem, which would hide that metadata and unload the modules
+# imported while it's in place.
+for version in valid_versions:
+    api_module = import_module('google.ads.google_ads.%s' % version)
+    for name in api_module.__all__:
+        getattr(api_module, name)
 
 class ModuleLevelTest(TestCase):
 
@@ -125,7 +135,9 @@ class GoogleAdsClientTest(FileTestCase):
                     'developer_token': self.developer_token,
                     'endpoint': None,
                     'login_customer_id': self.login_customer_id,
-                    'logging_config': None
+                    'logging_config': None,
+                    'rate_limits': None,
+                    'retry': None
                 })
 
     def test_get_client_kwargs_login_customer_id_as_None(self):
@@ -149,7 +161,9 @@ class GoogleAdsClientTest(FileTestCase):
                     'developer_token': self.developer_token,
                     'endpoint': None,
                     'login_customer_id': None,
-                    'logging_config': None
+                    'logging_config': None,
+                    'rate_limits': None,
+                    'retry': None
                 })
 
     def test_get_client_kwargs(self):
@@ -172,7 +186,9 @@ class GoogleAdsClientTest(FileTestCase):
                     'developer_token': self.developer_token,
                     'endpoint': None,
                     'login_customer_id': None,
-                    'logging_config': None
+                    'logging_config': None,
+                    'rate_limits': None,
+                    'retry': None
                 })
 
     def test_get_client_kwargs_custom_endpoint(self):
@@ -197,7 +213,9 @@ class GoogleAdsClientTest(FileTestCase):
                     'developer_token': self.developer_token,
                     'endpoint': endpoint,
                     'login_customer_id': None,
-                    'logging_config': None
+                    'logging_config': None,
+                    'rate_limits': None,
+                    'retry': None
                 })
 
     def test_load_from_storage(self):
@@ -230,7 +248,9 @@ class GoogleAdsClientTest(FileTestCase):
                 developer_token=self.developer_token,
                 endpoint=None,
                 login_customer_id=None,
-                logging_config=None)
+                logging_config=None,
+                rate_limits=None,
+                retry=None)
 
     def test_load_from_storage_login_cid_int(self):
         login_cid = 1234567890
@@ -264,7 +284,9 @@ class GoogleAdsClientTest(FileTestCase):
                 developer_token=self.developer_token,
                 endpoint=None,
                 login_customer_id=str(login_cid),
-                logging_config=None)
+                logging_config=None,
+                rate_limits=None,
+                retry=None)
 
     def test_load_from_storage_custom_path(self):
         config = {
@@ -291,7 +313,9 @@ class GoogleAdsClientTest(FileTestCase):
                 developer_token=self.developer_token,
                 endpoint=None,
                 login_customer_id=None,
-                logging_config=None)
+                logging_config=None,
+                rate_limits=None,
+                retry=None)
 
     def test_load_from_storage_file_not_found(self):
         wrong_file_path = 'test/wrong-google-ads.yaml'
@@ -345,7 +369,9 @@ class GoogleAdsClientTest(FileTestCase):
                 developer_token=self.developer_token,
                 endpoint=None,
                 login_customer_id=None,
-                logging_config=None)
+                logging_config=None,
+                rate_limits=None,
+                retry=None)
 
     def test_load_from_storage_service_account_no_delegated_account(self):
         config = {
@@ -382,6 +408,127 @@ class GoogleAdsClientTest(FileTestCase):
             for service_name in service_names:
                 client.get_service(service_name)
 
+    def test_init_rate_limits_from_config(self):
+        with mock.patch.object(Client.oauth2, 'get_installed_app_credentials'):
+            client = Client.GoogleAdsClient(
+                mock.Mock(), self.developer_token,
+                rate_limits={'customer': {'rate': 5}})
+
+        self.assertIsInstance(client.rate_limiter,
+                              Client.rate_limit.RateLimiter)
+        self.assertEqual(client.rate_limiter.customer_limit, {'rate': 5})
+
+    def test_get_service_with_rate_limits(self):
+        rate_limiter = Client.rate_limit.RateLimiter()
+        client = Client.GoogleAdsClient(mock.Mock(), self.developer_token,
+                                        rate_limits=rate_limiter)
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            client.get_service('GoogleAdsService')
+
+        interceptors = mock_intercept_channel.call_args[0][1:]
+        self.assertIsInstance(interceptors[0], Client.RateLimitInterceptor)
+        self.assertIs(interceptors[0].rate_limiter, rate_limiter)
+
+    def test_get_service_with_concurrency_limiter(self):
+        concurrency_limiter = (
+            concurrency_limit.AdaptiveConcurrencyLimiter())
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token,
+            rate_limits=Client.rate_limit.RateLimiter(),
+            concurrency_limiter=concurrency_limiter)
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            client.get_service('GoogleAdsService')
+
+        interceptors = mock_intercept_channel.call_args[0][1:]
+        self.assertIsInstance(interceptors[0], Client.RateLimitInterceptor)
+        self.assertIsInstance(interceptors[1],
+                              Client.ConcurrencyLimitInterceptor)
+        self.assertIs(interceptors[1].concurrency_limiter, concurrency_limiter)
+
+    def test_get_service_with_retry(self):
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token,
+            retry={'policies': {'INTERNAL': None}})
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            service = client.get_service('GoogleAdsService')
+
+        interceptors = mock_intercept_channel.call_args[0][1:]
+        self.assertIsInstance(interceptors[0], Client.RetryInterceptor)
+        self.assertIs(interceptors[0].retrier, client.retrier)
+        self.assertNotIn('INTERNAL', client.retrier.policies)
+        # Retries of the service client's method configs are disabled.
+        self.assertIsNone(service._method_configs['Search'].retry)
+
+    def test_get_service_without_retry(self):
+        client = self._create_test_client()
+        service = client.get_service('GoogleAdsService')
+
+        self.assertIsNotNone(service._method_configs['Search'].retry)
+
+    def test_get_service_with_metrics_registry(self):
+        metrics_registry = mock.Mock()
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, retry={},
+            concurrency_limiter=mock.Mock(),
+            metrics_registry=metrics_registry)
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            client.get_service('GoogleAdsService')
+
+        interceptors = mock_intercept_channel.call_args[0][1:]
+        self.assertEqual(
+            [type(interceptor) for interceptor in interceptors],
+            [Client.RetryInterceptor, Client.ConcurrencyLimitInterceptor,
+             Client.MetricsInterceptor, Client.MetadataInterceptor,
+             Client.LoggingInterceptor, Client.ExceptionInterceptor])
+        self.assertIs(interceptors[0].metrics_registry, metrics_registry)
+        self.assertIs(interceptors[2].metrics_registry, metrics_registry)
+
+    def test_init_applies_logging_config_once(self):
+        logging_config = {'version': 1}
+
+        with mock.patch('logging.config.dictConfig') as mock_dictConfig:
+            client = Client.GoogleAdsClient(
+                mock.Mock(), self.developer_token,
+                logging_config=logging_config, logging_sample_rate=0.5)
+            client.get_service('GoogleAdsService')
+            client.get_service('CampaignService')
+
+        mock_dictConfig.assert_called_once_with(logging_config)
+
+    def test_get_service_logging_sample_rate(self):
+        client = Client.GoogleAdsClient(mock.Mock(), self.developer_token,
+                                        logging_sample_rate=0.25)
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            client.get_service('GoogleAdsService')
+
+        logging_interceptor = [
+            interceptor for interceptor in mock_intercept_channel.call_args[0]
+            if isinstance(interceptor, Client.LoggingInterceptor)][0]
+        self.assertEqual(logging_interceptor.sample_rate, 0.25)
+
+    def test_init_async_logging(self):
+        with mock.patch.object(Client, 'enable_async_logging') as mock_enable:
+            Client.GoogleAdsClient(mock.Mock(), self.developer_token,
+                                   async_logging=True)
+
+        mock_enable.assert_called_once_with()
+
+    def test_get_service_without_rate_limits(self):
+        client = self._create_test_client()
+
+        with mock.patch('grpc.intercept_channel') as mock_intercept_channel:
+            client.get_service('GoogleAdsService')
+
+        interceptors = mock_intercept_channel.call_args[0][1:]
+        self.assertFalse(any(
+            isinstance(interceptor, Client.RateLimitInterceptor)
+            for interceptor in interceptors))
+
     def test_get_service_custom_endpoint(self):
         service_name = 'GoogleAdsService'
         service_module_base = 'google_ads_service'
@@ -407,6 +554,171 @@ class GoogleAdsClientTest(FileTestCase):
                 address=endpoint, credentials=client.credentials,
                 options=Client.GRPC_CHANNEL_OPTIONS)
 
+    def test_get_service_with_channel_pool(self):
+        service_name = 'GoogleAdsService'
+        transport_create_channel_path = (
+            'google.ads.google_ads.%s.services.transports.'
+            'google_ads_service_grpc_transport.'
+            'GoogleAdsServiceGrpcTransport.create_channel'
+            % Client._DEFAULT_VERSION)
+        client = self._create_test_client()
+        client.channel_pool = ChannelPool()
+
+        with mock.patch(transport_create_channel_path) as mock_create_channel:
+            services = [client.get_service(service_name) for _ in range(3)]
+            # All service clients share a single pooled channel.
+            mock_create_channel.assert_called_once_with(
+                address='googleads.googleapis.com:443',
+                credentials=client.credentials,
+                options=Client.GRPC_CHANNEL_OPTIONS)
+            self.assertEqual(client.channel_pool.get_stats(),
+                             {'channels': 1, 'leases': 3})
+
+            # Garbage collected service clients release their lease.
+            del services
+            self.assertEqual(client.channel_pool.get_stats(),
+                             {'channels': 1, 'leases': 0})
+
+            client.close()
+            mock_create_channel.return_value.close.assert_called_once_with()
+
+    def test_get_service_with_service_cache(self):
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, service_cache_size=2)
+
+        with mock.patch.object(
+            client, '_create_service',
+            side_effect=lambda *args: (mock.Mock(), mock.Mock())
+        ) as mock_create_service:
+            first = client.get_service('GoogleAdsService')
+            second = client.get_service('GoogleAdsService')
+            self.assertIs(first, second)
+            mock_create_service.assert_called_once_with(
+                'GoogleAdsService', latest_version)
+
+            # A different login customer ID results in a new service client.
+            client.login_customer_id = self.login_customer_id
+            third = client.get_service('GoogleAdsService')
+            self.assertIsNot(first, third)
+            self.assertEqual(mock_create_service.call_count, 2)
+
+    def test_get_service_cache_eviction_releases_channel(self):
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, service_cache_size=1)
+        releases = {}
+
+        def create_service(name, version):
+            releases[name] = mock.Mock()
+            return mock.Mock(), releases[name]
+
+        with mock.patch.object(client, '_create_service',
+                               side_effect=create_service):
+            client.get_service('GoogleAdsService')
+            client.get_service('CampaignService')
+            releases['GoogleAdsService'].assert_called_once_with()
+            releases['CampaignService'].assert_not_called()
+
+            client.close()
+            releases['CampaignService'].assert_called_once_with()
+
+    def test_get_service_cache_concurrent_misses(self):
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, service_cache_size=1)
+        # Both threads miss the cache before either creates its service.
+        barrier = threading.Barrier(2, timeout=5)
+        services = []
+
+        def create_service(name, version):
+            barrier.wait()
+            service = mock.Mock(channel_open=True)
+
+            def release():
+                service.channel_open = False
+
+            services.append(service)
+            return service, release
+
+        results = []
+
+        def get_service():
+            results.append(client.get_service('GoogleAdsService'))
+
+        with mock.patch.object(client, '_create_service',
+                               side_effect=create_service):
+            threads = [threading.Thread(target=get_service)
+                       for _ in range(2)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(services), 2)
+        self.assertIs(results[0], results[1])
+        self.assertTrue(results[0].channel_open)
+        # The duplicate service is released instead of the cached one.
+        self.assertEqual(sorted(service.channel_open for service in services),
+                         [False, True])
+        self.assertIs(client.get_service('GoogleAdsService'), results[0])
+
+    def test_get_service_cache_closes_unpooled_channel(self):
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, service_cache_size=1)
+        transport_create_channel_path = (
+            'google.ads.google_ads.%s.services.transports.'
+            'google_ads_service_grpc_transport.'
+            'GoogleAdsServiceGrpcTransport.create_channel' % latest_version)
+
+        with mock.patch(transport_create_channel_path) as mock_create_channel:
+            client.get_service('GoogleAdsService')
+            client.close()
+            mock_create_channel.return_value.close.assert_called_once_with()
+
+    def test_close_without_channel_pool(self):
+        client = self._create_test_client()
+        try:
+            client.close()
+        except Exception:
+            self.fail('close without a channel pool raised an error')
+
+    def test_get_service_future_methods(self):
+        client = self._create_test_client()
+        service = client.get_service('CampaignService')
+        mock_future = mock.Mock()
+        mock_stub = mock.Mock()
+        mock_stub.future.return_value = mock_future
+        stubs_path = ('google.ads.google_ads.%s.services.transports.'
+                      'campaign_service_grpc_transport.'
+                      'CampaignServiceGrpcTransport.mutate_campaigns'
+                      % latest_version)
+
+        with mock.patch(stubs_path, new_callable=mock.PropertyMock,
+                        return_value=mock_stub):
+            result = service.mutate_campaigns_future('123', [])
+
+        self.assertIs(result, mock_future)
+        request = mock_stub.future.call_args[0][0]
+        self.assertEqual(request.customer_id, '123')
+        mock_stub.assert_not_called()
+
+    def test_get_service_paged_future_method(self):
+        client = self._create_test_client()
+        service = client.get_service('GoogleAdsService')
+        mock_stub = mock.Mock()
+        stubs_path = ('google.ads.google_ads.%s.services.transports.'
+                      'google_ads_service_grpc_transport.'
+                      'GoogleAdsServiceGrpcTransport.search' % latest_version)
+
+        with mock.patch(stubs_path, new_callable=mock.PropertyMock,
+                        return_value=mock_stub):
+            result = service.search_future('123', 'query', page_size=10)
+
+        self.assertIs(result, mock_stub.future.return_value)
+        request = mock_stub.future.call_args[0][0]
+        self.assertEqual(request.query, 'query')
+        self.assertEqual(request.page_size, 10)
+
     def test_get_service_not_found(self):
         client = self._create_test_client()
         self.assertRaises(ValueError, client.get_service, 'BadService')
@@ -444,6 +756,376 @@ class GoogleAdsClientTest(FileTestCase):
             ValueError, Client.GoogleAdsClient.get_type,
             'GoogleAdsFailure', version='bad_version')
 
+    def test_get_type_uses_registry(self):
+        operation = Client.GoogleAdsClient.get_type('CampaignOperation')
+
+        with mock.patch.object(Client, '_get_version') as mock_get_version:
+            result = Client.GoogleAdsClient.get_type('CampaignOperation')
+            mock_get_version.assert_not_called()
+
+        self.assertIs(type(result), type(operation))
+        self.assertIs(
+            Client._type_registry[(latest_version, 'CampaignOperation')],
+            type(operation))
+
+
+class TypePrototypesTest(TestCase):
+
+    def setUp(self):
+        self.prototypes = Client.TypePrototypes()
+
+    def test_get_type(self):
+        prototype = Client.GoogleAdsClient.get_type('CampaignOperation')
+        prototype.create.name.value = 'Template'
+
+        self.prototypes.set_prototype('CampaignOperation', prototype)
+        prototype.create.name.value = 'Changed'
+        first = self.prototypes.get_type('CampaignOperation')
+        first.create.id.value = 1
+        second = self.prototypes.get_type('CampaignOperation')
+
+        self.assertEqual(first.create.name.value, 'Template')
+        self.assertEqual(second.create.name.value, 'Template')
+        self.assertFalse(second.create.HasField('id'))
+
+    def test_get_type_without_prototype(self):
+        self.assertEqual(
+            self.prototypes.get_type('CampaignOperation'),
+            Client.GoogleAdsClient.get_type('CampaignOperation'))
+
+    def test_client_get_type_unchanged(self):
+        prototype = Client.GoogleAdsClient.get_type('CampaignOperation')
+        prototype.create.name.value = 'Template'
+
+        self.prototypes.set_prototype('CampaignOperation', prototype)
+
+        self.assertFalse(Client.GoogleAdsClient.get_type(
+            'CampaignOperation').HasField('create'))
+        self.assertFalse(Client.TypePrototypes().get_type(
+            'CampaignOperation').HasField('create'))
+
+    def test_set_prototype_none(self):
+        prototype = Client.GoogleAdsClient.get_type('CampaignOperation')
+        prototype.create.name.value = 'Template'
+        self.prototypes.set_prototype('CampaignOperation', prototype)
+
+        self.prototypes.set_prototype('CampaignOperation', None)
+
+        self.assertFalse(self.prototypes.get_type(
+            'CampaignOperation').HasField('create'))
+
+    def test_set_prototype_wrong_type(self):
+        self.assertRaises(
+            ValueError, self.prototypes.set_prototype, 'CampaignOperation',
+            Client.GoogleAdsClient.get_type('AdGroupOperation'))
+
+    def test_other_version(self):
+        prototypes = Client.TypePrototypes(version='v1')
+        prototype = Client.GoogleAdsClient.get_type('CampaignOperation',
+                                                    version='v1')
+        prototype.create.name.value = 'Template'
+
+        prototypes.set_prototype('CampaignOperation', prototype)
+
+        self.assertIs(type(prototypes.get_type('CampaignOperation')),
+                      type(prototype))
+        self.assertRaises(
+            ValueError, self.prototypes.set_prototype, 'CampaignOperation',
+            prototype)
+
+
+class RetryInterceptorTest(TestCase):
+
+    _METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Search'
+
+    def setUp(self):
+        self.sleep = mock.Mock()
+        self.retrier = Client.retry_module.Retrier(
+            sleep=self.sleep, uniform=lambda low, high: low)
+        self.interceptor = Client.RetryInterceptor(self.retrier,
+                                                   latest_version)
+        self.client_call_details = mock.Mock()
+        self.client_call_details.method = self._METHOD
+
+    def _get_mock_response(self, code=None, failure=None, done=True):
+        response = mock.Mock()
+        response.done.return_value = done
+
+        if code is None:
+            response.exception.return_value = None
+            return response
+
+        exception = mock.Mock(spec=('code', 'trailing_metadata'))
+        exception.code.return_value = code
+        exception.trailing_metadata.return_value = (
+            (('google.ads.googleads.%s.errors.googleadsfailure-bin'
+              % latest_version, failure.SerializeToString()),)
+            if failure else ())
+        response.exception.return_value = exception
+        return response
+
+    def test_retries_until_success(self):
+        responses = [
+            self._get_mock_response(grpc.StatusCode.UNAVAILABLE),
+            self._get_mock_response(grpc.StatusCode.UNAVAILABLE),
+            self._get_mock_response()]
+        continuation = mock.Mock(side_effect=responses)
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, mock.Mock())
+
+        self.assertIs(result, responses[-1])
+        self.assertEqual(continuation.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+        self.assertEqual(self.retrier.get_stats()['requests'], 3)
+
+    def test_gives_up_after_max_attempts(self):
+        continuation = mock.Mock(side_effect=lambda *args: (
+            self._get_mock_response(grpc.StatusCode.DEADLINE_EXCEEDED)))
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, mock.Mock())
+
+        self.assertEqual(result.exception().code(),
+                         grpc.StatusCode.DEADLINE_EXCEEDED)
+        self.assertEqual(continuation.call_count, 3)
+
+    def test_does_not_retry_permanent_errors(self):
+        continuation = mock.Mock(return_value=self._get_mock_response(
+            grpc.StatusCode.INVALID_ARGUMENT))
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, mock.Mock())
+
+        self.assertEqual(continuation.call_count, 1)
+        self.sleep.assert_not_called()
+
+    def test_does_not_retry_pending_requests(self):
+        response = self._get_mock_response(done=False)
+        continuation = mock.Mock(return_value=response)
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, mock.Mock())
+
+        self.assertIs(result, response)
+        response.exception.assert_not_called()
+
+    def test_retries_google_ads_failure_codes(self):
+        failure = error_protos.GoogleAdsFailure()
+        failure.errors.add().error_code.database_error = 2
+        responses = [
+            self._get_mock_response(grpc.StatusCode.ABORTED, failure),
+            self._get_mock_response()]
+        continuation = mock.Mock(side_effect=responses)
+        self.client_call_details.method = (
+            '/google.ads.googleads.v2.services.CampaignService/'
+            'MutateCampaigns')
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, mock.Mock())
+
+        self.assertEqual(continuation.call_count, 2)
+        self.assertEqual(self.retrier.get_stats()['retries_by_code'],
+                         {'database_error.CONCURRENT_MODIFICATION': 1})
+
+    def test_get_error_codes_google_ads_exception(self):
+        failure = error_protos.GoogleAdsFailure()
+        failure.errors.add().error_code.internal_error = 4
+        error = mock.Mock()
+        error.code.return_value = grpc.StatusCode.INVALID_ARGUMENT
+        exception = GoogleAdsException(error, mock.Mock(), failure, '123')
+
+        self.assertEqual(
+            Client._get_google_ads_error_codes(
+                exception, self.interceptor._exception_interceptor),
+            ['internal_error.TRANSIENT_ERROR'])
+        self.assertEqual(Client._get_status_name(exception),
+                         'INVALID_ARGUMENT')
+
+
+class MetricsInterceptorTest(TestCase):
+
+    _METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Search'
+
+    def setUp(self):
+        self.metrics_registry = mock.Mock()
+        self.interceptor = Client.MetricsInterceptor(self.metrics_registry,
+                                                     latest_version)
+        self.client_call_details = mock.Mock()
+        self.client_call_details.method = self._METHOD
+        self.request = google_ads_service_pb2.SearchGoogleAdsRequest(
+            customer_id='1234567890', query='SELECT campaign.id FROM campaign')
+
+    def test_intercept_unary_unary(self):
+        result = google_ads_service_pb2.SearchGoogleAdsResponse()
+        result.results.add().campaign.id.value = 1
+        result.results.add().campaign.id.value = 2
+        response = mock.Mock()
+        response.done.return_value = True
+        response.exception.return_value = None
+        response.result.return_value = result
+        continuation = mock.Mock(return_value=response)
+
+        self.assertIs(self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request), response)
+
+        self.metrics_registry.record_request.assert_called_once_with(
+            'GoogleAdsService/Search', 'OK', mock.ANY,
+            customer_id='1234567890', request_bytes=self.request.ByteSize(),
+            response_bytes=result.ByteSize(), results=2)
+
+    def test_intercept_unary_unary_google_ads_exception(self):
+        failure = error_protos.GoogleAdsFailure()
+        failure.errors.add().error_code.internal_error = 4
+        error = mock.Mock()
+        error.code.return_value = grpc.StatusCode.INVALID_ARGUMENT
+        response = mock.Mock()
+        response.done.return_value = True
+        response.exception.return_value = GoogleAdsException(
+            error, mock.Mock(), failure, '123')
+        continuation = mock.Mock(return_value=response)
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.metrics_registry.record_request.assert_called_once_with(
+            'GoogleAdsService/Search', 'INVALID_ARGUMENT', mock.ANY,
+            customer_id='1234567890', request_bytes=self.request.ByteSize(),
+            error_codes=['internal_error.TRANSIENT_ERROR'])
+
+    def test_intercept_unary_unary_pending(self):
+        response = mock.Mock()
+        response.done.return_value = False
+        continuation = mock.Mock(return_value=response)
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.metrics_registry.record_request.assert_not_called()
+        response.exception.return_value = None
+        response.result.return_value = (
+            google_ads_service_pb2.SearchGoogleAdsResponse())
+        response.add_done_callback.call_args[0][0](response)
+        self.assertEqual(self.metrics_registry.record_request.call_count, 1)
+
+
+class RateLimitInterceptorTest(TestCase):
+
+    def test_intercept_unary_unary(self):
+        rate_limiter = mock.Mock()
+        interceptor = Client.RateLimitInterceptor(rate_limiter, 'token')
+        client_call_details = mock.Mock()
+        client_call_details.method = (
+            '/google.ads.googleads.v2.services.GoogleAdsService/Mutate')
+        request = mock.Mock()
+        request.customer_id = '1234567890'
+        continuation = mock.Mock()
+
+        result = interceptor.intercept_unary_unary(
+            continuation, client_call_details, request)
+
+        rate_limiter.acquire.assert_called_once_with(
+            developer_token='token', customer_id='1234567890',
+            method=client_call_details.method)
+        continuation.assert_called_once_with(client_call_details, request)
+        self.assertEqual(result, continuation.return_value)
+
+    def test_intercept_unary_unary_rate_limit_exceeded(self):
+        rate_limiter = Client.rate_limit.RateLimiter(
+            developer_token_limit={'rate': 1}, blocking=False)
+        interceptor = Client.RateLimitInterceptor(rate_limiter, 'token')
+        continuation = mock.Mock()
+        client_call_details = mock.Mock()
+        client_call_details.method = (
+            '/google.ads.googleads.v2.services.GoogleAdsService/Search')
+
+        interceptor.intercept_unary_unary(
+            continuation, client_call_details, mock.Mock())
+
+        self.assertRaises(
+            Client.rate_limit.RateLimitExceededError,
+            interceptor.intercept_unary_unary,
+            continuation, client_call_details, mock.Mock())
+        self.assertEqual(continuation.call_count, 1)
+
+
+class ConcurrencyLimitInterceptorTest(TestCase):
+
+    def setUp(self):
+        self.concurrency_limiter = mock.Mock()
+        self.interceptor = Client.ConcurrencyLimitInterceptor(
+            self.concurrency_limiter)
+        self.client_call_details = mock.Mock()
+        self.client_call_details.method = (
+            '/google.ads.googleads.v2.services.GoogleAdsService/Mutate')
+        self.request = mock.Mock()
+        self.request.customer_id = '1234567890'
+
+    def _get_mock_response(self, done=True, code=None):
+        response = mock.Mock()
+        response.done.return_value = done
+
+        if code is None:
+            response.exception.return_value = None
+        else:
+            response.exception.return_value.code.return_value = code
+
+        return response
+
+    def test_intercept_unary_unary(self):
+        response = self._get_mock_response()
+        continuation = mock.Mock(return_value=response)
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.assertIs(result, response)
+        self.concurrency_limiter.acquire.assert_called_once_with(
+            customer_id='1234567890', method=self.client_call_details.method)
+        self.concurrency_limiter.release.assert_called_once_with(
+            self.concurrency_limiter.acquire.return_value, dropped=False)
+
+    def test_intercept_unary_unary_resource_exhausted(self):
+        continuation = mock.Mock(return_value=self._get_mock_response(
+            code=grpc.StatusCode.RESOURCE_EXHAUSTED))
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.concurrency_limiter.release.assert_called_once_with(
+            self.concurrency_limiter.acquire.return_value, dropped=True)
+
+    def test_intercept_unary_unary_other_error(self):
+        continuation = mock.Mock(return_value=self._get_mock_response(
+            code=grpc.StatusCode.INVALID_ARGUMENT))
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.concurrency_limiter.release.assert_called_once_with(
+            self.concurrency_limiter.acquire.return_value, dropped=False)
+
+    def test_intercept_unary_unary_pending(self):
+        response = self._get_mock_response(done=False)
+        continuation = mock.Mock(return_value=response)
+
+        self.interceptor.intercept_unary_unary(
+            continuation, self.client_call_details, self.request)
+
+        self.concurrency_limiter.release.assert_not_called()
+        callback = response.add_done_callback.call_args[0][0]
+        callback(response)
+        self.concurrency_limiter.release.assert_called_once_with(
+            self.concurrency_limiter.acquire.return_value, dropped=False)
+
+    def test_intercept_unary_unary_continuation_raises(self):
+        continuation = mock.Mock(side_effect=ValueError())
+
+        self.assertRaises(ValueError, self.interceptor.intercept_unary_unary,
+                          continuation, self.client_call_details, self.request)
+        self.concurrency_limiter.release.assert_called_once_with(
+            self.concurrency_limiter.acquire.return_value)
+
 
 class MetadataInterceptorTest(TestCase):
 
@@ -747,7 +1429,9 @@ class LoggingInterceptorTest(TestCase):
                 mock_client_call_details,
                 mock_request)
 
-            mock_logger.info.assert_called_once_with(
+            mock_logger.info.assert_called_once()
+            self.assertEqual(
+                str(mock_logger.info.call_args[0][0]),
                 interceptor._SUMMARY_LOG_LINE.format(
                     self._MOCK_CUSTOMER_ID, self._MOCK_ENDPOINT,
                     mock_client_call_details.method, self._MOCK_REQUEST_ID,
@@ -758,7 +1442,9 @@ class LoggingInterceptorTest(TestCase):
             trailing_metadata = Client._parse_metadata_to_json(
                 mock_trailing_metadata)
 
-            mock_logger.debug.assert_called_once_with(
+            mock_logger.debug.assert_called_once()
+            self.assertEqual(
+                str(mock_logger.debug.call_args[0][0]),
                 interceptor._FULL_REQUEST_LOG_LINE.format(
                     self._MOCK_METHOD, self._MOCK_ENDPOINT, initial_metadata,
                     mock_request, trailing_metadata, mock_response.result()))
@@ -783,7 +1469,9 @@ class LoggingInterceptorTest(TestCase):
 
             mock_trailing_metadata = mock_response.trailing_metadata()
 
-            mock_logger.warning.assert_called_once_with(
+            mock_logger.warning.assert_called_once()
+            self.assertEqual(
+                str(mock_logger.warning.call_args[0][0]),
                 interceptor._SUMMARY_LOG_LINE.format(
                     self._MOCK_CUSTOMER_ID, self._MOCK_ENDPOINT,
                     mock_client_call_details.method, self._MOCK_REQUEST_ID,
@@ -794,12 +1482,85 @@ class LoggingInterceptorTest(TestCase):
             trailing_metadata = Client._parse_metadata_to_json(
                 mock_trailing_metadata)
 
-            mock_logger.info.assert_called_once_with(
+            mock_logger.info.assert_called_once()
+            self.assertEqual(
+                str(mock_logger.info.call_args[0][0]),
                 interceptor._FULL_FAULT_LOG_LINE.format(
                     self._MOCK_METHOD, self._MOCK_ENDPOINT, initial_metadata,
                     mock_request, trailing_metadata,
                     mock_response.exception().failure))
 
+    def test_init_invalid_sample_rate(self):
+        """Raises a ValueError if the sample rate is out of range."""
+        self.assertRaises(ValueError, Client.LoggingInterceptor,
+                          sample_rate=1.5)
+
+    def test_intercept_unary_unary_info_disabled(self):
+        """Successful requests aren't inspected if INFO is disabled."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_response = mock.Mock()
+        mock_response.exception.return_value = None
+
+        with mock.patch('google.ads.google_ads.client._logger') as mock_logger:
+            mock_logger.isEnabledFor.side_effect = (
+                lambda level: level >= logging.WARNING)
+            interceptor = Client.LoggingInterceptor()
+            interceptor.intercept_unary_unary(
+                lambda client_call_details, request: mock_response,
+                mock_client_call_details,
+                self._get_mock_request())
+
+            mock_logger.info.assert_not_called()
+            mock_logger.debug.assert_not_called()
+            mock_response.trailing_metadata.assert_not_called()
+            mock_response.result.assert_not_called()
+
+    def test_intercept_unary_unary_debug_disabled(self):
+        """Full requests aren't logged or formatted if DEBUG is disabled."""
+        mock_response = self._get_mock_response()
+        mock_response.result = mock.Mock()
+
+        with mock.patch('google.ads.google_ads.client._logger') as mock_logger:
+            mock_logger.isEnabledFor.side_effect = (
+                lambda level: level >= logging.INFO)
+            interceptor = Client.LoggingInterceptor()
+            interceptor.intercept_unary_unary(
+                lambda client_call_details, request: mock_response,
+                self._get_mock_client_call_details(),
+                self._get_mock_request())
+
+            mock_logger.info.assert_called_once()
+            mock_logger.debug.assert_not_called()
+            mock_response.result.assert_not_called()
+
+    def test_intercept_unary_unary_sampled(self):
+        """Only sampled successful requests are logged."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_request = self._get_mock_request()
+
+        with mock.patch('google.ads.google_ads.client._logger') as mock_logger, \
+            mock.patch('random.random', side_effect=[0.5, 0.1]):
+            interceptor = Client.LoggingInterceptor(sample_rate=0.25)
+
+            for _ in range(2):
+                interceptor.intercept_unary_unary(
+                    self._get_mock_continuation_fn(),
+                    mock_client_call_details,
+                    mock_request)
+
+            mock_logger.info.assert_called_once()
+
+    def test_intercept_unary_unary_failures_are_not_sampled(self):
+        """Failed requests are logged regardless of the sample rate."""
+        with mock.patch('google.ads.google_ads.client._logger') as mock_logger:
+            interceptor = Client.LoggingInterceptor(sample_rate=0)
+            interceptor.intercept_unary_unary(
+                self._get_mock_continuation_fn(fail=True),
+                self._get_mock_client_call_details(),
+                self._get_mock_request())
+
+            mock_logger.warning.assert_called_once()
+
     def test_get_initial_metadata(self):
         """_Returns a tuple of metadata from client_call_details."""
         with mock.patch('logging.config.dictConfig'):
@@ -856,6 +1617,37 @@ class LoggingInterceptorTest(TestCase):
             result = interceptor._parse_exception_to_str(mock_exception)
             self.assertEqual(result, '{}')
 
+    def test_intercept_unary_unary_pending_request(self):
+        """Pending requests are logged once they complete."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_request = self._get_mock_request()
+        mock_response = self._get_mock_response()
+        mock_response.done = mock.Mock(return_value=False)
+
+        def mock_continuation_fn(client_call_details, request):
+            return mock_response
+
+        with mock.patch('logging.config.dictConfig'), \
+            mock.patch('google.ads.google_ads.client._logger') as mock_logger:
+            interceptor = self._create_test_interceptor()
+            result = interceptor.intercept_unary_unary(
+                mock_continuation_fn,
+                mock_client_call_details,
+                mock_request)
+
+            self.assertIs(result, mock_response)
+            mock_logger.info.assert_not_called()
+
+            callback = mock_response.add_done_callback.call_args[0][0]
+            callback(mock_response)
+            mock_logger.info.assert_called_once()
+            self.assertEqual(
+                str(mock_logger.info.call_args[0][0]),
+                interceptor._SUMMARY_LOG_LINE.format(
+                    self._MOCK_CUSTOMER_ID, self._MOCK_ENDPOINT,
+                    mock_client_call_details.method, self._MOCK_REQUEST_ID,
+                    False, None))
+
     def test_get_trailing_metadata(self):
         """Retrieves metadata from a response object."""
         with mock.patch('logging.config.dictConfig'):
@@ -928,6 +1720,121 @@ class LoggingInterceptorTest(TestCase):
             self.assertEqual(result, self._MOCK_TRANSPORT_ERROR_MESSAGE)
 
 
+class DeferredLogMessageTest(TestCase):
+    """Tests for the google.ads.googleads.client._DeferredLogMessage class."""
+
+    def test_str_formats_lazily(self):
+        format_function = mock.Mock(return_value='message')
+
+        message = Client._DeferredLogMessage(format_function, 'a', 1)
+
+        format_function.assert_not_called()
+        self.assertEqual(str(message), 'message')
+        format_function.assert_called_once_with('a', 1)
+
+    def test_nested_messages(self):
+        message = Client._DeferredLogMessage(
+            '{} {}'.format, Client._DeferredLogMessage(str.upper, 'a'), 'b')
+
+        self.assertEqual(str(message), 'A b')
+
+
+class EnableAsyncLoggingTest(TestCase):
+    """Tests for the google.ads.googleads.client.enable_async_logging function.
+    """
+
+    _LOGGER_NAME = 'google_ads_async_logging_test'
+
+    def setUp(self):
+        self.parent_logger = logging.getLogger(self._LOGGER_NAME)
+        self.logger = logging.getLogger('%s.client' % self._LOGGER_NAME)
+        # Other tests may have disabled logging globally.
+        self.addCleanup(logging.disable, logging.root.manager.disable)
+        logging.disable(logging.NOTSET)
+        # The test runner may have attached its own handlers.
+        self.addCleanup(setattr, self.parent_logger, 'handlers',
+                        self.parent_logger.handlers)
+        self.parent_logger.handlers = []
+        self.parent_logger.propagate = False
+        self.parent_logger.setLevel(logging.INFO)
+
+        for patcher in (
+                mock.patch.object(Client, '_LOGGER_PACKAGE',
+                                  '%s.client' % self._LOGGER_NAME),
+                mock.patch.object(Client, '_async_logging', None),
+                mock.patch('atexit.register')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.addCleanup(self._reset_loggers)
+
+    def _reset_loggers(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+        self.logger.propagate = True
+
+    def test_records_are_emitted_by_a_listener(self):
+        handler = mock.Mock(level=logging.NOTSET)
+        self.parent_logger.addHandler(handler)
+        message = mock.Mock()
+
+        async_logging = Client.enable_async_logging()
+        self.logger.info(message)
+        self.assertFalse(self.logger.propagate)
+        self.assertEqual(
+            [type(handler) for handler in self.logger.handlers],
+            [Client._DeferredQueueHandler])
+        async_logging.stop()
+
+        record = handler.handle.call_args[0][0]
+        # Records are queued as they are, for the listener's handlers to
+        # format.
+        self.assertIs(record.msg, message)
+
+    def test_enabled_once(self):
+        self.parent_logger.addHandler(logging.NullHandler())
+
+        async_logging = Client.enable_async_logging()
+        self.addCleanup(async_logging.stop)
+
+        self.assertIs(Client.enable_async_logging(), async_logging)
+        self.assertEqual(len(self.logger.handlers), 1)
+
+    def test_stop_restores_logger(self):
+        handler = logging.NullHandler()
+        self.logger.addHandler(handler)
+        async_logging = Client.enable_async_logging()
+
+        async_logging.stop()
+
+        self.assertEqual(self.logger.handlers, [handler])
+        self.assertTrue(self.logger.propagate)
+        self.assertIsNone(Client._async_logging)
+
+    def test_stop_twice(self):
+        self.parent_logger.addHandler(logging.NullHandler())
+        async_logging = Client.enable_async_logging()
+        async_logging.stop()
+
+        # The exit handler doesn't fail if logging was already stopped.
+        async_logging.stop()
+
+    def test_enable_after_stop(self):
+        self.parent_logger.addHandler(logging.NullHandler())
+        Client.enable_async_logging().stop()
+
+        async_logging = Client.enable_async_logging()
+        self.addCleanup(async_logging.stop)
+
+        self.assertIsNotNone(async_logging)
+        self.assertFalse(self.logger.propagate)
+
+    def test_no_handlers(self):
+        self.assertIsNone(Client.enable_async_logging())
+        self.assertTrue(self.logger.propagate)
+
+
 class ExceptionInterceptorTest(TestCase):
     """Tests for the google.ads.googleads.client.ExceptionInterceptor class."""
 
@@ -1034,6 +1941,9 @@ class ExceptionInterceptorTest(TestCase):
         mock_exception = grpc.RpcError()
 
         class MockResponse():
+            def done(self):
+                return True
+
             def exception(self):
                 return mock_exception
 
@@ -1058,6 +1968,9 @@ class ExceptionInterceptorTest(TestCase):
     def test_intercept_unary_unary_response_is_successful(self):
         """If response.exception() is None response is returned."""
         class MockResponse():
+            def done(self):
+                return True
+
             def exception(self):
                 return None
 
@@ -1076,3 +1989,54 @@ class ExceptionInterceptorTest(TestCase):
             mock_continuation, mock_client_call_details, mock_request)
 
         self.assertEqual(result, mock_response)
+
+    def test_intercept_unary_unary_response_is_pending(self):
+        """Pending responses are wrapped and translated once complete."""
+        mock_error_message = self._MOCK_FAILURE_VALUE
+        interceptor = self._create_test_interceptor()
+
+        class MockRpcErrorResponse(grpc.RpcError):
+            def __init__(self):
+                self.callbacks = []
+                self.is_done = False
+
+            def done(self):
+                return self.is_done
+
+            def code(self):
+                return grpc.StatusCode.INVALID_ARGUMENT
+
+            def trailing_metadata(self):
+                return ((interceptor._failure_key, mock_error_message),
+                        ('request-id', '123456'))
+
+            def exception(self, timeout=None):
+                return self
+
+            def add_done_callback(self, fn):
+                self.callbacks.append(fn)
+
+        mock_response = MockRpcErrorResponse()
+
+        def mock_continuation(client_call_details, request):
+            return mock_response
+
+        future = interceptor.intercept_unary_unary(
+            mock_continuation, mock.Mock(), mock.Mock())
+
+        self.assertIsInstance(future, Client._GoogleAdsFuture)
+        self.assertFalse(future.done())
+        self.assertEqual(future.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+        callback = mock.Mock()
+        future.add_done_callback(callback)
+        mock_response.is_done = True
+        mock_response.callbacks[0](mock_response)
+        callback.assert_called_once_with(future)
+
+        exception = future.exception()
+        self.assertIsInstance(exception, GoogleAdsException)
+        self.assertEqual(exception.request_id, '123456')
+        # The translated exception is only created once.
+        self.assertIs(future.exception(), exception)
+        self.assertRaises(GoogleAdsException, future.result)
@@ -0,0 +1,151 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library columnar builder."""
+
+import mock
+import unittest
+from importlib import import_module
+
+from google.api_core import page_iterator
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads import columnar
+from google.ads.google_ads.columnar import ColumnarBuilder
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+def _create_row(campaign_id, name, status=2, ctr=0.5):
+    row = google_ads_service_pb2.GoogleAdsRow()
+    row.campaign.id.value = campaign_id
+    row.campaign.name.value = name
+    row.campaign.status = status
+    row.metrics.ctr.value = ctr
+    return row
+
+
+@unittest.skipIf(columnar.numpy is None, 'NumPy is not installed.')
+class ColumnarBuilderTest(unittest.TestCase):
+
+    _QUERY = ('SELECT campaign.id, campaign.name, campaign.status, '
+              'metrics.ctr FROM campaign')
+
+    def test_init_without_numpy(self):
+        with mock.patch.object(columnar, 'numpy', None):
+            self.assertRaises(ImportError, ColumnarBuilder, self._QUERY)
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, ColumnarBuilder, self._QUERY,
+                          initial_capacity=0)
+        self.assertRaises(ValueError, ColumnarBuilder, self._QUERY,
+                          growth_factor=1)
+
+    def test_add_rows(self):
+        builder = ColumnarBuilder(self._QUERY)
+        builder.add_rows([_create_row(1, 'a', ctr=0.25), _create_row(2, 'b')])
+
+        columns = builder.build()
+
+        self.assertEqual(list(columns), builder.fields)
+        self.assertEqual(columns['campaign.id'].dtype, columnar.numpy.int64)
+        self.assertEqual(columns['campaign.id'].tolist(), [1, 2])
+        self.assertEqual(columns['campaign.name'].dtype, object)
+        self.assertEqual(columns['campaign.name'].tolist(), ['a', 'b'])
+        self.assertEqual(columns['campaign.status'].dtype,
+                         columnar.numpy.int32)
+        self.assertEqual(columns['metrics.ctr'].dtype, columnar.numpy.float64)
+        self.assertEqual(columns['metrics.ctr'].tolist(), [0.25, 0.5])
+
+    def test_add_rows_grows_geometrically(self):
+        builder = ColumnarBuilder(self._QUERY, initial_capacity=2)
+
+        builder.add_rows([_create_row(index, 'a') for index in range(3)])
+        self.assertEqual(builder._capacity, 4)
+        builder.add_rows([_create_row(index, 'a') for index in range(3, 10)])
+        self.assertEqual(builder._capacity, 10)
+
+        self.assertEqual(len(builder), 10)
+        self.assertEqual(builder.build()['campaign.id'].tolist(),
+                         list(range(10)))
+
+    def test_add_response_presizes(self):
+        builder = ColumnarBuilder(self._QUERY, initial_capacity=2)
+        response = google_ads_service_pb2.SearchGoogleAdsResponse(
+            total_results_count=100)
+        response.results.extend([_create_row(1, 'a')])
+
+        builder.add_response(response)
+
+        self.assertEqual(builder._capacity, 100)
+        self.assertEqual(len(builder), 1)
+
+    def test_extend(self):
+        responses = []
+        for index in range(3):
+            response = google_ads_service_pb2.SearchGoogleAdsResponse()
+            response.results.extend([_create_row(index, 'a')])
+            if index < 2:
+                response.next_page_token = str(index + 1)
+            responses.append(response)
+
+        iterator = page_iterator.GRPCIterator(
+            client=None,
+            method=lambda request: responses[int(request.page_token or 0)],
+            request=google_ads_service_pb2.SearchGoogleAdsRequest(),
+            items_field='results')
+
+        builder = ColumnarBuilder(self._QUERY)
+        builder.extend(iterator)
+
+        self.assertEqual(builder.build()['campaign.id'].tolist(), [0, 1, 2])
+
+    def test_enum_categories(self):
+        builder = ColumnarBuilder(self._QUERY)
+        builder.add_rows([_create_row(1, 'a', status=2)])
+
+        categories = builder.get_categories('campaign.status')
+
+        self.assertEqual(categories[2], 'ENABLED')
+        self.assertEqual(builder.build()['campaign.status'].tolist(), [2])
+
+    def test_dictionary_encode_strings(self):
+        builder = ColumnarBuilder(self._QUERY, dictionary_encode_strings=True)
+        builder.add_rows([_create_row(1, 'b'), _create_row(2, 'a'),
+                          _create_row(3, 'b')])
+
+        self.assertEqual(builder.build()['campaign.name'].tolist(), [0, 1, 0])
+        self.assertEqual(builder.get_categories('campaign.name'),
+                         {0: 'b', 1: 'a'})
+
+    def test_get_categories_invalid_field(self):
+        builder = ColumnarBuilder(self._QUERY)
+        self.assertRaises(ValueError, builder.get_categories, 'campaign.id')
+        self.assertRaises(ValueError, builder.get_categories, 'ad_group.id')
+
+    def test_repeated_field(self):
+        builder = ColumnarBuilder(
+            'SELECT campaign.url_custom_parameters FROM campaign')
+        row = google_ads_service_pb2.GoogleAdsRow()
+        row.campaign.url_custom_parameters.add().key.value = 'season'
+
+        builder.add_rows([row, google_ads_service_pb2.GoogleAdsRow()])
+
+        column = builder.build()['campaign.url_custom_parameters']
+        self.assertEqual(len(column), 2)
+        self.assertEqual(column[0][0].key.value, 'season')
+        self.assertEqual(len(column[1]), 0)
@@ -0,0 +1,154 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library adaptive concurrency limiter."""
+
+import threading
+from unittest import TestCase
+
+from google.ads.google_ads.concurrency_limit import AdaptiveConcurrencyLimiter
+
+_MUTATE_METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Mutate'
+_KEY = ('123', 'GoogleAdsService/Mutate')
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AdaptiveConcurrencyLimiterTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _create_limiter(self, **kwargs):
+        return AdaptiveConcurrencyLimiter(clock=self.clock, **kwargs)
+
+    def _complete(self, limiter, latency=1.0, dropped=False, count=1):
+        permits = [limiter.acquire('123', _MUTATE_METHOD)
+                   for _ in range(count)]
+        self.clock.now += latency
+
+        for permit in permits:
+            limiter.release(permit, dropped=dropped)
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter,
+                          initial_limit=0)
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter,
+                          initial_limit=200)
+        self.assertRaises(ValueError, AdaptiveConcurrencyLimiter,
+                          backoff_ratio=1)
+
+    def test_acquire_and_release(self):
+        limiter = self._create_limiter(initial_limit=4)
+
+        permit = limiter.acquire('123', _MUTATE_METHOD)
+
+        self.assertEqual(limiter.get_limits()[_KEY]['in_flight'], 1)
+        limiter.release(permit)
+        self.assertEqual(limiter.get_limits()[_KEY], {
+            'limit': 4, 'in_flight': 0, 'completed': 1, 'dropped': 0,
+            'min_latency': 0})
+
+    def test_additive_increase(self):
+        limiter = self._create_limiter(initial_limit=4)
+
+        self._complete(limiter, count=4)
+
+        # Responses add 1/limit, about one per round trip, but only while at
+        # least half of the limit is in flight.
+        self.assertAlmostEqual(limiter.get_limits()[_KEY]['limit'],
+                               4 + 1 / 4.0 + 1 / 4.25)
+
+    def test_no_increase_when_underused(self):
+        limiter = self._create_limiter(initial_limit=10)
+
+        self._complete(limiter, count=2)
+
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 10)
+
+    def test_increase_is_capped(self):
+        limiter = self._create_limiter(initial_limit=2, max_limit=2)
+
+        self._complete(limiter, count=2)
+
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 2)
+
+    def test_multiplicative_decrease_on_resource_exhausted(self):
+        limiter = self._create_limiter(initial_limit=8)
+
+        self._complete(limiter, dropped=True, count=4)
+
+        # Requests started before the decrease don't decrease it again.
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 4)
+        self.assertEqual(limiter.get_limits()[_KEY]['dropped'], 4)
+
+        self._complete(limiter, dropped=True)
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 2)
+
+    def test_decrease_is_capped(self):
+        limiter = self._create_limiter(initial_limit=2, min_limit=2)
+
+        self._complete(limiter, dropped=True)
+
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 2)
+
+    def test_decrease_on_latency(self):
+        limiter = self._create_limiter(initial_limit=8, latency_tolerance=2)
+        self._complete(limiter, latency=1.0)
+
+        self._complete(limiter, latency=1.5)
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 8)
+
+        self._complete(limiter, latency=3.0)
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 4)
+
+    def test_latency_tolerance_disabled(self):
+        limiter = self._create_limiter(initial_limit=8, latency_tolerance=None)
+        self._complete(limiter, latency=1.0)
+
+        self._complete(limiter, latency=100.0)
+
+        self.assertEqual(limiter.get_limits()[_KEY]['limit'], 8)
+
+    def test_keys_are_limited_separately(self):
+        limiter = self._create_limiter(initial_limit=1)
+
+        limiter.acquire('123', _MUTATE_METHOD)
+        limiter.acquire('456', _MUTATE_METHOD)
+        limiter.acquire('123', 'GoogleAdsService/Search')
+
+        self.assertEqual(len(limiter.get_limits()), 3)
+
+    def test_acquire_waits_for_release(self):
+        limiter = self._create_limiter(initial_limit=1)
+        permit = limiter.acquire('123', _MUTATE_METHOD)
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire('123', _MUTATE_METHOD)
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(permit)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
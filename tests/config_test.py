@@ -146,6 +146,32 @@ class ConfigTest(FileTestCase):
                 'path_to_private_key_file': self.path_to_private_key_file,
                 'delegated_account': self.delegated_account})
 
+    def test_load_from_env_rate_limits(self):
+        environ = {
+            'GOOGLE_ADS_DEVELOPER_TOKEN': self.developer_token,
+            'GOOGLE_ADS_RATE_LIMITS': '{"customer": {"rate": 5}}'}
+
+        with mock.patch('os.environ', environ):
+            result = config.load_from_env()
+            self.assertEqual(result['rate_limits'], {'customer': {'rate': 5}})
+
+    def test_load_from_env_rate_limits_invalid_json(self):
+        environ = {
+            'GOOGLE_ADS_DEVELOPER_TOKEN': self.developer_token,
+            'GOOGLE_ADS_RATE_LIMITS': 'rate: 5'}
+
+        with mock.patch('os.environ', environ):
+            self.assertRaises(ValueError, config.load_from_env)
+
+    def test_load_from_env_retry(self):
+        environ = {
+            'GOOGLE_ADS_DEVELOPER_TOKEN': self.developer_token,
+            'GOOGLE_ADS_RETRY': '{"budget": {"ratio": 0.2}}'}
+
+        with mock.patch('os.environ', environ):
+            result = config.load_from_env()
+            self.assertEqual(result['retry'], {'budget': {'ratio': 0.2}})
+
     def test_load_from_env_missing_required_key(self):
         # environ is missing required developer_token key
         environ = {
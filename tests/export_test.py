@@ -0,0 +1,182 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library search exporter."""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from importlib import import_module
+from unittest import TestCase
+
+from google.protobuf.internal.decoder import _DecodeVarint
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads import export
+from google.ads.google_ads.export import SearchExporter
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+def _create_rows(count):
+    rows = []
+    for index in range(count):
+        row = google_ads_service_pb2.GoogleAdsRow()
+        row.campaign.id.value = index
+        row.campaign.name.value = 'Campaign, "%d"' % index
+        row.metrics.clicks.value = index * 10
+        rows.append(row)
+    return rows
+
+
+class SearchExporterTest(TestCase):
+
+    _QUERY = 'SELECT campaign.id, campaign.name, metrics.clicks FROM campaign'
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _get_path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_init_invalid_arguments(self):
+        path = self._get_path('out.csv')
+        self.assertRaises(ValueError, SearchExporter, path, self._QUERY,
+                          file_format='xml')
+        self.assertRaises(ValueError, SearchExporter, path, file_format='csv')
+        self.assertRaises(ValueError, SearchExporter, path, self._QUERY,
+                          max_file_bytes=10)
+
+    def test_export_csv(self):
+        path = self._get_path('out.csv')
+        exporter = SearchExporter(path, self._QUERY)
+
+        stats = exporter.export(_create_rows(2))
+
+        with open(path) as csv_file:
+            self.assertEqual(csv_file.read().splitlines(), [
+                'campaign.id,campaign.name,metrics.clicks',
+                '0,"Campaign, ""0""",0',
+                '1,"Campaign, ""1""",10'])
+        self.assertEqual(stats['rows'], 2)
+        self.assertEqual(stats['paths'], [path])
+        self.assertEqual(stats['bytes'], os.path.getsize(path))
+
+    def test_export_jsonl(self):
+        path = self._get_path('out.jsonl')
+        exporter = SearchExporter(path, self._QUERY, file_format='jsonl')
+
+        exporter.export(_create_rows(2))
+
+        with open(path) as jsonl_file:
+            lines = [json.loads(line) for line in jsonl_file]
+        self.assertEqual(lines[1], {'campaign.id': 1,
+                                    'campaign.name': 'Campaign, "1"',
+                                    'metrics.clicks': 10})
+
+    def test_export_jsonl_message_field(self):
+        path = self._get_path('out.jsonl')
+        exporter = SearchExporter(
+            path, 'SELECT campaign.network_settings FROM campaign',
+            file_format='jsonl')
+        row = google_ads_service_pb2.GoogleAdsRow()
+        row.campaign.network_settings.target_search_network.value = True
+
+        exporter.export([row])
+
+        with open(path) as jsonl_file:
+            self.assertEqual(json.loads(jsonl_file.read()), {
+                'campaign.network_settings': {'targetSearchNetwork': True}})
+
+    def test_export_delimited_protobuf(self):
+        path = self._get_path('out.pb')
+        rows = _create_rows(3)
+
+        SearchExporter(path, file_format='pb').export(rows)
+
+        with open(path, 'rb') as pb_file:
+            data = pb_file.read()
+
+        position = 0
+        result = []
+        while position < len(data):
+            size, position = _DecodeVarint(data, position)
+            result.append(google_ads_service_pb2.GoogleAdsRow.FromString(
+                data[position:position + size]))
+            position += size
+        self.assertEqual(result, rows)
+
+    def test_export_compressed(self):
+        path = self._get_path('out.csv.gz')
+        SearchExporter(path, self._QUERY, compress=True).export(
+            _create_rows(2))
+
+        with gzip.open(path, 'rt') as csv_file:
+            self.assertEqual(len(csv_file.read().splitlines()), 3)
+
+    def test_export_rotates_files(self):
+        path = self._get_path('out-{index}.csv')
+        exporter = SearchExporter(path, self._QUERY, max_file_bytes=100,
+                                  chunk_bytes=50)
+
+        stats = exporter.export(_create_rows(20))
+
+        self.assertGreater(len(stats['paths']), 1)
+        self.assertEqual(stats['paths'][0], self._get_path('out-0.csv'))
+        lines = []
+        for file_path in stats['paths']:
+            with open(file_path) as csv_file:
+                file_lines = csv_file.read().splitlines()
+            # Every file starts with a header.
+            self.assertEqual(file_lines[0],
+                             'campaign.id,campaign.name,metrics.clicks')
+            lines.extend(file_lines[1:])
+        self.assertEqual([line.split(',')[0] for line in lines],
+                         [str(index) for index in range(20)])
+
+    def test_export_chunk_bytes_are_encoded_bytes(self):
+        path = self._get_path('out-{index}.csv')
+        rows = _create_rows(4)
+        for row in rows:
+            # 30 characters taking 60 bytes in UTF-8.
+            row.campaign.name.value = u'\u00e9' * 30
+        # Files are rotated after every chunk, so that each file holds one.
+        exporter = SearchExporter(path, self._QUERY, max_file_bytes=1,
+                                  chunk_bytes=50)
+
+        stats = exporter.export(rows)
+
+        self.assertEqual(len(stats['paths']), 4)
+
+    def test_export_no_rows(self):
+        path = self._get_path('out.csv')
+        stats = SearchExporter(path, self._QUERY).export([])
+
+        self.assertEqual(stats['rows'], 0)
+        with open(path) as csv_file:
+            self.assertEqual(csv_file.read().splitlines(),
+                             ['campaign.id,campaign.name,metrics.clicks'])
+
+    def test_encode_varint(self):
+        for value in (0, 1, 127, 128, 300, 1 << 40):
+            self.assertEqual(_DecodeVarint(export._encode_varint(value), 0),
+                             (value, len(export._encode_varint(value))))
@@ -0,0 +1,181 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library fan-out executor."""
+
+import mock
+import threading
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads import fan_out
+from google.ads.google_ads.fan_out import CustomerRow
+from google.ads.google_ads.fan_out import FanOutExecutor
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+def _create_row(campaign_id):
+    row = google_ads_service_pb2.GoogleAdsRow()
+    row.campaign.id.value = campaign_id
+    return row
+
+
+def _create_client_row(customer_id, level, hidden=False):
+    row = google_ads_service_pb2.GoogleAdsRow()
+    row.customer_client.client_customer.value = 'customers/%s' % customer_id
+    row.customer_client.level.value = level
+    row.customer_client.hidden.value = hidden
+    return row
+
+
+class FanOutExecutorTest(TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.service = self.client.get_service.return_value
+        # Maps customer IDs to lists of pages, or to an exception to raise.
+        self.accounts = {}
+        self.queries = {}
+
+        def search(customer_id, query, page_size=None):
+            self.queries[customer_id] = query
+            result = self.accounts[customer_id]
+            if isinstance(result, Exception):
+                raise result
+            if customer_id == 'manager':
+                return result
+            return mock.Mock(pages=result)
+
+        self.service.search.side_effect = search
+
+    def test_init_invalid_max_workers(self):
+        self.assertRaises(ValueError, FanOutExecutor, self.client,
+                          max_workers=0)
+
+    def test_init_version(self):
+        FanOutExecutor(self.client, version='v1')
+        self.client.get_service.assert_called_once_with(
+            'GoogleAdsService', version='v1')
+
+    def test_get_client_customer_ids(self):
+        self.accounts['manager'] = [
+            _create_client_row('manager', 0),
+            _create_client_row('1', 1),
+            _create_client_row('2', 2),
+            _create_client_row('3', 1, hidden=True)]
+        executor = FanOutExecutor(self.client)
+
+        self.assertEqual(executor.get_client_customer_ids('manager'),
+                         ['1', '2'])
+        self.assertEqual(
+            executor.get_client_customer_ids('manager', include_hidden=True),
+            ['1', '2', '3'])
+        self.assertEqual(
+            executor.get_client_customer_ids('manager', max_level=1), ['1'])
+
+    def test_search(self):
+        self.accounts['1'] = [[_create_row(1), _create_row(2)],
+                              [_create_row(3)]]
+        self.accounts['2'] = [[_create_row(4)]]
+        executor = FanOutExecutor(self.client, max_workers=2)
+
+        rows = list(executor.search('query', ['1', '2']))
+
+        self.assertEqual(
+            sorted((row.customer_id, row.row.campaign.id.value)
+                   for row in rows),
+            [('1', 1), ('1', 2), ('1', 3), ('2', 4)])
+        self.assertIsInstance(rows[0], CustomerRow)
+        stats = executor.get_stats()
+        self.assertEqual(stats['accounts'], 2)
+        self.assertEqual(stats['accounts_completed'], 2)
+        self.assertEqual(stats['accounts_failed'], 0)
+        self.assertEqual(stats['rows'], 4)
+
+    def test_search_query_template(self):
+        self.accounts['1'] = [[]]
+        self.accounts['2'] = [[]]
+        executor = FanOutExecutor(self.client)
+
+        list(executor.search(lambda customer_id: 'query %s' % customer_id,
+                             ['1', '2']))
+
+        self.assertEqual(self.queries, {'1': 'query 1', '2': 'query 2'})
+
+    def test_search_isolates_account_errors(self):
+        error = RuntimeError('account failed')
+        self.accounts['1'] = error
+        self.accounts['2'] = [[_create_row(4)]]
+        executor = FanOutExecutor(self.client)
+
+        with mock.patch.object(fan_out, '_logger'):
+            rows = list(executor.search('query', ['1', '2']))
+
+        self.assertEqual([row.customer_id for row in rows], ['2'])
+        self.assertEqual(executor.errors, [fan_out.AccountError('1', error)])
+        stats = executor.get_stats()
+        self.assertEqual(stats['accounts_completed'], 1)
+        self.assertEqual(stats['accounts_failed'], 1)
+
+    def test_search_hierarchy(self):
+        self.accounts['manager'] = [_create_client_row('manager', 0),
+                                    _create_client_row('1', 1)]
+        self.accounts['1'] = [[_create_row(1)]]
+        executor = FanOutExecutor(self.client)
+
+        rows = list(executor.search_hierarchy('manager', 'query'))
+
+        self.assertEqual([(row.customer_id, row.row.campaign.id.value)
+                          for row in rows], [('1', 1)])
+
+    def test_search_bounded_concurrency(self):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def pages():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            yield [_create_row(1)]
+
+        for customer_id in range(10):
+            self.accounts[str(customer_id)] = pages()
+
+        executor = FanOutExecutor(self.client, max_workers=3)
+        rows = list(executor.search('query', self.accounts))
+
+        self.assertEqual(len(rows), 10)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_search_abandoned(self):
+        for customer_id in range(5):
+            self.accounts[str(customer_id)] = [[_create_row(1)]] * 10
+
+        executor = FanOutExecutor(self.client, max_workers=2,
+                                  max_buffered_pages=1)
+        rows = executor.search('query', list(self.accounts))
+        next(rows)
+        rows.close()
+
+        # Searches that hadn't started are skipped once the caller stops.
+        self.assertLess(executor.get_stats()['rows'], 50)
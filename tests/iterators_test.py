@@ -0,0 +1,142 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library iterators."""
+
+import threading
+from importlib import import_module
+from unittest import TestCase
+
+from google.api_core import page_iterator
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads.iterators import PrefetchingPageIterator
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+class PrefetchingPageIteratorTest(TestCase):
+
+    def _create_test_iterator(self, pages, error=None):
+        """Creates a GRPCIterator over SearchGoogleAdsResponse pages.
+
+        Args:
+            pages: a list of lists of campaign IDs, one per page.
+            error: an optional exception raised in place of the last page.
+        """
+        responses = []
+        for index, rows in enumerate(pages):
+            response = google_ads_service_pb2.SearchGoogleAdsResponse()
+            for value in rows:
+                response.results.add().campaign.id.value = value
+            if index < len(pages) - 1:
+                response.next_page_token = str(index + 1)
+            responses.append(response)
+
+        self.requested_tokens = []
+
+        def method(request):
+            self.requested_tokens.append(request.page_token)
+            index = int(request.page_token or 0)
+            if error is not None and index == len(pages) - 1:
+                raise error
+            return responses[index]
+
+        return page_iterator.GRPCIterator(
+            client=None, method=method,
+            request=google_ads_service_pb2.SearchGoogleAdsRequest(),
+            items_field='results')
+
+    def test_init_invalid_depth(self):
+        self.assertRaises(ValueError, PrefetchingPageIterator,
+                          self._create_test_iterator([[1]]), depth=0)
+
+    def test_iterate_results(self):
+        iterator = PrefetchingPageIterator(
+            self._create_test_iterator([[1, 2], [3], [4, 5]]), depth=2)
+
+        self.assertEqual([row.campaign.id.value for row in iterator],
+                         [1, 2, 3, 4, 5])
+        self.assertEqual(self.requested_tokens, ['', '1', '2'])
+
+    def test_iterate_pages(self):
+        iterator = PrefetchingPageIterator(
+            self._create_test_iterator([[1, 2], [3]]))
+
+        self.assertEqual([len(page.results) for page in iterator.pages],
+                         [2, 1])
+
+    def test_iterate_twice(self):
+        iterator = PrefetchingPageIterator(self._create_test_iterator([[1]]))
+        list(iterator)
+        with self.assertRaisesRegex(ValueError, 'already started'):
+            list(iterator)
+
+    def test_iterate_closed(self):
+        iterator = PrefetchingPageIterator(self._create_test_iterator([[1]]))
+        iterator.close()
+
+        with self.assertRaisesRegex(ValueError, 'Iterator is closed.'):
+            list(iterator)
+
+        self.assertIsNone(iterator._thread)
+
+    def test_fetch_error(self):
+        error = RuntimeError('page failed')
+        iterator = PrefetchingPageIterator(
+            self._create_test_iterator([[1, 2], [3]], error=error))
+        results = iter(iterator)
+
+        self.assertEqual(next(results).campaign.id.value, 1)
+        self.assertEqual(next(results).campaign.id.value, 2)
+        with self.assertRaises(RuntimeError) as context:
+            next(results)
+        self.assertIs(context.exception, error)
+
+    def test_prefetches_up_to_depth(self):
+        fetched = threading.Semaphore(0)
+        grpc_iterator = self._create_test_iterator([[1], [2], [3], [4]])
+        method = grpc_iterator._method
+
+        def counting_method(request):
+            response = method(request)
+            fetched.release()
+            return response
+
+        grpc_iterator._method = counting_method
+        iterator = PrefetchingPageIterator(grpc_iterator, depth=2)
+        pages = iterator.pages
+
+        self.assertEqual(next(pages).results[0].campaign.id.value, 1)
+        # With the first page consumed, two more pages are fetched ahead of
+        # the caller, and the fourth is requested but can't be enqueued.
+        for _ in range(4):
+            self.assertTrue(fetched.acquire(timeout=5))
+        self.assertEqual(self.requested_tokens, ['', '1', '2', '3'])
+        self.assertEqual(iterator._queue.qsize(), 2)
+        iterator.close()
+
+    def test_close_stops_background_thread(self):
+        iterator = PrefetchingPageIterator(
+            self._create_test_iterator([[1], [2], [3], [4]]))
+
+        with iterator:
+            self.assertEqual(next(iter(iterator)).campaign.id.value, 1)
+
+        iterator._thread.join(timeout=5)
+        self.assertFalse(iterator._thread.is_alive())
+        self.assertLess(len(self.requested_tokens), 4)
@@ -0,0 +1,149 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library metrics."""
+
+import os
+import shutil
+import tempfile
+import threading
+from http.server import HTTPServer
+from unittest import TestCase
+from urllib.request import urlopen
+
+from google.ads.google_ads.metrics import Counter
+from google.ads.google_ads.metrics import Histogram
+from google.ads.google_ads.metrics import MetricsRegistry
+
+_SEARCH = 'GoogleAdsService/Search'
+
+
+class HistogramTest(TestCase):
+
+    def test_observe(self):
+        histogram = Histogram('latency', 'Latency.', ('method',), (1, 5))
+
+        for value in (0.5, 1, 3, 10):
+            histogram.observe((_SEARCH,), value)
+
+        self.assertEqual(histogram.get(), {(_SEARCH,): {
+            'buckets': [(1, 2), (5, 3), (float('inf'), 4)],
+            'count': 4,
+            'sum': 14.5}})
+
+    def test_render(self):
+        histogram = Histogram('latency', 'Latency.', ('method',), (0.5,))
+        histogram.observe((_SEARCH,), 0.25)
+
+        self.assertEqual(histogram.render(), [
+            'latency_bucket{method="%s",le="0.5"} 1' % _SEARCH,
+            'latency_bucket{method="%s",le="+Inf"} 1' % _SEARCH,
+            'latency_sum{method="%s"} 0.25' % _SEARCH,
+            'latency_count{method="%s"} 1' % _SEARCH])
+
+
+class CounterTest(TestCase):
+
+    def test_render_escapes_label_values(self):
+        counter = Counter('errors', 'Errors.', ('code',))
+        counter.inc(('a"b\\c\nd',), 2)
+
+        self.assertEqual(counter.render(), ['errors{code="a\\"b\\\\c\\nd"} 2'])
+
+
+class MetricsRegistryTest(TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_record_request(self):
+        self.registry.record_request(_SEARCH, 'OK', 0.2, customer_id='123',
+                                     request_bytes=100, response_bytes=5000,
+                                     results=10)
+        self.registry.record_request(
+            _SEARCH, 'INVALID_ARGUMENT', 0.1,
+            error_codes=['request_error.INVALID_CUSTOMER_ID'])
+
+        metrics = self.registry.get_metrics()
+
+        self.assertEqual(metrics['google_ads_requests_total'], {
+            (_SEARCH, 'OK'): 1, (_SEARCH, 'INVALID_ARGUMENT'): 1})
+        self.assertEqual(
+            metrics['google_ads_request_latency_seconds'][(_SEARCH,)]['count'],
+            2)
+        self.assertEqual(
+            metrics['google_ads_request_bytes'][(_SEARCH,)]['sum'], 100)
+        self.assertEqual(
+            metrics['google_ads_response_bytes'][(_SEARCH,)]['sum'], 5000)
+        self.assertEqual(
+            metrics['google_ads_response_results'][(_SEARCH,)]['sum'], 10)
+        self.assertEqual(metrics['google_ads_errors_total'], {
+            (_SEARCH, 'request_error.INVALID_CUSTOMER_ID'): 1})
+
+    def test_record_request_customer_labels(self):
+        registry = MetricsRegistry(customer_labels=True)
+
+        registry.record_request(_SEARCH, 'OK', 0.2, customer_id='123')
+
+        self.assertEqual(registry.get_metrics()['google_ads_requests_total'],
+                         {(_SEARCH, '123', 'OK'): 1})
+
+    def test_record_retry(self):
+        self.registry.record_retry(_SEARCH)
+        self.registry.record_retry(_SEARCH)
+
+        self.assertEqual(self.registry.get_metrics()['google_ads_retries_total'],
+                         {(_SEARCH,): 2})
+
+    def test_render_prometheus(self):
+        self.registry.record_request(_SEARCH, 'OK', 0.2)
+
+        text = self.registry.render_prometheus()
+
+        self.assertIn('# TYPE google_ads_requests_total counter\n', text)
+        self.assertIn('google_ads_requests_total{method="%s",status="OK"} 1\n'
+                      % _SEARCH, text)
+        self.assertIn('# TYPE google_ads_request_latency_seconds histogram\n',
+                      text)
+        self.assertIn('google_ads_request_latency_seconds_bucket{method="%s",'
+                      'le="0.25"} 1\n' % _SEARCH, text)
+        self.assertTrue(text.endswith('\n'))
+
+    def test_write_prometheus(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'google_ads.prom')
+        self.registry.record_retry(_SEARCH)
+
+        self.registry.write_prometheus(path)
+
+        with open(path) as metrics_file:
+            self.assertEqual(metrics_file.read(),
+                             self.registry.render_prometheus())
+        self.assertEqual(os.listdir(directory), ['google_ads.prom'])
+
+    def test_get_http_handler(self):
+        self.registry.record_retry(_SEARCH)
+        server = HTTPServer(('127.0.0.1', 0), self.registry.get_http_handler())
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        response = urlopen('http://127.0.0.1:%d/metrics' % server.server_port)
+
+        self.assertEqual(response.headers['Content-Type'],
+                         'text/plain; version=0.0.4; charset=utf-8')
+        self.assertEqual(response.read().decode('utf-8'),
+                         self.registry.render_prometheus())
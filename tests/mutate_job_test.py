@@ -0,0 +1,243 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library mutate job pipeline."""
+
+import threading
+import time
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import util
+from google.ads.google_ads.mutate_job import MutateJobPipeline
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+google_ads_service_pb2 = import_module(
+    '%s.services.google_ads_service_pb2' % _PROTO_PATH)
+mutate_job_service_pb2 = import_module(
+    '%s.services.mutate_job_service_pb2' % _PROTO_PATH)
+
+
+def _create_operation(index):
+    operation = google_ads_service_pb2.MutateOperation()
+    operation.campaign_operation.create.name.value = 'Campaign %d' % index
+    return operation
+
+
+class FakeOperation(object):
+    """A long-running operation done after a number of polls."""
+
+    def __init__(self, polls, poll_exception=None, error=None):
+        self.polls = polls
+        self.poll_exception = poll_exception
+        self.error = error
+        self.poll_times = []
+
+    def done(self):
+        self.poll_times.append(time.monotonic())
+
+        if self.poll_exception:
+            raise self.poll_exception
+
+        return len(self.poll_times) >= self.polls
+
+    def exception(self):
+        return self.error
+
+
+class FakeMutateJobService(object):
+    """Records uploaded chunks and lists a result per uploaded operation."""
+
+    def __init__(self, polls=1, poll_exception=None, job_error=None):
+        self.polls = polls
+        self.poll_exception = poll_exception
+        self.job_error = job_error
+        self.chunks = {}
+        self.operations = {}
+        self._lock = threading.Lock()
+        self._job_ids = iter(range(1, 1000))
+
+    def create_mutate_job(self, customer_id):
+        with self._lock:
+            resource_name = 'customers/%s/mutateJobs/%d' % (
+                customer_id, next(self._job_ids))
+
+        self.chunks[resource_name] = []
+        return mutate_job_service_pb2.CreateMutateJobResponse(
+            resource_name=resource_name)
+
+    def add_mutate_job_operations(self, resource_name, sequence_token,
+                                  mutate_operations):
+        chunks = self.chunks[resource_name]
+        chunks.append((sequence_token, list(mutate_operations)))
+        return mutate_job_service_pb2.AddMutateJobOperationsResponse(
+            next_sequence_token=str(len(chunks)))
+
+    def run_mutate_job(self, resource_name):
+        operation = FakeOperation(self.polls, self.poll_exception,
+                                  self.job_error)
+        self.operations[resource_name] = operation
+        return operation
+
+    def list_mutate_job_results(self, resource_name, page_size=None):
+        operations = [operation for _, chunk in self.chunks[resource_name]
+                      for operation in chunk]
+
+        for index, operation in enumerate(operations):
+            result = mutate_job_service_pb2.MutateJobResult()
+            result.operation_index = index
+            result.mutate_operation_response.campaign_result.resource_name = (
+                operation.campaign_operation.create.name.value)
+            yield result
+
+
+class MutateJobPipelineTest(TestCase):
+
+    def setUp(self):
+        self.service = FakeMutateJobService()
+
+    def _create_pipeline(self, **kwargs):
+        kwargs.setdefault('initial_poll_delay', 0.001)
+        kwargs.setdefault('max_poll_delay', 0.004)
+        pipeline = MutateJobPipeline(self.service, **kwargs)
+        self.addCleanup(pipeline.close)
+        return pipeline
+
+    def test_init_invalid_arguments(self):
+        for kwargs in ({'max_operations': 0}, {'max_bytes': 0},
+                       {'initial_poll_delay': 0},
+                       {'initial_poll_delay': 2, 'max_poll_delay': 1},
+                       {'poll_multiplier': 0.5}, {'max_workers': 0}):
+            self.assertRaises(ValueError, MutateJobPipeline, self.service,
+                              **kwargs)
+
+    def test_upload_chunks_by_count(self):
+        pipeline = self._create_pipeline(max_operations=2)
+        resource_name = self.service.create_mutate_job('123').resource_name
+
+        count = pipeline.upload(resource_name,
+                                (_create_operation(index)
+                                 for index in range(5)))
+
+        chunks = self.service.chunks[resource_name]
+        self.assertEqual(count, 5)
+        self.assertEqual([(token, len(operations))
+                          for token, operations in chunks],
+                         [(None, 2), ('1', 2), ('2', 1)])
+        self.assertEqual(pipeline.get_stats()['upload_requests'], 3)
+
+    def test_upload_chunks_by_bytes(self):
+        operation_size = util.get_encoded_size(_create_operation(0))
+        pipeline = self._create_pipeline(max_bytes=operation_size * 2)
+        resource_name = self.service.create_mutate_job('123').resource_name
+
+        pipeline.upload(resource_name, [_create_operation(index)
+                                        for index in range(3)],
+                        sequence_token='7')
+
+        self.assertEqual([(token, len(operations)) for token, operations
+                          in self.service.chunks[resource_name]],
+                         [('7', 2), ('1', 1)])
+
+    def test_submit_streams_results(self):
+        self.service.polls = 3
+        pipeline = self._create_pipeline()
+        results = []
+
+        future = pipeline.submit('123', [_create_operation(index)
+                                         for index in range(3)],
+                                 results.append)
+
+        self.assertEqual(future.result(5), 'customers/123/mutateJobs/1')
+        self.assertEqual([result.mutate_operation_response.campaign_result
+                          .resource_name for result in results],
+                         ['Campaign 0', 'Campaign 1', 'Campaign 2'])
+        stats = pipeline.get_stats()
+        self.assertEqual((stats['jobs'], stats['operations'], stats['polls'],
+                          stats['results']), (1, 3, 3, 3))
+
+    def test_polls_back_off(self):
+        self.service.polls = 4
+        pipeline = self._create_pipeline()
+
+        pipeline.submit('123', [_create_operation(0)], lambda result: None)
+        pipeline.wait(5)
+
+        poll_times = self.service.operations[
+            'customers/123/mutateJobs/1'].poll_times
+        delays = [later - earlier
+                  for earlier, later in zip(poll_times, poll_times[1:])]
+        # The delays double up to max_poll_delay.
+        for delay, expected in zip(delays, (0.002, 0.004, 0.004)):
+            self.assertGreaterEqual(delay, expected * 0.99)
+
+    def test_many_jobs(self):
+        self.service.polls = 3
+        pipeline = self._create_pipeline()
+        results = []
+        lock = threading.Lock()
+
+        def callback(result):
+            with lock:
+                results.append(result)
+
+        jobs = [pipeline.submit('123', [_create_operation(index)
+                                        for index in range(10)], callback)
+                for _ in range(20)]
+
+        self.assertTrue(pipeline.wait(5))
+        self.assertEqual(len(set(job.result() for job in jobs)), 20)
+        self.assertEqual(len(results), 200)
+        self.assertEqual(pipeline.get_stats()['polls'], 60)
+
+    def test_poll_failure(self):
+        error = Exception('Unavailable.')
+        self.service.poll_exception = error
+        pipeline = self._create_pipeline()
+
+        future = pipeline.submit('123', [_create_operation(0)],
+                                 lambda result: None)
+
+        self.assertIs(future.exception(5), error)
+        self.assertEqual(pipeline.get_stats()['failed_jobs'], 1)
+
+    def test_job_failure(self):
+        error = Exception('Internal error.')
+        self.service.job_error = error
+        pipeline = self._create_pipeline()
+        results = []
+
+        future = pipeline.submit('123', [_create_operation(0)],
+                                 results.append)
+
+        self.assertIs(future.exception(5), error)
+        self.assertEqual(results, [])
+        self.assertEqual(pipeline.get_stats()['failed_jobs'], 1)
+
+    def test_callback_failure(self):
+        error = ValueError('Invalid result.')
+        pipeline = self._create_pipeline()
+
+        def callback(result):
+            raise error
+
+        future = pipeline.submit('123', [_create_operation(0)], callback)
+
+        self.assertIs(future.exception(5), error)
+
+    def test_submit_after_close(self):
+        pipeline = self._create_pipeline()
+        pipeline.close()
+
+        self.assertRaises(ValueError, pipeline.submit, '123', [],
+                          lambda result: None)
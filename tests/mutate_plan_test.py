@@ -0,0 +1,198 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library mutate planner."""
+
+from importlib import import_module
+from unittest import TestCase
+
+import mock
+
+from google.ads.google_ads import mutate_plan
+from google.ads.google_ads.errors import GoogleAdsException
+from google.ads.google_ads.mutate_plan import MutatePlan
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+google_ads_service_pb2 = import_module(
+    '%s.services.google_ads_service_pb2' % _PROTO_PATH)
+errors_pb2 = import_module('%s.errors.errors_pb2' % _PROTO_PATH)
+
+_BUDGET = 'customers/123/campaignBudgets/%d'
+_CAMPAIGN = 'customers/123/campaigns/%d'
+_AD_GROUP = 'customers/123/adGroups/%d'
+
+
+def _create_budget(temp_id):
+    operation = google_ads_service_pb2.MutateOperation()
+    operation.campaign_budget_operation.create.resource_name = (
+        _BUDGET % temp_id)
+    return operation
+
+
+def _create_campaign(temp_id, budget_temp_id=None):
+    operation = google_ads_service_pb2.MutateOperation()
+    campaign = operation.campaign_operation.create
+    campaign.resource_name = _CAMPAIGN % temp_id
+
+    if budget_temp_id is not None:
+        campaign.campaign_budget.value = _BUDGET % budget_temp_id
+
+    return operation
+
+
+def _create_ad_group(temp_id, campaign_temp_id):
+    operation = google_ads_service_pb2.MutateOperation()
+    ad_group = operation.ad_group_operation.create
+    ad_group.resource_name = _AD_GROUP % temp_id
+    ad_group.campaign.value = _CAMPAIGN % campaign_temp_id
+    return operation
+
+
+def _failure_with_indexes(*indexes):
+    failure = errors_pb2.GoogleAdsFailure()
+
+    for index in indexes:
+        failure.errors.add().location.field_path_elements.add(
+            field_name='mutate_operations').index.value = index
+
+    return failure
+
+
+def _get_indexes(failure):
+    return [error.location.field_path_elements[0].index.value
+            for error in failure.errors]
+
+
+class MutatePlanTest(TestCase):
+
+    def test_groups_interleaved_operations(self):
+        operations = [_create_budget(-1), _create_campaign(-2, -1),
+                      _create_budget(-3), _create_campaign(-4, -3),
+                      _create_ad_group(-5, -2), _create_ad_group(-6, -4)]
+
+        plan = MutatePlan(operations)
+
+        self.assertEqual(plan.order, [0, 2, 1, 3, 4, 5])
+        self.assertEqual(plan.get_runs(), [
+            ('campaign_budget_operation', 2), ('campaign_operation', 2),
+            ('ad_group_operation', 2)])
+        self.assertEqual(plan.operations,
+                         [operations[index] for index in plan.order])
+
+    def test_prefers_types_that_can_be_finished(self):
+        # The second campaign needs the budget, so creating the budget first
+        # leaves a single run of campaigns.
+        operations = [_create_campaign(-1), _create_budget(-2),
+                      _create_campaign(-3, -2)]
+
+        plan = MutatePlan(operations)
+
+        self.assertEqual(plan.order, [1, 0, 2])
+
+    def test_reference_before_target_keeps_order(self):
+        # A reference before the resource is created stays before it, so the
+        # request fails as the caller's would.
+        operations = [_create_campaign(-2, -1), _create_budget(-1)]
+
+        self.assertEqual(MutatePlan(operations).order, [0, 1])
+
+    def test_operations_on_the_same_resource_keep_order(self):
+        update = google_ads_service_pb2.MutateOperation()
+        update.campaign_operation.update.resource_name = _CAMPAIGN % 1
+        remove = google_ads_service_pb2.MutateOperation()
+        remove.campaign_operation.remove = _CAMPAIGN % 1
+        operations = [_create_budget(-1), update, _create_budget(-2), remove]
+
+        plan = MutatePlan(operations)
+
+        self.assertLess(plan.order.index(1), plan.order.index(3))
+        self.assertEqual(len(plan.get_runs()), 2)
+
+    def test_restore_results(self):
+        plan = MutatePlan([_create_campaign(-1), _create_budget(-2),
+                           _create_campaign(-3, -2)])
+
+        self.assertEqual(plan.restore_results(['budget', 'first', 'second']),
+                         ['first', 'budget', 'second'])
+        self.assertEqual(plan.get_original_index(0), 1)
+
+    def test_restore_response(self):
+        plan = MutatePlan([_create_campaign(-1), _create_budget(-2),
+                           _create_campaign(-3, -2)])
+        response = google_ads_service_pb2.MutateGoogleAdsResponse()
+        response.mutate_operation_responses.add().campaign_budget_result\
+            .resource_name = _BUDGET % 2
+        response.mutate_operation_responses.add()
+        response.mutate_operation_responses.add().campaign_result\
+            .resource_name = _CAMPAIGN % 3
+        response.partial_failure_error.code = 3
+        response.partial_failure_error.details.add().Pack(
+            _failure_with_indexes(1))
+
+        restored = plan.restore_response(response)
+
+        self.assertEqual(
+            [result.WhichOneof('response')
+             for result in restored.mutate_operation_responses],
+            [None, 'campaign_budget_result', 'campaign_result'])
+        failure = errors_pb2.GoogleAdsFailure()
+        restored.partial_failure_error.details[0].Unpack(failure)
+        self.assertEqual(_get_indexes(failure), [0])
+
+    def test_mutate(self):
+        service = mock.Mock()
+        service.mutate.return_value = (
+            google_ads_service_pb2.MutateGoogleAdsResponse())
+        operations = [_create_campaign(-1), _create_budget(-2),
+                      _create_campaign(-3, -2)]
+
+        mutate_plan.mutate(service, '123', operations, partial_failure=True)
+
+        service.mutate.assert_called_once_with(
+            '123', [operations[1], operations[0], operations[2]],
+            partial_failure=True)
+
+    def test_mutate_failure(self):
+        failure = _failure_with_indexes(0, 2)
+        service = mock.Mock()
+        service.mutate.side_effect = GoogleAdsException(
+            None, None, failure, 'request-id')
+        operations = [_create_campaign(-1), _create_budget(-2),
+                      _create_campaign(-3, -2)]
+
+        self.assertRaises(GoogleAdsException, mutate_plan.mutate, service,
+                          '123', operations)
+        self.assertEqual(_get_indexes(failure), [1, 2])
+
+
+class GetDependenciesTest(TestCase):
+
+    def test_get_dependencies(self):
+        operations = [_create_budget(-1), _create_campaign(-2, -1),
+                      _create_ad_group(-3, -2), _create_ad_group(-4, -2)]
+
+        self.assertEqual(mutate_plan.get_dependencies(operations),
+                         [set(), {0}, {1}, {1}])
+
+    def test_get_referenced_resource_names(self):
+        self.assertEqual(
+            mutate_plan.get_referenced_resource_names(
+                _create_ad_group(-3, -2)),
+            {_CAMPAIGN % -2})
+
+    def test_get_target_resource_name_customer_operation(self):
+        operation = google_ads_service_pb2.MutateOperation()
+        operation.customer_operation.update.resource_name = 'customers/123'
+
+        self.assertEqual(mutate_plan.get_target_resource_name(operation),
+                         'customers/123')
@@ -0,0 +1,189 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library partial failure helpers."""
+
+from importlib import import_module
+from unittest import TestCase
+
+import mock
+
+from google.ads.google_ads import partial_failure
+from google.ads.google_ads.retry import RetryPolicy
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+campaign_service_pb2 = import_module(
+    '%s.services.campaign_service_pb2' % _PROTO_PATH)
+errors_pb2 = import_module('%s.errors.errors_pb2' % _PROTO_PATH)
+quota_error_pb2 = import_module('%s.errors.quota_error_pb2' % _PROTO_PATH)
+range_error_pb2 = import_module('%s.errors.range_error_pb2' % _PROTO_PATH)
+
+_TRANSIENT = 'transient'
+_PERMANENT = 'permanent'
+
+
+def _add_error(failure, index, kind):
+    error = failure.errors.add(message='%s %s' % (kind, index))
+
+    if kind == _TRANSIENT:
+        error.error_code.quota_error = (
+            quota_error_pb2.QuotaErrorEnum.RESOURCE_TEMPORARILY_EXHAUSTED)
+    else:
+        error.error_code.range_error = range_error_pb2.RangeErrorEnum.TOO_LOW
+
+    if index is not None:
+        error.location.field_path_elements.add(
+            field_name='operations').index.value = index
+
+
+def _create_response(names, failures=None):
+    """Creates a response with a result per name.
+
+    failures maps operation indexes to the kind of their error. Failed
+    operations get an empty result.
+    """
+    failures = failures or {}
+    response = campaign_service_pb2.MutateCampaignsResponse()
+    failure = errors_pb2.GoogleAdsFailure()
+
+    for index, name in enumerate(names):
+        result = response.results.add()
+
+        if index in failures:
+            _add_error(failure, index, failures[index])
+        else:
+            result.resource_name = name
+
+    if failures:
+        response.partial_failure_error.code = 3
+        response.partial_failure_error.details.add().Pack(failure)
+
+    return response
+
+
+def _create_operation(name):
+    operation = campaign_service_pb2.CampaignOperation()
+    operation.remove = name
+    return operation
+
+
+class FakeMutate(object):
+    """Fails operations with the kinds of errors scheduled for their names."""
+
+    def __init__(self, errors):
+        # Lists of the kinds of errors of each attempt, by resource name.
+        self.errors = errors
+        self.requests = []
+
+    def __call__(self, customer_id, operations, partial_failure=None):
+        names = [operation.remove for operation in operations]
+        self.requests.append(names)
+        failures = {}
+
+        for index, name in enumerate(names):
+            scheduled = self.errors.get(name)
+
+            if scheduled:
+                failures[index] = scheduled.pop(0)
+
+        return _create_response(names, failures)
+
+
+class GetOperationErrorsTest(TestCase):
+
+    def test_get_operation_errors(self):
+        response = _create_response(['a', 'b', 'c'],
+                                    {0: _TRANSIENT, 2: _PERMANENT})
+
+        errors = partial_failure.get_operation_errors(response)
+
+        self.assertEqual(sorted(errors), [0, 2])
+        self.assertEqual([error.message for error in errors[2]],
+                         ['permanent 2'])
+
+    def test_unindexed_errors(self):
+        response = _create_response(['a'], {0: _PERMANENT})
+        failure = errors_pb2.GoogleAdsFailure()
+        _add_error(failure, None, _PERMANENT)
+        response.partial_failure_error.details.add().Pack(failure)
+
+        errors = partial_failure.get_operation_errors(response)
+
+        self.assertEqual([error.message for error in errors[None]],
+                         ['permanent None'])
+
+    def test_no_partial_failure(self):
+        self.assertEqual(partial_failure.get_operation_errors(
+            _create_response(['a'])), {})
+
+    def test_is_retryable(self):
+        failure = errors_pb2.GoogleAdsFailure()
+        _add_error(failure, 0, _TRANSIENT)
+        _add_error(failure, 0, _PERMANENT)
+
+        self.assertTrue(partial_failure.is_retryable(failure.errors[:1]))
+        self.assertFalse(partial_failure.is_retryable(failure.errors))
+
+    def test_retryable_error_codes(self):
+        self.assertEqual(partial_failure.RETRYABLE_ERROR_CODES, {
+            'internal_error.TRANSIENT_ERROR',
+            'quota_error.RESOURCE_TEMPORARILY_EXHAUSTED',
+            'database_error.CONCURRENT_MODIFICATION'})
+
+
+class MutateWithRetryTest(TestCase):
+
+    def setUp(self):
+        self.sleep = mock.Mock()
+        self.policy = RetryPolicy(max_attempts=3, initial_delay=1.0,
+                                  max_delay=1.0)
+
+    def _mutate(self, mutate, names):
+        return partial_failure.mutate_with_retry(
+            mutate, '123', [_create_operation(name) for name in names],
+            policy=self.policy, sleep=self.sleep)
+
+    def test_retries_only_transient_failures(self):
+        mutate = FakeMutate({'b': [_TRANSIENT], 'c': [_PERMANENT],
+                             'd': [_TRANSIENT, _TRANSIENT]})
+
+        outcomes = self._mutate(mutate, ['a', 'b', 'c', 'd'])
+
+        self.assertEqual(mutate.requests, [['a', 'b', 'c', 'd'], ['b', 'd'],
+                                           ['d']])
+        self.assertEqual([(outcome.result and outcome.result.resource_name,
+                           len(outcome.errors), outcome.attempts)
+                          for outcome in outcomes],
+                         [('a', 0, 1), ('b', 0, 2), (None, 1, 1),
+                          ('d', 0, 3)])
+        self.assertEqual(self.sleep.call_args_list,
+                         [mock.call(1.0), mock.call(1.0)])
+
+    def test_gives_up_after_max_attempts(self):
+        mutate = FakeMutate({'a': [_TRANSIENT] * 5})
+
+        outcome, = self._mutate(mutate, ['a'])
+
+        self.assertEqual(len(mutate.requests), 3)
+        self.assertIsNone(outcome.result)
+        self.assertEqual(outcome.attempts, 3)
+        self.assertEqual(outcome.errors[0].message, 'transient 0')
+
+    def test_no_failures(self):
+        mutate = FakeMutate({})
+
+        outcomes = self._mutate(mutate, ['a', 'b'])
+
+        self.assertEqual(len(mutate.requests), 1)
+        self.assertEqual([outcome.errors for outcome in outcomes], [[], []])
+        self.sleep.assert_not_called()
@@ -0,0 +1,190 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library rate limiter."""
+
+from unittest import TestCase
+
+from google.ads.google_ads.rate_limit import RateLimiter
+from google.ads.google_ads.rate_limit import RateLimitExceededError
+from google.ads.google_ads.rate_limit import TokenBucket
+
+_MUTATE_METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Mutate'
+
+
+class FakeClock(object):
+    """A clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(TestCase):
+
+    def test_init_invalid_rate(self):
+        self.assertRaises(ValueError, TokenBucket, 0)
+        self.assertRaises(ValueError, TokenBucket, 1, burst=0)
+
+    def test_default_burst(self):
+        self.assertEqual(TokenBucket(0.5, now=0).burst, 1)
+        self.assertEqual(TokenBucket(2.5, now=0).burst, 3)
+
+    def test_get_delay(self):
+        bucket = TokenBucket(2, burst=2, now=0)
+
+        self.assertEqual(bucket.get_delay(0), 0)
+        bucket.take(0)
+        bucket.take(0)
+        self.assertEqual(bucket.get_delay(0), 0.5)
+        self.assertEqual(bucket.get_delay(0.25), 0.25)
+        self.assertEqual(bucket.get_delay(0.5), 0)
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = TokenBucket(1, burst=2, now=0)
+        bucket.take(0)
+
+        bucket.get_delay(100)
+
+        bucket.take(100)
+        bucket.take(100)
+        self.assertEqual(bucket.get_delay(100), 1)
+
+
+class RateLimiterTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _create_limiter(self, **kwargs):
+        return RateLimiter(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_init_invalid_limit(self):
+        self.assertRaises(ValueError, RateLimiter, customer_limit={})
+        self.assertRaises(ValueError, RateLimiter,
+                          method_limits={'GoogleAdsService/Search':
+                                         {'rate': -1}})
+
+    def test_from_config(self):
+        limiter = RateLimiter.from_config({
+            'developer_token': {'rate': 50, 'burst': 100},
+            'methods': {'GoogleAdsService/Mutate': {'rate': 2}},
+            'blocking': False,
+            'timeout': 10})
+
+        self.assertEqual(limiter.developer_token_limit,
+                         {'rate': 50, 'burst': 100})
+        self.assertIsNone(limiter.customer_limit)
+        self.assertEqual(limiter.method_limits,
+                         {'GoogleAdsService/Mutate': {'rate': 2}})
+        self.assertFalse(limiter.blocking)
+        self.assertEqual(limiter.timeout, 10)
+
+    def test_from_config_unknown_key(self):
+        self.assertRaises(ValueError, RateLimiter.from_config,
+                          {'customers': {'rate': 1}})
+
+    def test_acquire_without_limits(self):
+        limiter = self._create_limiter()
+
+        for _ in range(100):
+            self.assertEqual(limiter.acquire('token', '123', _MUTATE_METHOD),
+                             0)
+
+        self.assertEqual(limiter.get_stats()['buckets'], 0)
+
+    def test_acquire_blocks_until_tokens_are_available(self):
+        limiter = self._create_limiter(developer_token_limit={'rate': 2})
+
+        limiter.acquire('token')
+        limiter.acquire('token')
+        waited = limiter.acquire('token')
+
+        self.assertEqual(waited, 0.5)
+        self.assertEqual(self.clock.sleeps, [0.5])
+        self.assertEqual(limiter.get_stats(), {'acquired': 3, 'rejected': 0,
+                                               'wait_seconds': 0.5,
+                                               'buckets': 1})
+
+    def test_acquire_non_blocking(self):
+        limiter = self._create_limiter(customer_limit={'rate': 1},
+                                       blocking=False)
+
+        limiter.acquire(customer_id='123')
+
+        with self.assertRaises(RateLimitExceededError) as context:
+            limiter.acquire(customer_id='123')
+
+        self.assertEqual(context.exception.wait_seconds, 1)
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(limiter.get_stats()['rejected'], 1)
+
+    def test_acquire_timeout(self):
+        limiter = self._create_limiter(customer_limit={'rate': 0.5},
+                                       timeout=1)
+
+        limiter.acquire(customer_id='123')
+
+        self.assertRaises(RateLimitExceededError, limiter.acquire,
+                          customer_id='123')
+        self.assertEqual(limiter.acquire(customer_id='123', timeout=5), 2)
+
+    def test_acquire_customers_are_limited_separately(self):
+        limiter = self._create_limiter(customer_limit={'rate': 1},
+                                       blocking=False)
+
+        limiter.acquire(customer_id='123')
+        limiter.acquire(customer_id='456')
+
+        self.assertFalse(limiter.try_acquire(customer_id='123'))
+
+    def test_acquire_method_limit(self):
+        limiter = self._create_limiter(
+            method_limits={'GoogleAdsService/Mutate': {'rate': 1}},
+            blocking=False)
+
+        limiter.acquire(method=_MUTATE_METHOD)
+
+        self.assertFalse(limiter.try_acquire(method=_MUTATE_METHOD))
+        self.assertTrue(limiter.try_acquire(
+            method='/google.ads.googleads.v2.services.GoogleAdsService/'
+                   'Search'))
+
+    def test_rejected_request_takes_no_tokens(self):
+        limiter = self._create_limiter(developer_token_limit={'rate': 10},
+                                       customer_limit={'rate': 1},
+                                       blocking=False)
+
+        limiter.acquire('token', '123')
+
+        for _ in range(20):
+            self.assertFalse(limiter.try_acquire('token', '123'))
+
+        # Only the first request took a token from the developer token bucket.
+        for _ in range(9):
+            self.assertTrue(limiter.try_acquire('token'))
+        self.assertFalse(limiter.try_acquire('token'))
+
+    def test_try_acquire(self):
+        limiter = self._create_limiter(developer_token_limit={'rate': 1})
+
+        self.assertTrue(limiter.try_acquire('token'))
+        self.assertFalse(limiter.try_acquire('token'))
+        self.assertEqual(self.clock.sleeps, [])
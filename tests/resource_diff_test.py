@@ -0,0 +1,150 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library resource diffs."""
+
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import resource_diff
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+campaign_pb2 = import_module('%s.resources.campaign_pb2' % _PROTO_PATH)
+customer_pb2 = import_module('%s.resources.customer_pb2' % _PROTO_PATH)
+ad_group_ad_label_pb2 = import_module(
+    '%s.resources.ad_group_ad_label_pb2' % _PROTO_PATH)
+campaign_service_pb2 = import_module(
+    '%s.services.campaign_service_pb2' % _PROTO_PATH)
+campaign_status_pb2 = import_module(
+    '%s.enums.campaign_status_pb2' % _PROTO_PATH)
+
+_STATUS = campaign_status_pb2.CampaignStatusEnum
+_RESOURCE_NAME = 'customers/123/campaigns/1'
+
+
+def _create_campaign():
+    campaign = campaign_pb2.Campaign(resource_name=_RESOURCE_NAME)
+    campaign.name.value = 'Campaign'
+    campaign.status = _STATUS.ENABLED
+    campaign.network_settings.target_search_network.value = True
+    campaign.network_settings.target_content_network.value = False
+    parameter = campaign.url_custom_parameters.add()
+    parameter.key.value = 'a'
+    parameter.value.value = '1'
+    return campaign
+
+
+class GetChangedFieldsTest(TestCase):
+
+    def test_no_changes(self):
+        self.assertEqual(resource_diff.get_changed_fields(
+            _create_campaign(), _create_campaign()), [])
+
+    def test_changed_fields(self):
+        desired = _create_campaign()
+        desired.status = _STATUS.PAUSED
+        desired.network_settings.target_content_network.value = True
+        desired.url_custom_parameters[0].value.value = '2'
+        desired.end_date.value = '2030-01-01'
+
+        self.assertEqual(
+            resource_diff.get_changed_fields(_create_campaign(), desired),
+            ['status', 'url_custom_parameters',
+             'network_settings.target_content_network', 'end_date'])
+
+    def test_unset_fields_are_ignored(self):
+        desired = campaign_pb2.Campaign(resource_name=_RESOURCE_NAME)
+        desired.name.value = 'Renamed'
+
+        self.assertEqual(resource_diff.get_changed_fields(
+            _create_campaign(), desired), ['name'])
+
+    def test_clear_unset(self):
+        desired = _create_campaign()
+        desired.ClearField('status')
+        desired.network_settings.ClearField('target_search_network')
+        del desired.url_custom_parameters[:]
+
+        self.assertEqual(
+            resource_diff.get_changed_fields(_create_campaign(), desired,
+                                             clear_unset=True),
+            ['status', 'url_custom_parameters',
+             'network_settings.target_search_network'])
+
+    def test_different_types(self):
+        self.assertRaises(ValueError, resource_diff.get_changed_fields,
+                          _create_campaign(), customer_pb2.Customer())
+
+
+class CreateUpdateOperationTest(TestCase):
+
+    def test_create_update_operation(self):
+        desired = _create_campaign()
+        desired.name.value = 'Renamed'
+        desired.network_settings.target_search_network.value = False
+
+        operation = resource_diff.create_update_operation(_create_campaign(),
+                                                          desired)
+
+        self.assertIsInstance(operation, campaign_service_pb2.CampaignOperation)
+        self.assertEqual(list(operation.update_mask.paths),
+                         ['name', 'network_settings.target_search_network'])
+        expected = campaign_pb2.Campaign(resource_name=_RESOURCE_NAME)
+        expected.name.value = 'Renamed'
+        expected.network_settings.target_search_network.value = False
+        self.assertEqual(operation.update, expected)
+
+    def test_no_op_updates_are_dropped(self):
+        self.assertIsNone(resource_diff.create_update_operation(
+            _create_campaign(), _create_campaign()))
+
+    def test_customer(self):
+        current = customer_pb2.Customer(resource_name='customers/123')
+        desired = customer_pb2.Customer()
+        desired.descriptive_name.value = 'Account'
+
+        operation = resource_diff.create_update_operation(current, desired)
+
+        self.assertEqual(operation.update.resource_name, 'customers/123')
+        self.assertEqual(list(operation.update_mask.paths),
+                         ['descriptive_name'])
+
+    def test_resource_name_mismatch(self):
+        desired = _create_campaign()
+        desired.resource_name = 'customers/123/campaigns/2'
+
+        self.assertRaises(ValueError, resource_diff.create_update_operation,
+                          _create_campaign(), desired)
+
+    def test_resource_without_updates(self):
+        current = ad_group_ad_label_pb2.AdGroupAdLabel(
+            resource_name='customers/123/adGroupAdLabels/1~2~3')
+        desired = ad_group_ad_label_pb2.AdGroupAdLabel()
+        desired.label.value = 'customers/123/labels/4'
+
+        self.assertRaises(ValueError, resource_diff.create_update_operation,
+                          current, desired)
+
+    def test_to_mutate_operation(self):
+        desired = _create_campaign()
+        desired.name.value = 'Renamed'
+        operation = resource_diff.create_update_operation(_create_campaign(),
+                                                          desired)
+
+        mutate_operation = resource_diff.to_mutate_operation(operation)
+
+        self.assertEqual(mutate_operation.campaign_operation, operation)
+
+    def test_get_resource_type(self):
+        self.assertEqual(resource_diff.get_resource_type(
+            ad_group_ad_label_pb2.AdGroupAdLabel), 'ad_group_ad_label')
@@ -0,0 +1,228 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library retries."""
+
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads import retry
+from google.ads.google_ads.retry import Retrier
+from google.ads.google_ads.retry import RetryBudget
+from google.ads.google_ads.retry import RetryPolicy
+
+errors_path = 'google.ads.google_ads.%s.proto.errors' % Client._DEFAULT_VERSION
+errors_pb2 = import_module('%s.errors_pb2' % errors_path)
+quota_error_pb2 = import_module('%s.quota_error_pb2' % errors_path)
+
+_SEARCH_METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Search'
+_MUTATE_METHOD = '/google.ads.googleads.v2.services.GoogleAdsService/Mutate'
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RetryPolicyTest(TestCase):
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, RetryPolicy, max_attempts=0)
+        self.assertRaises(ValueError, RetryPolicy, initial_delay=10,
+                          max_delay=1)
+
+    def test_get_delay_decorrelated_jitter(self):
+        policy = RetryPolicy(initial_delay=1, max_delay=60)
+        bounds = []
+
+        def uniform(low, high):
+            bounds.append((low, high))
+            return high
+
+        delay = None
+        for _ in range(4):
+            delay = policy.get_delay(delay, uniform)
+
+        # Each delay is drawn between the initial delay and three times the
+        # previous delay, capped at the maximum delay.
+        self.assertEqual(bounds, [(1, 3), (1, 9), (1, 27), (1, 81)])
+        self.assertEqual(delay, 60)
+
+
+class RetryBudgetTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_withdraw_until_exhausted(self):
+        budget = RetryBudget(max_tokens=2, min_retries_per_second=0,
+                             clock=self.clock)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_deposit(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=2,
+                             min_retries_per_second=0, clock=self.clock)
+        budget.withdraw()
+        budget.withdraw()
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    def test_refills_over_time(self):
+        budget = RetryBudget(ratio=0, max_tokens=1, min_retries_per_second=0.5,
+                             clock=self.clock)
+        budget.withdraw()
+
+        self.clock.now += 1
+        self.assertFalse(budget.withdraw())
+        self.clock.now += 1
+        self.assertTrue(budget.withdraw())
+
+    def test_balance_is_capped(self):
+        budget = RetryBudget(ratio=1, max_tokens=3, clock=self.clock)
+
+        for _ in range(10):
+            budget.deposit()
+        self.clock.now += 100
+
+        self.assertEqual(budget.get_balance(), 3)
+
+
+class RetrierTest(TestCase):
+
+    def setUp(self):
+        self.budget = RetryBudget(clock=FakeClock())
+
+    def _create_retrier(self, **kwargs):
+        return Retrier(budget=self.budget, uniform=lambda low, high: low,
+                       **kwargs)
+
+    def test_get_policy_most_specific_first(self):
+        retrier = self._create_retrier()
+
+        code, policy = retrier.get_policy(
+            ['quota_error.RESOURCE_TEMPORARILY_EXHAUSTED',
+             'RESOURCE_EXHAUSTED'], _MUTATE_METHOD)
+
+        self.assertEqual(code, 'quota_error.RESOURCE_TEMPORARILY_EXHAUSTED')
+        self.assertIs(policy, retry.DEFAULT_POLICIES[code])
+
+    def test_get_policy_idempotent_only(self):
+        retrier = self._create_retrier()
+
+        self.assertEqual(retrier.get_policy(['UNAVAILABLE'], _MUTATE_METHOD),
+                         (None, None))
+        self.assertEqual(retrier.get_policy(['UNAVAILABLE'], _SEARCH_METHOD),
+                         ('UNAVAILABLE', retry.DEFAULT_POLICIES['UNAVAILABLE']))
+
+    def test_get_policy_unknown_code(self):
+        retrier = self._create_retrier()
+
+        self.assertEqual(
+            retrier.get_policy(['request_error.INVALID_CUSTOMER_ID',
+                                'INVALID_ARGUMENT'], _SEARCH_METHOD),
+            (None, None))
+
+    def test_get_policy_mixed_google_ads_errors(self):
+        retrier = self._create_retrier()
+
+        self.assertEqual(
+            retrier.get_policy(['field_error.REQUIRED',
+                                'database_error.CONCURRENT_MODIFICATION',
+                                'ABORTED'], _MUTATE_METHOD),
+            (None, None))
+
+    def test_get_policy_every_google_ads_error_retryable(self):
+        retrier = self._create_retrier()
+
+        code, policy = retrier.get_policy(
+            ['database_error.CONCURRENT_MODIFICATION',
+             'quota_error.RESOURCE_TEMPORARILY_EXHAUSTED',
+             'RESOURCE_EXHAUSTED'], _MUTATE_METHOD)
+
+        self.assertEqual(code, 'database_error.CONCURRENT_MODIFICATION')
+        self.assertIs(policy, retry.DEFAULT_POLICIES[code])
+
+    def test_policies_override_defaults(self):
+        policy = RetryPolicy(max_attempts=2)
+        retrier = self._create_retrier(policies={'UNAVAILABLE': policy,
+                                                 'INTERNAL': None,
+                                                 'ABORTED': policy})
+
+        self.assertIs(retrier.policies['UNAVAILABLE'], policy)
+        self.assertIs(retrier.policies['ABORTED'], policy)
+        self.assertNotIn('INTERNAL', retrier.policies)
+
+    def test_get_retry_delay(self):
+        retrier = self._create_retrier()
+
+        delays = [retrier.get_retry_delay(['RESOURCE_EXHAUSTED'],
+                                          _MUTATE_METHOD, attempt, None)
+                  for attempt in (1, 2, 3)]
+
+        # The default RESOURCE_EXHAUSTED policy makes three attempts.
+        self.assertEqual(delays, [5.0, 5.0, None])
+        self.assertEqual(retrier.get_stats()['retries'], 2)
+        self.assertEqual(retrier.get_stats()['retries_by_code'],
+                         {'RESOURCE_EXHAUSTED': 2})
+
+    def test_get_retry_delay_budget_exhausted(self):
+        self.budget = RetryBudget(max_tokens=1, min_retries_per_second=0,
+                                  clock=FakeClock())
+        retrier = self._create_retrier()
+
+        self.assertIsNotNone(retrier.get_retry_delay(
+            ['RESOURCE_EXHAUSTED'], _MUTATE_METHOD, 1, None))
+        self.assertIsNone(retrier.get_retry_delay(
+            ['RESOURCE_EXHAUSTED'], _MUTATE_METHOD, 1, None))
+        self.assertEqual(retrier.get_stats()['budget_exhausted'], 1)
+
+    def test_from_config(self):
+        retrier = Retrier.from_config({
+            'policies': {'RESOURCE_EXHAUSTED': {'max_attempts': 2},
+                         'INTERNAL': None},
+            'budget': {'ratio': 0.2}})
+
+        self.assertEqual(retrier.policies['RESOURCE_EXHAUSTED'].max_attempts,
+                         2)
+        self.assertNotIn('INTERNAL', retrier.policies)
+        self.assertEqual(retrier.budget.ratio, 0.2)
+
+    def test_from_config_invalid(self):
+        self.assertRaises(ValueError, Retrier.from_config, {'attempts': 3})
+        self.assertRaises(ValueError, Retrier.from_config,
+                          {'policies': {'INTERNAL': {'attempts': 3}}})
+
+
+class GetGoogleAdsErrorCodesTest(TestCase):
+
+    def test_get_google_ads_error_codes(self):
+        failure = errors_pb2.GoogleAdsFailure()
+        failure.errors.add().error_code.quota_error = (
+            quota_error_pb2.QuotaErrorEnum.RESOURCE_TEMPORARILY_EXHAUSTED)
+        failure.errors.add().error_code.database_error = 2
+        failure.errors.add()
+
+        self.assertEqual(retry.get_google_ads_error_codes(failure),
+                         ['quota_error.RESOURCE_TEMPORARILY_EXHAUSTED',
+                          'database_error.CONCURRENT_MODIFICATION'])
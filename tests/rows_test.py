@@ -0,0 +1,116 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library row utilities."""
+
+from importlib import import_module
+from unittest import TestCase
+
+from google.protobuf.descriptor import FieldDescriptor
+
+from google.ads.google_ads import client as Client
+from google.ads.google_ads import rows
+from google.ads.google_ads.rows import RowFlattener
+
+latest_version = Client._DEFAULT_VERSION
+
+google_ads_service_pb2 = import_module(
+    'google.ads.google_ads.%s.proto.services.google_ads_service_pb2'
+    % latest_version)
+
+
+class GetSelectFieldsTest(TestCase):
+
+    def test_get_select_fields(self):
+        query = ('select campaign.id,\n  metrics.clicks  '
+                 'FROM campaign WHERE campaign.status = \'ENABLED\'')
+        self.assertEqual(rows.get_select_fields(query),
+                         ['campaign.id', 'metrics.clicks'])
+
+    def test_get_select_fields_invalid_query(self):
+        self.assertRaises(ValueError, rows.get_select_fields,
+                          'FROM campaign')
+
+
+class GetFieldDescriptorTest(TestCase):
+
+    def test_wrapper_field(self):
+        path, descriptor = rows.get_field_descriptor('campaign.name')
+        self.assertEqual(path, 'campaign.name.value')
+        self.assertEqual(descriptor.type, FieldDescriptor.TYPE_STRING)
+
+    def test_enum_field(self):
+        path, descriptor = rows.get_field_descriptor('campaign.status')
+        self.assertEqual(path, 'campaign.status')
+        self.assertEqual(descriptor.type, FieldDescriptor.TYPE_ENUM)
+
+    def test_unknown_field(self):
+        self.assertRaises(ValueError, rows.get_field_descriptor,
+                          'campaign.unknown')
+        self.assertRaises(ValueError, rows.get_field_descriptor,
+                          'campaign.name.value.unknown')
+
+
+class RowFlattenerTest(TestCase):
+
+    _QUERY = ('SELECT campaign.id, campaign.status, '
+              'ad_group_criterion.keyword.text, metrics.ctr '
+              'FROM keyword_view')
+
+    def _create_row(self, campaign_id, text):
+        row = google_ads_service_pb2.GoogleAdsRow()
+        row.campaign.id.value = campaign_id
+        row.campaign.status = 2
+        row.ad_group_criterion.keyword.text.value = text
+        row.metrics.ctr.value = 0.5
+        return row
+
+    def test_to_tuple(self):
+        flattener = RowFlattener(self._QUERY)
+        self.assertEqual(flattener.to_tuple(self._create_row(1, 'shoes')),
+                         (1, 2, 'shoes', 0.5))
+
+    def test_to_tuple_single_field(self):
+        flattener = RowFlattener('SELECT campaign.id FROM campaign')
+        self.assertEqual(flattener.to_tuple(self._create_row(1, 'shoes')),
+                         (1,))
+
+    def test_to_dict(self):
+        flattener = RowFlattener(self._QUERY)
+        self.assertEqual(flattener.to_dict(self._create_row(1, 'shoes')),
+                         {'campaign.id': 1, 'campaign.status': 2,
+                          'ad_group_criterion.keyword.text': 'shoes',
+                          'metrics.ctr': 0.5})
+
+    def test_tuples(self):
+        flattener = RowFlattener(self._QUERY)
+        result = list(flattener.tuples([self._create_row(1, 'a'),
+                                        self._create_row(2, 'b')]))
+        self.assertEqual(result, [(1, 2, 'a', 0.5), (2, 2, 'b', 0.5)])
+
+    def test_dicts(self):
+        flattener = RowFlattener('SELECT campaign.id FROM campaign')
+        result = list(flattener.dicts([self._create_row(1, 'a'),
+                                       self._create_row(2, 'b')]))
+        self.assertEqual(result, [{'campaign.id': 1}, {'campaign.id': 2}])
+
+    def test_field_descriptors(self):
+        flattener = RowFlattener(self._QUERY)
+        self.assertEqual(
+            [descriptor.type for descriptor in flattener.field_descriptors],
+            [FieldDescriptor.TYPE_INT64, FieldDescriptor.TYPE_ENUM,
+             FieldDescriptor.TYPE_STRING, FieldDescriptor.TYPE_DOUBLE])
+
+    def test_unknown_field(self):
+        self.assertRaises(ValueError, RowFlattener,
+                          'SELECT campaign.unknown FROM campaign')
@@ -0,0 +1,174 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Google Ads API client library account sync."""
+
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import mutate_plan
+from google.ads.google_ads.sync import AccountSync
+
+_PROTO_PATH = 'google.ads.google_ads.v2.proto'
+google_ads_service_pb2 = import_module(
+    '%s.services.google_ads_service_pb2' % _PROTO_PATH)
+campaign_pb2 = import_module('%s.resources.campaign_pb2' % _PROTO_PATH)
+ad_group_pb2 = import_module('%s.resources.ad_group_pb2' % _PROTO_PATH)
+campaign_status_pb2 = import_module(
+    '%s.enums.campaign_status_pb2' % _PROTO_PATH)
+
+_STATUS = campaign_status_pb2.CampaignStatusEnum
+_CAMPAIGN = 'customers/123/campaigns/%d'
+_AD_GROUP = 'customers/123/adGroups/%d'
+_CAMPAIGN_QUERY = 'SELECT campaign.name, campaign.status FROM campaign'
+_AD_GROUP_QUERY = 'SELECT ad_group.name, ad_group.campaign FROM ad_group'
+
+
+def _create_campaign(name, campaign_id=None, status=_STATUS.ENABLED):
+    campaign = campaign_pb2.Campaign(status=status)
+    campaign.name.value = name
+
+    if campaign_id is not None:
+        campaign.resource_name = _CAMPAIGN % campaign_id
+
+    return campaign
+
+
+def _create_ad_group(name, ad_group_id, campaign_name):
+    ad_group = ad_group_pb2.AdGroup(resource_name=_AD_GROUP % ad_group_id)
+    ad_group.name.value = name
+    ad_group.campaign.value = campaign_name
+    return ad_group
+
+
+class FakeGoogleAdsService(object):
+    """Searches fixed rows and returns real names for temp resource names."""
+
+    def __init__(self, campaigns, ad_groups):
+        self.rows = {
+            _CAMPAIGN_QUERY: [google_ads_service_pb2.GoogleAdsRow(
+                campaign=campaign) for campaign in campaigns],
+            _AD_GROUP_QUERY: [google_ads_service_pb2.GoogleAdsRow(
+                ad_group=ad_group) for ad_group in ad_groups],
+        }
+        self.searches = []
+        self.requests = []
+
+    def search(self, customer_id, query, page_size=None):
+        self.searches.append(query)
+        return iter(self.rows[query])
+
+    def mutate(self, customer_id, mutate_operations, **kwargs):
+        self.requests.append(list(mutate_operations))
+        response = google_ads_service_pb2.MutateGoogleAdsResponse()
+
+        for operation in mutate_operations:
+            operation_type = mutate_plan.get_operation_type(operation)
+            result = getattr(response.mutate_operation_responses.add(),
+                             operation_type.replace('_operation', '_result'))
+            name = mutate_plan.get_target_resource_name(operation)
+            result.resource_name = (name or '').replace('/-', '/')
+
+        return response
+
+
+class AccountSyncTest(TestCase):
+
+    def setUp(self):
+        self.service = FakeGoogleAdsService(
+            [_create_campaign('A', 1), _create_campaign('B', 2),
+             _create_campaign('C', 3)],
+            [_create_ad_group('C1', 4, _CAMPAIGN % 3)])
+        self.sync = AccountSync(self.service, '123')
+        self.sync.manage('campaign', _CAMPAIGN_QUERY,
+                         key=lambda campaign: campaign.name.value)
+        self.sync.manage('ad_group', _AD_GROUP_QUERY)
+
+    def _get_desired(self):
+        new_campaign = _create_campaign('D')
+        new_campaign.resource_name = _CAMPAIGN % -1
+        return [_create_campaign('A', 1, status=_STATUS.PAUSED),
+                _create_campaign('B'), new_campaign,
+                _create_ad_group('D1', -2, new_campaign.resource_name)]
+
+    def test_dry_run(self):
+        plan = self.sync.sync(self._get_desired(), dry_run=True)
+
+        self.assertEqual(plan.get_summary(), {
+            'creates': {'campaign': 1, 'ad_group': 1},
+            'updates': {'campaign': 1},
+            # The ad group of campaign C is removed with it.
+            'removes': {'campaign': 1},
+            'unchanged': 1,
+            'expected_rpc_count': 1})
+        self.assertEqual(self.service.searches,
+                         [_CAMPAIGN_QUERY, _AD_GROUP_QUERY])
+        self.assertEqual(self.service.requests, [])
+        self.assertIsNone(plan.responses)
+
+    def test_plan_operations(self):
+        self.sync.fetch()
+
+        plan = self.sync.plan(self._get_desired())
+
+        update, = plan.updates
+        self.assertEqual(list(update.campaign_operation.update_mask.paths),
+                         ['status'])
+        remove, = plan.removes
+        self.assertEqual(remove.campaign_operation.remove, _CAMPAIGN % 3)
+
+    def test_apply(self):
+        plan = self.sync.sync(self._get_desired())
+
+        self.assertEqual(len(self.service.requests), 1)
+        self.assertEqual(len(self.service.requests[0]), 4)
+        self.assertEqual(len(plan.responses), 1)
+        self.assertEqual(plan.resource_names, {_CAMPAIGN % -1: _CAMPAIGN % 1,
+                                               _AD_GROUP % -2: _AD_GROUP % 2})
+
+    def test_expected_rpc_count_matches_requests(self):
+        sync = AccountSync(self.service, '123', max_operations=2)
+        sync.manage('campaign', _CAMPAIGN_QUERY, remove_missing=False)
+
+        plan = sync.sync([_create_campaign('New %d' % index)
+                          for index in range(5)])
+
+        self.assertEqual(plan.get_expected_rpc_count(), 3)
+        self.assertEqual(len(self.service.requests), 3)
+        self.assertEqual(plan.removes, [])
+
+    def test_no_changes(self):
+        sync = AccountSync(self.service, '123')
+        sync.manage('campaign', _CAMPAIGN_QUERY, remove_missing=False)
+
+        plan = sync.sync([_create_campaign('A', 1)])
+
+        self.assertEqual(plan.unchanged, 1)
+        self.assertEqual(plan.get_expected_rpc_count(), 0)
+        self.assertEqual(self.service.requests, [])
+
+    def test_unfetched_resource_is_updated(self):
+        sync = AccountSync(self.service, '123')
+        sync.fetch()
+
+        plan = sync.plan([_create_campaign('Z', 9)])
+
+        update, = plan.updates
+        self.assertEqual(list(update.campaign_operation.update_mask.paths),
+                         ['name', 'status'])
+
+    def test_init_invalid_arguments(self):
+        self.assertRaises(ValueError, AccountSync, self.service, '123',
+                          page_size=0)
+        self.assertRaises(ValueError, AccountSync, self.service, '123',
+                          max_operations=0)
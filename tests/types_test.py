@@ -0,0 +1,61 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the lazily populated Google Ads API types modules."""
+
+from importlib import import_module
+from unittest import TestCase
+
+from google.api_core.protobuf_helpers import get_messages
+
+from google.ads.google_ads import client as Client
+
+valid_versions = Client._VALID_API_VERSIONS
+
+
+class TypesTest(TestCase):
+
+    def _get_types(self, version):
+        return import_module('google.ads.google_ads.%s.types' % version)
+
+    def test_index_matches_modules(self):
+        """The prebuilt index lists exactly the messages of each module."""
+        for version in valid_versions:
+            types = self._get_types(version)
+            modules = dict(types._shared_modules)
+            modules.update(types._local_modules)
+
+            for module_name, names in modules.items():
+                self.assertEqual(
+                    sorted(get_messages(import_module(module_name))),
+                    sorted(names), module_name)
+
+    def test_getattr(self):
+        for version in valid_versions:
+            types = self._get_types(version)
+            operation = types.CampaignOperation
+
+            self.assertEqual(operation.__name__, 'CampaignOperation')
+            self.assertEqual(operation.__module__,
+                             'google.ads.googleads_%s.types' % version)
+            self.assertIs(types.CampaignOperation, operation)
+            self.assertIn('CampaignOperation', dir(types))
+
+    def test_getattr_shared_type(self):
+        types = self._get_types(Client._DEFAULT_VERSION)
+        self.assertEqual(types.FieldMask.__module__,
+                         'google.protobuf.field_mask_pb2')
+
+    def test_getattr_unknown_type(self):
+        types = self._get_types(Client._DEFAULT_VERSION)
+        self.assertRaises(AttributeError, getattr, types, 'BadType')
@@ -14,8 +14,11 @@
 """Tests for the Google Ads API client library utilities."""
 
 
+import mock
 from unittest import TestCase
 
+from google.ads.google_ads import util
+from google.ads.google_ads.util import LRUCache
 from google.ads.google_ads.util import ResourceName
 
 class ResourceNameTest(TestCase):
@@ -23,3 +26,85 @@ class ResourceNameTest(TestCase):
         composite = ResourceName.format_composite('test', 'test')
         self.assertEqual(composite, 'test~test')
 
+
+class LRUCacheTest(TestCase):
+    def setUp(self):
+        self.on_evict = mock.Mock()
+        self.cache = LRUCache(2, on_evict=self.on_evict)
+
+    def test_init_invalid_max_size(self):
+        self.assertRaises(ValueError, LRUCache, 0)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertEqual(self.cache.get('missing', 'default'), 'default')
+
+    def test_put_and_get(self):
+        self.cache.put('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIn('a', self.cache)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_put_evicts_least_recently_used(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        # Reading "a" makes "b" the least recently used entry.
+        self.cache.get('a')
+        self.cache.put('c', 3)
+        self.on_evict.assert_called_once_with('b', 2)
+        self.assertNotIn('b', self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_put_replaces_existing(self):
+        self.cache.put('a', 1)
+        self.cache.put('a', 2)
+        self.on_evict.assert_called_once_with('a', 1)
+        self.assertEqual(self.cache.get('a'), 2)
+
+    def test_put_same_value(self):
+        value = object()
+        self.cache.put('a', value)
+        self.cache.put('a', value)
+        self.on_evict.assert_not_called()
+
+    def test_setdefault(self):
+        self.assertEqual(self.cache.setdefault('a', 1), 1)
+        self.assertEqual(self.cache.setdefault('a', 2), 1)
+        self.on_evict.assert_not_called()
+        self.assertEqual(self.cache.get('a'), 1)
+
+    def test_setdefault_evicts_least_recently_used(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.setdefault('a', 3)
+        self.cache.setdefault('c', 4)
+        self.on_evict.assert_called_once_with('b', 2)
+
+    def test_pop(self):
+        self.cache.put('a', 1)
+        self.assertEqual(self.cache.pop('a'), 1)
+        self.assertIsNone(self.cache.pop('a'))
+        self.on_evict.assert_not_called()
+
+    def test_clear(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.on_evict.assert_has_calls([mock.call('a', 1), mock.call('b', 2)])
+
+
+class GetEncodedSizeTest(TestCase):
+
+    def test_get_encoded_size(self):
+        message = mock.Mock()
+        message.ByteSize.return_value = 100
+
+        # The field tag, a one byte length prefix and the message.
+        self.assertEqual(util.get_encoded_size(message), 102)
+
+    def test_get_encoded_size_long_length_prefix(self):
+        message = mock.Mock()
+        message.ByteSize.return_value = 200
+
+        self.assertEqual(util.get_encoded_size(message), 203)
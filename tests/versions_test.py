@@ -0,0 +1,86 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the lazily loaded Google Ads API version packages."""
+
+import threading
+from importlib import import_module
+from unittest import TestCase
+
+from google.ads.google_ads import client as Client
+
+valid_versions = Client._VALID_API_VERSIONS
+
+
+class VersionPackageTest(TestCase):
+
+    def _get_package(self, version):
+        return import_module('google.ads.google_ads.%s' % version)
+
+    def test_service_client(self):
+        for version in valid_versions:
+            package = self._get_package(version)
+            service_module = import_module(
+                'google.ads.google_ads.%s.services.campaign_service_client'
+                % version)
+
+            service_client = package.CampaignServiceClient
+
+            self.assertTrue(issubclass(
+                service_client, service_module.CampaignServiceClient))
+            self.assertEqual(service_client.__doc__,
+                             service_module.CampaignServiceClient.__doc__)
+            self.assertEqual(service_client.__module__, package.__name__)
+            self.assertIs(service_client.enums, package.enums)
+            self.assertIs(package.CampaignServiceClient, service_client)
+
+    def test_service_grpc_transport(self):
+        for version in valid_versions:
+            package = self._get_package(version)
+            transport_module = import_module(
+                'google.ads.google_ads.%s.services.transports.'
+                'campaign_service_grpc_transport' % version)
+
+            transport = package.CampaignServiceGrpcTransport
+
+            self.assertTrue(issubclass(
+                transport, transport_module.CampaignServiceGrpcTransport))
+            self.assertFalse(hasattr(transport, 'enums'))
+
+    def test_unknown_attribute(self):
+        package = self._get_package(Client._DEFAULT_VERSION)
+        self.assertRaises(AttributeError, getattr, package, 'BadServiceClient')
+
+    def test_dir(self):
+        package = self._get_package(Client._DEFAULT_VERSION)
+        names = dir(package)
+
+        for name in package.__all__:
+            self.assertIn(name, names)
+
+    def test_concurrent_access(self):
+        package = self._get_package(Client._DEFAULT_VERSION)
+        name = 'FeedItemServiceClient'
+        vars(package).pop(name, None)
+        results = []
+
+        def get_class():
+            results.append(getattr(package, name))
+
+        threads = [threading.Thread(target=get_class) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(results)), 1)